@@ -0,0 +1,243 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from unisul_compiler import pybackend
+from unisul_compiler.bytecode import compile_program
+from unisul_compiler.cache import compiler_version
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.generator import generate_program
+from unisul_compiler.incremental import Document
+from unisul_compiler.lexer import describe, describe_parallel
+from unisul_compiler.optimizer import optimize
+from unisul_compiler.pybackend import compile_python, execute_python
+from unisul_compiler.runtime import InputReader
+from unisul_compiler.source import Source
+from unisul_compiler.table_parser import PARSERS
+from unisul_compiler.vm import execute
+
+# Fases medidas, na ordem do compilador, seguidas da verificação completa e incremental após uma edição
+PHASES = ('describe', 'describe_parallel', 'parse', 'parse_table', 'optimize', 'bytecode', 'python', 'vm', 'python_run',
+          'recheck', 'incremental')
+
+# Fases que também são medidas em programas inválidos, com os erros registrados
+INVALID_PHASES = ('describe', 'describe_parallel', 'parse', 'parse_table', 'recheck', 'incremental')
+
+# CLI
+parser = argparse.ArgumentParser(description='''
+Mede o desempenho do compilador da linguagem "A" em programas sintéticos de tamanhos crescentes.
+''')
+parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                    help='quantidades de comandos dos programas gerados (padrão: 100 1000 10000)')
+parser.add_argument('--declarations', type=int, default=20,
+                    help='quantidade de variáveis declaradas (padrão: 20)')
+parser.add_argument('--depth', type=int, default=3,
+                    help='profundidade máxima dos blocos SE e ENQUANTO (padrão: 3)')
+parser.add_argument('--expression-length', type=int, default=5,
+                    help='quantidade de operandos das expressões (padrão: 5)')
+parser.add_argument('--comment-density', type=float, default=0.1,
+                    help='fração das linhas com um comentário (padrão: 0.1)')
+parser.add_argument('--string-density', type=float, default=0.2,
+                    help='fração dos comandos IMPRIMIR com uma cadeia de caracteres (padrão: 0.2)')
+parser.add_argument('--errors', type=int, default=0,
+                    help='quantidade de erros inseridos em cada programa, medindo apenas a análise (padrão: 0)')
+parser.add_argument('--loop-iterations', type=int, default=3,
+                    help='quantidade de iterações de cada laço ENQUANTO (padrão: 3)')
+parser.add_argument('--seed', type=int, default=0, help='semente dos programas gerados (padrão: 0)')
+parser.add_argument('--phases', nargs='+', choices=PHASES, default=list(PHASES),
+                    help='fases medidas (padrão: todas)')
+parser.add_argument('--parallel-jobs', type=int, nargs='+', default=[os.cpu_count() or 1],
+                    help='quantidades de processos medidas em describe_parallel, comparadas com describe '
+                         '(padrão: a quantidade de processadores)')
+parser.add_argument('--repeat', type=int, default=10,
+                    help='quantidade de medições de cada fase (padrão: 10)')
+parser.add_argument('--output', type=Path, help='arquivo JSON onde os resultados são gravados')
+parser.add_argument('--baseline', type=Path,
+                    help='arquivo JSON de resultados anteriores, com os quais os resultados são comparados')
+parser.add_argument('--threshold', type=float, default=0.1,
+                    help='aumento relativo do tempo mediano ou da memória considerado uma regressão (padrão: 0.1)')
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Retorna o percentil de uma lista ordenada de medições (pela posição mais próxima)."""
+    return samples[min(len(samples) - 1, max(0, round(fraction * len(samples) + 0.5) - 1))]
+
+
+def phases(text: str, invalid: bool,
+           executors: Dict[int, ProcessPoolExecutor]) -> Dict[str, Tuple[Callable, Callable]]:
+    """Retorna, para cada fase, a função que prepara a sua entrada e a função medida.
+
+    A preparação não é medida; as fases que alteram a sua entrada a recebem nova a cada medição.
+    A análise em paralelo é medida com cada quantidade de processos, já iniciados, em ``describe_parallel/N``.
+    """
+    def diagnostics():
+        return Diagnostics() if invalid else None
+
+    def parallel(jobs: int) -> Tuple[Callable, Callable]:
+        return (lambda: Source(text),
+                lambda source: describe_parallel(source, None, diagnostics(), jobs, executors[jobs], min_size=0))
+
+    parallel_phases = {f'describe_parallel/{jobs}': parallel(jobs) for jobs in executors}
+
+    tokens = describe(Source(text), None, diagnostics())
+
+    # a edição verificada: um espaço inserido no início da linha do meio
+    lines = text.split('\n')
+    middle = len(lines) // 2 + 1
+    edited_text = '\n'.join(lines[:middle - 1] + [' ' + lines[middle - 1]] + lines[middle:])
+    document = []
+
+    def recheck(source):
+        diagnostics = Diagnostics()
+        return PARSERS['descent'](describe(source, None, diagnostics), None, diagnostics)
+
+    def analyzed_document():
+        # o documento é analisado uma única vez, e cada medição insere mais um espaço na mesma linha
+        if not document:
+            document.append(Document(text))
+        return document[0]
+
+    rechecks = {
+        'recheck': (lambda: Source(edited_text), recheck),
+        'incremental': (analyzed_document, lambda document: document.edit(middle, 1, middle, 1, ' ')),
+    }
+    if invalid:
+        return {
+            'describe': (lambda: Source(text), lambda source: describe(source, None, Diagnostics())),
+            **parallel_phases,
+            'parse': (lambda: tokens, lambda tokens: PARSERS['descent'](tokens, None, Diagnostics())),
+            'parse_table': (lambda: tokens, lambda tokens: PARSERS['table'](tokens, None, Diagnostics())),
+            **rechecks,
+        }
+
+    program = PARSERS['descent'](tokens)
+    code = compile_program(program)
+    python_code = compile_python(program)
+
+    def python(program):
+        pybackend._code_objects.clear()
+        return compile_python(program)
+
+    return {
+        'describe': (lambda: Source(text), describe),
+        **parallel_phases,
+        'parse': (lambda: tokens, PARSERS['descent']),
+        'parse_table': (lambda: tokens, PARSERS['table']),
+        'optimize': (lambda: PARSERS['descent'](tokens), optimize),
+        'bytecode': (lambda: program, compile_program),
+        'python': (lambda: program, python),
+        'vm': (lambda: InputReader(itertools.repeat('3\n')), lambda reader: execute(code, reader, len)),
+        'python_run': (lambda: InputReader(itertools.repeat('3\n')),
+                       lambda reader: execute_python(python_code, reader, len)),
+        **rechecks,
+    }
+
+
+def measure(prepare: Callable, function: Callable, repeat: int, tokens: int) -> dict:
+    """Mede uma fase: as latências, a vazão pela latência mediana e o pico de memória alocada."""
+    samples = []
+    for _ in range(repeat):
+        argument = prepare()
+        started_at = time.perf_counter()
+        function(argument)
+        samples.append(time.perf_counter() - started_at)
+    samples.sort()
+
+    # medir a memória à parte, já que o rastreamento torna as alocações mais lentas
+    argument = prepare()
+    tracemalloc.start()
+    try:
+        function(argument)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    median = percentile(samples, 0.5)
+    return {
+        'samples': len(samples),
+        'min': samples[0],
+        'mean': sum(samples) / len(samples),
+        'p50': median,
+        'p90': percentile(samples, 0.9),
+        'p99': percentile(samples, 0.99),
+        'max': samples[-1],
+        'tokens_per_second': tokens / max(median, 1e-9),
+        'peak_memory': peak_memory,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Compara os resultados com os anteriores, retornando as regressões encontradas."""
+    previous = {(entry['size'], phase): measurement
+                for entry in baseline['results'] for phase, measurement in entry['phases'].items()}
+    regressions = []
+    for entry in results['results']:
+        for phase, measurement in entry['phases'].items():
+            if (old := previous.get((entry['size'], phase))) is None:
+                continue
+            for metric in ('p50', 'peak_memory'):
+                if old[metric] and measurement[metric] > old[metric] * (1 + threshold):
+                    regressions.append(
+                        f'{phase} com {entry["size"]} comandos: {metric} {measurement[metric]:.6g} '
+                        f'(antes {old[metric]:.6g}, {measurement[metric] / old[metric] - 1:+.1%})')
+    return regressions
+
+
+args = parser.parse_args()
+phase_names = [name for phase in args.phases if not args.errors or phase in INVALID_PHASES
+               for name in ([f'{phase}/{jobs}' for jobs in args.parallel_jobs]
+                            if phase == 'describe_parallel' else [phase])]
+# os processos da análise em paralelo são iniciados uma única vez, fora das medições
+executors = ({jobs: ProcessPoolExecutor(jobs) for jobs in args.parallel_jobs}
+             if 'describe_parallel' in args.phases else {})
+results = {
+    'environment': {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'compiler_version': compiler_version(),
+    },
+    'parameters': {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+    'results': [],
+}
+
+for size in args.sizes:
+    text = generate_program(args.declarations, size, args.depth, args.expression_length, args.comment_density,
+                            args.string_density, args.errors, args.loop_iterations, args.seed)
+    phase_functions = phases(text, args.errors > 0, executors)
+    token_count = len(describe(Source(text), None, Diagnostics()))
+    entry = {'size': size, 'lines': text.count('\n'), 'characters': len(text), 'tokens': token_count, 'phases': {}}
+    for phase in phase_names:
+        measurement = measure(*phase_functions[phase], args.repeat, token_count)
+        # a aceleração da análise em paralelo em relação à análise sequencial
+        if phase.startswith('describe_parallel/') and 'describe' in entry['phases']:
+            measurement['speedup'] = entry['phases']['describe']['p50'] / max(measurement['p50'], 1e-9)
+        entry['phases'][phase] = measurement
+        print(f'{phase:>20} {size:>8} comandos {token_count:>9} tokens: '
+              f'p50 {measurement["p50"] * 1000:10.3f}ms  p90 {measurement["p90"] * 1000:10.3f}ms  '
+              f'p99 {measurement["p99"] * 1000:10.3f}ms  {measurement["tokens_per_second"]:12.0f} tokens/s  '
+              f'{measurement["peak_memory"] / 1024:10.1f}KiB'
+              + (f'  {measurement["speedup"]:5.2f}x' if 'speedup' in measurement else ''))
+    results['results'].append(entry)
+
+for executor in executors.values():
+    executor.shutdown()
+
+if args.output is not None:
+    args.output.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+if args.baseline is not None:
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for regression in regressions:
+        print(f'❌ regressão: {regression}')
+    if regressions:
+        sys.exit(1)
+    print(f'✔ nenhuma regressão acima de {args.threshold:.0%} em relação a {args.baseline}')
@@ -1,24 +1,351 @@
 import argparse
+import glob
+import subprocess
+import sys
+import time
 from pathlib import Path
 
-from unisul_compiler.lexer import describe
-from unisul_compiler.parser import parse
+from unisul_compiler.artifact import ARTIFACT_SUFFIX, Artifact, InvalidArtifact, save_artifact
+from unisul_compiler.batch import check_files, expand_paths, format_json, format_result, format_summary
+from unisul_compiler.bytecode import compile_program
+from unisul_compiler.cbackend import UnsupportedProgram, build_c, emit_c
+from unisul_compiler.cfg import uninitialized_reads
+from unisul_compiler.cache import CACHE_DIR, CACHE_MAX_SIZE, CompileCache, read_source
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError, ATooManyErrors
+from unisul_compiler.lexer import CHUNK_SIZE, PARALLEL_MIN_SIZE, describe, describe_parallel, describe_stream
+from unisul_compiler.optimizer import optimize
+from unisul_compiler.parser import GROUPINGS
+from unisul_compiler.profiler import PROFILE_FORMATS, Profiler
+from unisul_compiler.pybackend import compile_python, execute_python
+from unisul_compiler.reporter import REPORTERS
+from unisul_compiler.runtime import InputReader
+from unisul_compiler.sandbox import Limits, Sandbox
+from unisul_compiler.server import serve_stdio, serve_unix
+from unisul_compiler.source import BytesSource, Source
+from unisul_compiler.stats import StatsReporter
+from unisul_compiler.table_parser import PARSERS
+from unisul_compiler.vectorized import numpy, read_input_matrix, run_many
+from unisul_compiler.vm import execute
 
 # CLI
 parser = argparse.ArgumentParser(description='''
-Compilador da linguagem "A" (sem geração de código, apenas relatório).
+Compilador da linguagem "A" (relatório da análise e, opcionalmente, execução do programa).
 ''')
-parser.add_argument('source_file_path', help='caminho para o arquivo de texto (código-fonte)')
+parser.add_argument('source_file_path', nargs='*',
+                    help='caminho para o arquivo de texto (código-fonte); com vários arquivos, '
+                         'diretórios ou padrões glob, analisa todos em lote')
+parser.add_argument('--stream', action='store_true',
+                    help='analisa o código-fonte em trechos, sem carregá-lo inteiro na memória; sem --run, '
+                         '--warnings, --optimize e --emit-c, apenas verifica os comandos, sem guardar a árvore')
+parser.add_argument('--mmap', action='store_true',
+                    help='analisa o arquivo mapeado na memória como bytes, sem copiá-lo nem decodificá-lo, '
+                         'com os identificadores e números restritos aos caracteres ASCII da especificação')
+parser.add_argument('--parallel-lex', action='store_true',
+                    help=f'analisa lexicamente o código-fonte dividido em trechos, terminados em quebras de linha, '
+                         f'distribuídos entre --jobs processos (a partir de {PARALLEL_MIN_SIZE // (1024 * 1024)} MiB)')
+parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                    help=f'quantidade de caracteres lidos por trecho com --stream (padrão: {CHUNK_SIZE})')
+parser.add_argument('--report', choices=REPORTERS,
+                    help='nível do relatório: silent, summary, verbose ou ndjson '
+                         '(padrão: verbose, ou silent com --run)')
+parser.add_argument('--grouping', choices=GROUPINGS, default='precedence',
+                    help='agrupamento das expressões: precedence (* e / antes de + e -, E antes de OU, '
+                         'à esquerda) ou legacy (sem precedência, à direita, como nas versões anteriores) '
+                         '(padrão: precedence)')
+parser.add_argument('--parser', choices=PARSERS, default='descent',
+                    help='analisador sintático: descent (descendente recursivo) ou table (tabela LL(1) gerada '
+                         'a partir da gramática) (padrão: descent)')
+parser.add_argument('-O', '--optimize', action='store_true',
+                    help='dobra as constantes, simplifica as identidades, remove os desvios de condição constante '
+                         'e as atribuições sem uso e move as expressões invariantes para fora dos laços, '
+                         'relatando os nós e operações removidos')
+parser.add_argument('-W', '--warnings', action='store_true',
+                    help='avisa das variáveis que podem ser lidas antes de "LER" ou "ATRIBUIR"')
+parser.add_argument('--emit-artifact', metavar='ARTIFACT_PATH',
+                    help=f'grava a análise (tokens, símbolos, literais e árvore sintática) em um artefato binário '
+                         f'({ARTIFACT_SUFFIX}), carregado sem cópia quando informado no lugar do código-fonte')
+parser.add_argument('--inspect-artifact', action='store_true',
+                    help=f'imprime o cabeçalho e o conteúdo de um artefato ({ARTIFACT_SUFFIX})')
+parser.add_argument('--emit-c', metavar='C_PATH',
+                    help='grava a tradução do programa para C99, com INT como long long e REAL como double')
+parser.add_argument('--build', action='store_true',
+                    help='compila o código de --emit-c com o compilador C do sistema (CC, ou cc) para um executável '
+                         'de mesmo nome sem a extensão, guardado no cache pelo resumo do código')
+parser.add_argument('--run', action='store_true',
+                    help='executa o programa após a análise, lendo os valores de "LER" da entrada padrão')
+parser.add_argument('--backend', choices=['vm', 'python'], default='vm',
+                    help='execução com --run: vm (máquina virtual) ou python (função Python compilada) '
+                         '(padrão: vm)')
+parser.add_argument('--input', metavar='INPUT_FILE_PATH',
+                    help='arquivo com os valores de "LER" para --run, no lugar da entrada padrão')
+parser.add_argument('--input-matrix', metavar='MATRIX_FILE_PATH',
+                    help='arquivo CSV (ou .npy) com os valores de "LER" de uma execução por linha: com --run, '
+                         'executa o programa uma vez por linha, todas juntas sobre vetores quando o NumPy '
+                         'está instalado')
+parser.add_argument('--max-operations', type=int, metavar='N',
+                    help='interrompe a execução com --run após N instruções da máquina virtual')
+parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                    help='interrompe a execução com --run após o tempo informado, em segundos')
+parser.add_argument('--max-output', type=int, metavar='BYTES',
+                    help='interrompe a execução com --run antes de "IMPRIMIR" exceder a quantidade de bytes')
+parser.add_argument('--max-reads', type=int, metavar='N',
+                    help='interrompe a execução com --run antes de "LER" mais de N valores')
+parser.add_argument('--profile', choices=PROFILE_FORMATS,
+                    help='executa com --run medindo as execuções, as operações e o tempo (amostrado) de cada '
+                         'comando e de cada linha, e escreve o perfil em texto, JSON ou pilhas agrupadas '
+                         '(collapsed) para ferramentas de flame graph')
+parser.add_argument('--profile-output', metavar='PROFILE_PATH',
+                    help='arquivo onde o perfil de --profile é gravado, no lugar da saída de erros')
+parser.add_argument('--stats', action='store_true',
+                    help='escreve na saída de erros um objeto JSON com o tempo de cada fase, a quantidade '
+                         'de tokens por tipo, os retrocessos do analisador léxico, as chamadas de expect, '
+                         'a quantidade de símbolos e o pico de memória')
+parser.add_argument('--server', action='store_true',
+                    help='mantém o compilador carregado, atendendo requisições em JSON, uma por linha, '
+                         'da entrada padrão (ou de --socket) em --jobs processos')
+parser.add_argument('--socket', metavar='SOCKET_PATH',
+                    help='caminho do socket Unix onde o servidor atende as conexões, no lugar da entrada padrão')
+parser.add_argument('--jobs', type=int,
+                    help='quantidade de processos da análise em lote, do servidor ou de --parallel-lex '
+                         '(padrão: quantidade de processadores)')
+parser.add_argument('--batch-report', choices=['text', 'json'], default='text',
+                    help='formato do relatório agregado da análise em lote (padrão: text)')
+parser.add_argument('--max-errors', type=int, default=20,
+                    help='quantidade de erros relatados antes de interromper a análise (padrão: 20)')
+parser.add_argument('--no-cache', action='store_true',
+                    help='não consulta nem alimenta o cache da análise')
+parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR,
+                    help=f'diretório do cache da análise (padrão: {CACHE_DIR})')
+parser.add_argument('--cache-max-size', type=int, default=CACHE_MAX_SIZE // (1024 * 1024), metavar='MB',
+                    help=f'tamanho máximo do diretório do cache, em MB (padrão: {CACHE_MAX_SIZE // (1024 * 1024)})')
 args = parser.parse_args()
+limits = Limits(args.max_operations, args.timeout, args.max_output, args.max_reads)
+cache_dir = None if args.no_cache else args.cache_dir
+cache_max_size = args.cache_max_size * 1024 * 1024
 
-source_file_path = Path(args.source_file_path)
+# atender requisições até o fim da entrada padrão, ou até ser interrompido
+if args.server:
+    if args.source_file_path:
+        parser.error('--server não aceita arquivos')
+    if args.socket is not None:
+        serve_unix(args.socket, args.jobs)
+    else:
+        serve_stdio(args.jobs)
+    sys.exit(0)
+if not args.source_file_path:
+    parser.error('informe o caminho de um arquivo')
+if args.mmap and args.stream:
+    parser.error('--mmap e --stream são excludentes')
+if args.parallel_lex and args.stream:
+    parser.error('--parallel-lex e --stream são excludentes')
+if args.build and args.emit_c is None:
+    parser.error('--build requer --emit-c')
+if args.emit_artifact is not None and (args.stream or args.mmap):
+    parser.error('--emit-artifact não é usado com --stream nem com --mmap')
+if limits != Limits():
+    if not args.run:
+        parser.error('os limites da execução requerem --run')
+    if args.backend != 'vm' or args.input_matrix is not None:
+        parser.error('os limites da execução valem apenas com --backend vm, sem --input-matrix')
+if args.profile_output is not None and args.profile is None:
+    parser.error('--profile-output requer --profile')
+if args.profile is not None:
+    if not args.run:
+        parser.error('--profile requer --run')
+    if args.backend != 'vm' or args.input_matrix is not None or limits != Limits():
+        parser.error('--profile executa apenas com --backend vm, sem --input-matrix e sem limites')
+if args.input_matrix is not None:
+    if not args.run:
+        parser.error('--input-matrix requer --run')
+    if args.input is not None:
+        parser.error('--input e --input-matrix são excludentes')
+    if args.backend != 'vm':
+        parser.error('--input-matrix executa apenas com --backend vm')
+    if args.input_matrix.endswith('.npy') and numpy is None:
+        parser.error('--input-matrix com um arquivo .npy requer o NumPy')
 
-print(f'Analisando o arquivo "{source_file_path}"...')
+# analisar em lote vários arquivos, diretórios ou padrões glob
+if (len(args.source_file_path) > 1
+        or glob.has_magic(args.source_file_path[0]) or Path(args.source_file_path[0]).is_dir()):
+    if args.run:
+        parser.error('--run aceita apenas um arquivo')
+    if args.stats:
+        parser.error('--stats aceita apenas um arquivo')
+    if args.mmap:
+        parser.error('--mmap aceita apenas um arquivo')
+    if args.parallel_lex:
+        parser.error('--parallel-lex aceita apenas um arquivo')
+    if args.emit_artifact is not None or args.inspect_artifact:
+        parser.error('os artefatos são gravados e inspecionados um arquivo por vez')
+    if args.emit_c is not None:
+        parser.error('--emit-c aceita apenas um arquivo')
+    started_at = time.perf_counter()
+    results = []
+    for result in check_files(expand_paths(args.source_file_path), args.jobs, args.stream, args.chunk_size,
+                              cache_dir, cache_max_size, args.max_errors, args.grouping, args.parser):
+        results.append(result)
+        if args.batch_report == 'text':
+            print(format_result(result))
+    elapsed = time.perf_counter() - started_at
+    print(format_summary(results, elapsed) if args.batch_report == 'text' else format_json(results, elapsed))
+    sys.exit(0 if all(result.valid for result in results) else 1)
 
-with open(source_file_path) as source_file:
-    print('\nAnálise léxica:')
-    tokens = describe(source_file.read())
+source_file_path = Path(args.source_file_path[0])
+is_artifact = source_file_path.suffix == ARTIFACT_SUFFIX
+if args.inspect_artifact and not is_artifact:
+    parser.error(f'--inspect-artifact requer um arquivo {ARTIFACT_SUFFIX}')
+if is_artifact and (args.stream or args.mmap or args.parallel_lex or args.emit_artifact is not None):
+    parser.error('um artefato não é analisado novamente')
+if is_artifact:
+    try:
+        artifact = Artifact.load(source_file_path)
+        if args.inspect_artifact:
+            print(artifact.info())
+            sys.exit(0)
+        # decodificar aqui a árvore sintática, relatando um artefato inválido como os demais
+        artifact_program = artifact.program
+    except (OSError, InvalidArtifact) as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    if artifact_program is None:
+        print(f'{source_file_path}: o artefato não guarda a árvore sintática', file=sys.stderr)
+        sys.exit(1)
+reporter = REPORTERS[args.report or ('silent' if args.run else 'verbose')]()
+if args.stats:
+    reporter = StatsReporter(reporter, lambda stats: print(stats.to_json(), file=sys.stderr))
+# no relatório em NDJSON, a saída do programa é um evento, e não texto entre as linhas JSON
+write = reporter.printed if reporter.prints else sys.stdout.write
+parse = PARSERS[args.parser]
 
+reporter.start(str(source_file_path))
 
-print('\nAnálise sintática e semântica:')
-parse(tokens)
+
+def fail(*errors):
+    """Relata os erros e encerra o compilador."""
+    for error in errors:
+        reporter.error(error)
+    reporter.finish()
+    sys.exit(1)
+
+
+diagnostics = Diagnostics(args.max_errors)
+try:
+    if is_artifact:
+        reporter.phase('Carregamento do artefato')
+        program = artifact_program
+        reporter.described(len(artifact.tokens))
+        reporter.parsed(len(program.symbols))
+    # o cache não guarda os eventos por token, nem é consultado na análise em trechos ou em bytes
+    elif (cache_dir is not None and not args.stream and not args.mmap and not args.parallel_lex
+          and args.emit_artifact is None and not reporter.traces):
+        program = CompileCache(cache_dir, cache_max_size).analyze(
+            source_file_path, reporter, diagnostics, args.grouping, args.parser)
+    elif args.stream:
+        with open(source_file_path) as source_file:
+            reporter.phase('Análise léxica, sintática e semântica')
+            # a árvore dos comandos é guardada apenas quando uma etapa seguinte a usa
+            check_only = not (args.run or args.warnings or args.optimize or args.emit_c is not None)
+            program = parse(describe_stream(source_file, args.chunk_size, reporter, diagnostics),
+                            reporter, diagnostics, args.grouping, check_only=check_only)
+    else:
+        if args.mmap:
+            source = BytesSource.map(source_file_path)
+        else:
+            source_data, source_text = read_source(source_file_path)
+            source = Source(source_text, str(source_file_path))
+        reporter.phase('Análise léxica')
+        if args.parallel_lex:
+            tokens = describe_parallel(source, reporter, diagnostics, args.jobs)
+        else:
+            tokens = describe(source, reporter, diagnostics)
+
+        reporter.phase('Análise sintática e semântica')
+        program = parse(tokens, reporter, diagnostics, args.grouping)
+except ATooManyErrors as error:
+    fail(*diagnostics.sorted(), error)
+if diagnostics.errors:
+    fail(*diagnostics.sorted())
+
+try:
+    if args.warnings:
+        reporter.phase('Análise de fluxo')
+        for warning in uninitialized_reads(program):
+            reporter.warned(warning)
+
+    if args.optimize:
+        reporter.phase('Otimização')
+        reporter.optimized(optimize(program))
+
+    if args.emit_artifact is not None:
+        reporter.phase('Gravação do artefato')
+        save_artifact(args.emit_artifact, tokens, program, source_data)
+
+    if args.emit_c is not None:
+        reporter.phase('Geração de código C')
+        c_code = emit_c(program)
+        try:
+            Path(args.emit_c).write_text(c_code)
+            if args.build:
+                reporter.phase('Compilação do código C')
+                build_c(c_code, cache_dir / 'c' if cache_dir is not None else None,
+                        output=Path(args.emit_c).with_suffix(''))
+        except subprocess.CalledProcessError as error:
+            # as mensagens do compilador C precedem o erro
+            print(error.stderr, end='', file=sys.stderr)
+            fail(error)
+        except OSError as error:
+            fail(error)
+
+    if args.run and args.input_matrix is not None:
+        reporter.phase('Geração de código')
+        code = compile_program(program)
+        reporter.phase('Execução')
+        if args.input_matrix.endswith('.npy'):
+            inputs = numpy.load(args.input_matrix)
+        else:
+            with open(args.input_matrix, newline='') as input_file:
+                inputs = read_input_matrix(input_file)
+        results = run_many(program, inputs, code)
+        for number, result in enumerate(results, 1):
+            write(f'--- execução {number} ---\n{result.output}')
+            if result.error is not None:
+                write(f'{result.error}\n')
+        reporter.finish()
+        sys.exit(0 if all(result.error is None for result in results) else 1)
+    elif args.run and args.profile is not None:
+        reporter.phase('Geração de código')
+        profiler = Profiler(program)
+        reporter.phase('Execução')
+        try:
+            if args.input is not None:
+                with open(args.input) as input_file:
+                    profiler.execute(InputReader(input_file), write)
+            else:
+                profiler.execute(InputReader(sys.stdin), write)
+        finally:
+            # o perfil inclui uma execução interrompida por um erro
+            sys.stdout.flush()
+            profile = profiler.profile().format(args.profile)
+            if args.profile_output is not None:
+                Path(args.profile_output).write_text(profile + '\n')
+            else:
+                print(profile, file=sys.stderr)
+    elif args.run:
+        reporter.phase('Geração de código')
+        if args.backend == 'python':
+            code, execute_code = compile_python(program), execute_python
+        elif limits != Limits():
+            code, execute_code = compile_program(program), Sandbox(limits).execute
+        else:
+            code, execute_code = compile_program(program), execute
+        reporter.phase('Execução')
+        if args.input is not None:
+            with open(args.input) as input_file:
+                execute_code(code, InputReader(input_file), write)
+        else:
+            execute_code(code, InputReader(sys.stdin), write)
+except (ARuntimeError, UnsupportedProgram) as error:
+    fail(error)
+
+reporter.finish()
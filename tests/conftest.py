@@ -0,0 +1,89 @@
+import random
+from typing import List, Tuple
+
+import pytest
+
+# Quantidade de programas aleatórios comparados pelos testes diferenciais
+RANDOM_PROGRAMS = 150
+
+_INTS = ['i1', 'i2', 'i3']
+_REALS = ['r1', 'r2']
+
+
+class _RandomProgram:
+    """Gera um programa válido que sempre termina, com leituras, divisões que podem ser
+    por zero, condições compostas e laços aninhados contados por variáveis próprias."""
+
+    def __init__(self, seed: int):
+        self.random = random.Random(seed)
+        self.loops = 0
+
+    def expression(self, kind: str, depth: int = 0) -> Tuple[str, str]:
+        """Retorna o texto e o tipo (``INT`` ou ``REAL``) de uma expressão aritmética."""
+        choice = self.random
+        if depth > 2 or choice.random() < 0.35:
+            if kind == 'INT' or choice.random() < 0.4:
+                return choice.choice(_INTS + [str(choice.randint(-3, 5))]), 'INT'
+            return choice.choice(_REALS + ['1.5', '0.0', '-0.5']), 'REAL'
+        operator = choice.choice('+-*' if kind == 'INT' else '+-*/')
+        left, left_kind = self.expression(kind, depth + 1)
+        if operator == '/' and choice.random() < 0.7:
+            # a maioria das divisões é por uma constante diferente de zero
+            right = choice.choice(['2', '4', '1.5', '-0.5'])
+            right_kind = 'REAL' if '.' in right else 'INT'
+        else:
+            right, right_kind = self.expression(kind, depth + 1)
+        text = f'{left} {operator} {right}'
+        if choice.random() < 0.5:
+            text = f'({text})'
+        result_kind = 'REAL' if 'REAL' in (left_kind, right_kind) or operator == '/' else 'INT'
+        return text, result_kind
+
+    def real_expression(self) -> str:
+        text, kind = self.expression('REAL')
+        return text if kind == 'REAL' else f'{text} * 1.0'
+
+    def condition(self) -> str:
+        choice = self.random
+        text = (f'{self.expression("REAL", 1)[0]} {choice.choice(["<", ">", "=", "<>", "<=", ">="])} '
+                f'{self.expression("REAL", 1)[0]}')
+        if choice.random() < 0.3:
+            text += f' {choice.choice(["E", "OU"])} {self.condition()}'
+        return text
+
+    def command(self, depth: int = 0) -> str:
+        choice = self.random
+        draw = choice.random()
+        if draw < 0.15:
+            return f'ATRIBUIR {self.expression("INT")[0]} A {choice.choice(_INTS)}'
+        if draw < 0.3:
+            return f'ATRIBUIR {self.real_expression()} A {choice.choice(_REALS)}'
+        if draw < 0.4:
+            return f'LER {choice.choice(_INTS + _REALS)}'
+        if draw < 0.55:
+            return f'IMPRIMIR {choice.choice(_INTS + _REALS)}'
+        if draw < 0.6 or depth > 2:
+            return "IMPRIMIR 'ok'"
+        if draw < 0.75:
+            return f'SE {self.condition()} ENTAO {self.command(depth + 1)}'
+        if draw < 0.87:
+            self.loops += 1
+            counter = f'c{self.loops}'
+            body = ' '.join(self.command(depth + 1) for _ in range(choice.randint(0, 3)))
+            return (f'ATRIBUIR 0 A {counter} ENQUANTO {counter} < {choice.randint(0, 4)} '
+                    f'INICIO {body} ATRIBUIR {counter} + 1 A {counter} FIM')
+        return f'INICIO {" ".join(self.command(depth + 1) for _ in range(choice.randint(0, 3)))} FIM'
+
+    def program(self) -> Tuple[str, str]:
+        """Retorna o código-fonte e os valores de entrada do programa."""
+        commands = '\n'.join(self.command() for _ in range(self.random.randint(1, 8)))
+        declarations = '\n'.join([*(f'{name} : INT' for name in _INTS), *(f'{name} : REAL' for name in _REALS),
+                                  *(f'c{loop} : INT' for loop in range(1, self.loops + 1))])
+        stdin = ' '.join(str(self.random.randint(-3, 3)) for _ in range(self.random.randint(0, 12)))
+        return f':DECLARACOES\n{declarations}\n:ALGORITMO\n{commands}\n', stdin
+
+
+@pytest.fixture(scope='session')
+def programs() -> List[Tuple[str, str]]:
+    """Programas aleatórios válidos, com os seus valores de entrada, para os testes diferenciais."""
+    return [_RandomProgram(seed).program() for seed in range(RANDOM_PROGRAMS)]
@@ -0,0 +1,64 @@
+import random
+import struct
+import zlib
+
+import pytest
+
+from unisul_compiler.artifact import _HEADER, Artifact, InvalidArtifact, dump_artifact
+from unisul_compiler.bytecode import compile_program
+from unisul_compiler.generator import generate_program
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.source import Source
+from unisul_compiler.vm import run
+
+
+def _artifact_data(seed: int):
+    text = generate_program(commands=30, seed=seed)
+    tokens = describe(Source(text, f'programa{seed}.txt'))
+    program = parse(tokens)
+    return dump_artifact(tokens, program, text.encode()), program
+
+
+def _reseal(data: bytes) -> bytes:
+    """Recalcula o CRC-32 do cabeçalho, para que a corrupção chegue à decodificação."""
+    data = bytearray(data)
+    struct.pack_into('<I', data, _HEADER.size - 4, zlib.crc32(bytes(data[_HEADER.size:])))
+    return bytes(data)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_round_trip(seed):
+    data, program = _artifact_data(seed)
+    artifact = Artifact(data)
+    stdin = ' '.join(map(str, range(1, 200)))
+    assert run(artifact.program, stdin) == run(program, stdin)
+
+
+def test_truncated_and_flipped_artifacts_are_rejected():
+    data, _ = _artifact_data(0)
+    rng = random.Random(0)
+    for _ in range(500):
+        with pytest.raises(InvalidArtifact):
+            Artifact(data[:rng.randrange(len(data))])
+        flipped = bytearray(data)
+        flipped[rng.randrange(_HEADER.size, len(data))] ^= 1 << rng.randrange(8)
+        with pytest.raises(InvalidArtifact):
+            Artifact(bytes(flipped))
+
+
+def test_corrupted_contents_raise_only_invalid_artifact():
+    data, _ = _artifact_data(1)
+    rng = random.Random(1)
+    for _ in range(2000):
+        corrupted = bytearray(data)
+        for _ in range(rng.randint(1, 4)):
+            corrupted[rng.randrange(_HEADER.size, len(data))] ^= 1 << rng.randrange(8)
+        try:
+            artifact = Artifact(_reseal(bytes(corrupted)))
+            artifact.info()
+            artifact.literals
+            list(artifact.tokens)
+            compile_program(artifact.program)
+        except InvalidArtifact:
+            pass
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from unisul_compiler import batch
+from unisul_compiler.batch import check_files, expand_paths, format_json, format_result
+
+_PROGRAM = ':DECLARACOES\nx : INT\n:ALGORITMO\nLER x\nIMPRIMIR x\n'
+
+
+@pytest.mark.parametrize('error', [RecursionError('maximum recursion depth exceeded'), MemoryError(), OverflowError()])
+def test_unexpected_failure_invalidates_only_its_file(tmp_path, monkeypatch, error):
+    paths = [tmp_path / 'falha.txt', tmp_path / 'valido.txt']
+    for path in paths:
+        path.write_text(_PROGRAM)
+    describe = batch.describe
+
+    def failing_describe(source, *arguments):
+        if source.name.endswith('falha.txt'):
+            raise error
+        return describe(source, *arguments)
+
+    monkeypatch.setattr(batch, 'describe', failing_describe)
+    failed, valid = check_files(paths, jobs=1)
+    assert (failed.valid, failed.error_type, failed.error_count) == (False, type(error).__name__, 1)
+    assert failed.error == (str(error) or type(error).__name__)
+    assert valid.valid and valid.tokens == 11
+
+
+def test_batch_checks_directories_in_order_with_processes_and_cache(tmp_path):
+    directory = tmp_path / 'programas'
+    (directory / 'sub').mkdir(parents=True)
+    (directory / 'a.txt').write_text(_PROGRAM)
+    (directory / 'b.txt').write_text(_PROGRAM.replace('LER x', 'LER').replace('IMPRIMIR x', 'IMPRIMIR y'))
+    (directory / 'sub' / 'c.txt').write_text(_PROGRAM.replace('x', 'z'))
+    paths = expand_paths([str(directory), str(tmp_path / 'ausente.txt')])
+    assert [path.name for path in paths] == ['a.txt', 'b.txt', 'c.txt', 'ausente.txt']
+
+    results = list(check_files(paths, jobs=2))
+    assert [(result.valid, result.error_type, result.error_count) for result in results] == [
+        (True, None, 0), (False, 'ASyntaxError', 2), (True, None, 0), (False, 'FileNotFoundError', 1)]
+    assert format_result(results[1]).endswith('(e mais 1 erros)')
+    summary = json.loads(format_json(results, 1.0))['summary']
+    assert (summary['files'], summary['valid'], summary['invalid']) == (4, 2, 2)
+
+    cache_dir = tmp_path / 'cache'
+    for hit in (False, True):
+        results = list(check_files(paths[:3], jobs=1, cache_dir=cache_dir))
+        assert [result.cached for result in results] == [hit] * 3
+        assert [result.valid for result in results] == [True, False, True]
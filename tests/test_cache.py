@@ -0,0 +1,78 @@
+import pytest
+
+from unisul_compiler.cache import CompileCache
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ASemanticError
+from unisul_compiler.vm import run
+
+_PROGRAM = ':DECLARACOES\nx : INT\nr : REAL\n:ALGORITMO\nLER x\nATRIBUIR 2 * x + 3 A x\nIMPRIMIR x\n'
+_INVALID = ':DECLARACOES\nx : INT\n:ALGORITMO\nATRIBUIR 1.5 A x\nIMPRIMIR y\n'
+
+
+def test_hit_returns_the_same_program_as_the_analysis(tmp_path):
+    path = tmp_path / 'programa.txt'
+    path.write_text(_PROGRAM)
+    first = CompileCache(tmp_path / 'cache').analyze(path)
+    cache = CompileCache(tmp_path / 'cache')
+    second = cache.analyze(path)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert repr(second) == repr(first)
+    assert run(second, '4') == run(first, '4') == '11\n'
+    # os nós continuam localizados no código-fonte
+    assert second.commands[1].expression.token.source.name == str(path)
+
+    # o agrupamento altera a árvore e, portanto, a chave
+    legacy = cache.analyze(path, grouping='legacy')
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert run(legacy, '4') == '14\n'
+
+
+def test_errors_are_cached_and_located_in_the_analyzed_file(tmp_path):
+    cache = CompileCache(tmp_path / 'cache')
+    paths = [tmp_path / 'a.txt', tmp_path / 'b.txt']
+    for path in paths:
+        path.write_text(_INVALID)
+        with pytest.raises(ASemanticError) as raised:
+            cache.analyze(path)
+        assert raised.value.location.name == str(path)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # os erros registrados são guardados em outra entrada
+    diagnostics = Diagnostics()
+    for _ in range(2):
+        diagnostics.errors.clear()
+        cache.analyze(paths[1], diagnostics=diagnostics)
+        assert [error.location.line for error in diagnostics.errors] == [4, 5]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_unreadable_entry_is_a_miss_and_is_replaced(tmp_path):
+    path = tmp_path / 'programa.txt'
+    path.write_text(_PROGRAM)
+    cache = CompileCache(tmp_path / 'cache')
+    cache.analyze(path)
+    [entry] = (tmp_path / 'cache').glob('*/*.pickle')
+    entry.write_bytes(b'corrompido')
+    assert run(cache.analyze(path), '1') == '5\n'
+    assert run(cache.analyze(path), '1') == '5\n'
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = CompileCache(tmp_path / 'cache')
+    path = tmp_path / 'programa.txt'
+    path.write_text(_PROGRAM)
+    cache.analyze(path)
+    [entry] = (tmp_path / 'cache').glob('*/*.pickle')
+
+    # espaço para pouco mais de duas entradas
+    cache = CompileCache(tmp_path / 'cache', max_size=entry.stat().st_size * 5 // 2)
+    for number in range(5, 9):
+        path.write_text(_PROGRAM.replace('2 *', f'{number} *'))
+        cache.analyze(path)
+    entries = list((tmp_path / 'cache').glob('*/*.pickle'))
+    assert len(entries) == 2
+    assert sum(entry.stat().st_size for entry in entries) <= cache.max_size
+    # a última entrada gravada permanece
+    assert run(cache.analyze(path), '1') == '11\n'
+    assert (cache.hits, cache.misses) == (1, 4)
@@ -0,0 +1,72 @@
+import io
+import random
+import shutil
+import subprocess
+
+import pytest
+
+from unisul_compiler.bytecode import compile_program
+from unisul_compiler.cbackend import build_c, emit_c
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.runtime import InputReader
+from unisul_compiler.source import Source
+from unisul_compiler.vm import execute
+
+# Erro do executável para um inteiro que a máquina virtual, sem limites, ainda representa
+_OVERFLOW = 'erro de execução, inteiro fora dos limites de 64 bits'
+
+
+@pytest.fixture(scope='module')
+def cache_dir(tmp_path_factory):
+    if shutil.which('cc') is None:
+        pytest.skip('compilador C indisponível')
+    return tmp_path_factory.mktemp('c')
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'nativo.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+def _outcomes(text: str, inputs, cache_dir):
+    """Executa o programa na máquina virtual e no executável com cada entrada, gerando
+    a saída e o erro de ambos."""
+    program = _parse(text)
+    code = compile_program(program)
+    executable = str(build_c(emit_c(program), cache_dir))
+    for stdin in inputs:
+        output = io.StringIO()
+        try:
+            execute(code, InputReader(stdin), output.write)
+            expected = output.getvalue(), None
+        except ARuntimeError as error:
+            expected = output.getvalue(), str(error)
+        result = subprocess.run([executable], input=stdin, capture_output=True, text=True)
+        assert result.returncode == (0 if result.stderr == '' else 1)
+        yield (result.stdout, result.stderr.strip() or None), expected
+
+
+def test_executables_behave_like_the_virtual_machine(programs, cache_dir):
+    # metade dos programas, para que o compilador C não demore
+    for seed, (text, stdin) in enumerate(programs[::2]):
+        choice = random.Random(seed)
+        inputs = [stdin, *(' '.join(choice.choice(['-2', '0', '3', '1.5']) for _ in range(choice.randint(0, 10)))
+                           for _ in range(2))]
+        for (output, error), expected in _outcomes(text, inputs, cache_dir):
+            if error is not None and error.endswith(_OVERFLOW):
+                assert expected[0].startswith(output), (text, inputs)
+            else:
+                assert (output, error) == expected, (text, inputs)
+
+
+def test_only_integers_beyond_64_bits_diverge(cache_dir):
+    text = (':DECLARACOES\nx : INT\nn : INT\n:ALGORITMO\nLER x\n'
+            'ENQUANTO n < 70 INICIO ATRIBUIR x * 2 A x ATRIBUIR n + 1 A n FIM\nIMPRIMIR x\n')
+    small, large = _outcomes(text, ['0', '1'], cache_dir)
+    assert small == (('0\n', None), ('0\n', None))
+    assert large == (('', f'nativo.txt:6:35: {_OVERFLOW}'), (f'{2 ** 70}\n', None))
@@ -0,0 +1,129 @@
+from unisul_compiler.cfg import (
+    build_cfg, constant_branches, dead_stores, evaluate_condition, evaluate_expression, uninitialized_reads,
+    variables_in)
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.runtime import InputReader, format_value
+from unisul_compiler.source import Source
+from unisul_compiler.syntax_tree import Assign, If, Print, Read, Variable, While
+from unisul_compiler.token import TokenKind
+from unisul_compiler.vm import run
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'fluxo.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+def test_unused_assignment_that_may_fail_is_not_a_dead_store():
+    program = _parse(':DECLARACOES\nx : INT\nr : REAL\n:ALGORITMO\nLER x\n'
+                     'ATRIBUIR x / 2 A r\nATRIBUIR x * 0.5 A r\nATRIBUIR 3 / 2 A r\nATRIBUIR x + 1 A x\n')
+    dead = dead_stores(build_cfg(program))
+    # a conversão de x para real pode falhar, mas não a de uma constante
+    assert sorted(command.expression.token.location.line for command in dead) == [8, 9]
+
+
+class _Values(dict):
+    """Valores das variáveis que registram os nomes lidos."""
+
+    def __getitem__(self, name):
+        self.reads.append(name)
+        return super().__getitem__(name)
+
+
+class _Trace:
+    """Executa um programa pela árvore, com as avaliações de ``cfg``, registrando as leituras
+    de variáveis ainda não atribuídas, as leituras de valores de atribuições consideradas
+    sem uso (exceto por outras atribuições sem uso, removidas com elas) e os resultados
+    das condições consideradas constantes."""
+
+    def __init__(self, program, stdin: str, dead, branches):
+        self.values = _Values((declaration.name, 0 if declaration.type == TokenKind.LITERAL_INT else 0.0)
+                              for declaration in program.declarations)
+        self.reader = InputReader(stdin)
+        self.dead = dead
+        self.branches = branches
+        self.output = []
+        # a atribuição que definiu o valor atual de cada variável
+        self.writers = {}
+        self.uninitialized = set()
+        self.dead_reads = []
+        self.wrong_branches = []
+        self.constant_conditions = 0
+        self.completed = True
+        try:
+            for command in program.commands:
+                self.execute(command)
+        except (ARuntimeError, ZeroDivisionError):
+            self.completed = False
+
+    def read(self, node, evaluate, command=None):
+        self.values.reads = []
+        result = evaluate(node, self.values)
+        for name in self.values.reads:
+            if name not in self.writers:
+                self.uninitialized.update((variable.name, variable.token.location) for variable in
+                                          ([node] if isinstance(node, Variable) else variables_in(node))
+                                          if variable.name == name)
+            elif self.writers[name] in self.dead and command not in self.dead:
+                self.dead_reads.append(self.writers[name])
+        if result is None:
+            raise ZeroDivisionError
+        return result
+
+    def condition(self, command) -> bool:
+        result = self.read(command.condition, evaluate_condition)
+        if command in self.branches:
+            self.constant_conditions += 1
+            if self.branches[command] != result:
+                self.wrong_branches.append(command)
+        return result
+
+    def execute(self, command):
+        if isinstance(command, Assign):
+            value = self.read(command.expression, evaluate_expression, command)
+            if command.target.type == TokenKind.LITERAL_FLOAT:
+                value = float(value)
+            self.values[command.target.name] = value
+            self.writers[command.target.name] = command
+        elif isinstance(command, Read):
+            self.values[command.target.name] = self.reader.read(command.target.type)
+            self.writers[command.target.name] = command
+        elif isinstance(command, Print):
+            if isinstance(command.value, Variable):
+                self.output.append(format_value(self.read(command.value, lambda node, values: values[node.name])))
+            else:
+                self.output.append(format_value(command.value.value))
+        elif isinstance(command, If):
+            if self.condition(command):
+                self.execute(command.command)
+        elif isinstance(command, While):
+            while self.condition(command):
+                self.execute(command.command)
+        else:
+            for inner in command.commands:
+                self.execute(inner)
+
+
+def test_analyses_agree_with_random_executions(programs):
+    warned = constant_conditions = 0
+    for text, stdin in programs:
+        program = _parse(text)
+        cfg = build_cfg(program)
+        warnings = {(warning.message.split('"')[1], warning.location) for warning in uninitialized_reads(program)}
+        trace = _Trace(program, stdin, dead_stores(cfg), constant_branches(cfg))
+        try:
+            assert ''.join(trace.output) == run(program, stdin) and trace.completed, text
+        except ARuntimeError:
+            assert not trace.completed, text
+        # toda leitura de uma variável ainda não atribuída é avisada
+        assert trace.uninitialized <= warnings, text
+        assert not trace.dead_reads, text
+        assert not trace.wrong_branches, text
+        warned += bool(trace.uninitialized)
+        constant_conditions += trace.constant_conditions
+    assert warned > len(programs) // 4 and constant_conditions > 0
@@ -0,0 +1,169 @@
+import io
+import shutil
+import subprocess
+
+import pytest
+
+from unisul_compiler.cbackend import build_c, emit_c
+from unisul_compiler.cfg import uninitialized_reads
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.lexer import describe
+from unisul_compiler.optimizer import optimize
+from unisul_compiler.parser import parse
+from unisul_compiler.profiler import Profiler
+from unisul_compiler.pybackend import MAX_LOOPS, compile_python, run_python
+from unisul_compiler.runtime import InputReader
+from unisul_compiler.source import Source
+from unisul_compiler.syntax_tree import Block, Number, NodeTransformer, NodeVisitor
+from unisul_compiler.vectorized import MIN_LANES, numpy, run_many
+from unisul_compiler.vm import run
+
+# Profundidade bem além do limite de recursão do Python (1000 quadros)
+DEPTH = 5000
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'profundo.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+def _long_expression() -> str:
+    """Uma atribuição com uma soma de ``DEPTH`` parcelas, aninhada à esquerda."""
+    return f':DECLARACOES\nx : INT\n:ALGORITMO\nATRIBUIR {" + ".join(["1"] * DEPTH)} A x\nIMPRIMIR x\n'
+
+
+def _deep_blocks() -> str:
+    """Um ``IMPRIMIR`` dentro de ``DEPTH`` blocos ``INICIO`` aninhados."""
+    return f':DECLARACOES\nx : INT\n:ALGORITMO\n{"INICIO " * DEPTH}IMPRIMIR x\n{"FIM " * DEPTH}\n'
+
+
+class _Counter(NodeVisitor):
+    def __init__(self):
+        self.numbers = 0
+
+    def visit_Number(self, node):
+        self.numbers += 1
+
+
+class _Doubler(NodeTransformer):
+    def visit_Number(self, node):
+        return Number(node.token, node.value * 2, node.type)
+
+    def visit_Block(self, node):
+        yield from self.generic_visit(node)
+        # remove os blocos vazios
+        return node if node.commands else None
+
+
+def test_visitors_traverse_deep_trees_without_recursion():
+    counter = _Counter()
+    counter.visit(_parse(_long_expression()))
+    assert counter.numbers == DEPTH
+
+    program = _parse(_long_expression())
+    _Doubler().visit(program)
+    counter = _Counter()
+    counter.visit(program)
+    assert counter.numbers == DEPTH
+    operation = program.commands[0].expression
+    while not isinstance(operation, Number):
+        operation = operation.left
+    assert operation.value == 2
+
+
+def test_transformer_removes_nodes_returning_none_at_any_depth():
+    program = _parse(_deep_blocks().replace('IMPRIMIR x', ''))
+    _Doubler().visit(program)
+    assert program.commands == []
+
+    program = _parse(_deep_blocks())
+    _Doubler().visit(program)
+    block, depth = program.commands[0], 1
+    while isinstance(block.commands[0], Block):
+        block, depth = block.commands[0], depth + 1
+    assert depth == DEPTH
+
+
+def test_virtual_machine_runs_deep_and_long_programs():
+    assert run(_parse(_long_expression())) == f'{DEPTH}\n'
+    assert run(_parse(_deep_blocks())) == '0\n'
+
+
+def test_profiler_attributes_instructions_of_deeply_nested_commands():
+    text = f':DECLARACOES\nx : INT\n:ALGORITMO\n{"SE x = 0 ENTAO " * DEPTH}IMPRIMIR x\n'
+    profiler = Profiler(_parse(text))
+    output = io.StringIO()
+    profiler.execute(InputReader(''), output.write)
+    profile = profiler.profile()
+    assert output.getvalue() == '0\n'
+    assert len(profile.commands) == DEPTH + 1
+    assert all(command.count == 1 for command in profile.commands)
+    assert [command.parent for command in profile.commands] == [None, *range(DEPTH)]
+
+
+def test_flow_analysis_of_deep_and_long_programs():
+    text = f':DECLARACOES\nx : INT\n:ALGORITMO\n{"SE x = 0 ENTAO ENQUANTO x < 1 " * DEPTH}LER x\n'
+    warnings = uninitialized_reads(_parse(text))
+    assert len(warnings) == 2 * DEPTH
+    assert uninitialized_reads(_parse(_long_expression())) == []
+
+
+def test_optimizer_handles_deep_and_long_programs():
+    for text, output in ((_long_expression(), f'{DEPTH}\n'), (_deep_blocks(), '0\n')):
+        program = _parse(text)
+        optimize(program)
+        assert run(program) == output
+
+    text = (f':DECLARACOES\nx : INT\ny : INT\n:ALGORITMO\nLER y\n{"ENQUANTO x < 1 " * DEPTH}'
+            f'ATRIBUIR y * 2 + y A x\nIMPRIMIR x\n')
+    program = _parse(text)
+    report = optimize(program)
+    assert report.hoisted == 1
+    assert run(program, '7') == '21\n'
+
+
+def test_python_backend_falls_back_to_the_virtual_machine():
+    for text, output in ((_long_expression(), f'{DEPTH}\n'), (_deep_blocks(), '0\n')):
+        code = compile_python(_parse(text))
+        assert code.fallback is not None
+        assert run_python(code) == output
+
+    # o compilador do Python aceita até 20 laços aninhados
+    for loops in (MAX_LOOPS, MAX_LOOPS + 1):
+        text = f':DECLARACOES\nx : INT\n:ALGORITMO\n{"ENQUANTO x < 1 " * loops}ATRIBUIR x + 1 A x\nIMPRIMIR x\n'
+        code = compile_python(_parse(text))
+        assert (code.fallback is None) == (loops == MAX_LOOPS)
+        assert run_python(code) == '1\n'
+
+
+def test_vectorized_runs_fall_back_to_the_virtual_machine():
+    if numpy is None:
+        pytest.skip('NumPy indisponível')
+    # uma leitura, dentro de DEPTH comandos SE, seguida de uma soma de DEPTH parcelas
+    text = (f':DECLARACOES\nx : INT\n:ALGORITMO\n{"SE x = 0 ENTAO " * DEPTH}LER x\n'
+            f'ATRIBUIR x + {" + ".join(["1"] * DEPTH)} A x\nIMPRIMIR x\n')
+    results = run_many(_parse(text), [[str(lane)] for lane in range(MIN_LANES)])
+    assert [result.output for result in results] == [f'{lane + DEPTH}\n' for lane in range(MIN_LANES)]
+    assert not any(result.vectorized for result in results)
+
+
+def test_c_backend_flattens_deep_and_long_programs(tmp_path):
+    if shutil.which('cc') is None:
+        pytest.skip('compilador C indisponível')
+    # tamanhos menores, para que o compilador C não demore
+    conditions = ' E '.join(['x < 5'] * 1000)
+    texts = [
+        f':DECLARACOES\nx : INT\n:ALGORITMO\n{"SE x = 0 ENTAO " * 3000}IMPRIMIR x\n',
+        f':DECLARACOES\nx : INT\n:ALGORITMO\n{"ENQUANTO x < 3 " * 300}ATRIBUIR x + 1 A x\nIMPRIMIR x\n',
+        f':DECLARACOES\nx : INT\n:ALGORITMO\nATRIBUIR {" + ".join(["1"] * 300)} A x\nIMPRIMIR x\n',
+        f":DECLARACOES\nx : INT\n:ALGORITMO\nSE {conditions} ENTAO IMPRIMIR 'sim'\n"
+        f"SE x > 0 OU {conditions} ENTAO IMPRIMIR 'nao'\n",
+    ]
+    for text in texts:
+        program = _parse(text)
+        code = emit_c(program)
+        assert max(len(line) - len(line.lstrip()) for line in code.splitlines()) < 1000
+        result = subprocess.run([str(build_c(code, tmp_path))], capture_output=True, text=True, check=True)
+        assert result.stdout == run(program)
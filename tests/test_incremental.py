@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.incremental import Document
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.source import Source
+
+# trechos inseridos pelas edições aleatórias, incluindo quebras de linha, comentários, aspas não fechadas
+# e sinais no início de uma linha, que dependem de a linha anterior terminar em um operando
+SNIPPETS = ['', ' ', '\n', ' INICIO ', ' FIM ', 'ATRIBUIR 1 A i1 ', '(', ')', ' + ', '-1', 'i2', "'", '%',
+            ' SE ', ' ENTAO ', ':', 'x : INT\n', '\nIMPRIMIR r1\n', '1.5', '\n-1', '\n+2 ', ' i3\n']
+
+
+def _analysis(text: str, grouping: str):
+    """Analisa o texto por inteiro, retornando a árvore, os erros na ordem do documento e os tokens."""
+    source = Source(text, 'documento.txt')
+    diagnostics = Diagnostics()
+    program = parse(describe(source, None, diagnostics), None, diagnostics, grouping)
+    errors = sorted(diagnostics.errors, key=lambda error: (error.location is None, error.location or ()))
+    tokens = [(token.kind, token.lexeme, token.location) for token in describe(source, None, Diagnostics())]
+    return repr(program), [str(error) for error in errors], tokens
+
+
+def _document(document: Document):
+    return (repr(document.program), [str(error) for error in document.diagnostics],
+            [(token.kind, token.lexeme, token.location) for token in document.tokens])
+
+
+@pytest.mark.parametrize('grouping', ['precedence', 'legacy'])
+def test_edits_analyze_random_programs_like_a_full_analysis(programs, grouping):
+    for seed, (text, _) in enumerate(programs):
+        choice = random.Random(seed)
+        document = Document(text, 'documento.txt', grouping)
+        for _ in range(8):
+            lines = document.text.split('\n')
+            start_line = choice.randrange(len(lines))
+            end_line = min(len(lines) - 1, start_line + choice.choice([0, 0, 0, 1, 2]))
+            start_column = choice.randint(1, len(lines[start_line]) + 1)
+            end_column = choice.randint(1, len(lines[end_line]) + 1)
+            if start_line == end_line and end_column < start_column:
+                start_column, end_column = end_column, start_column
+            piece = choice.choice(SNIPPETS) if choice.random() < 0.7 else choice.choice(text.split(' '))
+            errors = document.edit(start_line + 1, start_column, end_line + 1, end_column, piece)
+            assert [str(error) for error in errors] == [str(error) for error in document.diagnostics]
+            assert _document(document) == _analysis(document.text, grouping), document.text
+
+
+def test_edit_keeps_the_commands_it_does_not_affect():
+    document = Document(':DECLARACOES\nx : INT\n:ALGORITMO\nLER x\nINICIO\nIMPRIMIR x\nFIM\nIMPRIMIR x\n',
+                        'documento.txt')
+    first, block, last = document.program.commands
+    errors = document.edit(6, 10, 6, 11, 'y')
+    assert [str(error) for error in errors] == ['documento.txt:6:10: erro semântico, variável "y" não declarada']
+    commands = document.program.commands
+    assert commands[0] is first and commands[2] is last and commands[1] is not block
+
+    # uma linha nova nas declarações, sem mudar os símbolos, só muda as localizações
+    errors = document.edit(2, 1, 2, 1, '\n')
+    assert [str(error) for error in errors] == ['documento.txt:7:10: erro semântico, variável "y" não declarada']
+    assert all(new is old for new, old in zip(document.program.commands, commands))
@@ -0,0 +1,51 @@
+import shutil
+import subprocess
+
+import pytest
+
+from unisul_compiler.cbackend import build_c, emit_c
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.pybackend import run_python
+from unisul_compiler.source import Source
+from unisul_compiler.vm import run
+
+_PROGRAM = ':DECLARACOES\nn : INT\nx : REAL\n:ALGORITMO\nLER n\nIMPRIMIR n\nLER x\nIMPRIMIR x\n'
+
+INPUTS = [
+    '+12 -3.50', '-0 7', '007 +0.25',
+    '1_000 1', '٣ 1', '1.0 1', '1 1_0.5', '1 ١.5', '1 1e5', '1 inf', '1 nan', '1 5.', '1 .5', '1 0x10',
+]
+
+
+def _run(execute, stdin: str):
+    try:
+        return execute(stdin), None
+    except ARuntimeError as error:
+        return None, str(error)
+
+
+@pytest.fixture(scope='module')
+def program():
+    return parse(describe(Source(_PROGRAM, 'entrada.txt')))
+
+
+@pytest.fixture(scope='module')
+def executable(program, tmp_path_factory):
+    if shutil.which('cc') is None:
+        pytest.skip('compilador C indisponível')
+    return build_c(emit_c(program), tmp_path_factory.mktemp('c'))
+
+
+@pytest.mark.parametrize('stdin', INPUTS)
+def test_input_values_are_read_alike_by_every_backend(program, executable, stdin):
+    output, error = _run(lambda text: run(program, text), stdin)
+    assert _run(lambda text: run_python(program, text), stdin) == (output, error)
+    result = subprocess.run([str(executable)], input=stdin, capture_output=True, text=True)
+    if error is None:
+        assert (result.returncode, result.stdout) == (0, output)
+    else:
+        assert result.returncode == 1 and result.stderr.strip() == error
+    # apenas os números da linguagem, com dígitos ASCII, são aceitos
+    assert (error is None) == (stdin in INPUTS[:3])
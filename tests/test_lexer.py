@@ -0,0 +1,25 @@
+import io
+
+import pytest
+
+from unisul_compiler.lexer import describe, describe_stream
+from unisul_compiler.source import Source
+
+# tokens do analisador léxico original, em que os números usam qualquer dígito Unicode
+UNICODE_NUMBERS = [
+    ('ATRIBUIR +1.٣ A x', [('ATRIBUIR', 'ATRIBUIR'), ('LITERAL_FLOAT', '+1.٣'), ('A', 'A'), ('IDENTIFIER', 'x')]),
+    ('ATRIBUIR -٣.٣ A x', [('ATRIBUIR', 'ATRIBUIR'), ('LITERAL_FLOAT', '-٣.٣'), ('A', 'A'), ('IDENTIFIER', 'x')]),
+    ('ATRIBUIR +١٢.5 A x', [('ATRIBUIR', 'ATRIBUIR'), ('LITERAL_FLOAT', '+١٢.5'), ('A', 'A'), ('IDENTIFIER', 'x')]),
+    ('ATRIBUIR 2 +1.٣ A x', [('ATRIBUIR', 'ATRIBUIR'), ('LITERAL_INT', '2'), ('ADDITION', '+'),
+                             ('LITERAL_FLOAT', '1.٣'), ('A', 'A'), ('IDENTIFIER', 'x')]),
+    ('ATRIBUIR (-1.٣) A x', [('ATRIBUIR', 'ATRIBUIR'), ('LEFT_PARENTHESIS', '('), ('LITERAL_FLOAT', '-1.٣'),
+                             ('RIGHT_PARENTHESIS', ')'), ('A', 'A'), ('IDENTIFIER', 'x')]),
+]
+
+
+@pytest.mark.parametrize('text, expected', UNICODE_NUMBERS)
+def test_signed_number_with_unicode_digits_is_a_single_token(text, expected):
+    assert [(token.kind.name, token.lexeme) for token in describe(Source(text, 'a.txt'))] == expected
+    for chunk_size in range(1, 6):
+        tokens = describe_stream(io.StringIO(text), chunk_size)
+        assert [(token.kind.name, token.lexeme) for token in tokens] == expected
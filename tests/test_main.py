@@ -0,0 +1,19 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+MAIN = Path(__file__).resolve().parent.parent / 'main.py'
+
+_PROGRAM = ":DECLARACOES\nx : INT\nr : REAL\n:ALGORITMO\nLER x\nIMPRIMIR x\nIMPRIMIR 'fim'\nATRIBUIR 1 / 0 A r\n"
+
+
+def test_ndjson_report_wraps_the_program_output_in_events(tmp_path):
+    path = tmp_path / 'programa.txt'
+    path.write_text(_PROGRAM)
+    result = subprocess.run([sys.executable, str(MAIN), str(path), '--run', '--report', 'ndjson'],
+                            input='5', capture_output=True, text=True)
+    assert result.returncode == 1
+    events = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [event['text'] for event in events if event['event'] == 'output'] == ['5\n', 'fim\n']
+    assert [event['event'] for event in events][-4:] == ['output', 'output', 'error', 'finish']
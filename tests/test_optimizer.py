@@ -0,0 +1,45 @@
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.optimizer import optimize
+from unisul_compiler.parser import parse
+from unisul_compiler.source import Source
+from unisul_compiler.vm import run
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'otimizado.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+def test_conversion_that_may_fail_is_not_hoisted_out_of_a_loop():
+    # x chega a 2 ** 1100, além do maior real, mas o laço que o converte nunca executa
+    text = (':DECLARACOES\nx : INT\ni : INT\nr : REAL\n:ALGORITMO\nATRIBUIR 1 A x\n'
+            'ENQUANTO i < 1100 INICIO ATRIBUIR x * 2 A x ATRIBUIR i + 1 A i FIM\n'
+            'ENQUANTO i < 0 INICIO ATRIBUIR x * 1.5 A r ATRIBUIR i + 1 A i IMPRIMIR r FIM\n'
+            'IMPRIMIR i\n')
+    program = _parse(text)
+    report = optimize(program)
+    assert report.hoisted == 0
+    assert run(program) == run(_parse(text)) == '1100\n'
+
+
+def _outcome(execute):
+    """Retorna a saída de uma execução e o seu erro, ``None`` caso termine normalmente."""
+    try:
+        return execute(), None
+    except ARuntimeError as error:
+        return None, str(error)
+
+
+def test_optimized_programs_behave_like_the_originals(programs):
+    optimized = 0
+    for text, stdin in programs:
+        expected = _outcome(lambda: run(_parse(text), stdin))
+        program = _parse(text)
+        report = optimize(program)
+        optimized += any(report)
+        assert _outcome(lambda: run(program, stdin)) == expected, text
+    assert optimized > len(programs) // 2
@@ -0,0 +1,80 @@
+import io
+from collections import Counter
+
+from unisul_compiler.bytecode import compile_program
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.profiler import Profiler
+from unisul_compiler.runtime import InputReader
+from unisul_compiler.source import Source
+from unisul_compiler.syntax_tree import Block, If, Print, String, While
+from unisul_compiler.vm import execute
+
+# Prefixo das linhas impressas pelos comandos inseridos para contar as execuções
+_MARKER = '\x00'
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'perfil.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+def _marked(command):
+    """Precede o comando, e o comando repetido de um ``ENQUANTO``, de um ``IMPRIMIR`` que o identifica."""
+    if isinstance(command, Block):
+        command.commands[:] = [_marked(inner) for inner in command.commands]
+        return command
+    location = str(command.token.location)
+    if isinstance(command, While):
+        command.command = Block(None, [Print(None, String(None, f'{_MARKER}repetição {location}')),
+                                       _marked(command.command)])
+    elif isinstance(command, If):
+        command.command = _marked(command.command)
+    return Block(None, [Print(None, String(None, f'{_MARKER}{location}')), command])
+
+
+def _outcome(run_program):
+    """Executa um programa com a saída em memória, retornando a saída, mesmo que parcial, e o erro."""
+    output = io.StringIO()
+    try:
+        run_program(output.write)
+    except ARuntimeError as error:
+        return output.getvalue(), str(error)
+    return output.getvalue(), None
+
+
+def test_loop_repetition_interrupted_by_an_error_is_counted():
+    profiler = Profiler(_parse(':DECLARACOES\nx : INT\n:ALGORITMO\nENQUANTO x < 5 INICIO LER x IMPRIMIR x FIM\n'))
+    assert _outcome(lambda write: profiler.execute(InputReader('1 2'), write)) == \
+        ('1\n2\n', 'perfil.txt:4:23: erro de execução, não existem mais valores de entrada')
+    loop, read, write = profiler.profile().commands
+    assert (loop.count, loop.iterations) == (1, 3)
+    assert (read.count, write.count) == (3, 2)
+
+
+def test_profile_counts_the_executions_of_random_programs(programs):
+    for text, stdin in programs:
+        profiler = Profiler(_parse(text))
+        output, error = _outcome(lambda write: profiler.execute(InputReader(stdin), write))
+        profile = profiler.profile()
+
+        # o mesmo programa, com os comandos que contam as execuções, na máquina virtual
+        program = _parse(text)
+        program.commands[:] = [_marked(command) for command in program.commands]
+        code = compile_program(program)
+        marked_output, marked_error = _outcome(lambda write: execute(code, InputReader(stdin), write))
+        lines = marked_output.splitlines(keepends=True)
+        assert (output, error) == (''.join(line for line in lines if not line.startswith(_MARKER)), marked_error)
+
+        # inclusive o comando interrompido por um erro
+        markers = Counter(line[1:-1] for line in lines if line.startswith(_MARKER))
+        for command in profile.commands:
+            location = str(command.location)
+            assert (command.count, command.iterations) == (markers[location], markers[f'repetição {location}']), text
+            assert (command.operations > 0) == (command.count > 0)
+        assert profile.operations >= sum(command.operations for command in profile.commands)
+        assert sum(line.count for line in profile.lines()) == sum(command.count for command in profile.commands)
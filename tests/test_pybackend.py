@@ -0,0 +1,33 @@
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.optimizer import optimize
+from unisul_compiler.parser import parse
+from unisul_compiler.pybackend import compile_python, run_python
+from unisul_compiler.source import Source
+from unisul_compiler.vm import run
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'python.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+def _outcome(execute):
+    """Retorna a saída de uma execução e o seu erro, ``None`` caso termine normalmente."""
+    try:
+        return execute(), None
+    except ARuntimeError as error:
+        return None, str(error)
+
+
+def test_python_backend_runs_random_programs_like_the_virtual_machine(programs):
+    for text, stdin in programs:
+        program = _parse(text)
+        assert compile_python(program).fallback is None
+        assert _outcome(lambda: run_python(program, stdin)) == _outcome(lambda: run(program, stdin)), text
+        # as temporárias do otimizador se tornam variáveis locais
+        optimize(program)
+        assert _outcome(lambda: run_python(program, stdin)) == _outcome(lambda: run(program, stdin)), text
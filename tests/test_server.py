@@ -0,0 +1,50 @@
+import io
+import json
+
+from unisul_compiler import server
+from unisul_compiler.server import DEFAULT_LIMITS, create_executor, handle_request, serve
+
+_INFINITE_LOOP = ':DECLARACOES\nx : INT\n:ALGORITMO\nATRIBUIR 1 A x\nENQUANTO x > 0\nATRIBUIR x + 1 A x\n'
+_DOUBLE = ':DECLARACOES\nx : INT\n:ALGORITMO\nLER x\nATRIBUIR x * 2 A x\nIMPRIMIR x\n'
+# Divide 2 ** 1100, além do maior real, convertendo-o para real
+_REAL_OVERFLOW = (':DECLARACOES\nx : INT\ni : INT\nr : REAL\n:ALGORITMO\nATRIBUIR 1 A x\n'
+                  'ENQUANTO i < 1100 INICIO ATRIBUIR x * 2 A x ATRIBUIR i + 1 A i FIM\n'
+                  "IMPRIMIR 'antes'\n"
+                  'ATRIBUIR x / 3 A r\nIMPRIMIR r\n')
+
+
+def test_run_without_limits_is_bounded_by_default(monkeypatch):
+    monkeypatch.setattr(server, 'DEFAULT_LIMITS', DEFAULT_LIMITS._replace(timeout=0.2))
+    response = handle_request({'op': 'run', 'source': _INFINITE_LOOP})
+    assert response['ok'] and not response['valid']
+    assert response['limit'] == 'timeout'
+
+
+def test_request_limits_override_but_do_not_remove_defaults():
+    response = handle_request({'op': 'run', 'source': _INFINITE_LOOP, 'limits': {'max_operations': 1000}})
+    assert response['limit'] == 'max_operations'
+    for key in ('max_operations', 'timeout'):
+        response = handle_request({'op': 'run', 'source': _INFINITE_LOOP, 'limits': {key: None}})
+        assert not response['ok']
+    response = handle_request({'op': 'run', 'source': _DOUBLE, 'input': '21', 'backend': 'python'})
+    assert not response['ok']
+    response = handle_request({'op': 'run', 'source': _DOUBLE, 'input': '21', 'limits': {'max_output': None}})
+    assert response['valid'] and response['output'] == '42\n'
+
+
+def test_integer_beyond_real_range_is_a_runtime_error_in_the_response():
+    response = handle_request({'op': 'run', 'source': _REAL_OVERFLOW})
+    assert response['ok'] and not response['valid'] and 'limit' not in response
+    assert response['output'] == 'antes\n'
+    assert response['diagnostics'] == [{'type': 'ARuntimeError',
+                                        'message': 'erro de execução, inteiro fora dos limites de REAL',
+                                        'line': 9, 'column': 10}]
+
+
+def test_serve_returns_at_end_of_input_with_an_infinite_loop(monkeypatch):
+    monkeypatch.setattr(server, 'DEFAULT_LIMITS', DEFAULT_LIMITS._replace(timeout=0.2))
+    output = io.StringIO()
+    with create_executor(1) as executor:
+        serve([json.dumps({'id': 1, 'op': 'run', 'source': _INFINITE_LOOP})], output.write, executor)
+    response = json.loads(output.getvalue())
+    assert response['id'] == 1 and response['limit'] == 'timeout'
@@ -0,0 +1,41 @@
+import tracemalloc
+
+import pytest
+
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.generator import generate_program
+from unisul_compiler.lexer import describe_stream
+from unisul_compiler.table_parser import PARSERS
+
+KiB = 1024
+
+
+def _write_source(path, size: int) -> int:
+    """Grava um programa válido com cerca de ``size`` caracteres, retornando a quantidade de linhas."""
+    declarations, commands = generate_program(commands=200, seed=1).split(':ALGORITMO\n')
+    text = f'{declarations}:ALGORITMO\n{commands * (size // len(commands) + 1)}'
+    path.write_text(text)
+    return text.count('\n')
+
+
+def _peak_memory(path, parser: str) -> int:
+    diagnostics = Diagnostics()
+    with open(path) as source_file:
+        tracemalloc.start()
+        try:
+            program = PARSERS[parser](describe_stream(source_file), None, diagnostics, check_only=True)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    assert not diagnostics.errors and not program.commands
+    return peak
+
+
+@pytest.mark.parametrize('parser', sorted(PARSERS))
+def test_check_only_stream_memory_grows_only_with_the_line_index(tmp_path, parser):
+    small_lines = _write_source(tmp_path / 'small.txt', 128 * KiB)
+    large_lines = _write_source(tmp_path / 'large.txt', 512 * KiB)
+    small = _peak_memory(tmp_path / 'small.txt', parser)
+    large = _peak_memory(tmp_path / 'large.txt', parser)
+    # 8 bytes por linha no índice, que dobra ao crescer, e nenhum nó dos comandos
+    assert large - small < 16 * (large_lines - small_lines) + 64 * KiB
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import AError
+from unisul_compiler.lexer import describe
+from unisul_compiler.source import Source
+from unisul_compiler.table_parser import PARSERS
+
+_PROGRAM = ':DECLARACOES\na : INT\nb : REAL\nc : INT\n:ALGORITMO\n{}\n'
+
+# expressões com um operador após um parênteses fechado, aplicado a toda a expressão que o precede
+LEGACY_COMMANDS = [
+    'ATRIBUIR (b + (b) + c) A b',
+    'ATRIBUIR (b / ((b) * a) + c) A b',
+    'ATRIBUIR (a - (b) * c + a) A b',
+    'ATRIBUIR ((a) + (c) - 1) A a',
+    'ATRIBUIR (c * (a + 3 - -1.5) + c - 3) A c',
+    'ATRIBUIR (a + (b) + c + (a) + c) A b',
+    'SE (a * (b) - c) < (b) ENTAO IMPRIMIR a',
+]
+
+
+# expressões com um parênteses não fechado
+UNCLOSED_COMMANDS = [
+    'ATRIBUIR (a + c c A a',
+    'ATRIBUIR ((b) * (a - 1 A b',
+    'SE (a < b ENTAO IMPRIMIR a',
+]
+
+
+def _outcome(parser: str, text: str, recover: bool, grouping: str = 'legacy'):
+    """Analisa um programa, retornando a árvore e os erros registrados, ou o erro lançado."""
+    diagnostics = Diagnostics() if recover else None
+    try:
+        program = PARSERS[parser](describe(Source(text, 'programa.txt')), None, diagnostics, grouping)
+    except AError as error:
+        return type(error), str(error)
+    return repr(program), [(type(error), str(error)) for error in diagnostics.errors] if recover else None
+
+
+@pytest.mark.parametrize('command', LEGACY_COMMANDS)
+def test_table_parser_groups_legacy_expressions_like_descent(command):
+    text = _PROGRAM.format(command)
+    for recover in (False, True):
+        assert _outcome('table', text, recover) == _outcome('descent', text, recover)
+
+
+@pytest.mark.parametrize('grouping', ['precedence', 'legacy'])
+@pytest.mark.parametrize('command', UNCLOSED_COMMANDS)
+def test_table_parser_reports_unclosed_parentheses_like_descent(command, grouping):
+    text = _PROGRAM.format(command)
+    for recover in (False, True):
+        assert _outcome('table', text, recover, grouping) == _outcome('descent', text, recover, grouping)
+
+
+def test_table_parser_analyzes_random_programs_like_descent(programs):
+    for seed, (text, _) in enumerate(programs):
+        # o programa válido e uma cópia sem uma das palavras, em geral inválida
+        words = text.split(' ')
+        del words[random.Random(seed).randrange(len(words))]
+        for variant in (text, ' '.join(words)):
+            for grouping in ('precedence', 'legacy'):
+                for recover in (False, True):
+                    assert _outcome('table', variant, recover, grouping) == \
+                        _outcome('descent', variant, recover, grouping), variant
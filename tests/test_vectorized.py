@@ -0,0 +1,63 @@
+import io
+import random
+
+import pytest
+
+from unisul_compiler.bytecode import compile_program
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.runtime import InputReader
+from unisul_compiler.source import Source
+from unisul_compiler.vectorized import MIN_LANES, numpy, run_many
+from unisul_compiler.vm import execute
+
+# valores de entrada, incluindo reais, que só podem ser lidos por variáveis do tipo REAL
+_VALUES = ['-3', '-2', '-1', '0', '1', '2', '3', '1.5', '-0.5']
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'vetores.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+def _outcome(code, stdin: str):
+    """Executa o programa na máquina virtual, retornando a saída, mesmo que parcial, e o erro."""
+    output = io.StringIO()
+    try:
+        execute(code, InputReader(stdin), output.write)
+    except ARuntimeError as error:
+        return output.getvalue(), str(error)
+    return output.getvalue(), None
+
+
+def test_vectorized_runs_behave_like_the_virtual_machine(programs):
+    if numpy is None:
+        pytest.skip('NumPy indisponível')
+    vectorized = 0
+    for seed, (text, _) in enumerate(programs):
+        program = _parse(text)
+        code = compile_program(program)
+        choice = random.Random(seed)
+        rows = [[choice.choice(_VALUES) for _ in range(choice.randint(0, 12))] for _ in range(MIN_LANES * 3)]
+        for row, result in zip(rows, run_many(program, rows)):
+            error = str(result.error) if result.error is not None else None
+            assert (result.output, error) == _outcome(code, ' '.join(row)), (text, row)
+            vectorized += result.vectorized
+    # a maioria das execuções é feita sobre vetores
+    assert vectorized > len(programs) * MIN_LANES * 3 // 2
+
+
+def test_lanes_that_diverge_in_a_loop_behave_like_the_virtual_machine():
+    if numpy is None:
+        pytest.skip('NumPy indisponível')
+    program = _parse(':DECLARACOES\nx : INT\nr : REAL\n:ALGORITMO\nLER x\nENQUANTO x < 3 INICIO LER r '
+                     'ATRIBUIR x + 1 A x SE r <> 0.0 ENTAO ATRIBUIR r / r * x A r IMPRIMIR r FIM\nIMPRIMIR x\n')
+    code = compile_program(program)
+    rows = [[str(first)] + ['0', '1.5', '-0.5'][:count] for first in range(-2, 4) for count in range(4)]
+    for row, result in zip(rows, run_many(program, rows)):
+        error = str(result.error) if result.error is not None else None
+        assert (result.output, error) == _outcome(code, ' '.join(row)), row
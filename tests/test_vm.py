@@ -0,0 +1,41 @@
+import pytest
+
+from unisul_compiler.diagnostics import Diagnostics
+from unisul_compiler.exceptions import ARuntimeError
+from unisul_compiler.lexer import describe
+from unisul_compiler.parser import parse
+from unisul_compiler.pybackend import run_python
+from unisul_compiler.source import Source
+from unisul_compiler.vm import run
+
+# Dobra x até 2 ** 1100, além do maior real (cerca de 2 ** 1024), antes do comando testado
+_HUGE = (':DECLARACOES\nx : INT\ni : INT\nr : REAL\n:ALGORITMO\nATRIBUIR 1 A x\n'
+         'ENQUANTO i < 1100 INICIO ATRIBUIR x * 2 A x ATRIBUIR i + 1 A i FIM\n{}\n')
+
+
+def _parse(text: str):
+    diagnostics = Diagnostics()
+    program = parse(describe(Source(text, 'grande.txt'), None, diagnostics), None, diagnostics)
+    assert not diagnostics.errors
+    return program
+
+
+@pytest.mark.parametrize('command, column', [
+    ('ATRIBUIR x / 3 A r', 10),
+    ('ATRIBUIR r + x A r', 14),
+    ('ATRIBUIR x * 1.0 A r', 10),
+    ('SE x > 1.5 ENTAO IMPRIMIR x', 4),
+    ('SE 0.5 = x ENTAO IMPRIMIR x', 10),
+    (f'ATRIBUIR {"9" * 400} * 1.0 A r', 10),
+])
+@pytest.mark.parametrize('execute', [run, run_python])
+def test_integer_beyond_real_range_is_a_located_runtime_error(command, column, execute):
+    with pytest.raises(ARuntimeError) as raised:
+        execute(_parse(_HUGE.format(command)))
+    assert raised.value.message == 'erro de execução, inteiro fora dos limites de REAL'
+    assert (raised.value.location.line, raised.value.location.column) == (8, column)
+
+
+@pytest.mark.parametrize('execute', [run, run_python])
+def test_integers_beyond_real_range_compare_exactly(execute):
+    assert execute(_parse(_HUGE.format('SE x > x - 1 ENTAO IMPRIMIR i'))) == '1100\n'
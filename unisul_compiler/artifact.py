@@ -0,0 +1,561 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .cache import compiler_version
+from .source import Source
+from .syntax_tree import (
+    Assign, BinaryOperation, Block, BooleanOperation, Command, Condition, Declaration, Expression, If, Node,
+    Number, Print, Program, Read, Relation, String, Variable, While)
+from .token import TOKEN_KINDS, Token, TokenBuffer, TokenKind
+
+# Identificação e versão do formato dos artefatos
+ARTIFACT_MAGIC = b'UNAC'
+ARTIFACT_VERSION = 2
+
+# Extensão dos arquivos de artefato
+ARTIFACT_SUFFIX = '.ac'
+
+# Cabeçalho: identificação, versão do formato, opções, resumo da versão do compilador,
+# resumo do código-fonte, CRC-32 do restante do arquivo e, para cada seção, a sua posição
+# e o seu tamanho em bytes
+_HEADER = struct.Struct('<4sHH32s32sI')
+_SECTION = struct.Struct('<QQ')
+
+# Opções do cabeçalho
+_HAS_PROGRAM = 1
+
+# Seções, na ordem do arquivo, com o tipo dos elementos de cada uma
+_SECTIONS = (
+    ('string_ends', 'q'),     # posição do fim de cada texto da tabela de textos
+    ('string_data', 'B'),     # textos em UTF-8; o primeiro é o nome do código-fonte
+    ('line_starts', 'q'),     # posições de início de cada linha do código-fonte
+    ('token_kinds', 'B'),
+    ('token_starts', 'q'),
+    ('token_ends', 'q'),
+    ('token_lexemes', 'i'),   # texto do lexema de cada token
+    ('symbol_names', 'i'),    # texto do nome de cada variável, na ordem das posições
+    ('symbol_types', 'B'),
+    ('literal_tags', 'B'),
+    ('literal_values', 'q'),  # valor de cada literal, ou o seu texto (reais como os bytes de um "double")
+    ('program', 'i'),         # nós da árvore sintática em pós-ordem, com _NODE_SIZE números cada
+)
+
+# Tipos dos literais
+_INT, _BIG_INT, _FLOAT, _STRING = range(4)
+
+# Classes dos nós da árvore sintática, indexadas pela sua etiqueta
+_NODE_CLASSES = (Number, Variable, BinaryOperation, String, Relation, BooleanOperation,
+                 Assign, Read, Print, If, While, Block, Declaration, Program)
+_NODE_TAGS = {node_class: tag for tag, node_class in enumerate(_NODE_CLASSES)}
+
+# Cada nó ocupa a sua etiqueta, o índice do seu token (-1 caso não tenha) e dois argumentos
+_NODE_SIZE = 4
+
+# Classes dos filhos de cada nó com uma quantidade fixa de filhos, na ordem em que são gravados
+_NODE_CHILDREN = {
+    Variable: (), Number: (), String: (), Declaration: (),
+    BinaryOperation: (Expression, Expression),
+    Relation: (Expression, Expression),
+    BooleanOperation: (Condition, Condition),
+    Assign: (Expression, Variable),
+    Read: (Variable,),
+    Print: ((Variable, String),),
+    If: (Condition, Command),
+    While: (Condition, Command),
+}
+
+# Tipos de token aceitos nos argumentos dos nós
+_VALUE_TYPES = (TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT)
+_ARITHMETIC_OPERATORS = (TokenKind.ADDITION, TokenKind.SUBTRACTION, TokenKind.MULTIPLICATION, TokenKind.DIVISION)
+_RELATIONAL_OPERATORS = (TokenKind.EQUAL, TokenKind.NOT_EQUAL, TokenKind.LESS, TokenKind.GREATER,
+                         TokenKind.LESS_EQUAL, TokenKind.GREATER_EQUAL)
+_BOOLEAN_OPERATORS = (TokenKind.AND, TokenKind.OR)
+
+
+class InvalidArtifact(ValueError):
+    """Erro lançado ao carregar um arquivo que não é um artefato válido desta versão do compilador."""
+
+
+class ArtifactInfo(NamedTuple):
+    """Resumo de um artefato."""
+    path: str
+    name: str
+    format_version: int
+    compiler_version: str
+    source_hash: str
+    size: int
+    tokens: int
+    symbols: Dict[str, TokenKind]
+    literals: int
+    nodes: Optional[int]
+
+    def __str__(self):
+        symbols = ', '.join(f'{name}:{"INT" if kind == TokenKind.LITERAL_INT else "REAL"}'
+                            for name, kind in self.symbols.items())
+        return '\n'.join([
+            f'Artefato: {self.path} ({self.size} bytes, formato {self.format_version})',
+            f'Código-fonte: {self.name} (SHA-256 {self.source_hash})',
+            f'Compilador: {self.compiler_version}',
+            f'Tokens: {self.tokens}',
+            f'Símbolos: {len(self.symbols)}' + (f' ({symbols})' if symbols else ''),
+            f'Literais: {self.literals}',
+            f'Árvore sintática: {f"{self.nodes} nós" if self.nodes is not None else "ausente"}',
+        ])
+
+
+class _Writer:
+    """Reúne as seções de um artefato, internando os textos e os literais."""
+
+    def __init__(self, tokens: TokenBuffer):
+        self.tokens = tokens
+        self.string_ends = array('q')
+        self.string_data = bytearray()
+        self.strings: Dict[str, int] = {}
+        self.literal_tags = array('B')
+        self.literal_values = array('q')
+        self.literals: Dict[Tuple[int, Union[int, bytes]], int] = {}
+        self.program = array('i')
+
+    def string(self, text: str) -> int:
+        """Retorna o índice de um texto na tabela de textos, adicionando-o caso não exista."""
+        if (index := self.strings.get(text)) is None:
+            index = self.strings[text] = len(self.string_ends)
+            self.string_data += text.encode('utf-8', 'surrogatepass')
+            self.string_ends.append(len(self.string_data))
+        return index
+
+    def literal(self, value: Union[int, float, str]) -> int:
+        """Retorna o índice de um literal no seu repositório, adicionando-o caso não exista."""
+        if isinstance(value, str):
+            tag, stored = _STRING, self.string(value)
+        elif isinstance(value, float):
+            tag, stored = _FLOAT, struct.unpack('<q', struct.pack('<d', value))[0]
+        elif -2 ** 63 <= value < 2 ** 63:
+            tag, stored = _INT, value
+        else:
+            tag, stored = _BIG_INT, self.string(str(value))
+        if (index := self.literals.get((tag, stored))) is None:
+            index = self.literals[tag, stored] = len(self.literal_tags)
+            self.literal_tags.append(tag)
+            self.literal_values.append(stored)
+        return index
+
+    def token_index(self, token: Optional[Token]) -> int:
+        """Retorna o índice de um token na sequência de tokens, -1 caso não pertença a ela."""
+        if token is None:
+            return -1
+        starts = self.tokens.starts
+        index = bisect_left(starts, token.start)
+        return index if index < len(starts) and starts[index] == token.start else -1
+
+    def node(self, node: Node) -> Tuple[int, int]:
+        """Retorna os dois argumentos de um nó."""
+        if isinstance(node, Number):
+            return self.literal(node.value), node.type.value
+        if isinstance(node, Variable):
+            return self.string(node.name), node.type.value
+        if isinstance(node, BinaryOperation):
+            return node.operator.value, node.type.value
+        if isinstance(node, String):
+            return self.literal(node.value), 0
+        if isinstance(node, (Relation, BooleanOperation)):
+            return node.operator.value, 0
+        if isinstance(node, Block):
+            return len(node.commands), 0
+        if isinstance(node, Declaration):
+            return self.string(node.name), node.type.value
+        if isinstance(node, Program):
+            return len(node.declarations), len(node.commands)
+        return 0, 0
+
+    def tree(self, program: Program):
+        """Grava os nós da árvore sintática em pós-ordem, sem recursão."""
+        records = []
+        pending = [program]
+        while pending:
+            node = pending.pop()
+            records.append((_NODE_TAGS[type(node)], self.token_index(node.token), *self.node(node)))
+            # a pré-ordem com os filhos da direita para a esquerda é a pós-ordem invertida
+            pending.extend(node.children())
+        for record in reversed(records):
+            self.program.extend(record)
+
+
+def dump_artifact(tokens: TokenBuffer, program: Optional[Program], source_data: bytes) -> bytes:
+    """Serializa a análise de um código-fonte como um artefato.
+
+    Args:
+        tokens: Os tokens do código-fonte.
+        program: A árvore sintática do programa, ``None`` para guardar apenas os tokens e os literais.
+        source_data: Os bytes do código-fonte, dos quais é guardado apenas o resumo.
+
+    Returns:
+        Os bytes do artefato.
+    """
+    source = tokens.source
+    writer = _Writer(tokens)
+    writer.string(source.name)
+    token_lexemes = array('i', (writer.string(token.lexeme) for token in tokens))
+    for token in tokens:
+        if token.kind == TokenKind.LITERAL_INT:
+            writer.literal(int(token.lexeme))
+        elif token.kind == TokenKind.LITERAL_FLOAT:
+            writer.literal(float(token.lexeme))
+        elif token.kind == TokenKind.LITERAL_STR:
+            writer.literal(token.lexeme[1:-1])
+
+    symbols = program.symbols if program is not None else {}
+    symbol_names = array('i', map(writer.string, symbols))
+    symbol_types = array('B', (kind.value for kind in symbols.values()))
+    if program is not None:
+        writer.tree(program)
+
+    sections = {
+        'string_ends': writer.string_ends,
+        'string_data': writer.string_data,
+        'line_starts': array('q', source.line_starts),
+        'token_kinds': tokens.kinds,
+        'token_starts': tokens.starts,
+        'token_ends': tokens.ends,
+        'token_lexemes': token_lexemes,
+        'symbol_names': symbol_names,
+        'symbol_types': symbol_types,
+        'literal_tags': writer.literal_tags,
+        'literal_values': writer.literal_values,
+        'program': writer.program,
+    }
+
+    position = _HEADER.size + _SECTION.size * len(_SECTIONS)
+    table, body = [], bytearray()
+    for name, typecode in _SECTIONS:
+        values = array(typecode, sections[name])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        # as seções são alinhadas em 8 bytes, para serem lidas como vetores sem cópia
+        body += bytes(-(position + len(body)) % 8)
+        table.append(_SECTION.pack(position + len(body), len(values) * values.itemsize))
+        body += values.tobytes()
+    contents = b''.join(table) + body
+    header = _HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, _HAS_PROGRAM if program is not None else 0,
+                          bytes.fromhex(compiler_version()), hashlib.sha256(source_data).digest(),
+                          zlib.crc32(contents))
+    return header + contents
+
+
+def save_artifact(path: Union[str, os.PathLike], tokens: TokenBuffer, program: Optional[Program],
+                  source_data: bytes):
+    """Grava a análise de um código-fonte em um arquivo de artefato.
+
+    Args:
+        path: O caminho do arquivo.
+        tokens: Os tokens do código-fonte.
+        program: A árvore sintática do programa, ``None`` para guardar apenas os tokens e os literais.
+        source_data: Os bytes do código-fonte, dos quais é guardado apenas o resumo.
+    """
+    with open(path, 'wb') as artifact_file:
+        artifact_file.write(dump_artifact(tokens, program, source_data))
+
+
+class ArtifactSource(Source):
+    """Código-fonte de um artefato: o texto não é guardado, mas as localizações
+    são calculadas pelas posições de início de linha do artefato e os lexemas
+    são os dos tokens do artefato."""
+    __slots__ = ('_artifact',)
+
+    def __init__(self, artifact: 'Artifact'):
+        """Cria o código-fonte de um artefato.
+
+        Args:
+            artifact: O artefato.
+        """
+        super().__init__(None, artifact.name)
+        self._line_starts = artifact.section('line_starts')
+        self._artifact = artifact
+
+    def __repr__(self) -> str:
+        return f'<ArtifactSource "{self.name}">'
+
+    def lexeme(self, start: int, end: int) -> str:
+        starts = self._artifact.section('token_starts')
+        index = bisect_left(starts, start)
+        if index < len(starts) and starts[index] == start:
+            return self._artifact.string(self._artifact.section('token_lexemes')[index])
+        raise ValueError(f'o artefato não guarda o trecho {start}:{end} do código-fonte')
+
+
+class Artifact:
+    """Artefato carregado de um arquivo mapeado na memória.
+
+    As seções são lidas como vetores sobre o próprio arquivo (``memoryview``), sem cópia;
+    os textos, os literais e a árvore sintática são decodificados apenas quando consultados.
+    """
+    __slots__ = ('path', 'name', 'format_version', 'compiler_version', 'source_hash', 'has_program',
+                 '_data', '_sections', '_source', '_program')
+
+    def __init__(self, data: Union[bytes, mmap.mmap, memoryview], path: str = '<artefato>',
+                 check_compiler: bool = True):
+        """Lê o cabeçalho de um artefato.
+
+        Args:
+            data: Os bytes do artefato.
+            path: O caminho do arquivo do artefato.
+            check_compiler: Se deve recusar um artefato gravado por outra versão do compilador.
+
+        Raises:
+            InvalidArtifact: Caso os bytes não sejam um artefato válido, estejam corrompidos,
+                ou sejam de outra versão do formato ou do compilador.
+        """
+        self.path = path
+        self._data = memoryview(data)
+        self._source: Optional[ArtifactSource] = None
+        self._program: Optional[Program] = None
+
+        table_size = _SECTION.size * len(_SECTIONS)
+        if len(self._data) < _HEADER.size + table_size:
+            raise InvalidArtifact(f'{path}: arquivo truncado')
+        magic, self.format_version, flags, compiler_digest, source_digest, checksum = \
+            _HEADER.unpack_from(self._data)
+        if magic != ARTIFACT_MAGIC:
+            raise InvalidArtifact(f'{path}: o arquivo não é um artefato')
+        if self.format_version != ARTIFACT_VERSION:
+            raise InvalidArtifact(f'{path}: versão do formato {self.format_version} não suportada '
+                                  f'(esperada: {ARTIFACT_VERSION})')
+        self.compiler_version = compiler_digest.hex()
+        if check_compiler and self.compiler_version != compiler_version():
+            raise InvalidArtifact(f'{path}: artefato gravado por outra versão do compilador')
+        self.source_hash = source_digest.hex()
+        self.has_program = bool(flags & _HAS_PROGRAM)
+        if zlib.crc32(self._data[_HEADER.size:]) != checksum:
+            raise InvalidArtifact(f'{path}: artefato corrompido (CRC-32 diferente do cabeçalho)')
+
+        self._sections: Dict[str, Union[memoryview, array]] = {}
+        for index, (name, typecode) in enumerate(_SECTIONS):
+            offset, size = _SECTION.unpack_from(self._data, _HEADER.size + _SECTION.size * index)
+            if offset % 8 or offset + size > len(self._data) or size % array(typecode).itemsize:
+                raise InvalidArtifact(f'{path}: seção "{name}" inválida')
+            view = self._data[offset:offset + size].cast(typecode)
+            if sys.byteorder == 'big' and typecode != 'B':
+                # o formato é little-endian: apenas aqui as seções são copiadas
+                view = array(typecode, view)
+                view.byteswap()
+            self._sections[name] = view
+        self._check_sections()
+        self.name = self.string(0)
+
+    def _invalid(self, detail: str) -> InvalidArtifact:
+        return InvalidArtifact(f'{self.path}: {detail}')
+
+    def _check_sections(self):
+        """Verifica os tamanhos das seções e os índices que não são verificados ao serem consultados."""
+        sections = self._sections
+        tokens = len(sections['token_kinds'])
+        if not (len(sections['token_starts']) == len(sections['token_ends'])
+                == len(sections['token_lexemes']) == tokens):
+            raise self._invalid('seções dos tokens com tamanhos diferentes')
+        if len(sections['symbol_names']) != len(sections['symbol_types']):
+            raise self._invalid('seções dos símbolos com tamanhos diferentes')
+        if len(sections['literal_tags']) != len(sections['literal_values']):
+            raise self._invalid('seções dos literais com tamanhos diferentes')
+        if not sections['string_ends'] or len(sections['program']) % _NODE_SIZE:
+            raise self._invalid('tabela de textos ou árvore sintática truncada')
+        for name in ('token_kinds', 'symbol_types'):
+            if sections[name] and not 1 <= min(sections[name]) <= max(sections[name]) < len(TOKEN_KINDS):
+                raise self._invalid(f'tipo de token inválido na seção "{name}"')
+        ends = sections['string_ends']
+        if any(start > end for start, end in zip(ends, ends[1:])) or ends[0] < 0 \
+                or ends[-1] > len(sections['string_data']):
+            raise self._invalid('tabela de textos inválida')
+
+    def _index(self, section: str, index: int) -> int:
+        """Verifica um índice de uma seção.
+
+        Raises:
+            InvalidArtifact: Caso o índice esteja fora da seção.
+        """
+        if not 0 <= index < len(self._sections[section]):
+            raise self._invalid(f'índice {index} fora da seção "{section}"')
+        return index
+
+    def __repr__(self) -> str:
+        return f'<Artifact "{self.path}", {len(self._sections["token_kinds"])} tokens>'
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], check_compiler: bool = True) -> 'Artifact':
+        """Mapeia um arquivo de artefato na memória, somente para leitura, sem lê-lo.
+
+        Args:
+            path: O caminho do arquivo.
+            check_compiler: Se deve recusar um artefato gravado por outra versão do compilador.
+
+        Returns:
+            O artefato.
+
+        Raises:
+            InvalidArtifact: Caso o arquivo não seja um artefato válido, ou seja de outra versão
+                do formato ou do compilador.
+        """
+        with open(path, 'rb') as artifact_file:
+            if os.fstat(artifact_file.fileno()).st_size == 0:
+                raise InvalidArtifact(f'{path}: arquivo vazio')
+            data = mmap.mmap(artifact_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data, str(path), check_compiler)
+
+    def section(self, name: str) -> Union[memoryview, array]:
+        """Retorna os elementos de uma seção, sem cópia."""
+        return self._sections[name]
+
+    def string(self, index: int) -> str:
+        """Retorna um texto da tabela de textos."""
+        ends = self._sections['string_ends']
+        index = self._index('string_ends', index)
+        start = ends[index - 1] if index else 0
+        try:
+            return bytes(self._sections['string_data'][start:ends[index]]).decode('utf-8', 'surrogatepass')
+        except UnicodeDecodeError:
+            raise self._invalid(f'texto {index} inválido') from None
+
+    def literal(self, index: int) -> Union[int, float, str]:
+        """Retorna um literal do repositório de literais, já convertido."""
+        tag = self._sections['literal_tags'][self._index('literal_tags', index)]
+        value = self._sections['literal_values'][index]
+        if tag == _INT:
+            return value
+        if tag == _FLOAT:
+            return struct.unpack('<d', struct.pack('<q', value))[0]
+        if tag not in (_BIG_INT, _STRING):
+            raise self._invalid(f'literal {index} de tipo desconhecido')
+        text = self.string(value)
+        if tag == _STRING:
+            return text
+        try:
+            return int(text)
+        except ValueError:
+            raise self._invalid(f'literal {index} inválido') from None
+
+    @property
+    def literals(self) -> List[Union[int, float, str]]:
+        """Os literais do repositório de literais, já convertidos."""
+        return [self.literal(index) for index in range(len(self._sections['literal_tags']))]
+
+    @property
+    def symbols(self) -> Dict[str, TokenKind]:
+        """O tipo de cada variável, na ordem das posições."""
+        return {self.string(name): TOKEN_KINDS[kind]
+                for name, kind in zip(self._sections['symbol_names'], self._sections['symbol_types'])}
+
+    @property
+    def source(self) -> ArtifactSource:
+        """O código-fonte do artefato, sem o texto."""
+        if self._source is None:
+            self._source = ArtifactSource(self)
+        return self._source
+
+    @property
+    def tokens(self) -> TokenBuffer:
+        """Os tokens do código-fonte, lidos do artefato sem cópia."""
+        tokens = TokenBuffer(self.source)
+        tokens.kinds = self._sections['token_kinds']
+        tokens.starts = self._sections['token_starts']
+        tokens.ends = self._sections['token_ends']
+        return tokens
+
+    @property
+    def program(self) -> Optional[Program]:
+        """A árvore sintática do programa, ``None`` caso o artefato não a guarde.
+
+        Raises:
+            InvalidArtifact: Caso a árvore sintática gravada seja inválida.
+        """
+        if self._program is None and self.has_program:
+            self._program = self._decode_program()
+        return self._program
+
+    def _token(self, index: int) -> Optional[Token]:
+        if index == -1:
+            return None
+        index = self._index('token_kinds', index)
+        return Token(TOKEN_KINDS[self._sections['token_kinds'][index]], None, self.source,
+                     self._sections['token_starts'][index], self._sections['token_ends'][index])
+
+    def _kind(self, value: int, kinds: Tuple[TokenKind, ...]) -> TokenKind:
+        """Converte o argumento de um nó em um dos tipos de token esperados."""
+        kind = TOKEN_KINDS[value] if 0 < value < len(TOKEN_KINDS) else None
+        if kind not in kinds:
+            raise self._invalid(f'tipo de token {value} inválido na árvore sintática')
+        return kind
+
+    def _children(self, stack: List[Node], classes: tuple) -> List[Node]:
+        """Retira da pilha os filhos de um nó, verificando as suas classes."""
+        children = self._list(stack, len(classes), Node)
+        if not all(isinstance(child, node_class) for child, node_class in zip(children, classes)):
+            raise self._invalid('árvore sintática inválida')
+        return children
+
+    def _list(self, stack: List[Node], count: int, node_class: type) -> List[Node]:
+        """Retira da pilha os ``count`` últimos nós, verificando a sua classe."""
+        if not 0 <= count <= len(stack):
+            raise self._invalid('árvore sintática inválida')
+        nodes = stack[len(stack) - count:]
+        del stack[len(stack) - count:]
+        if not all(isinstance(node, node_class) for node in nodes):
+            raise self._invalid('árvore sintática inválida')
+        return nodes
+
+    def _decode_program(self) -> Program:
+        """Reconstrói a árvore sintática a partir dos nós em pós-ordem, sem recursão,
+        verificando cada etiqueta, índice e filho."""
+        records = self._sections['program']
+        stack: List[Node] = []
+        variables: List[Variable] = []
+        for position in range(0, len(records), _NODE_SIZE):
+            tag, token_index, first, second = records[position:position + _NODE_SIZE]
+            if not 0 <= tag < len(_NODE_CLASSES):
+                raise self._invalid(f'etiqueta de nó {tag} desconhecida')
+            node_class = _NODE_CLASSES[tag]
+            token = self._token(token_index)
+            if node_class is Block:
+                node = Block(token, self._list(stack, first, Command))
+            elif node_class is Program:
+                commands = self._list(stack, second, Command)
+                node = Program(token, self._list(stack, first, Declaration), commands)
+            else:
+                children = self._children(stack, _NODE_CHILDREN[node_class])
+                if node_class is Number:
+                    node = Number(token, self.literal(first), self._kind(second, _VALUE_TYPES))
+                elif node_class is Variable:
+                    node = Variable(token, self.string(first), self._kind(second, _VALUE_TYPES))
+                    variables.append(node)
+                elif node_class is String:
+                    node = String(token, self.literal(first))
+                elif node_class is Declaration:
+                    node = Declaration(token, self.string(first), self._kind(second, _VALUE_TYPES))
+                elif node_class is BinaryOperation:
+                    node = BinaryOperation(token, self._kind(first, _ARITHMETIC_OPERATORS), *children,
+                                           self._kind(second, _VALUE_TYPES))
+                elif node_class is Relation:
+                    node = Relation(token, self._kind(first, _RELATIONAL_OPERATORS), *children)
+                elif node_class is BooleanOperation:
+                    node = BooleanOperation(token, self._kind(first, _BOOLEAN_OPERATORS), *children)
+                else:  # Assign, Read, Print, If, While
+                    node = node_class(token, *children)
+            stack.append(node)
+        if len(stack) != 1 or not isinstance(stack[0], Program):
+            raise self._invalid('árvore sintática inválida')
+        symbols = stack[0].symbols
+        if any(symbols.get(variable.name) != variable.type for variable in variables):
+            raise self._invalid('variável não declarada na árvore sintática')
+        return stack[0]
+
+    def info(self) -> ArtifactInfo:
+        """Retorna o resumo do artefato."""
+        return ArtifactInfo(self.path, self.name, self.format_version, self.compiler_version, self.source_hash,
+                            len(self._data), len(self._sections['token_kinds']), self.symbols,
+                            len(self._sections['literal_tags']),
+                            len(self._sections['program']) // _NODE_SIZE if self.has_program else None)
@@ -0,0 +1,232 @@
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from .cache import CACHE_MAX_SIZE, CompileCache
+from .diagnostics import Diagnostics
+from .exceptions import ALexicalError, ASemanticError, ASyntaxError, ATooManyErrors
+from .lexer import CHUNK_SIZE, describe, describe_stream
+from .reporter import Reporter
+from .source import Source
+from .table_parser import PARSERS
+
+
+class FileResult(NamedTuple):
+    """Resultado da análise de um arquivo em lote."""
+    path: str
+    valid: bool
+    tokens: int
+    symbols: int
+    elapsed: float
+    error_type: Optional[str] = None
+    error: Optional[str] = None
+    cached: Optional[bool] = None
+    error_count: int = 0
+
+
+class _CountingReporter(Reporter):
+    """Guarda apenas as quantidades de tokens e de símbolos relatadas e a consulta do cache."""
+
+    def __init__(self):
+        self.token_count = 0
+        self.symbol_count = 0
+        self.hit: Optional[bool] = None
+
+    def cached(self, hit: bool):
+        self.hit = hit
+
+    def described(self, token_count: int):
+        self.token_count = token_count
+
+    def parsed(self, symbol_count: int):
+        self.symbol_count = symbol_count
+
+
+def expand_paths(patterns: Iterable[str]) -> List[Path]:
+    """Expande os caminhos de arquivos, diretórios (recursivamente) e padrões glob.
+
+    Args:
+        patterns: Os caminhos e padrões.
+
+    Returns:
+        Os caminhos dos arquivos, sem repetições e na ordem em que foram encontrados.
+    """
+    paths = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in map(Path, matches):
+            if match.is_dir():
+                paths.update(dict.fromkeys(sorted(path for path in match.rglob('*') if path.is_file())))
+            else:
+                paths[match] = None
+    return list(paths)
+
+
+@lru_cache(maxsize=None)
+def _open_cache(cache_dir: Path, cache_max_size: int) -> CompileCache:
+    # um cache por processo, que estima o tamanho do diretório entre os arquivos
+    return CompileCache(cache_dir, cache_max_size)
+
+
+def check_file(path: Path, stream: bool = False, chunk_size: int = CHUNK_SIZE,
+               cache_dir: Optional[Path] = None, cache_max_size: int = CACHE_MAX_SIZE,
+               max_errors: Optional[int] = None, grouping: str = 'precedence',
+               parser: str = 'descent') -> FileResult:
+    """Analisa léxica, sintática e semanticamente um arquivo, sem relatar nada.
+
+    Args:
+        path: O caminho do arquivo.
+        stream: Se o código-fonte é analisado em trechos, sem consultar o cache.
+        chunk_size: A quantidade de caracteres lidos por trecho com ``stream``.
+        cache_dir: O diretório do cache da análise, ``None`` para não usar o cache.
+        cache_max_size: O tamanho máximo do diretório do cache, em bytes.
+        max_errors: A quantidade máxima de erros registrados (padrão: sem limite).
+        grouping: O agrupamento das expressões (``precedence`` ou ``legacy``).
+        parser: O analisador sintático (``descent`` ou ``table``).
+
+    Returns:
+        O resultado da análise, com o primeiro erro e a quantidade de erros
+        caso o programa seja inválido ou a análise falhe.
+    """
+    reporter = _CountingReporter()
+    diagnostics = Diagnostics(max_errors)
+    parse = PARSERS[parser]
+    started_at = time.perf_counter()
+    error = None
+    try:
+        if cache_dir is not None and not stream:
+            _open_cache(cache_dir, cache_max_size).analyze(path, reporter, diagnostics, grouping, parser)
+        else:
+            with open(path) as source_file:
+                if stream:
+                    parse(describe_stream(source_file, chunk_size, reporter, diagnostics),
+                          reporter, diagnostics, grouping, check_only=True)
+                else:
+                    parse(describe(Source(source_file.read(), str(path)), reporter, diagnostics),
+                          reporter, diagnostics, grouping)
+    except ATooManyErrors:
+        pass
+    except (ALexicalError, ASyntaxError, ASemanticError, OSError, UnicodeDecodeError) as raised_error:
+        error = raised_error
+    except Exception as raised_error:
+        # uma falha inesperada do compilador (como ``RecursionError`` ou ``MemoryError``)
+        # invalida apenas o arquivo, sem interromper a análise dos demais
+        error = raised_error
+    elapsed = time.perf_counter() - started_at
+
+    if error is None and diagnostics.errors:
+        error = diagnostics.sorted()[0]
+    if error is not None:
+        return FileResult(str(path), False, reporter.token_count, reporter.symbol_count, elapsed,
+                          type(error).__name__, str(error) or type(error).__name__, reporter.hit,
+                          max(len(diagnostics), 1))
+    return FileResult(str(path), True, reporter.token_count, reporter.symbol_count, elapsed, cached=reporter.hit)
+
+
+def _check_file(arguments) -> FileResult:
+    return check_file(*arguments)
+
+
+def check_files(paths: List[Path], jobs: Optional[int] = None,
+                stream: bool = False, chunk_size: int = CHUNK_SIZE,
+                cache_dir: Optional[Path] = None, cache_max_size: int = CACHE_MAX_SIZE,
+                max_errors: Optional[int] = None, grouping: str = 'precedence',
+                parser: str = 'descent') -> Iterator[FileResult]:
+    """Analisa vários arquivos, distribuindo-os entre processos.
+
+    Um arquivo inválido não interrompe a análise dos demais.
+
+    Args:
+        paths: Os caminhos dos arquivos.
+        jobs: A quantidade de processos (padrão: a quantidade de processadores).
+            Com um único processo, os arquivos são analisados no processo atual.
+        stream: Se os códigos-fonte são analisados em trechos.
+        chunk_size: A quantidade de caracteres lidos por trecho com ``stream``.
+        cache_dir: O diretório do cache da análise, compartilhado entre os processos,
+            ``None`` para não usar o cache.
+        cache_max_size: O tamanho máximo do diretório do cache, em bytes.
+        max_errors: A quantidade máxima de erros registrados por arquivo (padrão: sem limite).
+        grouping: O agrupamento das expressões (``precedence`` ou ``legacy``).
+        parser: O analisador sintático (``descent`` ou ``table``).
+
+    Yields:
+        O resultado de cada arquivo, na ordem dos caminhos.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    arguments = [(path, stream, chunk_size, cache_dir, cache_max_size, max_errors, grouping, parser)
+                 for path in paths]
+    if jobs == 1 or len(paths) <= 1:
+        yield from map(_check_file, arguments)
+        return
+
+    # agrupar os arquivos, evitando uma troca de mensagens entre processos por arquivo
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(jobs) as executor:
+        yield from executor.map(_check_file, arguments, chunksize=chunksize)
+
+
+def format_result(result: FileResult) -> str:
+    """Formata o resultado de um arquivo como uma linha de texto."""
+    status = '✔' if result.valid else '❌'
+    if result.valid:
+        detail = f'{result.tokens} tokens'
+    elif result.error_count > 1:
+        detail = f'{result.error} (e mais {result.error_count - 1} erros)'
+    else:
+        detail = result.error
+    return f'{status} {result.path} ({result.elapsed * 1000:.1f}ms): {detail}'
+
+
+def format_summary(results: List[FileResult], elapsed: float) -> str:
+    """Formata o resumo de uma análise em lote.
+
+    Args:
+        results: Os resultados dos arquivos.
+        elapsed: O tempo total da análise, em segundos.
+
+    Returns:
+        A quantidade de programas válidos e inválidos e a vazão da análise.
+    """
+    valid = sum(result.valid for result in results)
+    tokens = sum(result.tokens for result in results)
+    hits = sum(result.cached is True for result in results)
+    misses = sum(result.cached is False for result in results)
+    elapsed = max(elapsed, 1e-9)
+    summary = (f'{len(results)} arquivos, {valid} válidos, {len(results) - valid} inválidos '
+               f'em {elapsed:.3f}s ({len(results) / elapsed:.1f} arquivos/s, {tokens / elapsed:.0f} tokens/s)')
+    if hits or misses:
+        summary += f', cache: {hits} acertos e {misses} faltas'
+    return summary
+
+
+def format_json(results: List[FileResult], elapsed: float) -> str:
+    """Formata os resultados e o resumo de uma análise em lote como um objeto JSON.
+
+    Args:
+        results: Os resultados dos arquivos.
+        elapsed: O tempo total da análise, em segundos.
+
+    Returns:
+        O objeto JSON.
+    """
+    tokens = sum(result.tokens for result in results)
+    valid = sum(result.valid for result in results)
+    return json.dumps({
+        'files': [result._asdict() for result in results],
+        'summary': {
+            'files': len(results),
+            'valid': valid,
+            'invalid': len(results) - valid,
+            'tokens': tokens,
+            'cache_hits': sum(result.cached is True for result in results),
+            'cache_misses': sum(result.cached is False for result in results),
+            'elapsed': elapsed,
+            'files_per_second': len(results) / max(elapsed, 1e-9),
+            'tokens_per_second': tokens / max(elapsed, 1e-9),
+        },
+    }, ensure_ascii=False, indent=2)
@@ -0,0 +1,284 @@
+from array import array
+from enum import IntEnum
+from typing import List, Optional, Union
+
+from .source import Location, Source
+from .syntax_tree import (
+    Assign, BinaryOperation, Block, Condition, Expression, If, NodeVisitor,
+    Number, Print, Program, Read, Relation, String, Variable, While)
+from .token import Token, TokenKind
+
+
+class Opcode(IntEnum):
+    """Instrução da máquina virtual da linguagem "A".
+
+    Cada instrução ocupa duas posições no código: o código da operação e o seu argumento.
+    As operações aritméticas são especializadas pelo tipo dos operandos.
+    """
+    # variáveis e constantes
+    LOAD_VAR = 0
+    LOAD_CONST = 1
+    STORE_VAR = 2
+    # promoção de inteiro para real
+    INT_TO_REAL = 3
+    # operadores aritméticos
+    ADD_INT = 4
+    SUB_INT = 5
+    MUL_INT = 6
+    ADD_REAL = 7
+    SUB_REAL = 8
+    MUL_REAL = 9
+    DIV_REAL = 10
+    # operadores relacionais
+    EQUAL = 11
+    NOT_EQUAL = 12
+    LESS = 13
+    GREATER = 14
+    LESS_EQUAL = 15
+    GREATER_EQUAL = 16
+    # desvios
+    JUMP = 17
+    POP_JUMP_IF_FALSE = 18
+    POP_JUMP_IF_TRUE = 19
+    # entrada e saída
+    READ_INT = 20
+    READ_REAL = 21
+    PRINT_INT = 22
+    PRINT_REAL = 23
+    PRINT_STR = 24
+    # fim do programa
+    HALT = 25
+
+
+# Operações aritméticas por operador, para operandos inteiros e reais
+ARITHMETIC_OPCODES = {
+    TokenKind.ADDITION: (Opcode.ADD_INT, Opcode.ADD_REAL),
+    TokenKind.SUBTRACTION: (Opcode.SUB_INT, Opcode.SUB_REAL),
+    TokenKind.MULTIPLICATION: (Opcode.MUL_INT, Opcode.MUL_REAL),
+    TokenKind.DIVISION: (Opcode.DIV_REAL, Opcode.DIV_REAL),
+}
+
+# Operações relacionais por operador
+RELATIONAL_OPCODES = {
+    TokenKind.EQUAL: Opcode.EQUAL,
+    TokenKind.NOT_EQUAL: Opcode.NOT_EQUAL,
+    TokenKind.LESS: Opcode.LESS,
+    TokenKind.GREATER: Opcode.GREATER,
+    TokenKind.LESS_EQUAL: Opcode.LESS_EQUAL,
+    TokenKind.GREATER_EQUAL: Opcode.GREATER_EQUAL,
+}
+
+
+class Code:
+    """Código compilado de um programa da linguagem "A"."""
+    __slots__ = ('instructions', 'constants', 'names', 'types', 'offsets', 'source')
+
+    def __init__(self, names: List[str], types: List[TokenKind], source: Optional[Source] = None):
+        """Cria um código vazio.
+
+        Args:
+            names: O nome da variável de cada posição.
+            types: O tipo da variável de cada posição.
+            source: O código-fonte, usado para localizar os erros de execução (opcional).
+        """
+        self.instructions = array('l')
+        self.constants: List[Union[int, float, str]] = []
+        self.names = names
+        self.types = types
+        self.offsets = array('q')
+        self.source = source
+
+    def __repr__(self) -> str:
+        return f'<Code {len(self.instructions) // 2} instruções, {len(self.names)} variáveis>'
+
+    def initial_values(self) -> List[Union[int, float]]:
+        """Retorna o valor inicial de cada variável (zero do seu tipo)."""
+        return [0 if kind == TokenKind.LITERAL_INT else 0.0 for kind in self.types]
+
+    def location(self, pc: int) -> Optional[Location]:
+        """Retorna a localização no código-fonte da instrução.
+
+        Args:
+            pc: A posição da instrução.
+
+        Returns:
+            A localização da instrução, ``None`` caso seja desconhecida.
+        """
+        if self.source is None or (offset := self.offsets[pc // 2]) < 0:
+            return None
+        return self.source.location(offset)
+
+    def disassemble(self) -> str:
+        """Retorna a listagem legível das instruções."""
+        lines = []
+        for pc in range(0, len(self.instructions), 2):
+            opcode, argument = Opcode(self.instructions[pc]), self.instructions[pc + 1]
+            if opcode in (Opcode.LOAD_VAR, Opcode.STORE_VAR, Opcode.READ_INT, Opcode.READ_REAL,
+                          Opcode.PRINT_INT, Opcode.PRINT_REAL):
+                detail = f'({self.names[argument]})'
+            elif opcode in (Opcode.LOAD_CONST, Opcode.PRINT_STR):
+                detail = f'({self.constants[argument]!r})'
+            else:
+                detail = ''
+            lines.append(f'{pc:>6} {opcode.name:<18} {argument} {detail}'.rstrip())
+        return '\n'.join(lines)
+
+
+class _Compiler(NodeVisitor):
+    """Traduz a árvore sintática para o código da máquina virtual."""
+
+    def __init__(self, program: Program):
+        symbols = program.symbols
+        self.slots = {name: slot for slot, name in enumerate(symbols)}
+        source = program.token.source if program.token is not None else None
+        self.code = Code(list(symbols), list(symbols.values()), source)
+        self.constant_slots = {}
+
+    def emit(self, opcode: Opcode, argument: int = 0, token: Optional[Token] = None) -> int:
+        """Adiciona uma instrução ao código.
+
+        Args:
+            opcode: A operação.
+            argument: O argumento da operação.
+            token: O token de origem da instrução (opcional).
+
+        Returns:
+            A posição da instrução.
+        """
+        pc = len(self.code.instructions)
+        self.code.instructions.extend((opcode, argument))
+        self.code.offsets.append(token.start if token is not None else -1)
+        return pc
+
+    def patch(self, pc: int, target: int):
+        """Define o destino de um desvio já emitido.
+
+        Args:
+            pc: A posição do desvio.
+            target: A posição de destino.
+        """
+        self.code.instructions[pc + 1] = target
+
+    def constant(self, value: Union[int, float, str]) -> int:
+        """Retorna a posição de uma constante, adicionando-a caso ainda não exista."""
+        key = (type(value), value)
+        if (index := self.constant_slots.get(key)) is None:
+            index = self.constant_slots[key] = len(self.code.constants)
+            self.code.constants.append(value)
+        return index
+
+    # Expressões
+    def expression(self, node: Expression, kind: TokenKind):
+        """Compila uma expressão, promovendo-a para real caso necessário.
+
+        Args:
+            node: A expressão.
+            kind: O tipo desejado do resultado.
+        """
+        yield node
+        if node.type == TokenKind.LITERAL_INT and kind == TokenKind.LITERAL_FLOAT:
+            self.emit(Opcode.INT_TO_REAL, token=node.token)
+
+    def visit_Number(self, node: Number):
+        self.emit(Opcode.LOAD_CONST, self.constant(node.value))
+
+    def visit_Variable(self, node: Variable):
+        self.emit(Opcode.LOAD_VAR, self.slots[node.name])
+
+    def visit_BinaryOperation(self, node: BinaryOperation):
+        # a divisão sempre opera sobre reais
+        operand_kind = (TokenKind.LITERAL_INT
+                        if node.type == TokenKind.LITERAL_INT else
+                        TokenKind.LITERAL_FLOAT)
+        yield self.expression(node.left, operand_kind)
+        yield self.expression(node.right, operand_kind)
+        int_opcode, real_opcode = ARITHMETIC_OPCODES[node.operator]
+        self.emit(int_opcode if operand_kind == TokenKind.LITERAL_INT else real_opcode, token=node.token)
+
+    # Condições
+    def branch(self, node: Condition, jump_if: bool, jumps: List[int]):
+        """Compila uma condição como desvios, sem avaliar o restante de uma operação
+        booleana cujo resultado já é conhecido.
+
+        Args:
+            node: A condição.
+            jump_if: O resultado da condição que provoca o desvio.
+            jumps: A lista onde são adicionadas as posições dos desvios a definir.
+        """
+        if isinstance(node, Relation):
+            # comparar "int" e "real" como reais
+            kind = (TokenKind.LITERAL_INT
+                    if node.left.type == node.right.type == TokenKind.LITERAL_INT else
+                    TokenKind.LITERAL_FLOAT)
+            yield self.expression(node.left, kind)
+            yield self.expression(node.right, kind)
+            self.emit(RELATIONAL_OPCODES[node.operator])
+            jumps.append(self.emit(Opcode.POP_JUMP_IF_TRUE if jump_if else Opcode.POP_JUMP_IF_FALSE))
+        elif (node.operator == TokenKind.AND) != jump_if:
+            # "E" desviando se falso, ou "OU" desviando se verdadeiro: basta uma das condições
+            yield self.branch(node.left, jump_if, jumps)
+            yield self.branch(node.right, jump_if, jumps)
+        else:
+            # "E" desviando se verdadeiro, ou "OU" desviando se falso: são necessárias as duas condições
+            skips = []
+            yield self.branch(node.left, not jump_if, skips)
+            yield self.branch(node.right, jump_if, jumps)
+            for pc in skips:
+                self.patch(pc, len(self.code.instructions))
+
+    # Comandos
+    def visit_Program(self, node: Program):
+        for command in node.commands:
+            yield command
+        self.emit(Opcode.HALT)
+
+    def visit_Assign(self, node: Assign):
+        yield self.expression(node.expression, node.target.type)
+        self.emit(Opcode.STORE_VAR, self.slots[node.target.name])
+
+    def visit_Read(self, node: Read):
+        opcode = Opcode.READ_INT if node.target.type == TokenKind.LITERAL_INT else Opcode.READ_REAL
+        self.emit(opcode, self.slots[node.target.name], node.token)
+
+    def visit_Print(self, node: Print):
+        if isinstance(node.value, String):
+            self.emit(Opcode.PRINT_STR, self.constant(node.value.value))
+        else:
+            opcode = Opcode.PRINT_INT if node.value.type == TokenKind.LITERAL_INT else Opcode.PRINT_REAL
+            self.emit(opcode, self.slots[node.value.name])
+
+    def visit_If(self, node: If):
+        jumps = []
+        yield self.branch(node.condition, False, jumps)
+        yield node.command
+        for pc in jumps:
+            self.patch(pc, len(self.code.instructions))
+
+    def visit_While(self, node: While):
+        start = len(self.code.instructions)
+        jumps = []
+        yield self.branch(node.condition, False, jumps)
+        yield node.command
+        self.emit(Opcode.JUMP, start, node.token)
+        for pc in jumps:
+            self.patch(pc, len(self.code.instructions))
+
+    def visit_Block(self, node: Block):
+        for command in node.commands:
+            yield command
+
+
+def compile_program(program: Program) -> Code:
+    """Compila a árvore sintática de um programa válido para o código da máquina virtual.
+
+    Cada variável ocupa uma posição fixa, na ordem da tabela de símbolos.
+
+    Args:
+        program: A árvore sintática do programa.
+
+    Returns:
+        O código do programa.
+    """
+    compiler = _Compiler(program)
+    compiler.visit(program)
+    return compiler.code
@@ -0,0 +1,284 @@
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from .diagnostics import Diagnostics
+from .exceptions import AError, ALexicalError, ASemanticError, ASyntaxError, ATooManyErrors
+from .lexer import describe
+from .reporter import Reporter, SilentReporter
+from .source import Source
+from .syntax_tree import Program
+from .table_parser import PARSERS
+from .token import TokenBuffer
+
+# Diretório padrão do cache
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'unisul-compiler'
+
+# Tamanho máximo padrão do diretório do cache, em bytes
+CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# Módulos cujo código determina o resultado da análise
+_COMPILER_MODULES = (
+    'cache', 'diagnostics', 'exceptions', 'grammar', 'lexer', 'parse_table', 'parser', 'source', 'syntax_tree',
+    'table_parser', 'token')
+
+
+@lru_cache(maxsize=None)
+def compiler_version() -> str:
+    """Retorna a versão do compilador, o resumo do código dos módulos da análise,
+    de forma que qualquer mudança no compilador invalide o cache."""
+    digest = hashlib.sha256()
+    for module in _COMPILER_MODULES:
+        digest.update((Path(__file__).parent / f'{module}.py').read_bytes())
+    return digest.hexdigest()
+
+
+def read_source(path: Union[str, Path]) -> Tuple[bytes, str]:
+    """Lê os bytes de um código-fonte e o seu texto, decodificado como por ``open``.
+
+    Args:
+        path: O caminho do arquivo.
+
+    Returns:
+        Os bytes e o texto do código-fonte.
+    """
+    data = Path(path).read_bytes()
+    return data, io.TextIOWrapper(io.BytesIO(data)).read()
+
+
+class CacheEntry(NamedTuple):
+    """Resultado da análise de um código-fonte guardado no cache."""
+    tokens: Optional[TokenBuffer]
+    program: Optional[Program]
+    errors: List[AError]
+    truncated: bool = False
+
+
+class _Pickler(pickle.Pickler):
+    """Guarda as referências ao código-fonte sem o seu texto, que é a própria chave do cache."""
+
+    def __init__(self, file, source: Source):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.source = source
+
+    def persistent_id(self, obj):
+        return 'source' if obj is self.source else None
+
+
+class _Unpickler(pickle.Unpickler):
+    """Restaura as referências ao código-fonte a partir do código-fonte atual."""
+
+    def __init__(self, file, source: Source):
+        super().__init__(file)
+        self.source = source
+
+    def persistent_load(self, pid):
+        if pid != 'source':
+            raise pickle.UnpicklingError(f'referência persistente "{pid}" desconhecida')
+        return self.source
+
+
+class CompileCache:
+    """Cache em disco dos resultados da análise, endereçado pelo conteúdo do código-fonte.
+
+    Cada entrada é um arquivo nomeado pelo resumo dos bytes do código-fonte e da versão
+    do compilador. As entradas são escritas em um arquivo temporário e renomeadas,
+    portanto vários processos podem consultar e alimentar o mesmo diretório.
+    As entradas menos usadas recentemente (pela data de modificação, atualizada
+    a cada acerto) são removidas quando o diretório excede o tamanho máximo.
+    """
+
+    def __init__(self, directory: Union[str, Path] = CACHE_DIR, max_size: int = CACHE_MAX_SIZE):
+        """Cria um cache.
+
+        Args:
+            directory: O diretório do cache, criado caso não exista.
+            max_size: O tamanho máximo do diretório, em bytes.
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f'<CompileCache "{self.directory}", {self.hits} acertos, {self.misses} faltas>'
+
+    def key(self, data: bytes, variant: str = '') -> str:
+        """Retorna a chave de um código-fonte.
+
+        Args:
+            data: Os bytes do código-fonte.
+            variant: As opções da análise que alteram o seu resultado.
+
+        Returns:
+            O resumo SHA-256 da versão do compilador, das opções e dos bytes do código-fonte.
+        """
+        digest = hashlib.sha256(f'{compiler_version()}:{variant}:'.encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Retorna o caminho da entrada de uma chave."""
+        return self.directory / key[:2] / f'{key[2:]}.pickle'
+
+    def load(self, key: str, source: Source) -> Optional[CacheEntry]:
+        """Retorna a entrada de uma chave, contando um acerto ou uma falta.
+
+        Args:
+            key: A chave do código-fonte.
+            source: O código-fonte, associado aos tokens e à árvore sintática da entrada.
+
+        Returns:
+            A entrada, ``None`` caso não exista ou não possa ser lida.
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as entry_file:
+                entry = _Unpickler(entry_file, source).load()
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+            self.misses += 1
+            return None
+
+        # a mesma entrada pode ter sido gravada a partir de outro arquivo
+        for error in entry.errors:
+            if error.location is not None:
+                error.location = error.location._replace(name=source.name)
+        self.hits += 1
+        return entry
+
+    def store(self, key: str, entry: CacheEntry, source: Source):
+        """Grava a entrada de uma chave e remove as entradas excedentes.
+
+        Uma entrada com uma árvore sintática profunda demais para ser serializada não é gravada.
+
+        Args:
+            key: A chave do código-fonte.
+            entry: A entrada.
+            source: O código-fonte da entrada, que não é gravado.
+        """
+        buffer = io.BytesIO()
+        try:
+            _Pickler(buffer, source).dump(entry)
+        except RecursionError:
+            return
+
+        path = self.path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(descriptor, 'wb') as entry_file:
+                entry_file.write(buffer.getbuffer())
+            os.replace(temporary_path, path)
+        except OSError:
+            try:
+                os.unlink(temporary_path)
+            except OSError:
+                pass
+            return
+
+        # percorrer o diretório apenas quando a estimativa do seu tamanho exceder o máximo
+        if self._size is None:
+            self.evict()
+        else:
+            self._size += len(buffer.getbuffer())
+            if self._size > self.max_size:
+                self.evict()
+
+    def evict(self):
+        """Remove as entradas menos usadas recentemente até que o diretório
+        não exceda o tamanho máximo."""
+        entries: List[Tuple[float, int, Path]] = []
+        total_size = 0
+        for path in self.directory.glob('*/*.pickle'):
+            try:
+                status = path.stat()
+            except OSError:
+                continue
+            entries.append((status.st_mtime, status.st_size, path))
+            total_size += status.st_size
+
+        if total_size > self.max_size:
+            for _, size, path in sorted(entries):
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total_size -= size
+                if total_size <= self.max_size:
+                    break
+        self._size = total_size
+
+    def analyze(self, path: Union[str, Path], reporter: Optional[Reporter] = None,
+                diagnostics: Optional[Diagnostics] = None, grouping: str = 'precedence',
+                parser: str = 'descent') -> Program:
+        """Analisa léxica, sintática e semanticamente um arquivo, consultando o cache.
+
+        Em um acerto, relata apenas as quantidades de tokens e de símbolos,
+        portanto não deve ser usado com relatórios que acompanham cada token.
+
+        Args:
+            path: O caminho do arquivo.
+            reporter: O relatório que recebe os eventos da análise (padrão: silencioso).
+            diagnostics: A lista vazia onde os erros são registrados em vez de lançados (opcional).
+            grouping: O agrupamento das expressões (``precedence`` ou ``legacy``).
+            parser: O analisador sintático (``descent`` ou ``table``).
+
+        Returns:
+            A árvore sintática do programa.
+
+        Raises:
+            ALexicalError: Caso encontre um símbolo inválido no código-fonte.
+            ASyntaxError: Caso o programa não satisfaça a sintaxe da linguagem.
+            ASemanticError: Caso o programa não satisfaça a semântica da linguagem.
+            ATooManyErrors: Caso os erros registrados excedam o limite.
+        """
+        reporter = reporter or SilentReporter()
+        data, text = read_source(path)
+        source = Source(text, str(path))
+        errors = 'first-error' if diagnostics is None else f'max-errors={diagnostics.limit}'
+        key = self.key(data, f'{errors}:grouping={grouping}:parser={parser}')
+
+        if (entry := self.load(key, source)) is not None:
+            reporter.cached(True)
+            reporter.phase('Análise léxica')
+            if entry.tokens is not None:
+                reporter.described(len(entry.tokens))
+                if reporter.counts:
+                    reporter.counted('tokens', entry.tokens.count_kinds())
+            reporter.phase('Análise sintática e semântica')
+            if diagnostics is None:
+                if entry.errors:
+                    raise entry.errors[0]
+            else:
+                diagnostics.errors.extend(entry.errors)
+                if entry.truncated:
+                    raise diagnostics.interrupt()
+            if entry.program is not None:
+                reporter.parsed(len(entry.program.symbols))
+            return entry.program
+
+        reporter.cached(False)
+        tokens = program = None
+        try:
+            reporter.phase('Análise léxica')
+            tokens = describe(source, reporter, diagnostics)
+            reporter.phase('Análise sintática e semântica')
+            program = PARSERS[parser](tokens, reporter, diagnostics, grouping)
+        except (ALexicalError, ASyntaxError, ASemanticError) as error:
+            self.store(key, CacheEntry(tokens, None, [error]), source)
+            raise
+        except ATooManyErrors:
+            self.store(key, CacheEntry(tokens, None, diagnostics.errors, True), source)
+            raise
+        self.store(key, CacheEntry(tokens, program, diagnostics.errors if diagnostics is not None else []), source)
+        return program
@@ -0,0 +1,635 @@
+import hashlib
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from .runtime import division_by_zero
+from .syntax_tree import (
+    Assign, BinaryOperation, Block, Command, Condition, Expression, If, Node, NodeVisitor,
+    Number, Print, Program, Read, Relation, String, Variable, While)
+from .token import TokenKind
+
+# Limites dos inteiros de 64 bits (``long long``)
+INT_MIN, INT_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Níveis de expressões e de comandos aninhados no código C gerado, além dos quais as subexpressões
+# são calculadas em temporárias e os comandos usam desvios, já que os compiladores C esgotam
+# a sua pilha com dezenas de milhares de níveis
+MAX_NESTING = 64
+
+# Opções do compilador C usadas por ``build_c``
+CC_FLAGS = ('-std=c99', '-O2')
+
+# Operadores do C por operador da linguagem "A"
+_OPERATORS = {
+    TokenKind.ADDITION: '+',
+    TokenKind.SUBTRACTION: '-',
+    TokenKind.MULTIPLICATION: '*',
+    TokenKind.DIVISION: '/',
+    TokenKind.EQUAL: '==',
+    TokenKind.NOT_EQUAL: '!=',
+    TokenKind.LESS: '<',
+    TokenKind.GREATER: '>',
+    TokenKind.LESS_EQUAL: '<=',
+    TokenKind.GREATER_EQUAL: '>=',
+    TokenKind.AND: '&&',
+    TokenKind.OR: '||',
+}
+
+# Funções do C que verificam os limites das operações com inteiros
+_INT_FUNCTIONS = {
+    TokenKind.ADDITION: 'a_add',
+    TokenKind.SUBTRACTION: 'a_sub',
+    TokenKind.MULTIPLICATION: 'a_mul',
+}
+
+# Mensagens dos erros de execução, como as da máquina virtual
+_MESSAGES = {
+    'A_DIVISION_BY_ZERO': division_by_zero().message,
+    'A_OVERFLOW': 'erro de execução, inteiro fora dos limites de 64 bits',
+    'A_NO_INPUT': 'erro de execução, não existem mais valores de entrada',
+    'A_INVALID_INPUT': 'erro de execução, valor de entrada "%s" não é %s',
+}
+
+# Funções de execução incluídas em todo programa gerado
+_RUNTIME = r'''
+static void a_fail(const char *location, const char *message)
+{
+    fflush(stdout);
+    if (location != NULL)
+        fprintf(stderr, "%s: ", location);
+    fprintf(stderr, "%s\n", message);
+    exit(1);
+}
+
+static long long a_add(long long a, long long b, const char *location)
+{
+    if ((b > 0 && a > LLONG_MAX - b) || (b < 0 && a < LLONG_MIN - b))
+        a_fail(location, A_OVERFLOW);
+    return a + b;
+}
+
+static long long a_sub(long long a, long long b, const char *location)
+{
+    if ((b < 0 && a > LLONG_MAX + b) || (b > 0 && a < LLONG_MIN + b))
+        a_fail(location, A_OVERFLOW);
+    return a - b;
+}
+
+static long long a_mul(long long a, long long b, const char *location)
+{
+    if (a > 0 ? (b > 0 ? a > LLONG_MAX / b : b < LLONG_MIN / a)
+              : (b > 0 ? a < LLONG_MIN / b : a != 0 && b < LLONG_MAX / a))
+        a_fail(location, A_OVERFLOW);
+    return a * b;
+}
+
+static double a_div(double a, double b, const char *location)
+{
+    if (b == 0.0)
+        a_fail(location, A_DIVISION_BY_ZERO);
+    return a / b;
+}
+
+/* Lê o próximo valor de entrada, separado por espaços em branco, ou NULL no fim da entrada. */
+static char *a_next_value(void)
+{
+    static char *buffer = NULL;
+    static size_t capacity = 0;
+    size_t length = 0;
+    int character;
+
+    do
+        character = getchar();
+    while (character != EOF && isspace(character));
+    if (character == EOF)
+        return NULL;
+    while (character != EOF && !isspace(character)) {
+        if (length + 1 >= capacity) {
+            capacity = capacity ? capacity * 2 : 64;
+            if ((buffer = realloc(buffer, capacity)) == NULL)
+                abort();
+        }
+        buffer[length++] = (char) character;
+        character = getchar();
+    }
+    buffer[length] = '\0';
+    return buffer;
+}
+
+static void a_invalid_input(const char *location, const char *value, const char *type)
+{
+    fflush(stdout);
+    if (location != NULL)
+        fprintf(stderr, "%s: ", location);
+    fprintf(stderr, A_INVALID_INPUT, value, type);
+    fputc('\n', stderr);
+    exit(1);
+}
+
+/* Verifica um valor de entrada como parse_value: sinal opcional, dígitos ASCII e, em um real,
+   um ponto seguido de dígitos, sem expoente, infinito ou valores hexadecimais. */
+static int a_valid_number(const char *value, int real)
+{
+    if (*value == '+' || *value == '-')
+        value++;
+    if (*value < '0' || *value > '9')
+        return 0;
+    while (*value >= '0' && *value <= '9')
+        value++;
+    if (real && *value == '.') {
+        value++;
+        if (*value < '0' || *value > '9')
+            return 0;
+        while (*value >= '0' && *value <= '9')
+            value++;
+    }
+    return *value == '\0';
+}
+
+static long long a_read_int(const char *location)
+{
+    char *value = a_next_value();
+    long long number;
+
+    if (value == NULL)
+        a_fail(location, A_NO_INPUT);
+    if (!a_valid_number(value, 0))
+        a_invalid_input(location, value, "INT");
+    errno = 0;
+    number = strtoll(value, NULL, 10);
+    if (errno == ERANGE)
+        a_fail(location, A_OVERFLOW);
+    return number;
+}
+
+static double a_read_real(const char *location)
+{
+    char *value = a_next_value();
+
+    if (value == NULL)
+        a_fail(location, A_NO_INPUT);
+    if (!a_valid_number(value, 1))
+        a_invalid_input(location, value, "REAL");
+    return strtod(value, NULL);
+}
+
+/* Imprime um real como o Python: os dígitos mais curtos que o representam e, com um
+   expoente entre -4 e 15, em notação decimal com ao menos uma casa após o ponto. */
+static void a_print_real(double value)
+{
+    char text[32], digits[20];
+    int precision, exponent, count = 0, i;
+    const char *p;
+
+    if (isnan(value)) {
+        puts("nan");
+        return;
+    }
+    if (isinf(value)) {
+        puts(value > 0 ? "inf" : "-inf");
+        return;
+    }
+    for (precision = 1; precision < 17; precision++) {
+        sprintf(text, "%.*e", precision - 1, value);
+        if (strtod(text, NULL) == value)
+            break;
+    }
+    sprintf(text, "%.*e", precision - 1, value);
+    p = text;
+    if (*p == '-')
+        putchar(*p++);
+    for (; *p != 'e'; p++)
+        if (*p != '.')
+            digits[count++] = *p;
+    exponent = atoi(p + 1);
+
+    if (exponent < -4 || exponent >= 16) {
+        putchar(digits[0]);
+        if (count > 1)
+            printf(".%.*s", count - 1, digits + 1);
+        printf("e%c%02d\n", exponent < 0 ? '-' : '+', exponent < 0 ? -exponent : exponent);
+    } else if (exponent < 0) {
+        fputs("0.", stdout);
+        for (i = -1; i > exponent; i--)
+            putchar('0');
+        printf("%.*s\n", count, digits);
+    } else {
+        for (i = 0; i <= exponent; i++)
+            putchar(i < count ? digits[i] : '0');
+        putchar('.');
+        if (count > exponent + 1)
+            printf("%.*s\n", count - exponent - 1, digits + exponent + 1);
+        else
+            puts("0");
+    }
+}
+'''
+
+
+class UnsupportedProgram(ValueError):
+    """Erro lançado quando o programa não pode ser representado em C."""
+
+
+def c_string(text: str) -> str:
+    """Retorna o literal de cadeia de caracteres do C de um texto, com os bytes
+    não ASCII em UTF-8 como sequências octais."""
+    characters = []
+    for byte in text.encode('utf-8', 'surrogatepass'):
+        character = chr(byte)
+        if character in '\\"?':
+            characters.append('\\' + character)
+        elif 32 <= byte < 127:
+            characters.append(character)
+        else:
+            characters.append(f'\\{byte:03o}')
+    return f'"{"".join(characters)}"'
+
+
+def c_int(value: int) -> str:
+    """Retorna o literal do C de um inteiro de 64 bits."""
+    if value == INT_MIN:
+        return f'({INT_MIN + 1}LL - 1)'
+    return f'{value}LL'
+
+
+def c_real(value: float) -> str:
+    """Retorna o literal do C de um real, exato (em hexadecimal)."""
+    if math.isnan(value):
+        return 'NAN'
+    if math.isinf(value):
+        return 'HUGE_VAL' if value > 0 else '(-HUGE_VAL)'
+    return value.hex() if math.copysign(1.0, value) > 0 else f'(-{(-value).hex()})'
+
+
+def _location_text(node: Node) -> str:
+    """Retorna a localização de um nó no código-fonte, para as mensagens de erro."""
+    return str(node.token.location) if node.token is not None else '<código-fonte>'
+
+
+def c_location(node: Node) -> str:
+    """Retorna o literal da localização de um nó no código-fonte, ``NULL`` caso seja desconhecida."""
+    if node.token is None or node.token.source is None:
+        return 'NULL'
+    return c_string(str(node.token.location))
+
+
+def _height(node: Node) -> int:
+    """Retorna a altura de uma condição ou expressão, ``0`` para um número ou uma variável."""
+    height = 0
+    pending = [(node, 0)]
+    while pending:
+        node, depth = pending.pop()
+        height = max(height, depth)
+        pending.extend((child, depth + 1) for child in node.children())
+    return height
+
+
+class _Translator(NodeVisitor):
+    """Traduz a árvore sintática para o código C de um programa.
+
+    As expressões retornam o seu código C, se a sua avaliação pode falhar e a sua altura.
+    Uma expressão com ``MAX_NESTING`` níveis é calculada em uma temporária antes do comando que
+    a usa, e um ``SE`` ou ``ENQUANTO`` com mais de ``MAX_NESTING`` níveis de comandos ou de
+    condição usa desvios (``goto``), de forma que o código C não tenha milhares de níveis.
+    """
+
+    def __init__(self, program: Program):
+        self.slots = {name: slot for slot, name in enumerate(program.symbols)}
+        self.lines: List[str] = []
+        self.level = 1
+        # temporárias que fixam a ordem de avaliação, por tipo
+        self.temporaries = {TokenKind.LITERAL_INT: 0, TokenKind.LITERAL_FLOAT: 0}
+        self.labels = 0
+        # atribuições das temporárias, emitidas antes do comando que as usa
+        self.spilled: List[str] = []
+
+    def emit(self, line: str):
+        """Adiciona uma linha ao código, no nível de indentação atual."""
+        self.lines.append('    ' * self.level + line)
+
+    def temporary(self, kind: TokenKind) -> str:
+        """Cria uma variável temporária do tipo."""
+        self.temporaries[kind] += 1
+        return f'{"i" if kind == TokenKind.LITERAL_INT else "r"}{self.temporaries[kind]}'
+
+    def label(self) -> str:
+        """Cria um rótulo de desvio."""
+        self.labels += 1
+        return f'l{self.labels}'
+
+    def spill(self, value: Tuple[str, bool, int], kind: TokenKind, position: Optional[int] = None
+              ) -> Tuple[str, bool, int]:
+        """Calcula uma expressão em uma temporária, antes do comando que a usa.
+
+        Args:
+            value: A expressão traduzida.
+            kind: O tipo da expressão.
+            position: A posição da atribuição entre as atribuições pendentes (padrão: a última).
+
+        Returns:
+            A temporária, como uma expressão traduzida.
+        """
+        temporary = self.temporary(kind)
+        self.spilled.insert(len(self.spilled) if position is None else position, f'{temporary} = {value[0]};')
+        return temporary, False, 0
+
+    def flush(self):
+        """Emite as atribuições das temporárias pendentes."""
+        for line in self.spilled:
+            self.emit(line)
+        self.spilled.clear()
+
+    def ordered(self, left: Tuple[str, bool, int], right: Tuple[str, bool, int],
+                kind: TokenKind) -> Tuple[str, str, str]:
+        """Fixa a avaliação do operando da esquerda antes do da direita quando ambos podem falhar,
+        já que o C não define a ordem de avaliação dos operandos, de forma que o erro
+        relatado seja o mesmo da máquina virtual.
+
+        Returns:
+            O código que avalia antes o operando da esquerda (ou vazio) e o código dos dois operandos.
+        """
+        if left[1] and right[1]:
+            temporary = self.temporary(kind)
+            return f'{temporary} = {left[0]}, ', temporary, right[0]
+        return '', left[0], right[0]
+
+    def operands(self, left: Expression, right: Expression, kind: TokenKind):
+        """Traduz os dois operandos de uma operação ou comparação.
+
+        Caso o operando da direita tenha movido subexpressões para temporárias, calculadas antes
+        do comando, o operando da esquerda que pode falhar é movido antes delas.
+
+        Returns:
+            O código que avalia antes o operando da esquerda (ou vazio), o código e a tradução dos operandos.
+        """
+        left_value = yield self.expression(left, kind)
+        position = len(self.spilled)
+        right_value = yield self.expression(right, kind)
+        if left_value[1] and len(self.spilled) > position:
+            left_value = self.spill(left_value, kind, position)
+        return (*self.ordered(left_value, right_value, kind), left_value, right_value)
+
+    # Expressões
+    def expression(self, node: Expression, kind: TokenKind):
+        """Traduz uma expressão, promovendo-a para real caso necessário.
+
+        Args:
+            node: A expressão.
+            kind: O tipo desejado do resultado.
+        """
+        promoted = node.type == TokenKind.LITERAL_INT and kind == TokenKind.LITERAL_FLOAT
+        if promoted and isinstance(node, Number):
+            try:
+                return c_real(float(node.value)), False, 0
+            except OverflowError:
+                raise UnsupportedProgram(f'{_location_text(node)}: constante inteira {node.value} '
+                                         f'fora dos limites de REAL') from None
+        code, fails, height = yield node
+        return (f'(double) {code}' if promoted else code), fails, height
+
+    def visit_Number(self, node: Number) -> Tuple[str, bool, int]:
+        if node.type != TokenKind.LITERAL_INT:
+            return c_real(node.value), False, 0
+        if not INT_MIN <= node.value <= INT_MAX:
+            raise UnsupportedProgram(f'{_location_text(node)}: '
+                                     f'constante inteira {node.value} fora dos limites de 64 bits do C')
+        return c_int(node.value), False, 0
+
+    def visit_Variable(self, node: Variable) -> Tuple[str, bool, int]:
+        return f'v{self.slots[node.name]}', False, 0
+
+    def visit_BinaryOperation(self, node: BinaryOperation):
+        # a divisão sempre opera sobre reais
+        operand_kind = (TokenKind.LITERAL_INT
+                        if node.type == TokenKind.LITERAL_INT else
+                        TokenKind.LITERAL_FLOAT)
+        prefix, left_code, right_code, left, right = yield self.operands(node.left, node.right, operand_kind)
+        height = max(left[2], right[2]) + 1
+        if operand_kind == TokenKind.LITERAL_INT:
+            function = _INT_FUNCTIONS[node.operator]
+            value = f'({prefix}{function}({left_code}, {right_code}, {c_location(node)}))', True, height
+        elif node.operator == TokenKind.DIVISION:
+            value = f'({prefix}a_div({left_code}, {right_code}, {c_location(node)}))', True, height
+        else:
+            value = f'({prefix}{left_code} {_OPERATORS[node.operator]} {right_code})', left[1] or right[1], height
+        return self.spill(value, node.type) if height >= MAX_NESTING else value
+
+    # Condições
+    def relation(self, node: Relation):
+        """Traduz uma comparação."""
+        # comparar "int" e "real" como reais
+        kind = (TokenKind.LITERAL_INT
+                if node.left.type == node.right.type == TokenKind.LITERAL_INT else
+                TokenKind.LITERAL_FLOAT)
+        prefix, left_code, right_code, left, right = yield self.operands(node.left, node.right, kind)
+        return f'({prefix}{left_code} {_OPERATORS[node.operator]} {right_code})', left[1] or right[1]
+
+    def condition(self, node: Condition):
+        """Traduz uma condição, sem avaliar o restante de uma operação
+        booleana cujo resultado já é conhecido."""
+        if isinstance(node, Relation):
+            return (yield self.relation(node))
+        left = yield self.condition(node.left)
+        right = yield self.condition(node.right)
+        return f'({left[0]} {_OPERATORS[node.operator]} {right[0]})', left[1] or right[1]
+
+    def branch(self, node: Condition, jump_if: bool, label: str):
+        """Traduz uma condição como desvios para um rótulo, como em ``bytecode``, calculando
+        as temporárias de cada comparação apenas quando ela é avaliada.
+
+        Args:
+            node: A condição.
+            jump_if: O resultado da condição que provoca o desvio.
+            label: O rótulo do desvio.
+        """
+        if isinstance(node, Relation):
+            code, _ = yield self.relation(node)
+            self.flush()
+            self.emit(f'if {code if jump_if else f"(!{code})"} goto {label};')
+        elif (node.operator == TokenKind.AND) != jump_if:
+            # "E" desviando se falso, ou "OU" desviando se verdadeiro: basta uma das condições
+            yield self.branch(node.left, jump_if, label)
+            yield self.branch(node.right, jump_if, label)
+        else:
+            # "E" desviando se verdadeiro, ou "OU" desviando se falso: são necessárias as duas condições
+            skip = self.label()
+            yield self.branch(node.left, not jump_if, skip)
+            yield self.branch(node.right, jump_if, label)
+            self.emit(f'{skip}:;')
+
+    # Comandos
+    def flat(self, node: Union[If, While]) -> bool:
+        """Verifica se um ``SE`` ou ``ENQUANTO`` deve ser traduzido com desvios,
+        por estar aninhado demais ou por ter uma condição alta demais."""
+        return self.level > MAX_NESTING or _height(node.condition) >= MAX_NESTING
+
+    def body(self, node: Command):
+        """Traduz o corpo de um comando ``SE`` ou ``ENQUANTO`` entre chaves."""
+        self.level += 1
+        yield node
+        self.level -= 1
+        self.emit('}')
+
+    def visit_Program(self, node: Program):
+        for command in node.commands:
+            yield command
+
+    def visit_Assign(self, node: Assign):
+        code, _, _ = yield self.expression(node.expression, node.target.type)
+        self.flush()
+        self.emit(f'v{self.slots[node.target.name]} = {code};')
+
+    def visit_Read(self, node: Read):
+        function = 'a_read_int' if node.target.type == TokenKind.LITERAL_INT else 'a_read_real'
+        self.emit(f'v{self.slots[node.target.name]} = {function}({c_location(node)});')
+
+    def visit_Print(self, node: Print):
+        if isinstance(node.value, String):
+            self.emit(f'fputs({c_string(node.value.value + chr(10))}, stdout);')
+        elif node.value.type == TokenKind.LITERAL_INT:
+            self.emit(f'printf("%lld\\n", v{self.slots[node.value.name]});')
+        else:
+            self.emit(f'a_print_real(v{self.slots[node.value.name]});')
+
+    def visit_If(self, node: If):
+        if self.flat(node):
+            end = self.label()
+            yield self.branch(node.condition, False, end)
+            yield node.command
+            self.emit(f'{end}:;')
+        else:
+            code, _ = yield self.condition(node.condition)
+            self.emit(f'if {code} {{')
+            yield self.body(node.command)
+
+    def visit_While(self, node: While):
+        if self.flat(node):
+            start, end = self.label(), self.label()
+            self.emit(f'{start}:;')
+            yield self.branch(node.condition, False, end)
+            yield node.command
+            self.emit(f'goto {start};')
+            self.emit(f'{end}:;')
+        else:
+            code, _ = yield self.condition(node.condition)
+            self.emit(f'while {code} {{')
+            yield self.body(node.command)
+
+    def visit_Block(self, node: Block):
+        for command in node.commands:
+            yield command
+
+
+def emit_c(program: Program) -> str:
+    """Traduz a árvore sintática de um programa válido para um programa C99 independente.
+
+    ``INT`` se torna ``long long`` e ``REAL`` se torna ``double``, com as mesmas promoções
+    da máquina virtual; ``SE`` e ``ENQUANTO`` se tornam ``if`` e ``while``, e ``LER``
+    e ``IMPRIMIR`` leem e escrevem na entrada e na saída padrão, com os reais impressos
+    como no Python. Os erros de execução são escritos na saída de erros, com a sua
+    localização, e encerram o programa com o código 1; como os inteiros do C têm 64 bits,
+    um resultado ou valor de entrada fora desses limites também é um erro de execução.
+    Expressões e comandos aninhados além de ``MAX_NESTING`` níveis são achatados com
+    temporárias e desvios.
+
+    Args:
+        program: A árvore sintática do programa.
+
+    Returns:
+        O código C do programa.
+
+    Raises:
+        UnsupportedProgram: Caso o programa tenha uma constante inteira fora dos limites de 64 bits
+            ou, convertida para ``REAL``, fora dos limites de ``REAL``.
+    """
+    translator = _Translator(program)
+    translator.visit(program)
+
+    origin = ''
+    if program.token is not None and program.token.source is not None:
+        origin = f' a partir de {program.token.source.name}'.replace('*/', '* /')
+    lines = [f'/* Gerado pelo compilador da linguagem "A"{origin} */',
+             '#include <ctype.h>',
+             '#include <errno.h>',
+             '#include <limits.h>',
+             '#include <math.h>',
+             '#include <stdio.h>',
+             '#include <stdlib.h>',
+             '']
+    lines.extend(f'#define {macro} {c_string(message)}' for macro, message in _MESSAGES.items())
+    lines.append(_RUNTIME)
+    lines.append('int main(void)')
+    lines.append('{')
+    for slot, (variable, kind) in enumerate(program.symbols.items()):
+        declaration = 'long long' if kind == TokenKind.LITERAL_INT else 'double'
+        lines.append(f'    {declaration} v{slot} = {"0" if kind == TokenKind.LITERAL_INT else "0.0"};'
+                     f' /* {variable.replace("*/", "* /")} */')
+    for kind, declaration, prefix in ((TokenKind.LITERAL_INT, 'long long', 'i'),
+                                      (TokenKind.LITERAL_FLOAT, 'double', 'r')):
+        if count := translator.temporaries[kind]:
+            lines.append(f'    {declaration} {", ".join(f"{prefix}{index}" for index in range(1, count + 1))};')
+    if program.symbols or any(translator.temporaries.values()):
+        lines.append('')
+    lines.extend(translator.lines)
+    lines.append('    return 0;')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def build_c(text: str, cache_dir: Optional[Union[str, os.PathLike]] = None, cc: Optional[str] = None,
+            output: Optional[Union[str, os.PathLike]] = None) -> Path:
+    """Compila o código C de um programa para um executável com o compilador C do sistema.
+
+    Com ``cache_dir``, o código e o executável são guardados no diretório, nomeados pelo
+    resumo do código e do compilador, e um programa já compilado não é compilado novamente.
+
+    Args:
+        text: O código C, gerado por ``emit_c``.
+        cache_dir: O diretório onde os executáveis são guardados (opcional).
+        cc: O compilador C (padrão: a variável de ambiente ``CC`` ou ``cc``).
+        output: O caminho do executável, copiado do cache caso exista (opcional com ``cache_dir``).
+
+    Returns:
+        O caminho do executável.
+
+    Raises:
+        OSError: Caso o compilador C não seja encontrado.
+        subprocess.CalledProcessError: Caso o compilador C falhe, com as suas mensagens em ``stderr``.
+    """
+    cc = cc or os.environ.get('CC') or 'cc'
+    if cache_dir is None:
+        if output is None:
+            raise ValueError('informe o caminho do executável ou o diretório do cache')
+        return _compile(text, cc, Path(output))
+
+    key = hashlib.sha256(f'{cc}:{" ".join(CC_FLAGS)}:{text}'.encode()).hexdigest()
+    executable = Path(cache_dir) / key[:2] / key[2:]
+    if not executable.exists():
+        executable.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=executable.parent, suffix='.tmp')
+        os.close(descriptor)
+        try:
+            _compile(text, cc, Path(temporary_path))
+            os.replace(temporary_path, executable)
+        finally:
+            if os.path.exists(temporary_path):
+                os.unlink(temporary_path)
+    if output is None:
+        return executable
+    shutil.copy2(executable, output)
+    return Path(output)
+
+
+def _compile(text: str, cc: str, executable: Path) -> Path:
+    """Compila o código C para o executável."""
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = Path(directory) / 'programa.c'
+        source_path.write_text(text)
+        subprocess.run([cc, *CC_FLAGS, '-o', str(executable), str(source_path)],
+                       check=True, capture_output=True, text=True)
+    return executable
@@ -0,0 +1,544 @@
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .exceptions import AWarning
+from .syntax_tree import (
+    Assign, BinaryOperation, Block, BooleanOperation, Command, Condition, Expression, If, Node, Number,
+    Print, Program, Read, Relation, Variable, While)
+from .token import TokenKind
+
+# Valor de uma variável que não é constante na propagação de constantes
+NOT_CONSTANT = object()
+
+
+class BasicBlock:
+    """Bloco básico: comandos executados em sequência, seguidos opcionalmente
+    da condição de um ``SE`` ou ``ENQUANTO``."""
+    __slots__ = ('index', 'commands', 'condition', 'branch', 'successors', 'predecessors')
+
+    def __init__(self, index: int):
+        """Cria um bloco básico vazio.
+
+        Args:
+            index: A posição do bloco no grafo.
+        """
+        self.index = index
+        self.commands: List[Union[Assign, Read, Print]] = []
+        self.condition: Optional[Condition] = None
+        self.branch: Optional[Union[If, While]] = None
+        # com uma condição, o sucessor quando verdadeira seguido do sucessor quando falsa
+        self.successors: List['BasicBlock'] = []
+        self.predecessors: List['BasicBlock'] = []
+
+    def __repr__(self) -> str:
+        return f'<BasicBlock {self.index}: {len(self.commands)} comandos>'
+
+
+class ControlFlowGraph:
+    """Grafo de fluxo de controle de um programa da linguagem "A"."""
+    __slots__ = ('blocks', 'entry', 'exit', 'variables')
+
+    def __init__(self, variables: Dict[str, TokenKind]):
+        """Cria um grafo apenas com o bloco de entrada.
+
+        Args:
+            variables: O tipo de cada variável declarada.
+        """
+        self.blocks: List[BasicBlock] = []
+        self.variables = variables
+        self.entry = self.new_block()
+        self.exit = self.entry
+
+    def __repr__(self) -> str:
+        return f'<ControlFlowGraph {len(self.blocks)} blocos>'
+
+    def new_block(self) -> BasicBlock:
+        """Adiciona um bloco básico vazio ao grafo."""
+        block = BasicBlock(len(self.blocks))
+        self.blocks.append(block)
+        return block
+
+    @staticmethod
+    def link(source: BasicBlock, target: BasicBlock):
+        """Adiciona uma aresta entre dois blocos."""
+        source.successors.append(target)
+        target.predecessors.append(source)
+
+    def reverse_postorder(self) -> List[BasicBlock]:
+        """Retorna os blocos alcançáveis a partir da entrada em pós-ordem reversa,
+        a ordem em que as análises para frente convergem mais rapidamente."""
+        order = []
+        visited = {self.entry.index}
+        pending = [(self.entry, iter(self.entry.successors))]
+        while pending:
+            block, successors = pending[-1]
+            for successor in successors:
+                if successor.index not in visited:
+                    visited.add(successor.index)
+                    pending.append((successor, iter(successor.successors)))
+                    break
+            else:
+                pending.pop()
+                order.append(block)
+        order.reverse()
+        return order
+
+
+def build_cfg(program: Program) -> ControlFlowGraph:
+    """Constrói o grafo de fluxo de controle de um programa válido.
+
+    Cada ``SE`` e cada ``ENQUANTO`` encerra um bloco com a sua condição; o ``ENQUANTO``
+    tem um bloco próprio para a condição, ao qual o fim do corpo retorna.
+
+    Args:
+        program: A árvore sintática do programa.
+
+    Returns:
+        O grafo, cujos blocos referenciam os nós da árvore.
+    """
+    cfg = ControlFlowGraph(program.symbols)
+    current = cfg.entry
+    # os comandos a adicionar, do último ao primeiro, e o fim do corpo de cada SE e ENQUANTO:
+    # o bloco da condição e o bloco seguinte ao SE, ou ``None`` no ENQUANTO, cujo corpo retorna à condição
+    pending: List[Union[Command, Tuple[BasicBlock, Optional[BasicBlock]]]] = list(reversed(program.commands))
+    while pending:
+        command = pending.pop()
+        if isinstance(command, tuple):
+            head, after = command
+            if after is None:
+                cfg.link(current, head)
+                after = cfg.new_block()
+                cfg.link(head, after)
+            else:
+                cfg.link(current, after)
+                cfg.link(head, after)
+            current = after
+        elif isinstance(command, Block):
+            pending.extend(reversed(command.commands))
+        elif isinstance(command, If):
+            current.condition, current.branch = command.condition, command
+            body = cfg.new_block()
+            cfg.link(current, body)
+            pending.append((current, cfg.new_block()))
+            pending.append(command.command)
+            current = body
+        elif isinstance(command, While):
+            head = cfg.new_block()
+            cfg.link(current, head)
+            head.condition, head.branch = command.condition, command
+            body = cfg.new_block()
+            cfg.link(head, body)
+            pending.append((head, None))
+            pending.append(command.command)
+            current = body
+        else:
+            current.commands.append(command)
+    cfg.exit = current
+    return cfg
+
+
+def variables_in(node: Node) -> Iterator[Variable]:
+    """Gera os usos de variáveis de uma expressão ou condição."""
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, Variable):
+            yield node
+        elif not isinstance(node, Number):
+            pending.extend(node.children())
+
+
+def operation_may_fail(node: BinaryOperation) -> bool:
+    """Verifica se uma operação aritmética pode falhar, sem considerar os seus operandos:
+    uma divisão por algo que não seja um número diferente de zero ou a conversão
+    para real de um operando inteiro que não seja um número."""
+    if node.operator == TokenKind.DIVISION and not (isinstance(node.right, Number) and node.right.value != 0):
+        return True
+    return node.type != TokenKind.LITERAL_INT and any(
+        operand.type == TokenKind.LITERAL_INT and not (isinstance(operand, Number) and as_real(operand.value) is not None)
+        for operand in (node.left, node.right))
+
+
+def may_fail(node: Expression) -> bool:
+    """Verifica se a avaliação de uma expressão pode falhar, com alguma operação de ``operation_may_fail``."""
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, BinaryOperation):
+            if operation_may_fail(node):
+                return True
+            pending.extend((node.left, node.right))
+    return False
+
+
+def as_real(value: Union[int, float]) -> Optional[float]:
+    """Converte um valor para real como a máquina virtual.
+
+    Returns:
+        O real, ``None`` caso seja um inteiro além dos limites dos reais, um erro da execução.
+    """
+    try:
+        return float(value)
+    except OverflowError:
+        return None
+
+
+def evaluate_operation(operator: TokenKind, kind: TokenKind,
+                       left: Union[int, float], right: Union[int, float]) -> Optional[Union[int, float]]:
+    """Calcula uma operação aritmética como a máquina virtual.
+
+    Args:
+        operator: O operador.
+        kind: O tipo do resultado; com ``LITERAL_FLOAT``, os operandos são promovidos a reais.
+        left: O operando à esquerda.
+        right: O operando à direita.
+
+    Returns:
+        O resultado, ``None`` caso seja uma divisão por zero ou a conversão de um inteiro
+        além dos limites dos reais, que são relatadas na execução.
+    """
+    if kind != TokenKind.LITERAL_INT:
+        left, right = as_real(left), as_real(right)
+        if left is None or right is None:
+            return None
+    if operator == TokenKind.ADDITION:
+        return left + right
+    if operator == TokenKind.SUBTRACTION:
+        return left - right
+    if operator == TokenKind.MULTIPLICATION:
+        return left * right
+    return left / right if right != 0 else None
+
+
+def evaluate_expression(node: Expression, values: Dict[str, object]) -> Optional[Union[int, float]]:
+    """Calcula uma expressão com os valores constantes das variáveis.
+
+    Args:
+        node: A expressão.
+        values: O valor de cada variável, ou ``NOT_CONSTANT``.
+
+    Returns:
+        O valor da expressão, ``None`` caso não seja constante ou caso a avaliação falhe.
+    """
+    operands: List[Union[int, float]] = []
+    # os nós a avaliar e, após os seus operandos, as operações
+    pending: List[Tuple[Expression, bool]] = [(node, False)]
+    while pending:
+        node, ready = pending.pop()
+        if isinstance(node, Number):
+            operands.append(node.value)
+        elif isinstance(node, Variable):
+            if (value := values[node.name]) is NOT_CONSTANT:
+                return None
+            operands.append(value)
+        elif not ready:
+            pending.extend(((node, True), (node.right, False), (node.left, False)))
+        else:
+            right = operands.pop()
+            value = evaluate_operation(node.operator, node.type, operands.pop(), right)
+            # um resultado NaN não é igual a si mesmo, portanto não é tratado como constante
+            if value is None or value != value:
+                return None
+            operands.append(value)
+    return operands[0]
+
+
+def evaluate_relation(node: Relation, values: Dict[str, object]) -> Optional[bool]:
+    """Calcula uma comparação com os valores constantes das variáveis.
+
+    Args:
+        node: A comparação.
+        values: O valor de cada variável, ou ``NOT_CONSTANT``.
+
+    Returns:
+        O resultado da comparação, ``None`` caso não seja constante ou caso a avaliação possa falhar.
+    """
+    if (left := evaluate_expression(node.left, values)) is None \
+            or (right := evaluate_expression(node.right, values)) is None:
+        return None
+    if node.left.type != node.right.type:
+        left, right = as_real(left), as_real(right)
+        if left is None or right is None:
+            return None
+    if node.operator == TokenKind.EQUAL:
+        return left == right
+    if node.operator == TokenKind.NOT_EQUAL:
+        return left != right
+    if node.operator == TokenKind.LESS:
+        return left < right
+    if node.operator == TokenKind.GREATER:
+        return left > right
+    if node.operator == TokenKind.LESS_EQUAL:
+        return left <= right
+    return left >= right
+
+
+def evaluate_condition(node: Condition, values: Dict[str, object]) -> Optional[bool]:
+    """Calcula uma condição com os valores constantes das variáveis, sem avaliar
+    o restante de uma operação booleana cujo resultado já é conhecido, como a máquina virtual.
+
+    Args:
+        node: A condição.
+        values: O valor de cada variável, ou ``NOT_CONSTANT``.
+
+    Returns:
+        O resultado da condição, ``None`` caso não seja constante ou caso a avaliação possa falhar.
+    """
+    # as operações booleanas em avaliação, e se o seu lado direito já está sendo avaliado
+    pending: List[Tuple[BooleanOperation, bool]] = []
+    while True:
+        while isinstance(node, BooleanOperation):
+            pending.append((node, False))
+            node = node.left
+        result = evaluate_relation(node, values)
+        while pending and result is not None:
+            operation, right = pending.pop()
+            if not right and result != (operation.operator == TokenKind.OR):
+                # o lado esquerdo não decide a operação
+                pending.append((operation, True))
+                node = operation.right
+                break
+        else:
+            return result
+
+
+def _command_uses(command: Union[Assign, Read, Print]) -> Iterator[Variable]:
+    """Gera os usos de variáveis de um comando."""
+    if isinstance(command, Assign):
+        yield from variables_in(command.expression)
+    elif isinstance(command, Print) and isinstance(command.value, Variable):
+        yield command.value
+
+
+def liveness(cfg: ControlFlowGraph) -> List[int]:
+    """Calcula as variáveis vivas no fim de cada bloco, cujo valor ainda pode ser lido.
+
+    Os conjuntos de variáveis são inteiros usados como vetores de bits, na ordem das declarações,
+    e os blocos são processados por uma lista de trabalho em pós-ordem.
+
+    Args:
+        cfg: O grafo do programa.
+
+    Returns:
+        O conjunto das variáveis vivas no fim de cada bloco, pela posição do bloco.
+    """
+    bits = {name: 1 << slot for slot, name in enumerate(cfg.variables)}
+    uses = [0] * len(cfg.blocks)
+    definitions = [0] * len(cfg.blocks)
+    for block in cfg.blocks:
+        used = defined = 0
+        for command in block.commands:
+            for variable in _command_uses(command):
+                used |= bits[variable.name] & ~defined
+            if not isinstance(command, Print):
+                defined |= bits[command.target.name]
+        if block.condition is not None:
+            for variable in variables_in(block.condition):
+                used |= bits[variable.name] & ~defined
+        uses[block.index], definitions[block.index] = used, defined
+
+    live_in = [0] * len(cfg.blocks)
+    live_out = [0] * len(cfg.blocks)
+    worklist = deque(reversed(cfg.reverse_postorder()))
+    queued = {block.index for block in worklist}
+    while worklist:
+        block = worklist.popleft()
+        queued.discard(block.index)
+        out = 0
+        for successor in block.successors:
+            out |= live_in[successor.index]
+        live_out[block.index] = out
+        if (new_in := uses[block.index] | (out & ~definitions[block.index])) != live_in[block.index]:
+            live_in[block.index] = new_in
+            for predecessor in block.predecessors:
+                if predecessor.index not in queued:
+                    queued.add(predecessor.index)
+                    worklist.append(predecessor)
+    return live_out
+
+
+def reaching_initial_definitions(cfg: ControlFlowGraph) -> List[int]:
+    """Calcula as definições que alcançam o início de cada bloco, restritas às definições
+    iniciais das variáveis (o seu valor antes de qualquer ``LER`` ou ``ATRIBUIR``).
+
+    Uma definição inicial alcança um bloco enquanto algum caminho desde a entrada não passa
+    por uma definição da variável; restringir as definições às iniciais mantém os conjuntos
+    com um bit por variável, na ordem das declarações, e não por comando. Os blocos são
+    processados por uma lista de trabalho em pós-ordem reversa.
+
+    Args:
+        cfg: O grafo do programa.
+
+    Returns:
+        O conjunto das variáveis cuja definição inicial alcança o início de cada bloco,
+        pela posição do bloco.
+    """
+    bits = {name: 1 << slot for slot, name in enumerate(cfg.variables)}
+    killed = [0] * len(cfg.blocks)
+    for block in cfg.blocks:
+        for command in block.commands:
+            if not isinstance(command, Print):
+                killed[block.index] |= bits[command.target.name]
+
+    reaching_in = [0] * len(cfg.blocks)
+    reaching_in[cfg.entry.index] = (1 << len(cfg.variables)) - 1
+    reaching_out: List[Optional[int]] = [None] * len(cfg.blocks)
+    worklist = deque(cfg.reverse_postorder())
+    queued = {block.index for block in worklist}
+    while worklist:
+        block = worklist.popleft()
+        queued.discard(block.index)
+        if block is not cfg.entry:
+            incoming = 0
+            for predecessor in block.predecessors:
+                incoming |= reaching_out[predecessor.index] or 0
+            reaching_in[block.index] = incoming
+        if (out := reaching_in[block.index] & ~killed[block.index]) != reaching_out[block.index]:
+            reaching_out[block.index] = out
+            for successor in block.successors:
+                if successor.index not in queued:
+                    queued.add(successor.index)
+                    worklist.append(successor)
+    return reaching_in
+
+
+def _propagate_block(block: BasicBlock, values: Dict[str, object]) -> Dict[str, object]:
+    """Calcula os valores das variáveis no fim dos comandos de um bloco."""
+    values = dict(values)
+    for command in block.commands:
+        if isinstance(command, Assign):
+            value = evaluate_expression(command.expression, values)
+            if value is not None and command.target.type == TokenKind.LITERAL_FLOAT:
+                value = as_real(value)
+            values[command.target.name] = NOT_CONSTANT if value is None else value
+        elif isinstance(command, Read):
+            values[command.target.name] = NOT_CONSTANT
+    return values
+
+
+def propagate_constants(cfg: ControlFlowGraph) -> List[Optional[Dict[str, object]]]:
+    """Calcula os valores constantes das variáveis no início de cada bloco.
+
+    As variáveis começam com os valores iniciais da execução (``0`` ou ``0.0``), e as arestas
+    de uma condição constante que nunca são seguidas não propagam valores, de forma que os blocos
+    que só elas alcançam permaneçam inalcançáveis.
+
+    Args:
+        cfg: O grafo do programa.
+
+    Returns:
+        O valor de cada variável no início de cada bloco (ou ``NOT_CONSTANT``),
+        ``None`` para os blocos inalcançáveis.
+    """
+    values_in: List[Optional[Dict[str, object]]] = [None] * len(cfg.blocks)
+    values_in[cfg.entry.index] = {name: 0 if kind == TokenKind.LITERAL_INT else 0.0
+                                  for name, kind in cfg.variables.items()}
+    worklist = deque([cfg.entry])
+    queued = {cfg.entry.index}
+    while worklist:
+        block = worklist.popleft()
+        queued.discard(block.index)
+        values = _propagate_block(block, values_in[block.index])
+        successors = block.successors
+        if block.condition is not None and (result := evaluate_condition(block.condition, values)) is not None:
+            successors = [successors[0 if result else 1]]
+        for successor in successors:
+            if (old := values_in[successor.index]) is None:
+                new = values
+            else:
+                new = {name: value if value is old[name] or value == old[name] else NOT_CONSTANT
+                       for name, value in values.items()}
+            if new != old:
+                values_in[successor.index] = new
+                if successor.index not in queued:
+                    queued.add(successor.index)
+                    worklist.append(successor)
+    return values_in
+
+
+def constant_branches(cfg: ControlFlowGraph) -> Dict[Union[If, While], bool]:
+    """Encontra os ``SE`` e ``ENQUANTO`` alcançáveis cuja condição é sempre verdadeira ou sempre falsa.
+
+    Args:
+        cfg: O grafo do programa.
+
+    Returns:
+        O resultado constante da condição de cada comando.
+    """
+    values_in = propagate_constants(cfg)
+    results = {}
+    for block in cfg.blocks:
+        if block.condition is None or values_in[block.index] is None:
+            continue
+        values = _propagate_block(block, values_in[block.index])
+        if (result := evaluate_condition(block.condition, values)) is not None:
+            results[block.branch] = result
+    return results
+
+
+def dead_stores(cfg: ControlFlowGraph) -> Set[Assign]:
+    """Encontra as atribuições cujo valor nunca é lido e cuja expressão não pode falhar.
+
+    Args:
+        cfg: O grafo do programa.
+
+    Returns:
+        As atribuições que podem ser removidas.
+    """
+    bits = {name: 1 << slot for slot, name in enumerate(cfg.variables)}
+    live_out = liveness(cfg)
+    dead = set()
+    for block in cfg.blocks:
+        live = live_out[block.index]
+        if block.condition is not None:
+            for variable in variables_in(block.condition):
+                live |= bits[variable.name]
+        for command in reversed(block.commands):
+            if isinstance(command, Print):
+                if isinstance(command.value, Variable):
+                    live |= bits[command.value.name]
+                continue
+            bit = bits[command.target.name]
+            if isinstance(command, Assign):
+                if not live & bit and not may_fail(command.expression):
+                    dead.add(command)
+                    continue
+                live &= ~bit
+                for variable in variables_in(command.expression):
+                    live |= bits[variable.name]
+            else:
+                live &= ~bit
+    return dead
+
+
+def uninitialized_reads(program: Program) -> List[AWarning]:
+    """Encontra as leituras de variáveis que podem ocorrer antes de qualquer ``LER`` ou ``ATRIBUIR``
+    da variável, em que a variável ainda tem o seu valor inicial.
+
+    Args:
+        program: A árvore sintática de um programa válido.
+
+    Returns:
+        Um aviso para cada leitura, na ordem do código-fonte.
+    """
+    cfg = build_cfg(program)
+    reaching_in = reaching_initial_definitions(cfg)
+    bits = {name: 1 << slot for slot, name in enumerate(cfg.variables)}
+    warnings = []
+
+    def check(variable: Variable, reaching: int):
+        if reaching & bits[variable.name]:
+            warnings.append(AWarning(f'aviso, variável "{variable.name}" pode ser lida antes de LER ou ATRIBUIR',
+                                     variable.token.location if variable.token is not None else None))
+
+    for block in cfg.reverse_postorder():
+        reaching = reaching_in[block.index]
+        for command in block.commands:
+            for variable in _command_uses(command):
+                check(variable, reaching)
+            if not isinstance(command, Print):
+                reaching &= ~bits[command.target.name]
+        if block.condition is not None:
+            for variable in variables_in(block.condition):
+                check(variable, reaching)
+    return sorted(warnings, key=lambda warning: (warning.location is None, warning.location or ()))
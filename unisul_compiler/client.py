@@ -0,0 +1,139 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+from typing import Iterable, Iterator, List, Optional
+
+
+class CompileClient:
+    """Cliente do servidor do compilador da linguagem "A" em um socket Unix.
+
+    Importa apenas a biblioteca padrão, de forma que inicie rapidamente.
+    """
+
+    def __init__(self, path: str):
+        """Conecta-se ao servidor.
+
+        Args:
+            path: O caminho do socket do servidor.
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path)
+        self._reader = self._socket.makefile('rb')
+        self._next_id = 0
+
+    def close(self):
+        """Encerra a conexão."""
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'CompileClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def request(self, request: dict) -> dict:
+        """Envia uma requisição e aguarda a sua resposta.
+
+        Args:
+            request: A requisição (``op``, ``source`` ou ``path`` e as opções da análise).
+
+        Returns:
+            A resposta do servidor.
+        """
+        return list(self.request_many([request]))[0]
+
+    def request_many(self, requests: Iterable[dict]) -> Iterator[dict]:
+        """Envia várias requisições sem aguardar as respostas e gera as respostas
+        na ordem em que ficam prontas.
+
+        As requisições sem ``id`` recebem um número sequencial.
+
+        Args:
+            requests: As requisições.
+
+        Yields:
+            As respostas, identificadas pelo ``id`` da requisição.
+        """
+        sent = 0
+        finished = False
+        condition = threading.Condition()
+
+        def send():
+            nonlocal sent, finished
+            try:
+                for request in requests:
+                    if 'id' not in request:
+                        request = {**request, 'id': self._next_id}
+                        self._next_id += 1
+                    self._socket.sendall(json.dumps(request, ensure_ascii=False).encode() + b'\n')
+                    with condition:
+                        sent += 1
+                        condition.notify()
+            finally:
+                with condition:
+                    finished = True
+                    condition.notify()
+
+        # enviar em uma thread própria, já que o servidor pausa a leitura até que as respostas sejam lidas
+        sender = threading.Thread(target=send, daemon=True)
+        sender.start()
+        received = 0
+        while True:
+            with condition:
+                # aguardar uma requisição ainda não respondida, ou o fim das requisições
+                condition.wait_for(lambda: finished or received < sent)
+                if received == sent:
+                    break
+            if not (line := self._reader.readline()):
+                raise ConnectionError('o servidor encerrou a conexão')
+            received += 1
+            yield json.loads(line)
+        sender.join()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Envia os arquivos ao servidor e escreve uma resposta em JSON por linha.
+
+    Returns:
+        O código de saída: 1 caso algum programa seja inválido ou alguma requisição falhe.
+    """
+    parser = argparse.ArgumentParser(description='''
+    Cliente do servidor do compilador da linguagem "A" (python main.py --server --socket caminho).
+    ''')
+    parser.add_argument('source_file_path', nargs='+', help='caminhos dos arquivos de texto (códigos-fonte)')
+    parser.add_argument('--socket', required=True, help='caminho do socket do servidor')
+    parser.add_argument('--op', choices=['check', 'compile', 'run'], default='check',
+                        help='operação: check (análise), compile (listagem do código) ou run (execução) '
+                             '(padrão: check)')
+    parser.add_argument('--input', metavar='INPUT_FILE_PATH', help='arquivo com os valores de "LER" para run')
+    parser.add_argument('--grouping', choices=['precedence', 'legacy'], default='precedence',
+                        help='agrupamento das expressões (padrão: precedence)')
+    parser.add_argument('--parser', choices=['descent', 'table'], default='descent',
+                        help='analisador sintático (padrão: descent)')
+    parser.add_argument('--backend', choices=['vm', 'python'], default='vm',
+                        help='código listado por compile; run executa apenas com vm (padrão: vm)')
+    parser.add_argument('-O', '--optimize', action='store_true', help='otimiza as expressões aritméticas')
+    args = parser.parse_args(argv)
+
+    stdin = ''
+    if args.input is not None:
+        with open(args.input) as input_file:
+            stdin = input_file.read()
+    options = {'op': args.op, 'grouping': args.grouping, 'parser': args.parser, 'backend': args.backend,
+               'optimize': args.optimize, 'input': stdin}
+    failed = False
+    with CompileClient(args.socket) as client:
+        # os arquivos são lidos pelo servidor, e não por este processo
+        requests = ({**options, 'id': path, 'path': os.path.abspath(path)} for path in args.source_file_path)
+        for response in client.request_many(requests):
+            failed = failed or not response.get('ok') or not response.get('valid')
+            print(json.dumps(response, ensure_ascii=False))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
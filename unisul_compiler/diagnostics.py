@@ -0,0 +1,56 @@
+from typing import Iterator, List, Optional
+
+from .exceptions import AError, ATooManyErrors
+
+
+class Diagnostics:
+    """Lista dos erros encontrados em uma única análise do código-fonte.
+
+    Um erro na mesma localização do erro anterior é descartado, já que é
+    consequência dele. Ao exceder o limite de erros, a análise é interrompida.
+    """
+    __slots__ = ('errors', 'limit', 'truncated')
+
+    def __init__(self, limit: Optional[int] = None):
+        """Cria uma lista de erros vazia.
+
+        Args:
+            limit: A quantidade máxima de erros coletados (padrão: sem limite).
+        """
+        self.errors: List[AError] = []
+        self.limit = limit
+        self.truncated = False
+
+    def __repr__(self) -> str:
+        return f'<Diagnostics {len(self.errors)} erros>'
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def __iter__(self) -> Iterator[AError]:
+        return iter(self.errors)
+
+    def add(self, error: AError):
+        """Adiciona um erro.
+
+        Args:
+            error: O erro.
+
+        Raises:
+            ATooManyErrors: Caso a quantidade de erros exceda o limite.
+        """
+        if self.errors and error.location is not None and error.location == self.errors[-1].location:
+            return
+        if self.limit is not None and len(self.errors) >= self.limit:
+            raise self.interrupt()
+        self.errors.append(error)
+
+    def interrupt(self) -> ATooManyErrors:
+        """Marca a lista como incompleta e cria o erro que interrompe a análise."""
+        self.truncated = True
+        return ATooManyErrors(f'análise interrompida após {self.limit} erros')
+
+    def sorted(self) -> List[AError]:
+        """Retorna os erros na ordem em que aparecem no código-fonte,
+        seguidos dos erros sem localização."""
+        return sorted(self.errors, key=lambda error: (error.location is None, error.location or ()))
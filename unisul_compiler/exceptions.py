@@ -1,10 +1,60 @@
-class ALexicalError(Exception):
+from typing import Optional
+
+from .source import Location
+
+
+class AError(Exception):
+    """Erro da Linguagem "A", com a sua localização no código-fonte quando conhecida."""
+
+    def __init__(self, message: str, location: Optional[Location] = None):
+        """Cria um erro.
+
+        Args:
+            message: A mensagem do erro.
+            location: A localização do erro no código-fonte (opcional).
+        """
+        super().__init__(message)
+        self.message = message
+        self.location = location
+
+    def __str__(self):
+        return f'{self.location}: {self.message}' if self.location is not None else self.message
+
+
+class ALexicalError(AError):
     """Erro léxico da Linguagem "A"."""
 
 
-class ASyntaxError(Exception):
+class ASyntaxError(AError):
     """Erro sintático da Linguagem "A"."""
 
 
-class ASemanticError(Exception):
+class ASemanticError(AError):
     """Erro semântico da Linguagem "A"."""
+
+
+class ARuntimeError(AError):
+    """Erro de execução da Linguagem "A"."""
+
+
+class ALimitExceeded(ARuntimeError):
+    """Erro de execução lançado quando um programa excede um dos limites da sua execução."""
+
+    def __init__(self, message: str, limit: str, location: Optional[Location] = None):
+        """Cria um erro de limite excedido.
+
+        Args:
+            message: A mensagem do erro.
+            limit: O nome do limite excedido (``max_operations``, ``timeout``, ``max_output`` ou ``max_reads``).
+            location: A localização do erro no código-fonte (opcional).
+        """
+        super().__init__(message, location)
+        self.limit = limit
+
+
+class AWarning(AError):
+    """Aviso da Linguagem "A": um provável engano que não impede a compilação, relatado mas nunca lançado."""
+
+
+class ATooManyErrors(AError):
+    """Erro lançado quando a quantidade de erros coletados excede o limite."""
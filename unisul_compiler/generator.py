@@ -0,0 +1,210 @@
+import random
+from typing import List, Optional, Tuple
+
+# Operadores aritméticos das expressões inteiras e reais
+_INT_OPERATORS = ('+', '-', '*')
+_REAL_OPERATORS = ('+', '-', '*', '/')
+
+# Operadores relacionais
+_RELATIONAL_OPERATORS = ('=', '<>', '<', '>', '<=', '>=')
+
+# Erros que podem ser inseridos em um comando simples
+ERROR_KINDS = ('lexical', 'syntax', 'undeclared', 'type')
+
+
+class _Generator:
+    """Gera as linhas de um programa sintético, comando a comando."""
+
+    def __init__(self, rng: random.Random, declarations: int, depth: int, expression_length: int,
+                 comment_density: float, string_density: float, loop_iterations: int):
+        self.rng = rng
+        self.depth = depth
+        self.expression_length = expression_length
+        self.comment_density = comment_density
+        self.string_density = string_density
+        self.loop_iterations = loop_iterations
+        # as variáveis de entrada só recebem valores de "LER" e as de saída nunca são lidas,
+        # de forma que os valores não cresçam a cada iteração dos laços
+        count = max(declarations, 4)
+        self.int_inputs = [f'x{index}' for index in range(0, count, 4)]
+        self.real_inputs = [f'x{index}' for index in range(1, count, 4)]
+        self.int_outputs = [f'y{index}' for index in range(2, count, 4)]
+        self.real_outputs = [f'y{index}' for index in range(3, count, 4)]
+        self.counters = [f'c{level}' for level in range(depth)]
+        # nível, comando e comentário de cada linha
+        self.lines: List[Tuple[int, str, str]] = []
+        # linhas onde um erro pode ser inserido
+        self.simple_lines: List[int] = []
+
+    def declarations(self) -> List[str]:
+        names = [(name, 'INT') for name in self.int_inputs + self.int_outputs + self.counters]
+        names += [(name, 'REAL') for name in self.real_inputs + self.real_outputs]
+        self.rng.shuffle(names)
+        return [f'{name} : {type_name}' for name, type_name in names]
+
+    def literal(self, real: bool) -> str:
+        sign = self.rng.choice('+-') if self.rng.random() < 0.1 else ''
+        if real:
+            return f'{sign}{self.rng.randint(0, 99)}.{self.rng.randint(0, 99)}'
+        return f'{sign}{self.rng.randint(0, 99)}'
+
+    def operand(self, real: bool, level: int) -> Tuple[str, bool]:
+        """Gera uma variável ou um número, retornando se é real."""
+        if self.rng.random() < 0.4:
+            is_real = real and self.rng.random() < 0.5
+            return self.literal(is_real), is_real
+        names = self.int_inputs + self.counters[:level]
+        if real:
+            names = names + self.real_inputs
+        name = self.rng.choice(names)
+        return name, name in self.real_inputs
+
+    def expression(self, real: bool, level: int) -> str:
+        """Gera uma expressão aritmética inteira ou real com ``expression_length`` operandos."""
+        operators = _REAL_OPERATORS if real else _INT_OPERATORS
+        parts = []
+        is_real = False
+        for index in range(max(self.expression_length, 1)):
+            if index:
+                operator = self.rng.choice(operators)
+                parts.append(operator)
+                if operator == '/':
+                    # dividir apenas por um número diferente de zero
+                    parts.append(f'{self.rng.randint(1, 9)}.{self.rng.randint(1, 9)}')
+                    is_real = True
+                    continue
+            if self.rng.random() < 0.15:
+                left, left_real = self.operand(real, level)
+                right, right_real = self.operand(real, level)
+                parts.append(f'({left} {self.rng.choice(_INT_OPERATORS)} {right})')
+                is_real = is_real or left_real or right_real
+            else:
+                operand, operand_real = self.operand(real, level)
+                parts.append(operand)
+                is_real = is_real or operand_real
+        if real and not is_real:
+            parts[0] = self.literal(True)
+        return ' '.join(parts)
+
+    def relation(self, level: int) -> str:
+        real = self.rng.random() < 0.5
+        return (f'{self.expression(real, level)} {self.rng.choice(_RELATIONAL_OPERATORS)} '
+                f'{self.expression(self.rng.random() < 0.5, level)}')
+
+    def condition(self, level: int) -> str:
+        condition = self.relation(level)
+        while self.rng.random() < 0.3:
+            condition += f' {self.rng.choice(["E", "OU"])} {self.relation(level)}'
+        return condition
+
+    def emit(self, level: int, text: str, simple: bool = False):
+        if simple:
+            self.simple_lines.append(len(self.lines))
+        comment = f' % comentário {len(self.lines)}' if self.rng.random() < self.comment_density else ''
+        self.lines.append((level, text, comment))
+
+    def simple_command(self, level: int):
+        choice = self.rng.random()
+        if choice < 0.6:
+            real = self.rng.random() < 0.5
+            target = self.rng.choice(self.real_outputs if real else self.int_outputs)
+            self.emit(level, f'ATRIBUIR {self.expression(real, level)} A {target}', True)
+        elif choice < 0.75:
+            self.emit(level, f'LER {self.rng.choice(self.int_inputs + self.real_inputs)}', True)
+        elif self.rng.random() < self.string_density:
+            self.emit(level, f"IMPRIMIR 'texto {len(self.lines)} com espaços'")
+        else:
+            self.emit(level, f'IMPRIMIR {self.rng.choice(self.int_outputs + self.real_outputs)}', True)
+
+    def commands(self, count: int):
+        """Gera ``count`` comandos, abrindo blocos ``SE`` e ``ENQUANTO`` até a profundidade máxima."""
+        # comandos restantes e laço (ou ``None`` para um "SE") de cada bloco aberto
+        blocks: List[Tuple[int, Optional[str]]] = []
+        for _ in range(count):
+            while blocks and blocks[-1][0] == 0:
+                self.close(blocks)
+            if blocks:
+                blocks[-1] = (blocks[-1][0] - 1, blocks[-1][1])
+            level = len(blocks)
+            if level < self.depth and self.rng.random() < 0.2:
+                size = self.rng.randint(1, 8)
+                if self.rng.random() < 0.5:
+                    counter = self.counters[level]
+                    self.emit(level, f'ATRIBUIR 0 A {counter}')
+                    condition = f'{counter} < {self.loop_iterations}'
+                    if self.rng.random() < 0.3:
+                        condition += f' E {self.relation(level)}'
+                    self.emit(level, f'ENQUANTO {condition}')
+                    self.emit(level, 'INICIO')
+                    blocks.append((size, counter))
+                elif self.rng.random() < 0.7:
+                    self.emit(level, f'SE {self.condition(level)} ENTAO')
+                    self.emit(level, 'INICIO')
+                    blocks.append((size, None))
+                else:
+                    self.emit(level, f'SE {self.condition(level)} ENTAO')
+                    self.simple_command(level + 1)
+            else:
+                self.simple_command(level)
+        while blocks:
+            self.close(blocks)
+
+    def close(self, blocks: List[Tuple[int, Optional[str]]]):
+        _, counter = blocks.pop()
+        level = len(blocks)
+        if counter is not None:
+            self.emit(level + 1, f'ATRIBUIR {counter} + 1 A {counter}')
+        self.emit(level, 'FIM')
+
+    def corrupt(self, count: int):
+        """Insere ``count`` erros em comandos simples distintos."""
+        for index in self.rng.sample(self.simple_lines, min(count, len(self.simple_lines))):
+            level, text, comment = self.lines[index]
+            words = text.split(' ')
+            kinds = ERROR_KINDS if words[0] == 'ATRIBUIR' else ERROR_KINDS[:-1]
+            kind = self.rng.choice(kinds)
+            if kind == 'lexical':
+                words.insert(self.rng.randint(1, len(words)), '#')
+            elif kind == 'syntax':
+                del words[words.index('A') if 'A' in words else 0]
+            elif kind == 'undeclared':
+                words[1:2] = ['indefinida', '+', words[1]] if words[0] == 'ATRIBUIR' else ['indefinida']
+            else:
+                # uma expressão real atribuída a uma variável inteira, ou o contrário
+                target = words[-1]
+                words[-1] = self.rng.choice(self.real_outputs if target in self.int_outputs else self.int_outputs)
+            self.lines[index] = (level, ' '.join(words), comment)
+
+
+def generate_program(declarations: int = 10, commands: int = 100, depth: int = 3, expression_length: int = 5,
+                     comment_density: float = 0.1, string_density: float = 0.2, errors: int = 0,
+                     loop_iterations: int = 3, seed: Optional[int] = None) -> str:
+    """Gera um programa sintético da linguagem "A".
+
+    Sem ``errors``, o programa é válido e a sua execução termina sem erros com qualquer entrada
+    de números inteiros: cada ``ENQUANTO`` conta até ``loop_iterations`` com uma variável
+    própria, as divisões são por números diferentes de zero e os valores das variáveis
+    atribuídas não são lidos, de forma que não cresçam a cada iteração.
+
+    Args:
+        declarations: A quantidade de variáveis declaradas, além dos contadores dos laços (mínimo: 4).
+        commands: A quantidade de comandos, incluindo os comandos ``SE`` e ``ENQUANTO``.
+        depth: A profundidade máxima dos blocos ``SE`` e ``ENQUANTO`` aninhados.
+        expression_length: A quantidade de operandos das expressões aritméticas.
+        comment_density: A fração das linhas com um comentário.
+        string_density: A fração dos comandos ``IMPRIMIR`` com uma cadeia de caracteres.
+        errors: A quantidade de erros léxicos, sintáticos ou semânticos inseridos em comandos distintos.
+        loop_iterations: A quantidade de iterações de cada laço ``ENQUANTO``.
+        seed: A semente dos números aleatórios, para gerar o mesmo programa (opcional).
+
+    Returns:
+        O código-fonte do programa.
+    """
+    generator = _Generator(random.Random(seed), declarations, depth, expression_length,
+                           comment_density, string_density, loop_iterations)
+    lines = [':DECLARACOES', *generator.declarations(), '', ':ALGORITMO']
+    generator.commands(commands)
+    if errors:
+        generator.corrupt(errors)
+    lines.extend('   ' * level + text + comment for level, text, comment in generator.lines)
+    return '\n'.join(lines) + '\n'
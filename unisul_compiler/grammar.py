@@ -0,0 +1,360 @@
+import argparse
+import hashlib
+import pprint
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .parser import ARITHMETIC_OPERATORS, COMMAND_SYNC_KINDS, DECLARATION_SYNC_KINDS, GROUPINGS
+from .token import TOKEN_KINDS, TokenKind
+
+# Símbolo de uma produção: um terminal (tipo de token), um não terminal (nome)
+# ou uma ação semântica (nome começando com "@"), executada ao ser desempilhada
+Symbol = Union[TokenKind, str]
+
+# Regras comuns aos agrupamentos das expressões, na forma BNF da gramática
+# do comentário de ``parser.py``: cada repetição ``{...}`` é um não terminal
+# recursivo à direita e cada produção vazia é uma lista vazia
+_COMMON_RULES: Dict[str, List[List[Symbol]]] = {
+    'program': [[TokenKind.DELIMITER, TokenKind.DECLARACOES, '@program', 'declarations',
+                 TokenKind.DELIMITER, TokenKind.ALGORITMO, '@algorithm', 'commands']],
+    'declarations': [['declaration', 'declarations'], []],
+    'declaration': [[TokenKind.IDENTIFIER, TokenKind.DELIMITER, 'type', '@declaration']],
+    'type': [[TokenKind.INT], [TokenKind.REAL]],
+    'commands': [['command', '@command', 'commands'], []],
+    'command': [
+        [TokenKind.ATRIBUIR, 'arithmetic_expression', TokenKind.A, TokenKind.IDENTIFIER, '@assign'],
+        [TokenKind.LER, TokenKind.IDENTIFIER, '@read'],
+        [TokenKind.IMPRIMIR, 'printable', '@print'],
+        [TokenKind.SE, 'relational_expression', TokenKind.ENTAO, 'command', '@if'],
+        [TokenKind.ENQUANTO, 'relational_expression', 'command', '@while'],
+        [TokenKind.INICIO, '@block', 'block_commands', TokenKind.FIM, '@end_block'],
+    ],
+    'block_commands': [['command', '@append', 'block_commands'], []],
+    'printable': [[TokenKind.IDENTIFIER], [TokenKind.LITERAL_STR]],
+    'relation': [['arithmetic_expression', 'relational_operator', 'arithmetic_expression', '@relation']],
+    'relational_operator': [
+        [TokenKind.EQUAL], [TokenKind.LESS], [TokenKind.GREATER],
+        [TokenKind.LESS_EQUAL], [TokenKind.GREATER_EQUAL], [TokenKind.NOT_EQUAL]],
+    'exp': [[TokenKind.LITERAL_INT, '@number'], [TokenKind.LITERAL_FLOAT, '@number'],
+            [TokenKind.IDENTIFIER, '@variable']],
+}
+
+# Regras de cada agrupamento das expressões
+GRAMMARS: Dict[str, Dict[str, List[List[Symbol]]]] = {
+    # "E" antes de "OU" e "*" e "/" antes de "+" e "-", associativos à esquerda
+    'precedence': {
+        **_COMMON_RULES,
+        'relational_expression': [['conjunction', 'disjunction_tail']],
+        'disjunction_tail': [[TokenKind.OR, 'conjunction', '@boolean', 'disjunction_tail'], []],
+        'conjunction': [['relation', 'conjunction_tail']],
+        'conjunction_tail': [[TokenKind.AND, 'relation', '@boolean', 'conjunction_tail'], []],
+        'arithmetic_expression': [['term', 'sum_tail']],
+        'sum_tail': [[TokenKind.ADDITION, 'term', '@binary', 'sum_tail'],
+                     [TokenKind.SUBTRACTION, 'term', '@binary', 'sum_tail'], []],
+        'term': [['factor', 'product_tail']],
+        'product_tail': [[TokenKind.MULTIPLICATION, 'factor', '@binary', 'product_tail'],
+                         [TokenKind.DIVISION, 'factor', '@binary', 'product_tail'], []],
+        'factor': [['exp'], [TokenKind.LEFT_PARENTHESIS, 'arithmetic_expression', 'closing_parenthesis',
+                             '@parenthesized']],
+        'closing_parenthesis': [[TokenKind.RIGHT_PARENTHESIS]],
+    },
+    # sem precedência, associativos à direita; o operador após um parênteses fechado
+    # só é aceito dentro de outro parênteses, aplicado a toda a expressão que o precede
+    # nesse parênteses, como no analisador original
+    'legacy': {
+        **_COMMON_RULES,
+        'relational_expression': [['relation', 'condition_tail']],
+        'condition_tail': [['boolean_operator', 'relational_expression', '@boolean'], []],
+        'boolean_operator': [[TokenKind.AND], [TokenKind.OR]],
+        'arithmetic_expression': [
+            ['exp', 'operation_tail'],
+            [TokenKind.LEFT_PARENTHESIS, 'parenthesized_expression', TokenKind.RIGHT_PARENTHESIS,
+             '@parenthesized']],
+        # dentro dos parênteses, "arithmetic_expression [arithmetic_operator arithmetic_expression]":
+        # os operandos e operadores até o parênteses fechado são reunidos em uma lista
+        # (``@chain``) e agrupados à direita (``@fold``) antes do operador seguinte
+        'parenthesized_expression': [
+            ['@chain', 'exp', '@append', 'chain_tail'],
+            [TokenKind.LEFT_PARENTHESIS, 'parenthesized_expression', TokenKind.RIGHT_PARENTHESIS,
+             '@parenthesized', 'operation_tail']],
+        'chain_tail': [['arithmetic_operator', '@append', 'chain_operand'], ['@fold']],
+        'chain_operand': [
+            ['exp', '@append', 'chain_tail'],
+            [TokenKind.LEFT_PARENTHESIS, 'parenthesized_expression', TokenKind.RIGHT_PARENTHESIS,
+             '@parenthesized', '@append', '@fold', 'operation_tail']],
+        'operation_tail': [['arithmetic_operator', 'arithmetic_expression', '@binary'], []],
+        'arithmetic_operator': [
+            [TokenKind.ADDITION], [TokenKind.SUBTRACTION], [TokenKind.MULTIPLICATION], [TokenKind.DIVISION]],
+    },
+}
+
+# Símbolo inicial da gramática
+START = 'program'
+
+# Listas de comandos, que terminam apenas em "FIM" ou no fim dos tokens: um token
+# que não inicia um comando é um erro, e não o fim da lista
+STRICT_NONTERMINALS = frozenset(['commands', 'block_commands'])
+
+# Tipos de token relatados no erro de um não terminal, no lugar dos que o iniciam:
+# um parênteses não fechado também aceitaria mais um operador
+EXPECTED_KINDS = {
+    'closing_parenthesis': (TokenKind.RIGHT_PARENTHESIS, *ARITHMETIC_OPERATORS),
+}
+
+# Listas recursivas à direita onde a análise recomeça após um erro sintático,
+# com os tipos de token de sincronização
+RECOVERY = {
+    'declarations': DECLARATION_SYNC_KINDS,
+    'commands': COMMAND_SYNC_KINDS,
+    'block_commands': COMMAND_SYNC_KINDS,
+}
+
+# Arquivo gerado com as tabelas serializadas
+TABLES_PATH = Path(__file__).parent / 'parse_table.py'
+
+
+class ParseTable(NamedTuple):
+    """Tabela LL(1) de uma gramática, com os símbolos codificados como inteiros.
+
+    Os terminais são os valores dos tipos de token (``0`` é o fim dos tokens),
+    seguidos dos não terminais e das ações semânticas. A tabela é indexada por
+    ``(não terminal - width) * width + tipo do token`` e guarda o índice da produção,
+    ou ``-1`` para um erro. Um não terminal anulável assume a sua produção vazia, e um
+    não terminal com uma única produção assume essa produção, diante de qualquer token
+    sem entrada (exceto os de ``STRICT_NONTERMINALS`` e ``EXPECTED_KINDS``), de forma
+    que o erro seja encontrado no próximo terminal ou não terminal com alternativas,
+    como no analisador descendente recursivo.
+    """
+    width: int
+    start: int
+    nonterminals: Tuple[str, ...]
+    actions: Tuple[str, ...]
+    # símbolos de cada produção, em ordem inversa (na ordem em que são empilhados)
+    productions: Tuple[Tuple[int, ...], ...]
+    table: Tuple[int, ...]
+    # tipos de token esperados por não terminal, relatados em um erro
+    expected: Tuple[Tuple[int, ...], ...]
+    # tipos de token de sincronização por não terminal, ``None`` caso não recupere erros
+    recovery: Tuple[Optional[Tuple[int, ...]], ...]
+
+
+def nullable_nonterminals(rules: Dict[str, List[List[Symbol]]]) -> Set[str]:
+    """Retorna os não terminais que derivam a sequência vazia."""
+    nullable: Set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for nonterminal, productions in rules.items():
+            if nonterminal not in nullable and any(
+                    all(isinstance(symbol, str) and (symbol.startswith('@') or symbol in nullable)
+                        for symbol in production)
+                    for production in productions):
+                nullable.add(nonterminal)
+                changed = True
+    return nullable
+
+
+def first_sets(rules: Dict[str, List[List[Symbol]]], nullable: Set[str]) -> Dict[str, Dict[TokenKind, None]]:
+    """Calcula o conjunto FIRST de cada não terminal.
+
+    Os terminais são ordenados pela ordem das produções, a ordem em que são relatados em um erro.
+
+    Args:
+        rules: As regras da gramática.
+        nullable: Os não terminais anuláveis.
+
+    Returns:
+        Os terminais que iniciam cada não terminal, como as chaves de um dicionário.
+    """
+    first: Dict[str, Dict[TokenKind, None]] = {nonterminal: {} for nonterminal in rules}
+    changed = True
+    while changed:
+        changed = False
+        for nonterminal, productions in rules.items():
+            # recalcular do início, de forma que a ordem não dependa das iterações anteriores
+            terminals: Dict[TokenKind, None] = {}
+            for production in productions:
+                terminals.update(sequence_first(production, first, nullable)[0])
+            if list(terminals) != list(first[nonterminal]):
+                first[nonterminal] = terminals
+                changed = True
+    return first
+
+
+def sequence_first(symbols: List[Symbol], first: Dict[str, Dict[TokenKind, None]],
+                   nullable: Set[str]) -> Tuple[Dict[TokenKind, None], bool]:
+    """Calcula o conjunto FIRST de uma sequência de símbolos.
+
+    Returns:
+        Os terminais que iniciam a sequência e se a sequência é anulável.
+    """
+    terminals: Dict[TokenKind, None] = {}
+    for symbol in symbols:
+        if isinstance(symbol, TokenKind):
+            terminals[symbol] = None
+            return terminals, False
+        if symbol.startswith('@'):
+            continue
+        terminals.update(first[symbol])
+        if symbol not in nullable:
+            return terminals, False
+    return terminals, True
+
+
+def follow_sets(rules: Dict[str, List[List[Symbol]]], first: Dict[str, Dict[TokenKind, None]],
+                nullable: Set[str], start: str = START) -> Dict[str, Set[Optional[TokenKind]]]:
+    """Calcula o conjunto FOLLOW de cada não terminal, com ``None`` para o fim dos tokens."""
+    follow: Dict[str, Set[Optional[TokenKind]]] = {nonterminal: set() for nonterminal in rules}
+    follow[start].add(None)
+    changed = True
+    while changed:
+        changed = False
+        for nonterminal, productions in rules.items():
+            for production in productions:
+                for index, symbol in enumerate(production):
+                    if not isinstance(symbol, str) or symbol.startswith('@'):
+                        continue
+                    terminals, rest_nullable = sequence_first(production[index + 1:], first, nullable)
+                    following = set(terminals)
+                    if rest_nullable:
+                        following |= follow[nonterminal]
+                    if not following <= follow[symbol]:
+                        follow[symbol] |= following
+                        changed = True
+    return follow
+
+
+def build_table(rules: Dict[str, List[List[Symbol]]], start: str = START) -> ParseTable:
+    """Calcula os conjuntos FIRST e FOLLOW de uma gramática e constrói a sua tabela LL(1).
+
+    Args:
+        rules: As regras da gramática.
+        start: O símbolo inicial.
+
+    Raises:
+        ValueError: Caso um não terminal não esteja definido ou a gramática não seja LL(1).
+
+    Returns:
+        A tabela da gramática.
+    """
+    for productions in rules.values():
+        for production in productions:
+            for symbol in production:
+                if isinstance(symbol, str) and not symbol.startswith('@') and symbol not in rules:
+                    raise ValueError(f'o não terminal "{symbol}" não está definido')
+
+    nullable = nullable_nonterminals(rules)
+    first = first_sets(rules, nullable)
+    follow = follow_sets(rules, first, nullable, start)
+
+    width = len(TOKEN_KINDS)
+    nonterminals = tuple(rules)
+    actions = tuple(dict.fromkeys(
+        symbol for productions in rules.values() for production in productions
+        for symbol in production if isinstance(symbol, str) and symbol.startswith('@')))
+    codes = {nonterminal: width + index for index, nonterminal in enumerate(nonterminals)}
+    codes.update({action: width + len(nonterminals) + index for index, action in enumerate(actions)})
+
+    productions = []
+    table = [-1] * (len(nonterminals) * width)
+    expected = []
+    conflicts = []
+    for row, nonterminal in enumerate(nonterminals):
+        row_kinds: Dict[TokenKind, None] = {}
+        empty_production = None
+        for production in rules[nonterminal]:
+            index = len(productions)
+            productions.append(tuple(
+                symbol.value if isinstance(symbol, TokenKind) else codes[symbol] for symbol in reversed(production)))
+            terminals, is_nullable = sequence_first(production, first, nullable)
+            row_kinds.update(terminals)
+            lookaheads = [terminal.value for terminal in terminals]
+            if is_nullable:
+                empty_production = index
+                lookaheads.extend(0 if terminal is None else terminal.value for terminal in follow[nonterminal])
+            for kind in lookaheads:
+                entry = row * width + kind
+                if table[entry] not in (-1, index):
+                    conflicts.append(f'{nonterminal} com {TOKEN_KINDS[kind] or "o fim dos tokens"}')
+                table[entry] = index
+        # assumir a produção vazia, ou a única produção, diante de um token inesperado
+        if nonterminal in STRICT_NONTERMINALS or nonterminal in EXPECTED_KINDS:
+            default = None
+        elif empty_production is not None:
+            default = empty_production
+        elif len(rules[nonterminal]) == 1:
+            default = len(productions) - 1
+        else:
+            default = None
+        if default is not None:
+            for entry in range(row * width, (row + 1) * width):
+                if table[entry] == -1:
+                    table[entry] = default
+        expected.append(tuple(kind.value for kind in EXPECTED_KINDS.get(nonterminal, row_kinds)))
+    if conflicts:
+        raise ValueError(f'a gramática não é LL(1), conflitos em: {", ".join(conflicts)}')
+
+    return ParseTable(
+        width, codes[start], nonterminals, tuple(action[1:] for action in actions), tuple(productions), tuple(table),
+        tuple(expected),
+        tuple(tuple(sorted(kind.value for kind in RECOVERY[nonterminal])) if nonterminal in RECOVERY else None
+              for nonterminal in nonterminals))
+
+
+def build_tables() -> Dict[str, ParseTable]:
+    """Constrói a tabela LL(1) de cada agrupamento das expressões."""
+    return {grouping: build_table(GRAMMARS[grouping]) for grouping in GROUPINGS}
+
+
+def grammar_digest() -> str:
+    """Retorna o resumo das regras da gramática e dos tipos de token,
+    que identifica as tabelas serializadas geradas a partir delas."""
+    data = (
+        [(kind.name, kind.value) for kind in TokenKind],
+        [(grouping, [(nonterminal, [[str(symbol) for symbol in production] for production in productions])
+                     for nonterminal, productions in GRAMMARS[grouping].items()])
+         for grouping in GROUPINGS],
+        START,
+        sorted(STRICT_NONTERMINALS),
+        sorted((nonterminal, sorted(kind.value for kind in kinds)) for nonterminal, kinds in RECOVERY.items()),
+    )
+    return hashlib.sha256(repr(data).encode()).hexdigest()
+
+
+def format_tables(tables: Dict[str, ParseTable]) -> str:
+    """Formata as tabelas como o código do módulo ``parse_table``."""
+    lines = [
+        '# Gerado por "python -m unisul_compiler.grammar" a partir das regras de grammar.py, não edite.',
+        'from .grammar import ParseTable',
+        '',
+        f'GRAMMAR_DIGEST = {grammar_digest()!r}',
+        '',
+        'TABLES = {',
+    ]
+    for grouping, table in tables.items():
+        lines.append(f'    {grouping!r}: ParseTable(')
+        for field, value in table._asdict().items():
+            text = pprint.pformat(value, width=100, compact=True).replace('\n', '\n' + ' ' * 8)
+            lines.append(f'        {field}={text},')
+        lines.append('    ),')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description='''
+    Gera as tabelas LL(1) da linguagem "A" a partir das regras da gramática.
+    ''')
+    argument_parser.add_argument('--check', action='store_true',
+                                 help=f'apenas verifica se {TABLES_PATH.name} corresponde às regras')
+    arguments = argument_parser.parse_args()
+
+    text = format_tables(build_tables())
+    if arguments.check:
+        if not TABLES_PATH.exists() or TABLES_PATH.read_text() != text:
+            sys.exit(f'{TABLES_PATH} está desatualizado, execute "python -m unisul_compiler.grammar"')
+        print(f'{TABLES_PATH} está atualizado')
+    else:
+        TABLES_PATH.write_text(text)
+        print(f'{TABLES_PATH} gerado')
@@ -0,0 +1,341 @@
+import copy
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .diagnostics import Diagnostics
+from .exceptions import AError
+from .lexer import _Scanner
+from .parser import parse
+from .source import Location, Source
+from .syntax_tree import Command, Declaration, Program
+from .token import Token, TokenKind
+
+# Quantidade de consultas de número de linha, após uma edição, respondidas por busca linear
+# antes de construir o índice das linhas
+LINE_LOOKUPS_BEFORE_INDEX = 8
+
+
+class _Line(Source):
+    """Linha de um documento, com os tokens e os erros léxicos encontrados nela.
+
+    As posições dos tokens são relativas à linha, e o número da linha é consultado no documento,
+    portanto os tokens e os nós da árvore sintática das demais linhas não mudam após uma edição.
+    """
+    __slots__ = ('document', 'tokens', 'errors', 'entry', 'exit', 'starts')
+
+    def __init__(self, text: str, document: 'Document'):
+        """Cria uma linha ainda não analisada.
+
+        Args:
+            text: O texto da linha, sem a quebra de linha.
+            document: O documento da linha.
+        """
+        super().__init__(text, document.name)
+        # ``None`` após a linha ser removida do documento
+        self.document: Optional['Document'] = document
+        self.tokens: List[Token] = []
+        self.errors: List[AError] = []
+        # se o token anterior ao início e ao fim da linha é um operando (os sinais seguintes são operadores)
+        self.entry = False
+        self.exit = False
+        # tokens da linha que iniciam comandos de nível superior
+        self.starts: List[Token] = []
+
+    def __repr__(self) -> str:
+        return f'<_Line "{self.text}">'
+
+    def location(self, offset: int) -> Location:
+        return Location(self.name, self.document.line_number(self), offset + 1)
+
+    def lex(self, after_operand: bool) -> bool:
+        """Analisa lexicamente a linha.
+
+        Args:
+            after_operand: Se o token anterior ao início da linha é um operando.
+
+        Returns:
+            Se o último token até o fim da linha é um operando.
+        """
+        diagnostics = Diagnostics()
+        scanner = _Scanner(self, diagnostics)
+        scanner.after_operand = after_operand
+        self.tokens = [Token(kind, None, self, start, end) for kind, start, end in scanner.tokenize(self.text)]
+        self.errors = diagnostics.errors
+        self.entry = after_operand
+        self.exit = scanner.after_operand
+        return self.exit
+
+
+class Document:
+    """Código-fonte da linguagem "A" mantido analisado entre edições, como em um editor.
+
+    A cada edição, as linhas alteradas são analisadas lexicamente outra vez, seguidas
+    das próximas linhas apenas enquanto o estado do analisador léxico no início delas mudar.
+    A análise sintática recomeça no último comando de nível superior anterior à edição
+    e termina ao encontrar, após a edição, o início de um comando anterior a ela,
+    já que a partir dele os tokens e a análise não mudam. Um bloco ``INICIO … FIM``
+    de nível superior é analisado novamente por inteiro; uma edição no cabeçalho ou
+    nas declarações só analisa novamente todos os comandos caso os símbolos mudem.
+
+    O custo de uma edição é proporcional ao tamanho da edição e dos comandos afetados,
+    e não ao tamanho do documento. Os tokens e os nós da árvore sintática são localizados
+    pelas suas linhas; para compilar e executar o programa, o texto (``text``) é analisado por inteiro.
+    """
+    __slots__ = ('name', 'grouping', 'lines', '_line_numbers', '_lookups', '_program_token',
+                 '_declarations', '_symbols', '_header_errors', '_starts', '_nodes', '_command_errors',
+                 '_error_lines')
+
+    def __init__(self, text: str, name: str = '<código-fonte>', grouping: str = 'precedence'):
+        """Cria e analisa um documento.
+
+        Args:
+            text: O texto do código-fonte.
+            name: O nome do código-fonte, geralmente o caminho do arquivo.
+            grouping: O agrupamento das expressões (``precedence`` ou ``legacy``).
+        """
+        self.name = name
+        self.grouping = grouping
+        self.lines: List[_Line] = []
+        self._line_numbers: Optional[Dict[int, int]] = None
+        self._lookups = 0
+        self._program_token: Optional[Token] = None
+        self._declarations: List[Declaration] = []
+        self._symbols: Dict[str, TokenKind] = {}
+        self._header_errors: List[Tuple[AError, Optional[_Line]]] = []
+        # o primeiro token de cada comando de nível superior, o seu nó (``None`` caso inválido)
+        # e os erros dos comandos inválidos
+        self._starts: List[Token] = []
+        self._nodes: List[Optional[Command]] = []
+        self._command_errors: Dict[Token, List[Tuple[AError, Optional[_Line]]]] = {}
+        # linhas com erros léxicos
+        self._error_lines: Dict[_Line, None] = {}
+
+        self._relex(0, -1, text.split('\n'))
+        self._reparse(0)
+
+    def __repr__(self) -> str:
+        return f'<Document "{self.name}" {len(self.lines)} linhas>'
+
+    @property
+    def text(self) -> str:
+        """O texto do código-fonte."""
+        return '\n'.join(line.text for line in self.lines)
+
+    @property
+    def tokens(self) -> Iterator[Token]:
+        """Os tokens válidos do código-fonte."""
+        return self._tokens(0, 0)
+
+    @property
+    def program(self) -> Program:
+        """A árvore sintática do programa, parcial caso existam erros."""
+        return Program(self._program_token, self._declarations, [node for node in self._nodes if node is not None])
+
+    @property
+    def diagnostics(self) -> List[AError]:
+        """Os erros do código-fonte, na ordem em que aparecem, seguidos dos erros sem localização."""
+        errors = [(error, line) for line in self._error_lines for error in line.errors]
+        errors.extend(self._header_errors)
+        for command_errors in self._command_errors.values():
+            errors.extend(command_errors)
+        errors = [self._relocate(error, line) for error, line in errors]
+        return sorted(errors, key=lambda error: (error.location is None, error.location or ()))
+
+    def line_number(self, line: _Line) -> int:
+        """Retorna o número atual (a partir de 1) de uma linha do documento.
+
+        Args:
+            line: A linha.
+
+        Returns:
+            O número da linha.
+        """
+        if self._line_numbers is not None:
+            return self._line_numbers[id(line)]
+        self._lookups += 1
+        if self._lookups > LINE_LOOKUPS_BEFORE_INDEX:
+            self._line_numbers = {id(line): number for number, line in enumerate(self.lines, 1)}
+            return self._line_numbers[id(line)]
+        return self.lines.index(line) + 1
+
+    def edit(self, start_line: int, start_column: int, end_line: int, end_column: int, text: str) -> List[AError]:
+        """Substitui um trecho do código-fonte e analisa novamente apenas o que a edição afeta.
+
+        As linhas e colunas começam em 1, como nas localizações dos erros, e o fim do trecho não é incluído.
+
+        Args:
+            start_line: A linha do início do trecho.
+            start_column: A coluna do início do trecho.
+            end_line: A linha do fim do trecho.
+            end_column: A coluna do fim do trecho.
+            text: O texto que substitui o trecho, possivelmente com quebras de linha.
+
+        Returns:
+            Os erros do código-fonte após a edição.
+
+        Raises:
+            ValueError: Caso o trecho não exista no código-fonte.
+        """
+        if not 1 <= start_line <= end_line <= len(self.lines) \
+                or not 1 <= start_column <= len(self.lines[start_line - 1].text) + 1 \
+                or not 1 <= end_column <= len(self.lines[end_line - 1].text) + 1 \
+                or (start_line == end_line and start_column > end_column):
+            raise ValueError(f'trecho inválido: {start_line}:{start_column} a {end_line}:{end_column}')
+
+        first, last = start_line - 1, end_line - 1
+        text = self.lines[first].text[:start_column - 1] + text + self.lines[last].text[end_column - 1:]
+        self._reparse(self._relex(first, last, text.split('\n')))
+        return self.diagnostics
+
+    def _relocate(self, error: AError, line: Optional[_Line]) -> AError:
+        """Atualiza a linha de um erro, caso as linhas anteriores tenham mudado."""
+        if line is None or (number := self.line_number(line)) == error.location.line:
+            return error
+        error = copy.copy(error)
+        error.location = error.location._replace(line=number)
+        return error
+
+    def _tokens(self, line_index: int, token_index: int) -> Iterator[Token]:
+        """Gera os tokens a partir de um token de uma linha."""
+        lines = self.lines
+        yield from lines[line_index].tokens[token_index:]
+        for index in range(line_index + 1, len(lines)):
+            yield from lines[index].tokens
+
+    def _relex(self, first: int, last: int, texts: List[str]) -> int:
+        """Substitui as linhas ``first`` a ``last`` e as analisa lexicamente, seguidas das próximas
+        linhas enquanto o estado do analisador léxico no início delas mudar.
+
+        Returns:
+            O índice da primeira linha analisada.
+        """
+        lines = self.lines
+        removed = lines[first:last + 1]
+        lines[first:last + 1] = [_Line(text, self) for text in texts]
+        end = first + len(texts)
+        self._line_numbers = None
+        self._lookups = 0
+
+        state = lines[first - 1].exit if first > 0 else False
+        index = first
+        while index < end or (index < len(lines) and lines[index].entry != state):
+            if index >= end:
+                removed.append(lines[index])
+                lines[index] = _Line(lines[index].text, self)
+                self._line_numbers = None
+            state = lines[index].lex(state)
+            if lines[index].errors:
+                self._error_lines[lines[index]] = None
+            index += 1
+
+        for line in removed:
+            self._error_lines.pop(line, None)
+            line.document = None
+        return first
+
+    def _locate(self, errors: List[AError]) -> List[Tuple[AError, Optional[_Line]]]:
+        """Associa cada erro à sua linha, cujo número pode mudar nas próximas edições."""
+        return [(error, self.lines[error.location.line - 1] if error.location is not None else None)
+                for error in errors]
+
+    def _reparse(self, first: int):
+        """Analisa novamente os comandos de nível superior a partir do último que começa
+        antes da linha ``first``, a primeira analisada lexicamente outra vez."""
+        start = None
+        for index in range(first - 1, -1, -1):
+            if self.lines[index].starts:
+                start = self.lines[index].starts[-1]
+                break
+
+        old_header_errors = self._header_errors
+        if start is None:
+            # analisar o cabeçalho e as declarações, até o primeiro comando
+            tokens = self._tokens(0, 0)
+            first_command = []
+            diagnostics = Diagnostics()
+            header = parse(tokens, None, diagnostics, self.grouping,
+                           on_command=lambda token: first_command.append(token) or True)
+            self._program_token = header.token
+            self._declarations = header.declarations
+            self._header_errors = self._locate(diagnostics.errors)
+            # com outros símbolos, todos os comandos são verificados novamente
+            resync = header.symbols == self._symbols
+            self._symbols = header.symbols
+            tokens = chain(first_command, tokens)
+            position = 0
+        else:
+            line = start.source
+            tokens = self._tokens(self.line_number(line) - 1, line.tokens.index(start))
+            resync = True
+            position = self._starts.index(start)
+
+        # o último erro anterior, já que um erro na mesma localização é descartado
+        if position == 0:
+            previous_errors = self._header_errors
+        else:
+            previous_errors = self._command_errors.get(self._starts[position - 1], [])
+        seed = [self._relocate(*previous_errors[-1])] if previous_errors else []
+
+        new_starts: List[Token] = []
+        error_marks: List[int] = []
+        diagnostics = Diagnostics()
+        diagnostics.errors.extend(seed)
+        resync_token: Optional[Token] = None
+
+        def previous_location(errors: List[Tuple[AError, Optional[_Line]]], token: Token) -> Optional[Location]:
+            """A localização do último erro, caso possa coincidir com a de um erro a partir do token."""
+            # os erros das linhas removidas precedem o token
+            if not errors or (errors[-1][1] is not None and errors[-1][1].document is None):
+                return None
+            if (location := self._relocate(*errors[-1]).location) is None or location < token.location:
+                return None
+            return location
+
+        def on_command(token: Token) -> bool:
+            nonlocal resync_token
+            # um comando que já começava neste token, após a edição (o primeiro token
+            # é o próprio comando anterior à edição): a análise a partir dele não muda,
+            # desde que o erro anterior a ele descarte os mesmos erros
+            if resync and token is not start and token in token.source.starts:
+                index = self._starts.index(token, position)
+                old_errors = self._command_errors.get(self._starts[index - 1], []) if index else old_header_errors
+                new_errors = [(diagnostics.errors[-1], None)] if diagnostics.errors else []
+                if previous_location(old_errors, token) == previous_location(new_errors, token):
+                    resync_token = token
+                    return True
+            new_starts.append(token)
+            error_marks.append(len(diagnostics.errors))
+            return False
+
+        commands = iter(parse(tokens, None, diagnostics, self.grouping, self._symbols, on_command).commands)
+
+        # associar os nós aos tokens que os iniciam, e os erros aos comandos
+        nodes: List[Optional[Command]] = []
+        node = next(commands, None)
+        for token in new_starts:
+            if node is not None and node.token is token:
+                nodes.append(node)
+                node = next(commands, None)
+            else:
+                nodes.append(None)
+        error_marks.append(len(diagnostics.errors))
+        errors = [None] * len(seed) + self._locate(diagnostics.errors[len(seed):])
+
+        end = self._starts.index(resync_token, position) if resync_token is not None else len(self._starts)
+        for token in self._starts[position:end]:
+            self._command_errors.pop(token, None)
+            if token in (markers := token.source.starts):
+                markers.remove(token)
+        self._starts[position:end] = new_starts
+        self._nodes[position:end] = nodes
+
+        # os comandos novos precedem os comandos restantes da linha do comando reencontrado
+        front = 0
+        for index, token in enumerate(new_starts):
+            if resync_token is not None and token.source is resync_token.source:
+                token.source.starts.insert(front, token)
+                front += 1
+            else:
+                token.source.starts.append(token)
+            if error_marks[index] != error_marks[index + 1]:
+                self._command_errors[token] = errors[error_marks[index]:error_marks[index + 1]]
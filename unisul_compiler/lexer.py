@@ -1,338 +1,643 @@
-from typing import List
-
-from .token import Token, TokenKind
+import os
+import re
+from array import array
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
+
+from .diagnostics import Diagnostics
+from .source import BytesSource, Source
+from .token import TOKEN_KINDS, Token, TokenBuffer, TokenKind
 from .exceptions import ALexicalError
-
-
-def describe(source_code: str):
-    """Analisa o código-fonte e retorna os tokens válidos encontrados
-    da línguagem "A".
+from .reporter import Reporter, SilentReporter
+
+
+# Tabela de dispersão das palavras reservadas e dos operadores booleanos
+KEYWORDS = {
+    'DECLARACOES': TokenKind.DECLARACOES,
+    'ALGORITMO': TokenKind.ALGORITMO,
+    'INT': TokenKind.INT,
+    'REAL': TokenKind.REAL,
+    'ATRIBUIR': TokenKind.ATRIBUIR,
+    'A': TokenKind.A,
+    'LER': TokenKind.LER,
+    'IMPRIMIR': TokenKind.IMPRIMIR,
+    'SE': TokenKind.SE,
+    'ENTAO': TokenKind.ENTAO,
+    'ENQUANTO': TokenKind.ENQUANTO,
+    'INICIO': TokenKind.INICIO,
+    'FIM': TokenKind.FIM,
+    'E': TokenKind.AND,
+    'OU': TokenKind.OR,
+}
+
+# Tabela de dispersão dos delimitadores, parênteses e operadores
+PUNCTUATION = {
+    ':': TokenKind.DELIMITER,
+    '(': TokenKind.LEFT_PARENTHESIS,
+    ')': TokenKind.RIGHT_PARENTHESIS,
+    '=': TokenKind.EQUAL,
+    '<>': TokenKind.NOT_EQUAL,
+    '<': TokenKind.LESS,
+    '>': TokenKind.GREATER,
+    '<=': TokenKind.LESS_EQUAL,
+    '>=': TokenKind.GREATER_EQUAL,
+    '+': TokenKind.ADDITION,
+    '-': TokenKind.SUBTRACTION,
+    '*': TokenKind.MULTIPLICATION,
+    '/': TokenKind.DIVISION,
+}
+
+# Tipos de token após os quais um sinal é um operador e não o início de um número
+OPERAND_KINDS = frozenset([TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT, TokenKind.IDENTIFIER])
+
+# Quantidade de caracteres lidos por trecho na análise sob demanda
+CHUNK_SIZE = 64 * 1024
+
+# Tamanho mínimo do código-fonte, em caracteres ou bytes, para analisá-lo em paralelo
+PARALLEL_MIN_SIZE = 1024 * 1024
+
+# Quantidade de trechos por processo na análise em paralelo, equilibrando a carga entre os processos
+PARALLEL_CHUNKS_PER_JOB = 4
+
+# Espaços em branco e comentários
+_GARBAGE = re.compile(r'(?:[ \t\r\n]+|%[^\r\n]*)*')
+
+# Padrões léxicos da linguagem "A", testados em uma única passagem
+_PATTERN = re.compile(r'''
+    (?P<SIGNED_FLOAT>[+-][0-9]+\.[0-9]+)
+  | (?P<SIGNED_INT>[+-][0-9]+(?![.0-9]))
+  | (?P<FLOAT>[0-9]+\.[0-9]+)
+  | (?P<INT>[0-9]+(?![.0-9]))
+  | (?P<STRING>'[^'\n]*')
+  | (?P<WORD>(?P<ALPHA>[A-Za-z]+)[0-9A-Za-z]*)
+  | (?P<UNICODE>[+-][0-9]+\.(?=[^\x00-\x7f]))  # número real com dígitos não ASCII
+  | (?P<PUNCTUATION><=|<>|>=|[:()=<>+\-*/])
+''', re.VERBOSE)
+
+# Classes dos bytes na análise de bytes: apenas as letras "A" a "Z" e "a" a "z" e os dígitos "0" a "9"
+# (ASCII) formam identificadores e números, como na especificação; os demais bytes são inválidos
+# fora das cadeias de caracteres e dos comentários
+_INVALID, _SPACE, _LETTER, _DIGIT, _SIGN, _PUNCTUATION, _QUOTE, _COMMENT = range(8)
+_BYTE_CLASSES = bytes(
+    _SPACE if byte in b' \t\r\n' else
+    _LETTER if byte in b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz' else
+    _DIGIT if byte in b'0123456789' else
+    _SIGN if byte in b'+-' else
+    _PUNCTUATION if byte in b':()=<>*/' else
+    _QUOTE if byte == ord("'") else
+    _COMMENT if byte == ord('%') else
+    _INVALID
+    for byte in range(256))
+
+# Palavras reservadas e pontuação indexadas pelos seus bytes
+_BYTE_KEYWORDS = {keyword.encode(): kind for keyword, kind in KEYWORDS.items()}
+_BYTE_PUNCTUATION = {symbol.encode() if len(symbol) > 1 else ord(symbol): kind
+                     for symbol, kind in PUNCTUATION.items()}
+
+# Padrões léxicos da análise de bytes, escolhidos pela classe do primeiro byte
+_BYTE_GARBAGE = re.compile(rb'(?:[ \t\r\n]+|%[^\r\n]*)*')
+_BYTE_WORD = re.compile(rb'([A-Za-z]+)[0-9A-Za-z]*')
+_BYTE_NUMBER = re.compile(rb'[+-]?[0-9]+(?:(\.)[0-9]+|(?![.0-9]))')
+_BYTE_STRING = re.compile(rb"'[^'\n]*'")
+
+
+def _describe_unicode(source_code: str, pointer: int, after_operand: bool) -> Optional[Tuple[TokenKind, int]]:
+    """Captura um token sob o ponteiro seguindo as regras de ``str.isnumeric``,
+    ``str.isalpha`` e ``str.isalnum``, usado quando há caracteres não ASCII.
 
     Args:
         source_code: O código-fonte.
+        pointer: A posição do início do token.
+        after_operand: Se o token anterior é um operando.
 
     Returns:
-        Os tokens válidos encontrados no código-fonte.
-
-    Raises:
-        ALexicalError: Caso encontre um símbolo inválido no código-fonte.
+        O tipo e a posição final do token.
+        ``None`` caso não forme um token válido.
     """
-    tokens: List[Token] = []
+    length = len(source_code)
+
+    def run(position: int, predicate) -> int:
+        while position < length and predicate(source_code[position]):
+            position += 1
+        return position
+
+    # número
+    position = pointer
+    if source_code[position] in '+-' and not after_operand:
+        position += 1
+    if position < length and source_code[position].isnumeric():
+        position = run(position, str.isnumeric)
+        if position < length and source_code[position] == '.':
+            if position + 1 < length and source_code[position + 1].isnumeric():
+                return TokenKind.LITERAL_FLOAT, run(position + 1, str.isnumeric)
+        else:
+            return TokenKind.LITERAL_INT, position
 
-    pointer = 0
+    # cadeia de caracteres
+    if (character := source_code[pointer]) == "'":
+        position = run(pointer + 1, lambda c: c not in "'\n")
+        return (TokenKind.LITERAL_STR, position + 1) if position < length and source_code[position] == "'" else None
 
-    def peek():
-        """Retorna o caractere sob o ponteiro.
+    # delimitador, parênteses e operadores
+    if (kind := PUNCTUATION.get(source_code[pointer:pointer + 2])) is not None:
+        return kind, pointer + 2
+    if (kind := PUNCTUATION.get(character)) is not None:
+        return kind, pointer + 1
 
-        Returns:
-            O caractere sob o ponteiro.
-            ``''`` caso o ponteiro esteja fora dos limites do código-fonte.
-        """
-        try:
-            return source_code[pointer]
-        except IndexError:
-            return ''
+    # palavra reservada, operador booleano e identificador
+    position = run(pointer, str.isalpha)
+    if (kind := KEYWORDS.get(source_code[pointer:position])) is not None:
+        return kind, position
+    if character.isalpha():
+        return TokenKind.IDENTIFIER, run(pointer + 1, str.isalnum)
 
-    def skip():
-        """Avança a posição do ponteiro."""
-        nonlocal pointer
-        pointer += 1
+    return None
 
-    def recede():
-        """Retrocede a posição do ponteiro."""
-        nonlocal pointer
-        pointer -= 1
 
-    def advance():
-        """Consome o caractere sob o ponteiro, avança a posição do ponteiro
-        e retorna o caractere consumido.
+class _Scanner:
+    """Estado do analisador léxico entre trechos consecutivos do código-fonte."""
+    __slots__ = ('source', 'diagnostics', 'offset', 'pointer', 'after_operand', 'backtracks')
 
-        Returns:
-            O caractere sob o ponteiro.
-            ``''`` caso o ponteiro esteja fora dos limites do código-fonte.
+    def __init__(self, source: Source, diagnostics: Optional[Diagnostics] = None):
+        """Cria o estado do analisador léxico.
+
+        Args:
+            source: O código-fonte, usado para localizar os erros.
+            diagnostics: A lista onde os erros são registrados em vez de lançados (opcional).
+        """
+        self.source = source
+        self.diagnostics = diagnostics
+        self.offset = 0
+        self.pointer = 0
+        self.after_operand = False
+        # tokens reconhecidos por um padrão e encurtados ou analisados novamente
+        self.backtracks = 0
+
+    def tokenize(self, source_code: str, final: bool = True) -> Iterator[Tuple[TokenKind, int, int]]:
+        """Percorre o código-fonte uma única vez, a partir do ponteiro,
+        e gera o tipo, a posição inicial e a posição final de cada token.
+
+        Caso o código-fonte seja apenas um trecho (``final`` falso), percorre somente
+        até a última quebra de linha, já que nenhum token atravessa uma quebra de linha,
+        mantendo o ponteiro no início da linha incompleta. As posições geradas são
+        relativas ao trecho, que começa na posição ``offset`` do código-fonte.
+
+        Args:
+            source_code: O código-fonte, ou o trecho do código-fonte.
+            final: Se não existem mais trechos após este.
+
+        Yields:
+            O tipo, a posição inicial e a posição final do token.
+
+        Caso os erros sejam registrados, cada sequência de símbolos inválidos
+        gera um único erro e a análise continua após ela.
+
+        Raises:
+            ALexicalError: Caso encontre um símbolo inválido no código-fonte.
         """
-        character = peek()
-        skip()
-        return character
-
-    # Padrões léxicos da linguagem "A"
-    def garbage():
-        """Ignora espaços em branco e comentários."""
-        while (peeked_character := peek()) in [' ', '\t', '\r', '\n', '%']:
-            skip()
-            if peeked_character == '%':
-                while peek() not in ['\r', '\n', '']:
-                    skip()
-
-    def number():
-        """Captura um número inteiro ou real.
+        length = len(source_code) if final else source_code.rfind('\n') + 1
+        skip_garbage = _GARBAGE.match
+        match_pattern = _PATTERN.match
+        after_operand = self.after_operand
+        pointer = self.pointer
+        backtracks = self.backtracks
+
+        while True:
+            pointer = skip_garbage(source_code, pointer, length).end()
+
+            # parar a procura por padrões ao chegar no fim do código-fonte
+            if pointer >= length:
+                break
+
+            if (match := match_pattern(source_code, pointer, length)) is not None:
+                end = match.end()
+                # caracteres não ASCII adjacentes podem estender o token
+                if end < length and source_code[end] > '\x7f' or match.lastgroup == 'UNICODE':
+                    match = None
+                    backtracks += 1
+            if match is None:
+                if (token := _describe_unicode(source_code, pointer, after_operand)) is None:
+                    self.pointer, self.after_operand = pointer, after_operand
+                    error = ALexicalError(
+                        f'erro léxico, símbolo "{source_code[pointer]}" inválido',
+                        self.source.location(self.offset + pointer))
+                    if self.diagnostics is None:
+                        raise error
+                    self.diagnostics.add(error)
+                    pointer = self.skip_invalid(source_code, pointer + 1, length, after_operand)
+                    continue
+                kind, end = token
+            else:
+                group = match.lastgroup
+                if group == 'WORD':
+                    # uma sequência de letras que forma uma palavra reservada tem precedência
+                    if (kind := KEYWORDS.get(match.group('ALPHA'))) is not None:
+                        if (alpha_end := match.end('ALPHA')) != end:
+                            end = alpha_end
+                            backtracks += 1
+                    else:
+                        kind = TokenKind.IDENTIFIER
+                elif group == 'PUNCTUATION':
+                    kind = PUNCTUATION[match.group()]
+                elif group == 'INT':
+                    kind = TokenKind.LITERAL_INT
+                elif group == 'FLOAT':
+                    kind = TokenKind.LITERAL_FLOAT
+                elif group == 'STRING':
+                    kind = TokenKind.LITERAL_STR
+                elif after_operand:
+                    # após um operando, o sinal é um operador aritmético
+                    kind, end = PUNCTUATION[source_code[pointer]], pointer + 1
+                    backtracks += 1
+                elif group == 'SIGNED_INT':
+                    kind = TokenKind.LITERAL_INT
+                else:
+                    kind = TokenKind.LITERAL_FLOAT
+
+            yield kind, pointer, end
+            after_operand = kind in OPERAND_KINDS
+            pointer = end
+
+        self.pointer, self.after_operand, self.backtracks = pointer, after_operand, backtracks
+
+    @staticmethod
+    def skip_invalid(source_code: str, pointer: int, length: int, after_operand: bool) -> int:
+        """Avança o ponteiro até o fim de uma sequência de símbolos inválidos.
+
+        Args:
+            source_code: O código-fonte, ou o trecho do código-fonte.
+            pointer: A posição seguinte ao primeiro símbolo inválido.
+            length: A posição do fim da análise.
+            after_operand: Se o token anterior é um operando.
 
         Returns:
-            O token.
-            ``None`` caso não forme um token válido.
+            A posição do próximo espaço em branco, comentário ou token válido.
         """
-        lexeme = ''
-
-        if peek() in ['+', '-']:
-            try:
-                if tokens[-1].kind in [TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT, TokenKind.IDENTIFIER]:
-                    return None
-            except IndexError:
-                pass
-            lexeme += advance()
-
-        if peek().isnumeric():
-            lexeme += advance()
-            while peek().isnumeric():
-                lexeme += advance()
-        else:
-            for _ in range(len(lexeme)):
-                recede()
-            return None
+        while (pointer < length and source_code[pointer] not in ' \t\r\n%'
+               and _describe_unicode(source_code, pointer, after_operand) is None):
+            pointer += 1
+        return pointer
 
-        if peek() == '.':
-            lexeme += advance()
 
-            if peek().isnumeric():
-                lexeme += advance()
-                while peek().isnumeric():
-                    lexeme += advance()
-
-                return Token(TokenKind.LITERAL_FLOAT, lexeme)
-            else:
-                for _ in range(len(lexeme)):
-                    recede()
-                return None
-        else:
-            return Token(TokenKind.LITERAL_INT, lexeme)
+class _ByteScanner(_Scanner):
+    """Estado do analisador léxico de um código-fonte em bytes (``BytesSource``).
 
-    def string():
-        """Captura uma cadeia de caracteres.
+    Cada token é reconhecido pelo padrão da classe do seu primeiro byte, consultada
+    em uma tabela de 256 posições, e os sinais após um operando são operadores
+    sem que o número com sinal seja tentado.
+    """
+    __slots__ = ()
 
-        Returns:
-            O token.
-            ``None`` caso não forme um token válido.
-        """
-        lexeme = ''
+    def tokenize(self, source_code: bytes, final: bool = True) -> Iterator[Tuple[TokenKind, int, int]]:
+        """Percorre o código-fonte uma única vez, a partir do ponteiro,
+        e gera o tipo, a posição inicial e a posição final de cada token.
 
-        if peek() == "'":
-            lexeme += advance()
-            while peek() not in ["'", '\n', '']:
-                lexeme += advance()
+        Args:
+            source_code: Os bytes do código-fonte.
+            final: Sempre verdadeiro, já que o código-fonte é mapeado por inteiro.
 
-            if peek() == "'":
-                lexeme += advance()
-                return Token(TokenKind.LITERAL_STR, lexeme)
-            else:
-                for _ in range(len(lexeme)):
-                    recede()
-                return None
-        else:
-            return None
+        Yields:
+            O tipo, a posição inicial e a posição final do token.
 
-    def delimiter():
-        """Captura um delimitador.
+        Raises:
+            ALexicalError: Caso encontre um símbolo inválido no código-fonte.
+        """
+        length = len(source_code)
+        skip_garbage = _BYTE_GARBAGE.match
+        match_word = _BYTE_WORD.match
+        match_number = _BYTE_NUMBER.match
+        match_string = _BYTE_STRING.match
+        classes = _BYTE_CLASSES
+        after_operand = self.after_operand
+        pointer = self.pointer
+        backtracks = self.backtracks
+
+        while True:
+            pointer = skip_garbage(source_code, pointer, length).end()
+
+            # parar a procura por padrões ao chegar no fim do código-fonte
+            if pointer >= length:
+                break
+
+            byte = source_code[pointer]
+            byte_class = classes[byte]
+            kind = None
+            if byte_class == _LETTER:
+                match = match_word(source_code, pointer, length)
+                end = match.end()
+                # uma sequência de letras que forma uma palavra reservada tem precedência
+                if (kind := _BYTE_KEYWORDS.get(match.group(1))) is not None:
+                    if (alpha_end := match.end(1)) != end:
+                        end = alpha_end
+                        backtracks += 1
+                else:
+                    kind = TokenKind.IDENTIFIER
+            elif byte_class == _DIGIT or (byte_class == _SIGN and not after_operand):
+                if (match := match_number(source_code, pointer, length)) is not None:
+                    kind = TokenKind.LITERAL_INT if match.start(1) == -1 else TokenKind.LITERAL_FLOAT
+                    end = match.end()
+                elif byte_class == _SIGN:
+                    kind, end = _BYTE_PUNCTUATION[byte], pointer + 1
+            elif byte_class == _SIGN:
+                # após um operando, o sinal é um operador aritmético
+                kind, end = _BYTE_PUNCTUATION[byte], pointer + 1
+            elif byte_class == _PUNCTUATION:
+                if (kind := _BYTE_PUNCTUATION.get(source_code[pointer:pointer + 2])) is not None:
+                    end = pointer + 2
+                else:
+                    kind, end = _BYTE_PUNCTUATION[byte], pointer + 1
+            elif byte_class == _QUOTE and (match := match_string(source_code, pointer, length)) is not None:
+                kind, end = TokenKind.LITERAL_STR, match.end()
+
+            if kind is None:
+                self.pointer, self.after_operand = pointer, after_operand
+                symbol = bytes(source_code[pointer:pointer + 4]).decode('utf-8', 'replace')[0]
+                error = ALexicalError(f'erro léxico, símbolo "{symbol}" inválido', self.source.location(pointer))
+                if self.diagnostics is None:
+                    raise error
+                self.diagnostics.add(error)
+                pointer = self.skip_invalid(source_code, pointer + 1, length, after_operand)
+                continue
+
+            yield kind, pointer, end
+            after_operand = kind in OPERAND_KINDS
+            pointer = end
+
+        self.pointer, self.after_operand, self.backtracks = pointer, after_operand, backtracks
+
+    @staticmethod
+    def skip_invalid(source_code: bytes, pointer: int, length: int, after_operand: bool) -> int:
+        """Avança o ponteiro até o fim de uma sequência de símbolos inválidos.
+
+        Args:
+            source_code: Os bytes do código-fonte.
+            pointer: A posição seguinte ao primeiro símbolo inválido.
+            length: A posição do fim da análise.
+            after_operand: Se o token anterior é um operando.
 
         Returns:
-            O token.
-            ``None`` caso não forme um token válido.
+            A posição do próximo espaço em branco, comentário ou token válido.
         """
-        lexeme = ''
+        while pointer < length:
+            byte_class = _BYTE_CLASSES[source_code[pointer]]
+            if byte_class in (_SPACE, _COMMENT, _LETTER, _SIGN, _PUNCTUATION):
+                break
+            if byte_class == _DIGIT and _BYTE_NUMBER.match(source_code, pointer, length) is not None:
+                break
+            if byte_class == _QUOTE and _BYTE_STRING.match(source_code, pointer, length) is not None:
+                break
+            pointer += 1
+        return pointer
+
+
+def describe(source_code: Union[str, bytes, Source], reporter: Optional[Reporter] = None,
+             diagnostics: Optional[Diagnostics] = None) -> TokenBuffer:
+    """Analisa o código-fonte e retorna os tokens válidos encontrados
+    da línguagem "A".
 
-        if peek() == ':':
-            lexeme += advance()
-            return Token(TokenKind.DELIMITER, lexeme)
-        else:
-            return None
+    Um código-fonte em bytes (``bytes`` ou ``BytesSource``, por exemplo um arquivo mapeado
+    na memória) é analisado sem ser decodificado, e apenas os caracteres ASCII da especificação
+    formam identificadores e números.
 
-    def reserved_word():
-        """Captura uma palavra reservada.
+    Args:
+        source_code: O código-fonte.
+        reporter: O relatório que recebe os eventos da análise (padrão: silencioso).
+        diagnostics: A lista onde os erros são registrados em vez de lançados (opcional).
 
-        Returns:
-            O token.
-            ``None`` caso não forme um token válido.
-        """
-        lexeme = ''
-
-        while peek().isalpha():
-            lexeme += advance()
-
-        if lexeme == 'DECLARACOES':
-            return Token(TokenKind.DECLARACOES, lexeme)
-        elif lexeme == 'ALGORITMO':
-            return Token(TokenKind.ALGORITMO, lexeme)
-        elif lexeme == 'INT':
-            return Token(TokenKind.INT, lexeme)
-        elif lexeme == 'REAL':
-            return Token(TokenKind.REAL, lexeme)
-        elif lexeme == 'ATRIBUIR':
-            return Token(TokenKind.ATRIBUIR, lexeme)
-        elif lexeme == 'A':
-            return Token(TokenKind.A, lexeme)
-        elif lexeme == 'LER':
-            return Token(TokenKind.LER, lexeme)
-        elif lexeme == 'IMPRIMIR':
-            return Token(TokenKind.IMPRIMIR, lexeme)
-        elif lexeme == 'SE':
-            return Token(TokenKind.SE, lexeme)
-        elif lexeme == 'ENTAO':
-            return Token(TokenKind.ENTAO, lexeme)
-        elif lexeme == 'ENQUANTO':
-            return Token(TokenKind.ENQUANTO, lexeme)
-        elif lexeme == 'INICIO':
-            return Token(TokenKind.INICIO, lexeme)
-        elif lexeme == 'FIM':
-            return Token(TokenKind.FIM, lexeme)
-        else:
-            for _ in range(len(lexeme)):
-                recede()
-            return None
+    Returns:
+        Os tokens válidos encontrados no código-fonte.
 
-    def parenthesis():
-        """Captura um parêntese.
+    Raises:
+        ALexicalError: Caso encontre um símbolo inválido no código-fonte.
+    """
+    if not isinstance(source_code, Source):
+        source_code = Source(source_code) if isinstance(source_code, str) else BytesSource(source_code)
+    source = source_code
+    reporter = reporter or SilentReporter()
+    traces = reporter.traces
+    tokens = TokenBuffer(source)
+    append_kind, append_start, append_end = tokens.kinds.append, tokens.starts.append, tokens.ends.append
+
+    scanner = _ByteScanner(source, diagnostics) if isinstance(source, BytesSource) else _Scanner(source, diagnostics)
+    for kind, start, end in scanner.tokenize(source.text):
+        append_kind(kind.value)
+        append_start(start)
+        append_end(end)
+
+        if traces:
+            reporter.found(Token(kind, None, source, start, end))
+
+    reporter.described(len(tokens))
+    if reporter.counts:
+        reporter.counted('tokens', tokens.count_kinds())
+        reporter.counted('lexer', {'backtracks': scanner.backtracks})
 
-        Returns:
-            O token.
-            ``None`` caso não forme um token válido.
-        """
-        lexeme = ''
-
-        if (peeked_character := peek()) == '(':
-            lexeme += advance()
-            return Token(TokenKind.LEFT_PARENTHESIS, lexeme)
-        elif peeked_character == ')':
-            lexeme += advance()
-            return Token(TokenKind.RIGHT_PARENTHESIS, lexeme)
-        else:
-            return None
+    return tokens
 
-    def relational_operator():
-        """Captura um operador relacional.
 
-        Returns:
-            O token.
-            ``None`` caso não forme um token válido.
-        """
-        lexeme = ''
-
-        if (peeked_character := peek()) == '=':
-            lexeme += advance()
-            return Token(TokenKind.EQUAL, lexeme)
-        elif peeked_character == '<':
-            lexeme += advance()
-            if (peeked_character := peek()) == '=':
-                lexeme += advance()
-                return Token(TokenKind.LESS_EQUAL, lexeme)
-            elif peeked_character == '>':
-                lexeme += advance()
-                return Token(TokenKind.NOT_EQUAL, lexeme)
-            else:
-                return Token(TokenKind.LESS, lexeme)
-        elif peeked_character == '>':
-            lexeme += advance()
-            if peek() == '=':
-                lexeme += advance()
-                return Token(TokenKind.GREATER_EQUAL, lexeme)
-            else:
-                return Token(TokenKind.GREATER, lexeme)
-        else:
-            return None
+def describe_stream(source_file: TextIO, chunk_size: int = CHUNK_SIZE, reporter: Optional[Reporter] = None,
+                    diagnostics: Optional[Diagnostics] = None) -> Iterator[Token]:
+    """Analisa o código-fonte lendo-o em trechos de tamanho fixo e gera os tokens
+    válidos encontrados da linguagem "A" sob demanda.
 
-    def arithmetic_operator():
-        """Captura um operador aritmético.
+    Args:
+        source_file: O arquivo do código-fonte, aberto em modo texto.
+        chunk_size: A quantidade de caracteres lidos por trecho.
+        reporter: O relatório que recebe os eventos da análise (padrão: silencioso).
+        diagnostics: A lista onde os erros são registrados em vez de lançados (opcional).
 
-        Returns:
-            O token.
-            ``None`` caso não forme um token válido.
-        """
-        lexeme = ''
-
-        if (peeked_character := peek()) == '+':
-            lexeme += advance()
-            return Token(TokenKind.ADDITION, lexeme)
-        elif peeked_character == '-':
-            lexeme += advance()
-            return Token(TokenKind.SUBTRACTION, lexeme)
-        elif peeked_character == '*':
-            lexeme += advance()
-            return Token(TokenKind.MULTIPLICATION, lexeme)
-        elif peeked_character == '/':
-            lexeme += advance()
-            return Token(TokenKind.DIVISION, lexeme)
-        else:
-            return None
+    Yields:
+        Os tokens válidos encontrados no código-fonte.
 
-    def boolean_operator():
-        """Captura um operador booleano.
+    Raises:
+        ALexicalError: Caso encontre um símbolo inválido no código-fonte.
+    """
+    source = Source(None, getattr(source_file, 'name', '<código-fonte>'))
+    reporter = reporter or SilentReporter()
+    traces = reporter.traces
+    # contagem dos tokens por tipo, apenas quando o relatório recebe os contadores
+    kind_counts = Counter() if reporter.counts else None
+    scanner = _Scanner(source, diagnostics)
+    buffer = ''
+    final = False
+    token_count = 0
 
-        Returns:
-            O token.
-            ``None`` caso não forme um token válido.
-        """
-        lexeme = ''
+    while not final:
+        chunk = source_file.read(chunk_size)
+        final = not chunk
+        source.feed(chunk, scanner.offset + len(buffer))
 
-        while peek().isalpha():
-            lexeme += advance()
+        # manter apenas o final do trecho anterior que ainda não formou um token
+        scanner.offset += scanner.pointer
+        buffer = buffer[scanner.pointer:] + chunk
+        scanner.pointer = 0
+        offset = scanner.offset
 
-        if lexeme == 'E':
-            return Token(TokenKind.AND, lexeme)
-        elif lexeme == 'OU':
-            return Token(TokenKind.OR, lexeme)
-        else:
-            for _ in range(len(lexeme)):
-                recede()
-            return None
+        for kind, start, end in scanner.tokenize(buffer, final):
+            token = Token(kind, buffer[start:end], source, offset + start, offset + end)
+            token_count += 1
 
-    def identifier():
-        """Captura um identificador.
+            if traces:
+                reporter.found(token)
+            if kind_counts is not None:
+                kind_counts[kind] += 1
 
-        Returns:
-            O token.
-            ``None`` caso não forme um token válido.
-        """
-        lexeme = ''
+            yield token
 
-        if peek().isalpha():
-            lexeme += advance()
+    reporter.described(token_count)
+    if kind_counts is not None:
+        reporter.counted('tokens', {kind.name: kind_counts[kind] for kind in TokenKind if kind in kind_counts})
+        reporter.counted('lexer', {'backtracks': scanner.backtracks})
 
-            while peek().isalnum():
-                lexeme += advance()
 
-            return Token(TokenKind.IDENTIFIER, lexeme)
-        else:
-            return None
+# Tokens de um trecho analisado em paralelo: os tipos, as posições no código-fonte,
+# os erros, os retrocessos e se o primeiro token é um número com sinal
+_ChunkResult = Tuple[array, array, array, List[ALexicalError], int, bool]
 
-    # procurar padrões da linguagem "A" até o fim do código-fonte
-    while True:
-        garbage()
 
-        # parar a procura por padrões ao chegar no fim do código-fonte
-        if peek() == '':
+def _split_lines(source_code: Union[str, bytes], parts: int) -> List[Tuple[int, int]]:
+    """Divide o código-fonte em trechos de tamanhos próximos, terminados em quebras de linha.
+
+    Nenhum token, cadeia de caracteres ou comentário atravessa uma quebra de linha,
+    portanto cada trecho começa fora deles e pode ser analisado isoladamente.
+
+    Returns:
+        A posição do início e do fim de cada trecho.
+    """
+    newline = '\n' if isinstance(source_code, str) else b'\n'
+    length = len(source_code)
+    boundaries = [0]
+    for part in range(1, parts):
+        position = source_code.find(newline, max(boundaries[-1], length * part // parts))
+        if position == -1 or position + 1 >= length:
             break
+        if position + 1 > boundaries[-1]:
+            boundaries.append(position + 1)
+    boundaries.append(length)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _chunk_scanner(chunk: Union[str, bytes], name: str) -> _Scanner:
+    """Cria o analisador de um trecho, que registra os erros localizados em relação ao trecho."""
+    if isinstance(chunk, str):
+        return _Scanner(Source(chunk, name), Diagnostics())
+    return _ByteScanner(BytesSource(chunk, name), Diagnostics())
+
+
+def _describe_chunk(arguments: Tuple[Union[str, bytes], int, str]) -> _ChunkResult:
+    """Analisa um trecho como se o token anterior não fosse um operando."""
+    chunk, offset, name = arguments
+    scanner = _chunk_scanner(chunk, name)
+    kinds, starts, ends = array('B'), array('q'), array('q')
+    append_kind, append_start, append_end = kinds.append, starts.append, ends.append
+    for kind, start, end in scanner.tokenize(chunk):
+        append_kind(kind.value)
+        append_start(offset + start)
+        append_end(offset + end)
+    signed = (len(kinds) > 0 and chunk[starts[0] - offset] in ('+-' if isinstance(chunk, str) else b'+-')
+              and TOKEN_KINDS[kinds[0]] in (TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT))
+    return kinds, starts, ends, scanner.diagnostics.errors, scanner.backtracks, signed
+
+
+def _redescribe_chunk(chunk: Union[str, bytes], offset: int, name: str, result: _ChunkResult) -> _ChunkResult:
+    """Analisa novamente um trecho cujo token anterior é um operando, até que os tokens
+    voltem a coincidir com os da análise em paralelo, reaproveitando os demais."""
+    old_kinds, old_starts, old_ends, old_errors, _, _ = result
+    scanner = _chunk_scanner(chunk, name)
+    scanner.after_operand = True
+    kinds, starts, ends = array('B'), array('q'), array('q')
+    index = 0
+    for kind, start, end in scanner.tokenize(chunk):
+        kinds.append(kind.value)
+        starts.append(offset + start)
+        ends.append(offset + end)
+        while index < len(old_ends) and old_ends[index] < offset + end:
+            index += 1
+        # o estado do analisador (a posição e se o último token é um operando) voltou a ser o mesmo
+        if (index < len(old_ends) and old_ends[index] == offset + end
+                and (TOKEN_KINDS[old_kinds[index]] in OPERAND_KINDS) == (kind in OPERAND_KINDS)):
+            kinds.extend(old_kinds[index + 1:])
+            starts.extend(old_starts[index + 1:])
+            ends.extend(old_ends[index + 1:])
+            resumed_at = scanner.source.location(end)[1:]
+            errors = scanner.diagnostics.errors + [error for error in old_errors
+                                                   if error.location[1:] >= resumed_at]
+            return kinds, starts, ends, errors, scanner.backtracks, False
+    return kinds, starts, ends, scanner.diagnostics.errors, scanner.backtracks, False
+
+
+def describe_parallel(source_code: Union[str, bytes, Source], reporter: Optional[Reporter] = None,
+                      diagnostics: Optional[Diagnostics] = None, jobs: Optional[int] = None,
+                      executor: Optional[Executor] = None, min_size: int = PARALLEL_MIN_SIZE) -> TokenBuffer:
+    """Analisa o código-fonte dividido em trechos, distribuídos entre processos,
+    e retorna os mesmos tokens e erros da análise por ``describe``.
+
+    Os trechos terminam em quebras de linha e são analisados como se o token anterior
+    não fosse um operando; um trecho cujo primeiro token é um número com sinal após
+    um operando é analisado novamente apenas até que os tokens voltem a coincidir.
+    Um código-fonte menor que ``min_size`` é analisado no processo atual.
 
-        # procurar e capturar um token válido,
-        if (token := number()) is not None:
-            tokens.append(token)
-        elif (token := string()) is not None:
-            tokens.append(token)
-        elif (token := delimiter()) is not None:
-            tokens.append(token)
-        elif (token := reserved_word()) is not None:
-            tokens.append(token)
-        elif (token := parenthesis()) is not None:
-            tokens.append(token)
-        elif (token := relational_operator()) is not None:
-            tokens.append(token)
-        elif (token := arithmetic_operator()) is not None:
-            tokens.append(token)
-        elif (token := boolean_operator()) is not None:
-            tokens.append(token)
-        elif (token := identifier()) is not None:
-            tokens.append(token)
-        # caso não encontre um token válido, levantar um erro léxico
-        else:
-            raise ALexicalError('erro léxico encontrado')
+    Args:
+        source_code: O código-fonte.
+        reporter: O relatório que recebe os eventos da análise (padrão: silencioso).
+        diagnostics: A lista onde os erros são registrados em vez de lançados (opcional).
+        jobs: A quantidade de processos, ou de processos do ``executor`` (padrão: a quantidade de processadores).
+            Com um único processo, o código-fonte é analisado no processo atual.
+        executor: Os processos que analisam os trechos, mantidos entre as análises (opcional).
+        min_size: O tamanho mínimo do código-fonte, em caracteres ou bytes, para analisá-lo em paralelo.
 
-        print(f'🥳 {token} encontrado')
+    Returns:
+        Os tokens válidos encontrados no código-fonte.
+
+    Raises:
+        ALexicalError: Caso encontre um símbolo inválido no código-fonte.
+    """
+    if not isinstance(source_code, Source):
+        source_code = Source(source_code) if isinstance(source_code, str) else BytesSource(source_code)
+    source = source_code
+    text = source.text
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(text) < min_size:
+        return describe(source, reporter, diagnostics)
+
+    reporter = reporter or SilentReporter()
+    chunks = _split_lines(text, jobs * PARALLEL_CHUNKS_PER_JOB)
+    arguments = ((text[start:end], start, source.name) for start, end in chunks)
+    if executor is None:
+        with ProcessPoolExecutor(jobs) as own_executor:
+            results = list(own_executor.map(_describe_chunk, arguments))
+    else:
+        results = executor.map(_describe_chunk, arguments)
+
+    tokens = TokenBuffer(source)
+    after_operand = False
+    backtracks = 0
+    for (start, end), result in zip(chunks, results):
+        if after_operand and result[5]:
+            result = _redescribe_chunk(text[start:end], start, source.name, result)
+        kinds, starts, ends, errors, chunk_backtracks, _ = result
+        if errors:
+            # as linhas dos erros são relativas ao trecho, que começa no início de uma linha
+            lines_before = source.location(start).line - 1
+            for error in errors:
+                error.location = error.location._replace(line=error.location.line + lines_before)
+                if diagnostics is None:
+                    raise error
+                diagnostics.add(error)
+        tokens.kinds.extend(kinds)
+        tokens.starts.extend(starts)
+        tokens.ends.extend(ends)
+        backtracks += chunk_backtracks
+        if kinds:
+            after_operand = TOKEN_KINDS[kinds[-1]] in OPERAND_KINDS
+
+    if reporter.traces:
+        for token in tokens:
+            reporter.found(token)
+    reporter.described(len(tokens))
+    if reporter.counts:
+        reporter.counted('tokens', tokens.count_kinds())
+        reporter.counted('lexer', {'backtracks': backtracks})
 
     return tokens
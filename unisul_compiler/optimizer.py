@@ -0,0 +1,294 @@
+from typing import Dict, Generator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .cfg import (
+    build_cfg, constant_branches, dead_stores, evaluate_operation, may_fail, operation_may_fail, variables_in)
+from .syntax_tree import (
+    Assign, BinaryOperation, Block, Declaration, Expression, If, Node, NodeTransformer,
+    Number, Program, Read, Variable, While)
+from .token import TokenKind
+
+
+class OptimizationReport(NamedTuple):
+    """Resumo da otimização de um programa."""
+    nodes_removed: int
+    operations_removed: int
+    folded: int
+    simplified: int
+    hoisted: int
+    dead_stores: int
+    branches_removed: int
+
+    def __str__(self):
+        return (f'{self.nodes_removed} nós e {self.operations_removed} operações removidos '
+                f'({self.folded} dobras de constantes, {self.simplified} simplificações, '
+                f'{self.dead_stores} atribuições sem uso, {self.branches_removed} desvios constantes), '
+                f'{self.hoisted} expressões movidas para fora de laços')
+
+
+def count_nodes(node: Node) -> Dict[type, int]:
+    """Conta os nós de uma árvore sintática por classe.
+
+    Args:
+        node: A raiz da árvore.
+
+    Returns:
+        A quantidade de nós de cada classe.
+    """
+    counts: Dict[type, int] = {}
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        counts[type(node)] = counts.get(type(node), 0) + 1
+        pending.extend(node.children())
+    return counts
+
+
+def is_number(node: Expression, value: int) -> bool:
+    """Verifica se a expressão é o número inteiro ou real de valor especificado."""
+    return isinstance(node, Number) and node.value == value
+
+
+class _Folder(NodeTransformer):
+    """Dobra as subexpressões constantes e simplifica as identidades aritméticas,
+    seguindo as regras de tipo de ``parser.arithmetic_expression``."""
+
+    def __init__(self):
+        self.folded = 0
+        self.simplified = 0
+
+    def visit_BinaryOperation(self, node: BinaryOperation) -> Generator[Node, Node, Expression]:
+        yield from self.generic_visit(node)
+        left, right, operator = node.left, node.right, node.operator
+
+        if isinstance(left, Number) and isinstance(right, Number):
+            # a divisão por zero permanece para ser relatada na execução
+            if (value := evaluate_operation(operator, node.type, left.value, right.value)) is None:
+                return node
+            self.folded += 1
+            return Number(node.token, value, node.type)
+
+        # as identidades só se aplicam quando o resultado mantém o tipo do operando,
+        # e as identidades com reais apenas quando preservam o sinal do zero
+        if operator == TokenKind.MULTIPLICATION:
+            if is_number(right, 1) and left.type == node.type:
+                return self.simplify(left)
+            if is_number(left, 1) and right.type == node.type:
+                return self.simplify(right)
+            if node.type == TokenKind.LITERAL_INT and (is_number(left, 0) or is_number(right, 0)):
+                return self.simplify(Number(node.token, 0, TokenKind.LITERAL_INT))
+        elif operator == TokenKind.ADDITION and node.type == TokenKind.LITERAL_INT:
+            if is_number(right, 0):
+                return self.simplify(left)
+            if is_number(left, 0):
+                return self.simplify(right)
+        elif operator == TokenKind.SUBTRACTION:
+            if is_number(right, 0) and left.type == node.type:
+                return self.simplify(left)
+        elif operator == TokenKind.DIVISION:
+            if is_number(right, 1) and left.type == node.type:
+                return self.simplify(left)
+
+        return node
+
+    def simplify(self, node: Expression) -> Expression:
+        self.simplified += 1
+        return node
+
+
+class _DataflowPruner(NodeTransformer):
+    """Remove os ``SE`` e ``ENQUANTO`` de condição constante e as atribuições sem uso
+    encontrados pelas análises de ``cfg``."""
+
+    def __init__(self, branches: Dict[Union[If, While], bool], dead: Set[Assign]):
+        self.branches = branches
+        self.dead = dead
+        self.branches_removed = 0
+        self.dead_stores = 0
+
+    def visit_Assign(self, node: Assign) -> Optional[Assign]:
+        if node in self.dead:
+            self.dead_stores += 1
+            return None
+        return node
+
+    def visit_If(self, node: If) -> Generator[Node, Optional[Node], Optional[Node]]:
+        yield from self.prune_command(node)
+        if (result := self.branches.get(node)) is None:
+            return node
+        self.branches_removed += 1
+        return node.command if result else None
+
+    def visit_While(self, node: While) -> Generator[Node, Optional[Node], Optional[While]]:
+        yield from self.prune_command(node)
+        # um laço de condição sempre verdadeira não termina e permanece como está
+        if self.branches.get(node) is False:
+            self.branches_removed += 1
+            return None
+        return node
+
+    def prune_command(self, node: Union[If, While]) -> Generator[Node, Optional[Node], None]:
+        """Otimiza o comando de um ``SE`` ou ``ENQUANTO``, substituindo-o
+        por um bloco vazio caso tenha sido removido."""
+        if (command := (yield node.command)) is None:
+            command = Block(node.token, [])
+        node.command = command
+
+
+class _Hoister(NodeTransformer):
+    """Move as subexpressões invariantes de cada laço ``ENQUANTO`` para variáveis
+    temporárias atribuídas antes do laço."""
+
+    def __init__(self, program: Program):
+        self.program = program
+        self.hoisted = 0
+        # variáveis modificadas no laço sendo otimizado
+        self.assigned: Set[str] = set()
+        # variáveis modificadas pelos comandos já visitados do laço (ou programa) que os contém
+        self.modified: Set[str] = set()
+        self.assignments: List[Assign] = []
+
+    def is_invariant(self, node: Expression) -> bool:
+        """Verifica se a expressão não depende das variáveis modificadas no laço
+        e não pode falhar, já que passa a ser avaliada mesmo que o laço não execute."""
+        return not may_fail(node) and all(variable.name not in self.assigned for variable in variables_in(node))
+
+    def invariant_operations(self, node: Expression) -> Set[BinaryOperation]:
+        """Retorna as operações invariantes de uma expressão, como em ``is_invariant``,
+        calculadas a partir dos operandos."""
+        invariant = set()
+        operands: List[bool] = []
+        pending: List[Tuple[Expression, bool]] = [(node, False)]
+        while pending:
+            node, ready = pending.pop()
+            if isinstance(node, Number):
+                operands.append(True)
+            elif isinstance(node, Variable):
+                operands.append(node.name not in self.assigned)
+            elif not ready:
+                pending.extend(((node, True), (node.right, False), (node.left, False)))
+            else:
+                right, left = operands.pop(), operands.pop()
+                if left and right and not operation_may_fail(node):
+                    invariant.add(node)
+                operands.append(node in invariant)
+        return invariant
+
+    def visit_Assign(self, node: Assign) -> Assign:
+        self.modified.add(node.target.name)
+        return node
+
+    def visit_Read(self, node: Read) -> Read:
+        self.modified.add(node.target.name)
+        return node
+
+    def visit_While(self, node: While) -> Generator[Node, Node, Node]:
+        # otimizar primeiro os laços internos, coletando as variáveis modificadas no laço
+        outer_modified, self.modified = self.modified, set()
+        node.command = yield node.command
+
+        outer_assigned, outer_assignments = self.assigned, self.assignments
+        self.assigned, self.assignments = self.modified, []
+
+        node.condition = yield self.hoist(node.condition)
+        node.command = yield self.hoist(node.command)
+
+        assignments = self.assignments
+        outer_modified.update(self.assigned, (assignment.target.name for assignment in assignments))
+        self.assigned, self.assignments, self.modified = outer_assigned, outer_assignments, outer_modified
+        if not assignments:
+            return node
+        return Block(node.token, [*assignments, node])
+
+    def hoist(self, node: Node) -> Generator[Generator, Optional[Node], Optional[Node]]:
+        """Substitui as subexpressões invariantes máximas do nó por variáveis temporárias.
+
+        Args:
+            node: O nó dentro do laço.
+
+        Returns:
+            O nó, ou ``None`` caso tenha sido movido para fora do laço.
+        """
+        # a atribuição de uma temporária de um laço interno pode sair inteira
+        if isinstance(node, Assign) and node.target.name.startswith('$') and self.is_invariant(node.expression):
+            self.assignments.append(node)
+            return None
+        if isinstance(node, Expression):
+            return self.hoist_expression(node)
+        # os laços internos já foram otimizados
+        if not isinstance(node, While):
+            for field in node._fields:
+                value = getattr(node, field)
+                if isinstance(value, Node):
+                    setattr(node, field, (yield self.hoist(value)))
+                elif isinstance(value, list):
+                    items = []
+                    for item in value:
+                        if (item := (yield self.hoist(item))) is not None:
+                            items.append(item)
+                    value[:] = items
+        return node
+
+    def hoist_expression(self, node: Expression) -> Expression:
+        """Substitui as operações invariantes máximas de uma expressão, da esquerda para a direita,
+        por variáveis temporárias."""
+        invariant = self.invariant_operations(node)
+        if node in invariant:
+            return self.temporary(node)
+        pending = [(node, 'right'), (node, 'left')] if isinstance(node, BinaryOperation) else []
+        while pending:
+            operation, field = pending.pop()
+            operand = getattr(operation, field)
+            if operand in invariant:
+                setattr(operation, field, self.temporary(operand))
+            elif isinstance(operand, BinaryOperation):
+                pending.extend(((operand, 'right'), (operand, 'left')))
+        return node
+
+    def temporary(self, node: BinaryOperation) -> Variable:
+        """Move uma operação para uma variável temporária atribuída antes do laço."""
+        name = f'${len(self.program.declarations)}'
+        self.program.declarations.append(Declaration(node.token, name, node.type))
+        self.assignments.append(Assign(node.token, node, Variable(node.token, name, node.type)))
+        self.hoisted += 1
+        return Variable(node.token, name, node.type)
+
+
+def optimize(program: Program) -> OptimizationReport:
+    """Otimiza um programa válido, modificando a sua árvore sintática.
+
+    Dobra as subexpressões constantes, simplifica as identidades ``x * 1``, ``x + 0``,
+    ``x - 0``, ``x / 1`` e ``x * 0`` (apenas para inteiros), remove os ``SE`` e ``ENQUANTO``
+    cuja condição é constante pela propagação de constantes no grafo de fluxo de controle
+    (mantendo o comando de um ``SE`` sempre verdadeiro), remove as atribuições cujo valor
+    nunca é lido e move as subexpressões invariantes dos laços para variáveis temporárias
+    (``$n``) declaradas no programa.
+
+    Args:
+        program: A árvore sintática do programa.
+
+    Returns:
+        O resumo da otimização.
+    """
+    counts_before = count_nodes(program)
+
+    folder = _Folder()
+    folder.visit(program)
+
+    # as atribuições sem uso são procuradas após a remoção dos desvios, que altera o fluxo
+    pruner = _DataflowPruner(constant_branches(build_cfg(program)), set())
+    pruner.visit(program)
+    pruner.branches, pruner.dead = {}, dead_stores(build_cfg(program))
+    pruner.visit(program)
+    counts_after = count_nodes(program)
+
+    hoister = _Hoister(program)
+    hoister.visit(program)
+
+    return OptimizationReport(
+        nodes_removed=sum(counts_before.values()) - sum(counts_after.values()),
+        operations_removed=counts_before.get(BinaryOperation, 0) - counts_after.get(BinaryOperation, 0),
+        folded=folder.folded,
+        simplified=folder.simplified,
+        hoisted=hoister.hoisted,
+        dead_stores=pruner.dead_stores,
+        branches_removed=pruner.branches_removed)
@@ -0,0 +1,108 @@
+# Gerado por "python -m unisul_compiler.grammar" a partir das regras de grammar.py, não edite.
+from .grammar import ParseTable
+
+GRAMMAR_DIGEST = '6b5f1c3f69dfbb6751cefb421052780a835add32613ad5540a0d1dfe81f2077f'
+
+TABLES = {
+    'precedence': ParseTable(
+        width=33,
+        start=33,
+        nonterminals=('program', 'declarations', 'declaration', 'type', 'commands', 'command', 'block_commands',
+         'printable', 'relation', 'relational_operator', 'exp', 'relational_expression', 'disjunction_tail',
+         'conjunction', 'conjunction_tail', 'arithmetic_expression', 'sum_tail', 'term', 'product_tail',
+         'factor', 'closing_parenthesis'),
+        actions=('program', 'algorithm', 'declaration', 'command', 'assign', 'read', 'print', 'if', 'while',
+         'block', 'end_block', 'append', 'relation', 'number', 'variable', 'boolean', 'binary',
+         'parenthesized'),
+        productions=((37, 55, 6, 4, 34, 54, 5, 4), (34, 35), (), (56, 36, 4, 32), (7,), (8,), (37, 57, 38), (),
+         (58, 32, 10, 48, 9), (59, 32, 11), (60, 40, 12), (61, 38, 14, 44, 13), (62, 38, 44, 15),
+         (64, 17, 39, 63, 16), (39, 65, 38), (), (32,), (3,), (66, 48, 42, 48), (20,), (22,), (23,), (24,),
+         (25,), (21,), (67, 1), (67, 2), (68, 32), (45, 46), (45, 69, 46, 31), (), (47, 41),
+         (47, 69, 41, 30), (), (49, 50), (49, 70, 50, 26), (49, 70, 50, 27), (), (51, 52), (51, 70, 52, 28),
+         (51, 70, 52, 29), (), (43,), (71, 53, 48, 18), (19,)),
+        table=(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+         2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1,
+         3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+         -1, -1, -1, -1, -1, -1, -1, 4, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, 7, -1, -1, -1, -1, -1, -1, -1, -1, 6, -1, 6, 6, 6, -1, 6, 6, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 8,
+         -1, 9, 10, 11, -1, 12, 13, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, 14, -1, 14, 14, 14, -1, 14, 14, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, 17, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 16, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18,
+         18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 19, 24, 20, 21, 22, 23, -1, -1,
+         -1, -1, -1, -1, -1, -1, 25, 26, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 27, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+         28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 30, 30, 30, 30,
+         30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+         30, 30, 29, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+         31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33,
+         33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 32, 33, 33, 34, 34, 34, 34, 34,
+         34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+         34, 34, 34, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37,
+         37, 37, 37, 37, 35, 36, 37, 37, 37, 37, 37, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+         38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 41, 41, 41, 41, 41, 41,
+         41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 39, 40, 41,
+         41, 41, -1, 42, 42, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 43, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, 42, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, 44, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+        expected=((4,), (32,), (32,), (7, 8), (9, 11, 12, 13, 15, 16), (9, 11, 12, 13, 15, 16),
+         (9, 11, 12, 13, 15, 16), (32, 3), (1, 2, 32, 18), (20, 22, 23, 24, 25, 21), (1, 2, 32),
+         (1, 2, 32, 18), (31,), (1, 2, 32, 18), (30,), (1, 2, 32, 18), (26, 27), (1, 2, 32, 18), (28, 29),
+         (1, 2, 32, 18), (19, 26, 27, 28, 29)),
+        recovery=(None, (4, 9, 11, 12, 13, 15, 16, 17, 32), None, None, (9, 11, 12, 13, 15, 16, 17), None,
+         (9, 11, 12, 13, 15, 16, 17), None, None, None, None, None, None, None, None, None, None, None,
+         None, None, None),
+    ),
+    'legacy': ParseTable(
+        width=33,
+        start=33,
+        nonterminals=('program', 'declarations', 'declaration', 'type', 'commands', 'command', 'block_commands',
+         'printable', 'relation', 'relational_operator', 'exp', 'relational_expression', 'condition_tail',
+         'boolean_operator', 'arithmetic_expression', 'parenthesized_expression', 'chain_tail',
+         'chain_operand', 'operation_tail', 'arithmetic_operator'),
+        actions=('program', 'algorithm', 'declaration', 'command', 'assign', 'read', 'print', 'if', 'while',
+         'block', 'end_block', 'append', 'relation', 'number', 'variable', 'boolean', 'parenthesized',
+         'chain', 'fold', 'binary'),
+        productions=((37, 54, 6, 4, 34, 53, 5, 4), (34, 35), (), (55, 36, 4, 32), (7,), (8,), (37, 56, 38), (),
+         (57, 32, 10, 47, 9), (58, 32, 11), (59, 40, 12), (60, 38, 14, 44, 13), (61, 38, 44, 15),
+         (63, 17, 39, 62, 16), (39, 64, 38), (), (32,), (3,), (65, 47, 42, 47), (20,), (22,), (23,), (24,),
+         (25,), (21,), (66, 1), (66, 2), (67, 32), (45, 41), (68, 44, 46), (), (30,), (31,), (51, 43),
+         (69, 19, 48, 18), (49, 64, 43, 70), (51, 69, 19, 48, 18), (50, 64, 52), (71,), (49, 64, 43),
+         (51, 71, 64, 69, 19, 48, 18), (72, 47, 52), (), (26,), (27,), (28,), (29,)),
+        table=(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+         2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1,
+         3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+         -1, -1, -1, -1, -1, -1, -1, 4, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, 7, -1, -1, -1, -1, -1, -1, -1, -1, 6, -1, 6, 6, 6, -1, 6, 6, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 8,
+         -1, 9, 10, 11, -1, 12, 13, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, 14, -1, 14, 14, 14, -1, 14, 14, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, 17, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 16, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18,
+         18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 19, 24, 20, 21, 22, 23, -1, -1,
+         -1, -1, -1, -1, -1, -1, 25, 26, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 27, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+         28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 30, 30, 30, 30,
+         30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+         30, 29, 29, 30, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, 31, 32, -1, -1, 33, 33, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, -1, 34, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 33, -1, 35, 35, -1, -1,
+         -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 36, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, 35, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+         38, 38, 38, 38, 37, 37, 37, 37, 38, 38, 38, -1, 39, 39, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, -1, 40, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 39, 42, 42, 42, 42, 42, 42,
+         42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 41, 41, 41, 41, 42,
+         42, 42, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+         -1, -1, -1, 43, 44, 45, 46, -1, -1, -1),
+        expected=((4,), (32,), (32,), (7, 8), (9, 11, 12, 13, 15, 16), (9, 11, 12, 13, 15, 16),
+         (9, 11, 12, 13, 15, 16), (32, 3), (1, 2, 32, 18), (20, 22, 23, 24, 25, 21), (1, 2, 32),
+         (1, 2, 32, 18), (30, 31), (30, 31), (1, 2, 32, 18), (1, 2, 32, 18), (26, 27, 28, 29),
+         (1, 2, 32, 18), (26, 27, 28, 29), (26, 27, 28, 29)),
+        recovery=(None, (4, 9, 11, 12, 13, 15, 16, 17, 32), None, None, (9, 11, 12, 13, 15, 16, 17), None,
+         (9, 11, 12, 13, 15, 16, 17), None, None, None, None, None, None, None, None, None, None, None,
+         None, None),
+    ),
+}
@@ -1,10 +1,15 @@
-from typing import Dict, List, Literal, Optional
+from typing import Callable, Dict, Iterable, Literal, Optional, Tuple
 
+from .diagnostics import Diagnostics
 from .token import Token, TokenKind
-from .exceptions import ASyntaxError, ASemanticError
+from .exceptions import AError, ASyntaxError, ASemanticError
+from .reporter import Reporter, SilentReporter, format_token_kinds
+from .syntax_tree import (
+    Assign, BinaryOperation, Block, BooleanOperation, Command, Condition, Declaration, Expression,
+    If, Number, Print, Program, Read, Relation, String, Variable, While)
 
 
-# Syntax
+# Syntax (as regras equivalentes, usadas pelo analisador com tabela LL(1), estão em ``grammar.py``)
 #
 # program := ':' DECLARACOES {declaration} ':' ALGORITMO {command}
 #
@@ -16,40 +21,279 @@ from .exceptions import ASyntaxError, ASemanticError
 #   IMPRIMIR (var | STRING) |
 #   SE relational_expression ENTAO command |
 #   ENQUANTO relational_expression command |
-#   INICIO [command] FIM
+#   INICIO {command} FIM
 #
-# relational_expression :=
-#   ['('] arithmetic_expression relational_operator arithmetic_expression
-#   [boolean_operator relational_expression] [')']
+# relational_expression := relation {boolean_operator relation}
+#
+# relation := arithmetic_expression relational_operator arithmetic_expression
 #
 # boolean_operator := 'E' | 'OU'
 #
-# arithmetic_expression :=
-#   ['('] exp [arithmetic_operator arithmetic_expression] [')']
+# arithmetic_expression := term {('+' | '-') term}
 #
-# arithmetic_operator := '+' | '-' | '*' | '/'
+# term := factor {('*' | '/') factor}
+#
+# factor := exp | '(' arithmetic_expression ')'
 #
 # relational_operator := '=' | '<' | '>' | '<=' | '>=' | '<>'
 #
 # exp := int | float | var
 #
 # var := identifier
+#
+# O agrupamento original (``grouping='legacy'``) não tem precedência entre os operadores
+# e agrupa à direita:
+#
+# relational_expression := relation [boolean_operator relational_expression]
+#
+# arithmetic_expression :=
+#   exp [arithmetic_operator arithmetic_expression] |
+#   '(' arithmetic_expression [arithmetic_operator arithmetic_expression] ')'
+#
+# arithmetic_operator := '+' | '-' | '*' | '/'
+
+
+# Agrupamentos das expressões
+GROUPINGS = ('precedence', 'legacy')
+
+# Precedência dos operadores aritméticos e booleanos, todos associativos à esquerda
+PRECEDENCE = {
+    TokenKind.ADDITION: 1,
+    TokenKind.SUBTRACTION: 1,
+    TokenKind.MULTIPLICATION: 2,
+    TokenKind.DIVISION: 2,
+    TokenKind.OR: 1,
+    TokenKind.AND: 2,
+}
+
+ARITHMETIC_OPERATORS = (TokenKind.ADDITION, TokenKind.SUBTRACTION, TokenKind.MULTIPLICATION, TokenKind.DIVISION)
+
+# Tipos de token onde a análise recomeça após um erro sintático em um comando
+COMMAND_SYNC_KINDS = frozenset([
+    TokenKind.ATRIBUIR, TokenKind.LER, TokenKind.IMPRIMIR,
+    TokenKind.SE, TokenKind.ENQUANTO, TokenKind.INICIO, TokenKind.FIM])
+
+# Tipos de token onde a análise recomeça após um erro sintático em uma declaração
+DECLARATION_SYNC_KINDS = frozenset([TokenKind.IDENTIFIER, TokenKind.DELIMITER]) | COMMAND_SYNC_KINDS
+
 
+class _EndOfTokens(Exception):
+    """Interrompe a recuperação de erros ao esgotar os tokens."""
 
-def parse(tokens: List[Token]):
-    pointer = 0
+
+def unexpected_token(token: Optional[Token], token_kinds: Tuple[TokenKind, ...]) -> ASyntaxError:
+    """Cria o erro de um token que não satisfaz nenhum dos tipos de token esperados.
+
+    Args:
+        token: O token, ``None`` caso não existam mais tokens.
+        token_kinds: Os tipos de token esperados.
+
+    Returns:
+        O erro sintático.
+    """
+    if token is not None:
+        return ASyntaxError(
+            f'erro sintático, o tipo do token {token} não satisfaz '
+            f'nenhum dos tipos de tokens esperados {format_token_kinds(token_kinds)}',
+            token.location)
+    return ASyntaxError(
+        'erro sintático, não existem mais tokens para satisfazer '
+        f'nenhum dos tipos de tokens esperados {format_token_kinds(token_kinds)}')
+
+
+def binary_operation(operator: Token, left_expression: Expression, right_expression: Expression) -> Expression:
+    """Cria o nó de uma operação aritmética, anotado com o seu tipo.
+
+    Args:
+        operator: O token do operador.
+        left_expression: A expressão da esquerda.
+        right_expression: A expressão da direita.
+
+    Returns:
+        O nó da operação.
+    """
+    # resolver em "inteiro" caso as duas expressões aritméticas resultarem
+    # em números inteiros e o operador for adição, subtração ou multiplicação,
+    # caso contrário resultar em "real"
+    if left_expression.type is None or right_expression.type is None:
+        # o tipo de uma variável não declarada é desconhecido
+        expression_kind = None
+    elif (left_expression.type == TokenKind.LITERAL_INT
+          and right_expression.type == TokenKind.LITERAL_INT
+          and operator.kind in [
+              TokenKind.ADDITION, TokenKind.SUBTRACTION, TokenKind.MULTIPLICATION]):
+        expression_kind = TokenKind.LITERAL_INT
+    else:
+        expression_kind = TokenKind.LITERAL_FLOAT
+
+    return BinaryOperation(operator, operator.kind, left_expression, right_expression, expression_kind)
+
+
+class Scope:
+    """Escopo global de um programa da linguagem "A": o dicionário de símbolos
+    e as verificações semânticas dos nós que o consultam."""
+    __slots__ = ('symbols', 'report')
+
+    def __init__(self, report: Callable[[AError], None]):
+        """Cria um escopo vazio.
+
+        Args:
+            report: A função que lança ou registra os erros semânticos.
+        """
+        self.symbols: Dict[str, Literal[TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT]] = {}
+        self.report = report
+
+    def __repr__(self) -> str:
+        return f'<Scope {len(self.symbols)} símbolos>'
+
+    def declare(self, name_token: Token, type_token: Token) -> Declaration:
+        """Adiciona uma variável ao dicionário de símbolos e cria o nó da sua declaração.
+
+        Args:
+            name_token: O token do identificador da variável.
+            type_token: O token do tipo da variável (``INT`` ou ``REAL``).
+
+        Raises:
+            ASemanticError: Caso a variável já tenha sido declarada.
+
+        Returns:
+            O nó da declaração.
+        """
+        if (var_name := name_token.lexeme) not in self.symbols:
+            self.symbols[var_name] = (TokenKind.LITERAL_INT
+                                      if type_token.kind == TokenKind.INT else
+                                      TokenKind.LITERAL_FLOAT)
+        else:
+            self.report(ASemanticError(f'erro semântico, variável "{var_name}" já foi declarada', name_token.location))
+
+        return Declaration(name_token, var_name, self.symbols[var_name])
+
+    def expect_variable(
+            self, var_token: Token,
+            var_type: Optional[Literal[TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT]] = None):
+        """Certifica que a variável foi declarada e retorna seu tipo,
+        e, caso especificado, satisfaça o tipo de variável esperado.
+
+        Args:
+            var_token: O token do identificador da variável.
+            var_type: O tipo de variável esperado (opcional).
+
+        Raises:
+            ASemanticError: Caso a variável não esteja declarada.
+            ASemanticError: Caso o tipo da variável não satisfaça
+                o tipo de variável esperado.
+
+        Returns:
+            O tipo da variável, ``None`` caso não esteja declarada e os erros sejam registrados.
+        """
+        # verificar se a variável foi declarada
+        if (symbol_kind := self.symbols.get(var_name := var_token.lexeme, None)) is None:
+            self.report(ASemanticError(f'erro semântico, variável "{var_name}" não declarada', var_token.location))
+        # verificar se o tipo da variável satisfaz o tipo de variável esperado
+        elif var_type is not None and symbol_kind is not var_type:
+            self.report(ASemanticError(
+                f'erro semântico, variável "{var_name}" com o tipo {symbol_kind} não satisfaz {var_type}',
+                var_token.location))
+
+        return symbol_kind
+
+    def variable(
+            self, var_token: Token,
+            var_type: Optional[Literal[TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT]] = None) -> Variable:
+        """Cria o nó de uma variável, certificando que foi declarada
+        e, caso especificado, satisfaça o tipo de variável esperado.
+
+        Args:
+            var_token: O token do identificador da variável.
+            var_type: O tipo de variável esperado (opcional).
+
+        Returns:
+            O nó da variável.
+        """
+        return Variable(var_token, var_token.lexeme, self.expect_variable(var_token, var_type))
+
+    def number(self, number_token: Token) -> Number:
+        """Cria o nó de um número.
+
+        Args:
+            number_token: O token do número.
+
+        Raises:
+            ASemanticError: Caso o número não possa ser representado.
+
+        Returns:
+            O nó do número.
+        """
+        try:
+            value = int(number_token.lexeme) if number_token.kind == TokenKind.LITERAL_INT else float(number_token.lexeme)
+        except ValueError:
+            self.report(ASemanticError(
+                f'erro semântico, número "{number_token.lexeme}" não representável', number_token.location))
+            value = 0 if number_token.kind == TokenKind.LITERAL_INT else 0.0
+        return Number(number_token, value, number_token.kind)
+
+
+def parse(tokens: Iterable[Token], reporter: Optional[Reporter] = None,
+          diagnostics: Optional[Diagnostics] = None, grouping: str = 'precedence',
+          symbols: Optional[Dict[str, TokenKind]] = None,
+          on_command: Optional[Callable[[Token], bool]] = None, check_only: bool = False) -> Program:
+    """Analisa sintática e semanticamente os tokens de um programa da linguagem "A".
+
+    Os tokens são consumidos um a um, com apenas um token de antecipação,
+    portanto podem vir de uma lista ou de um gerador. As expressões e os comandos
+    aninhados são analisados com pilhas explícitas, sem limite de tamanho ou profundidade.
+
+    Caso os erros sejam registrados, os erros semânticos não interrompem a análise,
+    e após um erro sintático os tokens são descartados até o próximo comando ou ``FIM``
+    (modo pânico), de forma que uma única análise encontre todos os erros.
+
+    Args:
+        tokens: Os tokens do programa.
+        reporter: O relatório que recebe os eventos da análise (padrão: silencioso).
+        diagnostics: A lista onde os erros são registrados em vez de lançados (opcional).
+        grouping: O agrupamento das expressões: ``precedence``, com ``*`` e ``/`` antes de
+            ``+`` e ``-`` e ``E`` antes de ``OU``, associativos à esquerda, ou ``legacy``,
+            sem precedência e associativos à direita.
+        symbols: O dicionário de símbolos de um programa já declarado. Caso informado,
+            os tokens são apenas uma sequência de comandos, sem o cabeçalho e as declarações (opcional).
+        on_command: A função chamada com o primeiro token de cada comando de nível superior,
+            antes de analisá-lo; caso retorne verdadeiro, a análise é encerrada neste token (opcional).
+        check_only: Se cada comando de nível superior é descartado após ser analisado, de forma que
+            a memória usada não cresça com o programa, apenas verificado (padrão: falso).
+
+    Returns:
+        A árvore sintática do programa, com as expressões anotadas com os seus tipos.
+        Caso existam erros registrados, a árvore é parcial e não deve ser executada.
+        Com ``check_only``, a árvore tem apenas as declarações.
+
+    Raises:
+        ASyntaxError: Caso o programa não satisfaça a sintaxe da linguagem.
+        ASemanticError: Caso o programa não satisfaça a semântica da linguagem.
+        ATooManyErrors: Caso os erros registrados excedam o limite.
+    """
+    reporter = reporter or SilentReporter()
+    traces = reporter.traces
+    legacy = grouping == 'legacy'
+    remaining_tokens = iter(tokens)
+    current_token: Optional[Token] = next(remaining_tokens, None)
 
     def peek():
         """Retorna o token sob o ponteiro.
 
         Returns:
             O token sob o ponteiro.
-            ``None`` caso o ponteiro esteja fora dos limites da lista de tokens.
+            ``None`` caso não existam mais tokens.
         """
-        try:
-            return tokens[pointer]
-        except IndexError:
-            return None
+        return current_token
+
+    def peek_kind():
+        """Retorna o tipo do token sob o ponteiro.
+
+        Returns:
+            O tipo do token sob o ponteiro.
+            ``None`` caso não existam mais tokens.
+        """
+        return current_token.kind if current_token is not None else None
 
     def expect(*token_kinds: TokenKind):
         """Captura o token sob o ponteiro, certifica que o seu tipo satisfaça
@@ -65,166 +309,339 @@ def parse(tokens: List[Token]):
         Returns:
             O token sob o ponteiro.
         """
-        nonlocal pointer
-        token_kinds_repr = " | ".join(map(str, token_kinds))
+        nonlocal current_token
 
         # verificar se ainda existem tokens
         if (token := peek()) is not None:
             # verificar se o tipo do token satisfaz um dos tipos de tokens esperados
             if token.kind in token_kinds:
-                print(f'👌 {token} satisfaz [{token_kinds_repr}]')
-                pointer += 1
+                if traces:
+                    reporter.satisfied(token, token_kinds)
+                current_token = next(remaining_tokens, None)
                 return token
-            else:
-                raise ASyntaxError(
-                    f'erro sintático, o tipo do token {token} não satisfaz '
-                    f'nenhum dos tipos de tokens esperados [{token_kinds_repr}]')
-        else:
-            raise ASyntaxError(
-                'erro sintático, não existem mais tokens para satisfazer '
-                f'nenhum dos tipos de tokens esperados [{token_kinds_repr}]')
+        raise unexpected_token(token, token_kinds)
 
-    # Dicionário de símbolos do programa (escopo global)
-    symbols: Dict[str, Literal[TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT]] = {}
+    # contar as chamadas de ``expect`` apenas quando o relatório recebe os contadores
+    expect_calls = 0
+    if reporter.counts:
+        uncounted_expect = expect
 
-    def expect_variable(
-            var_name: str,
-            var_type: Optional[Literal[TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT]] = None):
-        """Certifica que a variável foi declarada e retorna seu tipo,
-        e, caso especificado, satisfaça o tipo de variável esperado.
+        def expect(*token_kinds: TokenKind):
+            nonlocal expect_calls
+            expect_calls += 1
+            return uncounted_expect(*token_kinds)
+
+    def report(error: AError):
+        """Lança um erro, ou registra-o caso os erros sejam registrados.
 
         Args:
-            var_name: O identificador da variável.
-            var_type: O tipo de variável esperado (opcional).
+            error: O erro.
+        """
+        if diagnostics is None:
+            raise error
+        diagnostics.add(error)
 
-        Raises:
-            ASemanticError: Caso a variável não esteja declarada.
-            ASemanticError: Caso o tipo da variável não satisfaça
-                o tipo de variável esperado.
+    def recover(error: AError, sync_kinds: frozenset):
+        """Registra um erro sintático e descarta os tokens até um ponto de sincronização.
 
-        Returns:
-            O tipo da variável.
+        Args:
+            error: O erro.
+            sync_kinds: Os tipos de token onde a análise recomeça.
+
+        Raises:
+            AError: O próprio erro, caso os erros não sejam registrados.
         """
-        # verificar se a variável foi declarada
-        if (symbol_kind := symbols.get(var_name, None)) is None:
-            raise ASemanticError(f'erro semântico, variável "{var_name}" não declarada')
-        # verificar se o tipo da variável satisfaz o tipo de variável esperado
-        elif var_type is not None and symbol_kind is not var_type:
-            raise ASemanticError(
-                f'erro semântico, variável "{var_name}" com o tipo {symbol_kind} não satisfaz {var_type}')
+        nonlocal current_token
+
+        if diagnostics is None:
+            raise error
+        at_end = current_token is None
+        diagnostics.add(error)
+        # não há mais o que analisar após um erro no fim dos tokens
+        if at_end:
+            raise _EndOfTokens
+        while current_token is not None and current_token.kind not in sync_kinds:
+            current_token = next(remaining_tokens, None)
 
-        return symbol_kind
+    # Dicionário de símbolos do programa (escopo global)
+    scope = Scope(report)
+    variable = scope.variable
+    number = scope.number
 
     # Padrões da linguagem "A"
-    def declaration():
-        """Captura uma declaração."""
+    def declaration() -> Declaration:
+        """Captura uma declaração.
+
+        Returns:
+            O nó da declaração.
+        """
         name_token = expect(TokenKind.IDENTIFIER)
         expect(TokenKind.DELIMITER)
         type_token = expect(TokenKind.INT, TokenKind.REAL)
 
         # adicionar a variável ao dicionário de símbolos
-        if (var_name := name_token.lexeme) not in symbols:
-            symbols[var_name] = (TokenKind.LITERAL_INT
-                                 if type_token.kind == TokenKind.INT else
-                                 TokenKind.LITERAL_FLOAT)
-        else:
-            raise ASemanticError(f'erro semântico, variável "{var_name}" já foi declarada')
+        return scope.declare(name_token, type_token)
 
-    def arithmetic_expression() -> Literal[TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT]:
+    def arithmetic_expression() -> Expression:
         """Captura uma expressão aritmética.
 
         Returns:
-            O tipo da expressão aritmética encontrada.
+            O nó da expressão aritmética encontrada, anotado com o seu tipo.
         """
-        left_expression = expect(TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT,
-                                 TokenKind.IDENTIFIER, TokenKind.LEFT_PARENTHESIS)
-
-        # resolver uma expressão aritmética ao reconhecer um parênteses aberto
-        if (has_parenthesis := (left_expression_kind := left_expression.kind) == TokenKind.LEFT_PARENTHESIS):
-            left_expression_kind = arithmetic_expression()
-
-        # certificar que a variável foi declarada e resgatar seu tipo, caso seja uma variável...
-        if left_expression_kind == TokenKind.IDENTIFIER:
-            left_expression_kind = expect_variable(left_expression.lexeme)
+        if legacy:
+            return legacy_arithmetic_expression()
+
+        # pilhas dos operandos e dos operadores e parênteses ainda não resolvidos
+        operands = []
+        operators = []
+        open_parentheses = 0
+
+        def reduce():
+            right_expression = operands.pop()
+            operands[-1] = binary_operation(operators.pop(), operands[-1], right_expression)
+
+        while True:
+            left_token = expect(TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT,
+                                TokenKind.IDENTIFIER, TokenKind.LEFT_PARENTHESIS)
+            if left_token.kind == TokenKind.LEFT_PARENTHESIS:
+                operators.append(left_token)
+                open_parentheses += 1
+                continue
+            # certificar que a variável foi declarada e resgatar seu tipo, caso seja uma variável...
+            operands.append(variable(left_token) if left_token.kind == TokenKind.IDENTIFIER else number(left_token))
+
+            # fechar os parênteses que seguem o operando
+            while open_parentheses and peek_kind() == TokenKind.RIGHT_PARENTHESIS:
+                expect(TokenKind.RIGHT_PARENTHESIS)
+                while operators[-1].kind != TokenKind.LEFT_PARENTHESIS:
+                    reduce()
+                operators.pop()
+                open_parentheses -= 1
+
+            if peek_kind() not in ARITHMETIC_OPERATORS:
+                break
+            operator = expect(*ARITHMETIC_OPERATORS)
+            precedence = PRECEDENCE[operator.kind]
+            while operators and operators[-1].kind != TokenKind.LEFT_PARENTHESIS \
+                    and PRECEDENCE[operators[-1].kind] >= precedence:
+                reduce()
+            operators.append(operator)
+
+        # capturar os parênteses que não foram fechados
+        if open_parentheses:
+            expect(TokenKind.RIGHT_PARENTHESIS, *ARITHMETIC_OPERATORS)
+        while operators:
+            reduce()
+        return operands[0]
+
+    def legacy_arithmetic_expression() -> Expression:
+        """Captura uma expressão aritmética com o agrupamento original,
+        sem precedência e associativa à direita.
 
-        if peek().kind in [
-                TokenKind.ADDITION, TokenKind.SUBTRACTION,
-                TokenKind.MULTIPLICATION, TokenKind.DIVISION]:
-            operator = expect(
-                TokenKind.ADDITION, TokenKind.SUBTRACTION,
-                TokenKind.MULTIPLICATION, TokenKind.DIVISION)
-            right_expression_kind = arithmetic_expression()
+        Returns:
+            O nó da expressão aritmética encontrada, anotado com o seu tipo.
+        """
+        # cada nível guarda se começou com um parênteses, a expressão da esquerda e o operador
+        levels = [[False, None, None]]
+        while True:
+            left_token = expect(TokenKind.LITERAL_INT, TokenKind.LITERAL_FLOAT,
+                                TokenKind.IDENTIFIER, TokenKind.LEFT_PARENTHESIS)
+
+            # resolver uma expressão aritmética ao reconhecer um parênteses aberto
+            if left_token.kind == TokenKind.LEFT_PARENTHESIS:
+                levels[-1][0] = True
+                levels.append([False, None, None])
+                continue
+            # certificar que a variável foi declarada e resgatar seu tipo, caso seja uma variável...
+            expression = variable(left_token) if left_token.kind == TokenKind.IDENTIFIER else number(left_token)
+
+            # entregar a expressão ao nível atual, resolvendo os níveis completos
+            while True:
+                level = levels[-1]
+                has_parenthesis, left_expression, operator = level
+                if left_expression is None:
+                    if peek_kind() in ARITHMETIC_OPERATORS:
+                        level[1] = expression
+                        level[2] = expect(*ARITHMETIC_OPERATORS)
+                        levels.append([False, None, None])
+                        break
+                    # capturar o parênteses fechado (1)
+                    if has_parenthesis:
+                        expect(TokenKind.RIGHT_PARENTHESIS)
+                else:
+                    # capturar o parênteses fechado (2)
+                    if has_parenthesis:
+                        expect(TokenKind.RIGHT_PARENTHESIS)
+                    expression = binary_operation(operator, left_expression, expression)
+
+                levels.pop()
+                if not levels:
+                    return expression
+
+    def relation() -> Relation:
+        """Captura uma comparação entre duas expressões aritméticas.
 
-            # capturar o parênteses fechado (2)
-            if has_parenthesis:
-                expect(TokenKind.RIGHT_PARENTHESIS)
+        Returns:
+            O nó da comparação.
+        """
+        # permitir a comparação entre "int" e "real"
+        left_expression = arithmetic_expression()
+        operator = expect(TokenKind.EQUAL, TokenKind.LESS, TokenKind.GREATER,
+                          TokenKind.LESS_EQUAL, TokenKind.GREATER_EQUAL, TokenKind.NOT_EQUAL)
+        return Relation(operator, operator.kind, left_expression, arithmetic_expression())
 
-            # resolver em "inteiro" caso as duas expressões aritméticas resultarem
-            # em números inteiros e o operador for adição, subtração ou multiplicação,
-            # caso contrário resultar em "real"
-            if (left_expression_kind == TokenKind.LITERAL_INT
-                and right_expression_kind == TokenKind.LITERAL_INT
-                and operator.kind in [
-                    TokenKind.ADDITION, TokenKind.SUBTRACTION, TokenKind.MULTIPLICATION]):
-                return TokenKind.LITERAL_INT
+    def relational_expression() -> Condition:
+        """Captura uma expressão relacional.
 
-            return TokenKind.LITERAL_FLOAT
+        Returns:
+            O nó da expressão relacional encontrada.
+        """
+        relations = [relation()]
+        boolean_operators = []
+        while peek_kind() in [TokenKind.AND, TokenKind.OR]:
+            boolean_operators.append(expect(TokenKind.AND, TokenKind.OR))
+            relations.append(relation())
+
+        if legacy:
+            # agrupar à direita, sem precedência
+            condition = relations.pop()
+            while boolean_operators:
+                boolean_operator = boolean_operators.pop()
+                condition = BooleanOperation(boolean_operator, boolean_operator.kind, relations.pop(), condition)
+            return condition
+
+        # agrupar "E" antes de "OU", à esquerda
+        conditions = [relations[0]]
+        operators = []
+        for boolean_operator, right_condition in zip(boolean_operators, relations[1:]):
+            while operators and PRECEDENCE[operators[-1].kind] >= PRECEDENCE[boolean_operator.kind]:
+                right = conditions.pop()
+                operator = operators.pop()
+                conditions[-1] = BooleanOperation(operator, operator.kind, conditions[-1], right)
+            operators.append(boolean_operator)
+            conditions.append(right_condition)
+        while operators:
+            right = conditions.pop()
+            operator = operators.pop()
+            conditions[-1] = BooleanOperation(operator, operator.kind, conditions[-1], right)
+        return conditions[0]
+
+    def command() -> Command:
+        """Captura um comando, incluindo os comandos aninhados.
 
-        # capturar o parênteses fechado (1)
-        if has_parenthesis:
-            expect(TokenKind.RIGHT_PARENTHESIS)
+        Returns:
+            O nó do comando.
+        """
+        # comandos incompletos ("SE", "ENQUANTO" e "INICIO"), do mais externo ao mais interno,
+        # com a classe do nó, o token do comando e a condição ou a lista de comandos
+        pending = []
+        while True:
+            try:
+                # permitir que existam blocos "INICIO FIM" vazios ou com outros blocos "INICIO FIM"
+                if pending and pending[-1][0] is Block and peek_kind() == TokenKind.FIM:
+                    expect(TokenKind.FIM)
+                    _, block_token, commands = pending.pop()
+                    node = Block(block_token, commands)
+                else:
+                    command_token = expect(
+                        TokenKind.ATRIBUIR, TokenKind.LER, TokenKind.IMPRIMIR,
+                        TokenKind.SE, TokenKind.ENQUANTO, TokenKind.INICIO)
+
+                    if command_token.kind == TokenKind.ATRIBUIR:
+                        expression = arithmetic_expression()
+                        expect(TokenKind.A)
+                        var_token = expect(TokenKind.IDENTIFIER)
+                        node = Assign(command_token, expression, variable(var_token, expression.type))
+                    elif command_token.kind == TokenKind.LER:
+                        var_token = expect(TokenKind.IDENTIFIER)
+                        node = Read(command_token, variable(var_token))
+                    elif command_token.kind == TokenKind.IMPRIMIR:
+                        possible_var_token = expect(TokenKind.IDENTIFIER, TokenKind.LITERAL_STR)
+                        if possible_var_token.kind == TokenKind.IDENTIFIER:
+                            node = Print(command_token, variable(possible_var_token))
+                        else:
+                            node = Print(command_token, String(possible_var_token, possible_var_token.lexeme[1:-1]))
+                    elif command_token.kind == TokenKind.SE:
+                        condition = relational_expression()
+                        expect(TokenKind.ENTAO)
+                        pending.append((If, command_token, condition))
+                        continue
+                    elif command_token.kind == TokenKind.ENQUANTO:
+                        pending.append((While, command_token, relational_expression()))
+                        continue
+                    else:  # TokenKind.INICIO
+                        pending.append((Block, command_token, []))
+                        continue
+            except (ASyntaxError, ASemanticError) as error:
+                # descartar os comandos incompletos até o bloco mais interno, onde a análise recomeça
+                while pending and pending[-1][0] is not Block:
+                    pending.pop()
+                if not pending:
+                    raise
+                recover(error, COMMAND_SYNC_KINDS)
+                continue
+
+            # completar os comandos "SE" e "ENQUANTO" que aguardavam este comando
+            while pending and pending[-1][0] is not Block:
+                node_class, command_token, condition = pending.pop()
+                node = node_class(command_token, condition, node)
+            if not pending:
+                return node
+            pending[-1][2].append(node)
+
+    def header(*token_kinds: TokenKind) -> Optional[Token]:
+        """Captura um token do cabeçalho de uma seção do programa, sem descartar
+        nenhum token caso o cabeçalho esteja incorreto e os erros sejam registrados.
 
-        return left_expression_kind
+        Args:
+            token_kinds: Os tipos de token esperados.
 
-    def relational_expression():
-        """Captura uma expressão relacional."""
-        # permitir a comparação entre "int" e "real"
-        arithmetic_expression()
-        expect(TokenKind.EQUAL, TokenKind.LESS, TokenKind.GREATER,
-               TokenKind.LESS_EQUAL, TokenKind.GREATER_EQUAL, TokenKind.NOT_EQUAL)
-        arithmetic_expression()
-        if peek().kind in [TokenKind.AND, TokenKind.OR]:
-            expect(TokenKind.AND, TokenKind.OR)
-            relational_expression()
-
-    def command():
-        """Captura um comando."""
-        command_token = expect(
-            TokenKind.ATRIBUIR, TokenKind.LER, TokenKind.IMPRIMIR,
-            TokenKind.SE, TokenKind.ENQUANTO, TokenKind.INICIO)
-
-        if command_token.kind == TokenKind.ATRIBUIR:
-            expression_kind = arithmetic_expression()
-            expect(TokenKind.A)
-            var_token = expect(TokenKind.IDENTIFIER)
-            expect_variable(var_token.lexeme, expression_kind)
-        elif command_token.kind == TokenKind.LER:
-            var_token = expect(TokenKind.IDENTIFIER)
-            expect_variable(var_token.lexeme)
-        elif command_token.kind == TokenKind.IMPRIMIR:
-            possible_var_token = expect(TokenKind.IDENTIFIER, TokenKind.LITERAL_STR)
-            if possible_var_token.kind == TokenKind.IDENTIFIER:
-                expect_variable(possible_var_token.lexeme)
-        elif command_token.kind == TokenKind.SE:
-            relational_expression()
-            expect(TokenKind.ENTAO)
-            command()
-        elif command_token.kind == TokenKind.ENQUANTO:
-            relational_expression()
-            command()
-        else:  # TokenKind.INICIO_RESERVED_WORD
-            # permitir que existam blocos "INICIO FIM" vazios ou com outros blocos "INICIO FIM"
-            while peek().kind != TokenKind.FIM:
-                command()
-            expect(TokenKind.FIM)
+        Returns:
+            O token, ``None`` caso o cabeçalho esteja incorreto.
+        """
+        try:
+            return expect(*token_kinds)
+        except ASyntaxError as error:
+            report(error)
+            if peek() is None:
+                raise _EndOfTokens from None
+            return None
 
     # capturar um programa da linguagem "A"
-    expect(TokenKind.DELIMITER)
-    expect(TokenKind.DECLARACOES)
-    while peek().kind == TokenKind.IDENTIFIER:
-        declaration()
-
-    expect(TokenKind.DELIMITER)
-    expect(TokenKind.ALGORITMO)
-    while peek() is not None:
-        command()
+    program_token = None
+    declarations = []
+    commands = []
+    try:
+        if symbols is None:
+            program_token = header(TokenKind.DELIMITER)
+            header(TokenKind.DECLARACOES)
+            while peek_kind() == TokenKind.IDENTIFIER:
+                try:
+                    declarations.append(declaration())
+                except ASyntaxError as error:
+                    recover(error, DECLARATION_SYNC_KINDS)
+
+            header(TokenKind.DELIMITER)
+            header(TokenKind.ALGORITMO)
+        else:
+            scope.symbols.update(symbols)
+        while peek() is not None:
+            if on_command is not None and on_command(current_token):
+                break
+            try:
+                node = command()
+                if not check_only:
+                    commands.append(node)
+            except (ASyntaxError, ASemanticError) as error:
+                recover(error, COMMAND_SYNC_KINDS)
+                # um "FIM" sem o seu "INICIO"
+                if peek_kind() == TokenKind.FIM:
+                    current_token = next(remaining_tokens, None)
+    except _EndOfTokens:
+        pass
+
+    reporter.parsed(len(scope.symbols))
+    if reporter.counts:
+        reporter.counted('parser', {'expect_calls': expect_calls})
+
+    return Program(program_token, declarations, commands)
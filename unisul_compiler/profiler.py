@@ -0,0 +1,374 @@
+import json
+import signal
+import time
+from array import array
+from collections import defaultdict
+from types import GeneratorType
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from .bytecode import Opcode, _Compiler
+from .runtime import InputReader
+from .source import Location
+from .syntax_tree import Assign, Command, If, Node, Print, Program, Read, While
+from .token import Token
+from .vm import execute
+
+# Operações que encerram os trechos sem desvios, como em ``vm``
+JUMP, POP_JUMP_IF_TRUE, HALT = int(Opcode.JUMP), int(Opcode.POP_JUMP_IF_TRUE), int(Opcode.HALT)
+
+# Intervalo padrão entre duas amostras do tempo de execução, em segundos (de processador)
+SAMPLE_INTERVAL = 0.001
+
+# Quantidade de laços listados entre os mais custosos
+HOT_LOOPS = 5
+
+# Formatos do perfil
+PROFILE_FORMATS = ('text', 'json', 'collapsed')
+
+# Nome de cada comando perfilado, pela classe do nó
+COMMAND_NAMES = {Assign: 'ATRIBUIR', Read: 'LER', Print: 'IMPRIMIR', If: 'SE', While: 'ENQUANTO'}
+
+
+class CommandProfile(NamedTuple):
+    """Perfil de um comando do programa."""
+    command: str
+    location: Optional[Location]
+    # posição em ``Profile.commands`` do comando que o contém, ``None`` no nível do programa
+    parent: Optional[int]
+    # quantidade de execuções do comando e, em um ENQUANTO, de repetições do seu comando
+    count: int
+    iterations: int
+    # instruções executadas pelo próprio comando (expressões e condições), sem os comandos internos
+    operations: int
+    # tempo do próprio comando e tempo acumulado com os comandos internos, em segundos
+    self_time: float
+    total_time: float
+
+    def frame(self) -> str:
+        """O nome do comando em uma pilha de chamadas."""
+        return f'{self.command} linha {self.location.line}' if self.location is not None else self.command
+
+
+class LineProfile(NamedTuple):
+    """Perfil de uma linha do código-fonte: os comandos iniciados na linha."""
+    line: int
+    count: int
+    operations: int
+    # tempo próprio dos comandos, em segundos
+    time: float
+    text: Optional[str]
+
+
+class Profile:
+    """Perfil da execução de um programa da linguagem "A", por comando e por linha."""
+    __slots__ = ('name', 'commands', 'operations', 'samples', 'interval', 'elapsed', '_source_lines')
+
+    def __init__(self, name: str, commands: List[CommandProfile], operations: int, samples: int,
+                 interval: Optional[float], elapsed: float, source_lines: Optional[List[str]] = None):
+        """Cria um perfil.
+
+        Args:
+            name: O nome do código-fonte.
+            commands: O perfil de cada comando, na ordem do código-fonte.
+            operations: A quantidade de instruções executadas.
+            samples: A quantidade de amostras do tempo.
+            interval: O intervalo entre as amostras, em segundos, ``None`` caso a amostragem
+                não esteja disponível.
+            elapsed: O tempo total da execução, em segundos.
+            source_lines: As linhas do código-fonte (opcional).
+        """
+        self.name = name
+        self.commands = commands
+        self.operations = operations
+        self.samples = samples
+        self.interval = interval
+        self.elapsed = elapsed
+        self._source_lines = source_lines
+
+    def __repr__(self) -> str:
+        return f'<Profile "{self.name}", {len(self.commands)} comandos, {self.operations} operações>'
+
+    def lines(self) -> List[LineProfile]:
+        """Agrupa o perfil dos comandos pela linha onde começam, na ordem do código-fonte."""
+        lines: Dict[int, List[CommandProfile]] = defaultdict(list)
+        for command in self.commands:
+            if command.location is not None:
+                lines[command.location.line].append(command)
+        source_lines = self._source_lines
+        return [LineProfile(line, sum(command.count for command in commands),
+                            sum(command.operations for command in commands),
+                            sum(command.self_time for command in commands),
+                            source_lines[line - 1].strip() if source_lines and line <= len(source_lines) else None)
+                for line, commands in sorted(lines.items())]
+
+    def hottest_loops(self, count: int = HOT_LOOPS) -> List[int]:
+        """Retorna as posições em ``commands`` dos laços ``ENQUANTO`` mais custosos,
+        pelo tempo acumulado e, em seguida, pela quantidade de repetições."""
+        loops = [index for index, command in enumerate(self.commands)
+                 if command.command == 'ENQUANTO' and command.count]
+        loops.sort(key=lambda index: (-self.commands[index].total_time, -self.commands[index].iterations))
+        return loops[:count]
+
+    def format_text(self) -> str:
+        """Formata o perfil como texto: o resumo, as linhas e os laços mais custosos."""
+        sampling = (f'{self.samples} amostras a cada {self.interval * 1000:g}ms de processador'
+                    if self.interval is not None else 'sem amostragem do tempo')
+        lines = [f'Perfil de {self.name}: {self.operations} operações em {self.elapsed:.3f}s ({sampling})', '',
+                 f'{"Linha":>6} {"Execuções":>10} {"Operações":>12} {"Tempo (ms)":>11} {"%":>6}  Código']
+        total_time = max(sum(command.self_time for command in self.commands), 1e-9)
+        for line in self.lines():
+            lines.append(f'{line.line:>6} {line.count:>10} {line.operations:>12} {line.time * 1000:>11.1f} '
+                         f'{line.time / total_time * 100:>6.1f}  {line.text or ""}'.rstrip())
+        if hottest := self.hottest_loops():
+            lines += ['', 'Laços mais custosos:']
+            for index in hottest:
+                loop = self.commands[index]
+                lines.append(f'  {loop.frame()}: {loop.count} execuções, {loop.iterations} repetições, '
+                             f'{loop.total_time * 1000:.1f}ms ({loop.total_time / total_time * 100:.1f}%)')
+        return '\n'.join(lines)
+
+    def to_json(self) -> str:
+        """Formata o perfil como um objeto JSON, com os tempos em segundos."""
+        return json.dumps({
+            'source': self.name,
+            'operations': self.operations,
+            'elapsed': self.elapsed,
+            'samples': self.samples,
+            'interval': self.interval,
+            'commands': [{
+                'command': command.command,
+                'line': command.location.line if command.location is not None else None,
+                'column': command.location.column if command.location is not None else None,
+                'parent': command.parent,
+                'count': command.count,
+                'iterations': command.iterations,
+                'operations': command.operations,
+                'self_time': command.self_time,
+                'total_time': command.total_time,
+            } for command in self.commands],
+            'lines': [line._asdict() for line in self.lines()],
+            'hottest_loops': self.hottest_loops(),
+        }, ensure_ascii=False, indent=2)
+
+    def format_collapsed(self) -> str:
+        """Formata o perfil como pilhas agrupadas (``collapsed stacks``), uma por linha, com o
+        tempo próprio de cada comando em microssegundos, lidas por ferramentas de flame graph."""
+        root = self.name.replace(';', '_')
+        stacks = []
+        for index, command in enumerate(self.commands):
+            microseconds = round(command.self_time * 1_000_000)
+            if not microseconds:
+                continue
+            frames = []
+            parent: Optional[int] = index
+            while parent is not None:
+                frames.append(self.commands[parent].frame())
+                parent = self.commands[parent].parent
+            stacks.append(f'{";".join([root, *reversed(frames)])} {microseconds}')
+        return '\n'.join(stacks)
+
+    def format(self, profile_format: str) -> str:
+        """Formata o perfil em um dos ``PROFILE_FORMATS``."""
+        if profile_format == 'json':
+            return self.to_json()
+        if profile_format == 'collapsed':
+            return self.format_collapsed()
+        return self.format_text()
+
+
+class _ProfilingCompiler(_Compiler):
+    """Compila o programa registrando o comando de origem de cada instrução."""
+
+    def __init__(self, program: Program):
+        super().__init__(program)
+        # comando de cada instrução, -1 no nível do programa
+        self.owners = array('l')
+        # nome, token e comando que contém cada comando, e a sua primeira instrução
+        self.commands: List[tuple] = []
+        self.starts: List[int] = []
+        self.current = -1
+        # primeira instrução do comando repetido de cada ENQUANTO, pela posição do laço,
+        # e os comandos repetidos ainda não compilados, com a posição do seu laço
+        self.bodies: Dict[int, int] = {}
+        self.pending_bodies: List[tuple] = []
+
+    def emit(self, opcode: Opcode, argument: int = 0, token: Optional[Token] = None) -> int:
+        self.owners.append(self.current)
+        return super().emit(opcode, argument, token)
+
+    def dispatch(self, node: Node):
+        if self.pending_bodies and self.pending_bodies[-1][0] is node:
+            self.bodies[self.pending_bodies.pop()[1]] = len(self.owners)
+        if (name := COMMAND_NAMES.get(type(node))) is None:
+            return super().dispatch(node)
+        return self.command(node, name)
+
+    def command(self, node: Command, name: str):
+        """Compila um comando, atribuindo a ele as instruções emitidas, inclusive as dos comandos internos."""
+        parent = self.current
+        self.current = len(self.commands)
+        self.commands.append((name, node.token, parent))
+        self.starts.append(len(self.owners))
+        if isinstance(node, While):
+            self.pending_bodies.append((node.command, self.current))
+        if isinstance(result := super().dispatch(node), GeneratorType):
+            yield result
+        self.current = parent
+
+
+class Profiler:
+    """Executa um programa da linguagem "A" na máquina virtual medindo cada comando e cada linha.
+
+    O programa executa no laço de ``vm.execute``: as execuções são contadas nos desvios, uma vez
+    por trecho sem desvios, e o tempo é amostrado por um sinal periódico (``SIGPROF``), que consulta
+    a instrução em execução nas variáveis do laço, portanto o custo do perfil é de uma chamada por
+    desvio. A amostragem requer ``signal.setitimer`` (sistemas Unix) e a thread principal; sem ela,
+    o perfil tem apenas as execuções e as operações.
+    """
+    __slots__ = ('code', 'interval', '_name', '_source_lines', '_owners', '_commands', '_starts', '_bodies',
+                 '_entries', '_times', '_samples', '_sampled', '_elapsed')
+
+    def __init__(self, program: Program, interval: float = SAMPLE_INTERVAL):
+        """Compila um programa válido para ser perfilado.
+
+        Args:
+            program: A árvore sintática do programa.
+            interval: O intervalo entre as amostras do tempo, em segundos de processador.
+        """
+        compiler = _ProfilingCompiler(program)
+        compiler.visit(program)
+        self.code = compiler.code
+        self.interval = interval
+        source = program.token.source if program.token is not None else None
+        self._name = source.name if source is not None else '<código-fonte>'
+        self._source_lines = source.text.split('\n') if source is not None and isinstance(source.text, str) else None
+        self._owners = compiler.owners
+        self._commands = compiler.commands
+        self._starts = compiler.starts
+        self._bodies = compiler.bodies
+        size = len(self.code.instructions)
+        self._entries = [0] * size
+        # tempo de processador amostrado em cada instrução
+        self._times = [0.0] * size
+        self._samples = 0
+        self._sampled = False
+        self._elapsed = 0.0
+
+    def execute(self, reader: InputReader, write: Callable[[str], object]):
+        """Executa o programa, acumulando o perfil de todas as execuções.
+
+        Args:
+            reader: O leitor dos valores de entrada do comando ``LER``.
+            write: A função que recebe a saída do comando ``IMPRIMIR``.
+
+        Raises:
+            ARuntimeError: Caso ocorra um erro de execução; o perfil inclui a execução interrompida.
+        """
+        times = self._times
+        entries = self._entries
+        loop_code = execute.__code__
+        # a posição do último desvio, pois após um desvio ``pc`` já é o destino
+        branch = 0
+        # o sinal pode chegar com atraso ou agrupado, portanto cada amostra vale o tempo desde a anterior
+        last_sample = time.process_time()
+
+        # cada trecho é contado no desvio (ou no fim do programa) que o encerra, pela sua primeira instrução
+        def on_branch(segment: int, position: int, opcode: int):
+            nonlocal branch
+            entries[segment] += 1
+            branch = position
+
+        branch_code = on_branch.__code__
+
+        def sample(signum, frame):
+            nonlocal last_sample
+            now = time.process_time()
+            position = None
+            # o sinal é tratado entre as instruções do Python, também no início de ``on_branch``
+            while frame is not None and frame.f_code is not loop_code:
+                if frame.f_code is branch_code:
+                    position = frame.f_locals['position']
+                frame = frame.f_back
+            if frame is not None:
+                if position is None:
+                    variables = frame.f_locals
+                    opcode = variables.get('opcode')
+                    if opcode is None:
+                        position = 0
+                    elif JUMP <= opcode <= POP_JUMP_IF_TRUE or opcode == HALT:
+                        position = branch
+                    else:
+                        position = variables['pc'] - 2
+                times[position] += now - last_sample
+                self._samples += 1
+            last_sample = now
+
+        previous = None
+        if hasattr(signal, 'setitimer'):
+            try:
+                previous = signal.signal(signal.SIGPROF, sample)
+            except ValueError:  # fora da thread principal
+                pass
+            else:
+                self._sampled = True
+                signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        started_at = time.perf_counter()
+        state = [0, 0]
+        try:
+            execute(self.code, reader, write, on_branch, state)
+        finally:
+            self._elapsed += time.perf_counter() - started_at
+            if previous is not None:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+                signal.signal(signal.SIGPROF, previous)
+            # as instruções executadas do trecho interrompido por um erro: o trecho completo
+            # menos o restante, que termina no mesmo desvio
+            pc, segment = state
+            if segment < pc:
+                entries[segment] += 1
+                entries[pc] -= 1
+
+    def profile(self) -> Profile:
+        """Retorna o perfil das execuções."""
+        instructions = self.code.instructions
+        counts = [0] * len(self._owners)
+        # cada trecho vai da sua primeira instrução até o primeiro desvio ou o fim do programa
+        for start in range(0, len(instructions), 2):
+            if not (entries := self._entries[start]):
+                continue
+            pc = start
+            while pc < len(instructions):
+                counts[pc // 2] += entries
+                if JUMP <= instructions[pc] <= POP_JUMP_IF_TRUE or instructions[pc] == HALT:
+                    break
+                pc += 2
+
+        size = len(self._commands)
+        operations = [0] * size
+        # desvios de volta de cada ENQUANTO, que não ocorrem após uma repetição interrompida por um erro
+        returns = [0] * size
+        self_times = [0.0] * size
+        for index, owner in enumerate(self._owners):
+            if owner >= 0:
+                operations[owner] += counts[index]
+                self_times[owner] += self._times[index * 2]
+                if instructions[index * 2] == JUMP:
+                    returns[owner] += counts[index]
+        total_times = self_times[:]
+        # os comandos internos sucedem os que os contêm
+        for index in range(size - 1, -1, -1):
+            if (parent := self._commands[index][2]) >= 0:
+                total_times[parent] += total_times[index]
+
+        commands = []
+        for index, (name, token, parent) in enumerate(self._commands):
+            start = self._starts[index]
+            count = (counts[start] if start < len(counts) else 0) - returns[index]
+            # as repetições são as execuções da primeira instrução do comando repetido
+            iterations = counts[self._bodies[index]] if index in self._bodies else 0
+            commands.append(CommandProfile(
+                name, token.location if token is not None else None, parent if parent >= 0 else None,
+                count, iterations, operations[index],
+                self_times[index], total_times[index]))
+        return Profile(self._name, commands, sum(counts), self._samples,
+                       self.interval if self._sampled else None, self._elapsed, self._source_lines)
@@ -0,0 +1,332 @@
+import ast
+import io
+from array import array
+from collections import OrderedDict
+from types import CodeType, TracebackType
+from typing import Callable, List, Optional, TextIO, Union
+
+from .bytecode import Code, compile_program
+from .cfg import as_real
+from .exceptions import ARuntimeError
+from .runtime import InputReader, division_by_zero, format_value, real_overflow
+from .source import Location, Source
+from .syntax_tree import (
+    Assign, BinaryOperation, Block, Command, Condition, Expression, If, NodeVisitor,
+    Number, Print, Program, Read, Relation, String, Variable, While)
+from .token import TokenKind
+from .vm import execute
+
+# Quantidade de objetos de código mantidos em memória, pelo código Python gerado
+CODE_CACHE_SIZE = 128
+
+# Níveis de ``ENQUANTO`` aninhados aceitos pelo compilador do Python (``CO_MAXBLOCKS``)
+MAX_LOOPS = 20
+
+# Altura da árvore sintática além da qual o código Python não é gerado, já que o módulo ``ast``
+# e o compilador do Python percorrem a árvore recursivamente
+MAX_HEIGHT = 100
+
+# Função que recebe as operações de entrada e saída como variáveis locais
+_TEMPLATE = 'def programa(read_int, read_real, write, format_value):\n    pass\n'
+
+# Operadores do Python por operador da linguagem "A"
+_OPERATORS = {
+    TokenKind.ADDITION: ast.Add,
+    TokenKind.SUBTRACTION: ast.Sub,
+    TokenKind.MULTIPLICATION: ast.Mult,
+    TokenKind.DIVISION: ast.Div,
+    TokenKind.EQUAL: ast.Eq,
+    TokenKind.NOT_EQUAL: ast.NotEq,
+    TokenKind.LESS: ast.Lt,
+    TokenKind.GREATER: ast.Gt,
+    TokenKind.LESS_EQUAL: ast.LtE,
+    TokenKind.GREATER_EQUAL: ast.GtE,
+}
+
+_code_objects: 'OrderedDict[str, CodeType]' = OrderedDict()
+
+
+class PythonCode:
+    """Programa da linguagem "A" compilado para uma função Python.
+
+    Cada operação que pode falhar (divisão, conversão para real e ``LER``) ocupa uma linha
+    própria no código gerado, de forma que a linha de um erro localize a sua origem.
+    Um programa aninhado demais para o compilador do Python guarda, em vez da função,
+    o código da máquina virtual (``fallback``), que o executa.
+    """
+    __slots__ = ('function', 'module', 'offsets', 'source', 'fallback')
+
+    def __init__(self, function: Optional[Callable], module: Optional[ast.Module], offsets: array,
+                 source: Optional[Source] = None, fallback: Optional[Code] = None):
+        """Cria um programa compilado.
+
+        Args:
+            function: A função do programa, ``None`` com ``fallback``.
+            module: A árvore sintática do código Python gerado, ``None`` com ``fallback``.
+            offsets: A posição no código-fonte de cada linha a partir da segunda.
+            source: O código-fonte, usado para localizar os erros de execução (opcional).
+            fallback: O código da máquina virtual que executa o programa (opcional).
+        """
+        self.function = function
+        self.module = module
+        self.offsets = offsets
+        self.source = source
+        self.fallback = fallback
+
+    def __repr__(self) -> str:
+        if self.fallback is not None:
+            return '<PythonCode executado pela máquina virtual>'
+        return f'<PythonCode {len(self.offsets)} operações localizadas>'
+
+    @property
+    def text(self) -> str:
+        """O código Python gerado; no Python 3.8, sem ``ast.unparse``, a sua árvore sintática.
+        Com ``fallback``, o código da máquina virtual."""
+        if self.fallback is not None:
+            return f'# aninhado demais para o Python, executado pela máquina virtual\n{self.fallback.disassemble()}'
+        if hasattr(ast, 'unparse'):
+            return ast.unparse(self.module)  # novermin
+        return ast.dump(self.module)
+
+    def location(self, line: int) -> Optional[Location]:
+        """Retorna a localização no código-fonte de uma linha do código gerado.
+
+        Args:
+            line: A linha do código gerado.
+
+        Returns:
+            A localização da linha, ``None`` caso seja desconhecida.
+        """
+        if self.source is None or not 2 <= line < len(self.offsets) + 2:
+            return None
+        return self.source.location(self.offsets[line - 2])
+
+
+def variable_name(name: str) -> str:
+    """Retorna o nome da variável local de uma variável da linguagem "A",
+    evitando as palavras reservadas do Python e as temporárias (``$n``) do otimizador."""
+    return f't{name[1:]}' if name.startswith('$') else f'v_{name}'
+
+
+def _fits(program: Program) -> bool:
+    """Verifica se o código Python de um programa respeita os limites do compilador do Python:
+    a altura da árvore sintática e os níveis de ``ENQUANTO`` aninhados."""
+    pending = [(program, 0, 0)]
+    while pending:
+        node, height, loops = pending.pop()
+        if height > MAX_HEIGHT or loops > MAX_LOOPS:
+            return False
+        loops += isinstance(node, While)
+        pending.extend((child, height + 1, loops) for child in node.children())
+    return True
+
+
+class _Translator(NodeVisitor):
+    """Traduz a árvore sintática para a árvore sintática de uma função Python."""
+
+    def __init__(self):
+        self.offsets = array('q')
+
+    def locate(self, node: ast.AST, offset: int) -> ast.AST:
+        """Coloca um nó Python em uma linha própria, associada à posição no código-fonte."""
+        node.lineno = node.end_lineno = len(self.offsets) + 2
+        node.col_offset = node.end_col_offset = 0
+        self.offsets.append(offset)
+        return node
+
+    # Expressões
+    def expression(self, node: Expression, kind: TokenKind) -> ast.expr:
+        """Traduz uma expressão, promovendo-a para real caso necessário.
+
+        Args:
+            node: A expressão.
+            kind: O tipo desejado do resultado.
+        """
+        if node.type == TokenKind.LITERAL_INT and kind == TokenKind.LITERAL_FLOAT:
+            if isinstance(node, Number) and (value := as_real(node.value)) is not None:
+                return ast.Constant(value)
+            # a conversão de um inteiro além dos limites dos reais falha
+            conversion = ast.Call(ast.Name('float', ast.Load()), [self.visit(node)], [])
+            if node.token is not None:
+                self.locate(conversion, node.token.start)
+            return conversion
+        return self.visit(node)
+
+    def visit_Number(self, node: Number) -> ast.expr:
+        return ast.Constant(node.value)
+
+    def visit_Variable(self, node: Variable) -> ast.expr:
+        return ast.Name(variable_name(node.name), ast.Load())
+
+    def visit_BinaryOperation(self, node: BinaryOperation) -> ast.expr:
+        # a divisão sempre opera sobre reais
+        operand_kind = (TokenKind.LITERAL_INT
+                        if node.type == TokenKind.LITERAL_INT else
+                        TokenKind.LITERAL_FLOAT)
+        operation = ast.BinOp(
+            self.expression(node.left, operand_kind),
+            _OPERATORS[node.operator](),
+            self.expression(node.right, operand_kind))
+        if node.operator == TokenKind.DIVISION and node.token is not None:
+            self.locate(operation, node.token.start)
+        return operation
+
+    # Condições
+    def condition(self, node: Condition) -> ast.expr:
+        """Traduz uma condição, sem avaliar o restante de uma operação
+        booleana cujo resultado já é conhecido."""
+        if isinstance(node, Relation):
+            # comparar "int" e "real" como reais
+            kind = (TokenKind.LITERAL_INT
+                    if node.left.type == node.right.type == TokenKind.LITERAL_INT else
+                    TokenKind.LITERAL_FLOAT)
+            return ast.Compare(
+                self.expression(node.left, kind), [_OPERATORS[node.operator]()], [self.expression(node.right, kind)])
+        operator = ast.And() if node.operator == TokenKind.AND else ast.Or()
+        return ast.BoolOp(operator, [self.condition(node.left), self.condition(node.right)])
+
+    # Comandos
+    def statements(self, node: Command) -> List[ast.stmt]:
+        """Traduz um comando para os comandos Python equivalentes.
+
+        Args:
+            node: O comando.
+
+        Returns:
+            Os comandos Python, possivelmente nenhum (``INICIO FIM`` vazio).
+        """
+        if isinstance(node, Block):
+            return [statement for command in node.commands for statement in self.statements(command)]
+        return [self.visit(node)]
+
+    def body(self, node: Command) -> List[ast.stmt]:
+        """Traduz o corpo de um comando ``SE`` ou ``ENQUANTO``, que não pode ser vazio."""
+        return self.statements(node) or [ast.Pass()]
+
+    def visit_Program(self, node: Program) -> ast.Module:
+        module = ast.parse(_TEMPLATE)
+        function = module.body[0]
+        # as variáveis começam com zero do seu tipo
+        function.body = [
+            ast.Assign([ast.Name(variable_name(declaration.name), ast.Store())],
+                       ast.Constant(0 if declaration.type == TokenKind.LITERAL_INT else 0.0))
+            for declaration in node.declarations]
+        function.body.extend(statement for command in node.commands for statement in self.statements(command))
+        function.body = function.body or [ast.Pass()]
+        return ast.fix_missing_locations(module)
+
+    def visit_Assign(self, node: Assign) -> ast.stmt:
+        return ast.Assign([ast.Name(variable_name(node.target.name), ast.Store())],
+                          self.expression(node.expression, node.target.type))
+
+    def visit_Read(self, node: Read) -> ast.stmt:
+        function = 'read_int' if node.target.type == TokenKind.LITERAL_INT else 'read_real'
+        call = ast.Call(ast.Name(function, ast.Load()), [], [])
+        if node.token is not None:
+            self.locate(call, node.token.start)
+        return ast.Assign([ast.Name(variable_name(node.target.name), ast.Store())], call)
+
+    def visit_Print(self, node: Print) -> ast.stmt:
+        if isinstance(node.value, String):
+            argument = ast.Constant(format_value(node.value.value))
+        else:
+            argument = ast.Call(ast.Name('format_value', ast.Load()), [self.visit(node.value)], [])
+        return ast.Expr(ast.Call(ast.Name('write', ast.Load()), [argument], []))
+
+    def visit_If(self, node: If) -> ast.stmt:
+        return ast.If(self.condition(node.condition), self.body(node.command), [])
+
+    def visit_While(self, node: While) -> ast.stmt:
+        return ast.While(self.condition(node.condition), self.body(node.command), [])
+
+
+def compile_python(program: Program) -> PythonCode:
+    """Compila a árvore sintática de um programa válido para uma função Python.
+
+    As variáveis se tornam variáveis locais da função, ``ENQUANTO`` se torna ``while``
+    e ``LER`` e ``IMPRIMIR`` chamam as funções de entrada e saída recebidas como argumentos.
+    O objeto de código é reaproveitado entre programas que geram o mesmo código Python.
+    Um programa com mais de ``MAX_LOOPS`` ``ENQUANTO`` aninhados ou com uma árvore sintática
+    mais alta que ``MAX_HEIGHT`` é compilado para a máquina virtual.
+
+    Args:
+        program: A árvore sintática do programa.
+
+    Returns:
+        O programa compilado.
+    """
+    source = program.token.source if program.token is not None else None
+    if not _fits(program):
+        return PythonCode(None, None, array('q'), source, compile_program(program))
+
+    translator = _Translator()
+    module = translator.visit(program)
+    # a árvore com as linhas identifica o objeto de código (``ast.unparse`` requer o Python 3.9)
+    key = ast.dump(module, include_attributes=True)
+
+    if (code := _code_objects.get(key)) is None:
+        code = _code_objects[key] = compile(module, '<linguagem A>', 'exec')
+        if len(_code_objects) > CODE_CACHE_SIZE:
+            _code_objects.popitem(last=False)
+    else:
+        _code_objects.move_to_end(key)
+
+    namespace = {'__builtins__': {'float': float}}
+    exec(code, namespace)
+    return PythonCode(namespace['programa'], module, translator.offsets, source)
+
+
+def _line(code: PythonCode, traceback: Optional[TracebackType]) -> int:
+    """Retorna a linha do código gerado onde ocorreu o erro, ``0`` caso seja desconhecida."""
+    line = 0
+    while traceback is not None:
+        if traceback.tb_frame.f_code is code.function.__code__:
+            line = traceback.tb_lineno
+        traceback = traceback.tb_next
+    return line
+
+
+def execute_python(code: PythonCode, reader: InputReader, write: Callable[[str], object]):
+    """Executa um programa da linguagem "A" compilado para uma função Python.
+
+    Args:
+        code: O programa compilado.
+        reader: O leitor dos valores de entrada do comando ``LER``.
+        write: A função que recebe a saída do comando ``IMPRIMIR``.
+
+    Raises:
+        ARuntimeError: Caso ocorra um erro de execução.
+    """
+    if code.fallback is not None:
+        execute(code.fallback, reader, write)
+        return
+    read = reader.read
+    try:
+        code.function(lambda: read(TokenKind.LITERAL_INT), lambda: read(TokenKind.LITERAL_FLOAT),
+                      write, format_value)
+    except ZeroDivisionError as error:
+        raise division_by_zero(code.location(_line(code, error.__traceback__))) from None
+    except OverflowError as error:
+        raise real_overflow(code.location(_line(code, error.__traceback__))) from None
+    except ARuntimeError as error:
+        error.location = error.location or code.location(_line(code, error.__traceback__))
+        raise
+
+
+def run_python(program: Union[Program, PythonCode], stdin: Union[str, TextIO] = '') -> str:
+    """Executa um programa válido da linguagem "A" como função Python e retorna a sua saída.
+
+    Args:
+        program: A árvore sintática ou o programa compilado.
+        stdin: Os valores de entrada do comando ``LER``, separados por espaços em branco.
+
+    Returns:
+        A saída do comando ``IMPRIMIR``.
+
+    Raises:
+        ARuntimeError: Caso ocorra um erro de execução.
+    """
+    code = program if isinstance(program, PythonCode) else compile_python(program)
+    output = io.StringIO()
+    execute_python(code, InputReader(stdin), output.write)
+    return output.getvalue()
@@ -0,0 +1,289 @@
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, TextIO, Tuple
+
+from .token import Token, TokenKind
+
+if TYPE_CHECKING:
+    from .optimizer import OptimizationReport
+
+
+def format_token_kinds(token_kinds: Tuple[TokenKind, ...]) -> str:
+    """Formata os tipos de token esperados.
+
+    Args:
+        token_kinds: Os tipos de token.
+
+    Returns:
+        Os tipos de token separados por ``|`` entre colchetes.
+    """
+    return f'[{" | ".join(map(str, token_kinds))}]'
+
+
+class Reporter:
+    """Recebe os eventos do compilador da linguagem "A" sem relatar nada.
+
+    Os eventos por token (``found`` e ``satisfied``) só são enviados
+    quando ``traces`` for verdadeiro, de forma que os laços do analisador léxico
+    e do analisador sintático não chamem nem formatem nada nos demais casos.
+    Da mesma forma, os contadores (``counted``) só são calculados e enviados
+    quando ``counts`` for verdadeiro, e a saída de um programa executado só é
+    enviada (``printed``), em vez de escrita na saída padrão, quando ``prints`` for verdadeiro.
+    """
+    traces = False
+    counts = False
+    prints = False
+
+    def start(self, source_name: str):
+        """Inicia o relatório de um código-fonte.
+
+        Args:
+            source_name: O nome do código-fonte.
+        """
+
+    def phase(self, name: str):
+        """Inicia uma fase do compilador.
+
+        Args:
+            name: O nome da fase.
+        """
+
+    def found(self, token: Token):
+        """Relata um token encontrado pelo analisador léxico.
+
+        Args:
+            token: O token encontrado.
+        """
+
+    def described(self, token_count: int):
+        """Relata o fim da análise léxica.
+
+        Args:
+            token_count: A quantidade de tokens encontrados.
+        """
+
+    def satisfied(self, token: Token, token_kinds: Tuple[TokenKind, ...]):
+        """Relata um token que satisfaz os tipos de token esperados pelo analisador sintático.
+
+        Args:
+            token: O token.
+            token_kinds: Os tipos de token esperados.
+        """
+
+    def cached(self, hit: bool):
+        """Relata a consulta do cache da análise.
+
+        Args:
+            hit: Se a análise foi encontrada no cache.
+        """
+
+    def parsed(self, symbol_count: int):
+        """Relata o fim da análise sintática e semântica.
+
+        Args:
+            symbol_count: A quantidade de símbolos declarados.
+        """
+
+    def optimized(self, report: 'OptimizationReport'):
+        """Relata o fim da otimização.
+
+        Args:
+            report: O resumo da otimização.
+        """
+
+    def counted(self, name: str, counters: Dict[str, int]):
+        """Relata um grupo de contadores de uma fase do compilador.
+
+        Args:
+            name: O nome do grupo (``tokens``, ``lexer`` ou ``parser``).
+            counters: Os valores dos contadores por nome.
+        """
+
+    def printed(self, text: str):
+        """Relata a saída do comando ``IMPRIMIR`` de um programa executado.
+
+        Args:
+            text: O texto escrito.
+        """
+
+    def warned(self, warning: Exception):
+        """Relata um aviso do compilador, que não torna o programa inválido.
+
+        Args:
+            warning: O aviso.
+        """
+
+    def error(self, error: Exception):
+        """Relata um erro do compilador.
+
+        Args:
+            error: O erro.
+        """
+
+    def finish(self):
+        """Encerra o relatório."""
+
+
+class SilentReporter(Reporter):
+    """Relata apenas os erros e os avisos, na saída de erros."""
+
+    def warned(self, warning: Exception):
+        print(warning, file=sys.stderr)
+
+    def error(self, error: Exception):
+        print(error, file=sys.stderr)
+
+
+class SummaryReporter(Reporter):
+    """Relata apenas um resumo de cada fase e o resultado."""
+
+    def __init__(self, output: Optional[TextIO] = None):
+        """Cria um relatório resumido.
+
+        Args:
+            output: O destino do relatório (padrão: saída padrão).
+        """
+        self._output = output or sys.stdout
+        self._started_at = 0.0
+        self._failed = False
+
+    def start(self, source_name: str):
+        self._started_at = time.perf_counter()
+        self._failed = False
+        print(f'Analisando o arquivo "{source_name}"...', file=self._output)
+
+    def cached(self, hit: bool):
+        print(f'Cache: {"acerto" if hit else "falta"}', file=self._output)
+
+    def described(self, token_count: int):
+        print(f'Análise léxica: {token_count} tokens encontrados', file=self._output)
+
+    def parsed(self, symbol_count: int):
+        print(f'Análise sintática e semântica: {symbol_count} símbolos declarados', file=self._output)
+
+    def optimized(self, report: 'OptimizationReport'):
+        print(f'Otimização: {report}', file=self._output)
+
+    def warned(self, warning: Exception):
+        print(f'⚠️ {warning}', file=self._output)
+
+    def error(self, error: Exception):
+        self._failed = True
+        print(f'❌ {error}', file=self._output)
+
+    def finish(self):
+        elapsed = time.perf_counter() - self._started_at
+        result = 'programa inválido' if self._failed else 'programa válido'
+        print(f'{result} ({elapsed:.3f}s)', file=self._output)
+
+
+class VerboseReporter(Reporter):
+    """Relata cada token encontrado e cada token que satisfaz o analisador sintático."""
+    traces = True
+
+    def __init__(self, output: Optional[TextIO] = None):
+        """Cria um relatório detalhado.
+
+        Args:
+            output: O destino do relatório (padrão: saída padrão).
+        """
+        self._output = output or sys.stdout
+
+    def start(self, source_name: str):
+        print(f'Analisando o arquivo "{source_name}"...', file=self._output)
+
+    def phase(self, name: str):
+        print(f'\n{name}:', file=self._output)
+
+    def found(self, token: Token):
+        print(f'🥳 {token} encontrado', file=self._output)
+
+    def satisfied(self, token: Token, token_kinds: Tuple[TokenKind, ...]):
+        print(f'👌 {token} satisfaz {format_token_kinds(token_kinds)}', file=self._output)
+
+    def optimized(self, report: 'OptimizationReport'):
+        print(f'⚡ {report}', file=self._output)
+
+    def warned(self, warning: Exception):
+        print(f'⚠️ {warning}', file=self._output)
+
+    def error(self, error: Exception):
+        print(f'\n❌ {error}', file=self._output)
+
+
+class NdjsonReporter(Reporter):
+    """Relata cada evento como um objeto JSON por linha, acumulando as linhas
+    e escrevendo-as em blocos. A saída de um programa executado também é um evento,
+    de forma que cada linha seja um objeto JSON."""
+    traces = True
+    prints = True
+
+    def __init__(self, output: Optional[TextIO] = None, buffer_size: int = 1024):
+        """Cria um relatório em NDJSON.
+
+        Args:
+            output: O destino do relatório (padrão: saída padrão).
+            buffer_size: A quantidade de eventos acumulados antes de cada escrita.
+        """
+        self._output = output or sys.stdout
+        self._buffer_size = buffer_size
+        self._buffer: List[str] = []
+
+    def _emit(self, event: dict):
+        self._buffer.append(json.dumps(event, ensure_ascii=False))
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Escreve os eventos acumulados."""
+        if self._buffer:
+            self._output.write('\n'.join(self._buffer) + '\n')
+            self._buffer.clear()
+
+    def start(self, source_name: str):
+        self._emit({'event': 'start', 'source': source_name})
+
+    def phase(self, name: str):
+        self._emit({'event': 'phase', 'name': name})
+
+    def found(self, token: Token):
+        self._emit({'event': 'token', 'kind': token.kind.name, 'lexeme': token.lexeme})
+
+    def cached(self, hit: bool):
+        self._emit({'event': 'cached', 'hit': hit})
+
+    def described(self, token_count: int):
+        self._emit({'event': 'described', 'tokens': token_count})
+
+    def satisfied(self, token: Token, token_kinds: Tuple[TokenKind, ...]):
+        self._emit({'event': 'satisfied', 'kind': token.kind.name, 'lexeme': token.lexeme,
+                    'expected': [token_kind.name for token_kind in token_kinds]})
+
+    def parsed(self, symbol_count: int):
+        self._emit({'event': 'parsed', 'symbols': symbol_count})
+
+    def optimized(self, report: 'OptimizationReport'):
+        self._emit({'event': 'optimized', **report._asdict()})
+
+    def printed(self, text: str):
+        self._emit({'event': 'output', 'text': text})
+
+    def warned(self, warning: Exception):
+        self._emit({'event': 'warning', 'type': type(warning).__name__, 'message': str(warning)})
+
+    def error(self, error: Exception):
+        self._emit({'event': 'error', 'type': type(error).__name__, 'message': str(error)})
+
+    def finish(self):
+        self._emit({'event': 'finish'})
+        self.flush()
+
+
+# Relatórios disponíveis por nível
+REPORTERS = {
+    'silent': SilentReporter,
+    'summary': SummaryReporter,
+    'verbose': VerboseReporter,
+    'ndjson': NdjsonReporter,
+}
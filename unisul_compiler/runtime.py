@@ -0,0 +1,111 @@
+import io
+import re
+from typing import Iterator, Optional, TextIO, Union
+
+from .exceptions import ARuntimeError
+from .source import Location
+from .token import TokenKind
+
+# Valores de entrada aceitos pelo comando ``LER``, como os números da linguagem, apenas com dígitos
+# ASCII, a mesma regra do código C gerado por ``cbackend``
+INT_VALUE = re.compile(r'[+-]?[0-9]+')
+REAL_VALUE = re.compile(r'[+-]?[0-9]+(?:\.[0-9]+)?')
+
+
+class InputReader:
+    """Lê os valores de entrada do comando ``LER``, separados por espaços em branco
+    ou quebras de linha, à medida que são necessários."""
+    __slots__ = ('_values', 'count')
+
+    def __init__(self, stdin: Union[str, TextIO]):
+        """Cria um leitor de valores de entrada.
+
+        Args:
+            stdin: O texto da entrada, ou um arquivo aberto em modo texto.
+        """
+        self._values = self._split(io.StringIO(stdin) if isinstance(stdin, str) else stdin)
+        self.count = 0
+
+    @staticmethod
+    def _split(stdin: TextIO) -> Iterator[str]:
+        for line in stdin:
+            yield from line.split()
+
+    def read(self, kind: TokenKind) -> Union[int, float]:
+        """Lê o próximo valor de entrada.
+
+        Args:
+            kind: O tipo da variável (``TokenKind.LITERAL_INT`` ou ``TokenKind.LITERAL_FLOAT``).
+
+        Raises:
+            ARuntimeError: Caso não existam mais valores de entrada.
+            ARuntimeError: Caso o valor não seja do tipo da variável.
+
+        Returns:
+            O valor lido.
+        """
+        if (value := next(self._values, None)) is None:
+            raise ARuntimeError('erro de execução, não existem mais valores de entrada')
+        self.count += 1
+        return parse_value(value, kind)
+
+
+def parse_value(value: str, kind: TokenKind) -> Union[int, float]:
+    """Converte um valor de entrada para o tipo de uma variável.
+
+    Um inteiro tem sinal opcional e dígitos ASCII, e um real pode ter ainda um ponto seguido de
+    dígitos, portanto valores como ``1_000``, ``1e5``, ``inf`` ou com outros dígitos Unicode são recusados.
+
+    Args:
+        value: O valor de entrada.
+        kind: O tipo da variável (``TokenKind.LITERAL_INT`` ou ``TokenKind.LITERAL_FLOAT``).
+
+    Raises:
+        ARuntimeError: Caso o valor não seja do tipo da variável.
+
+    Returns:
+        O valor convertido.
+    """
+    if kind == TokenKind.LITERAL_INT:
+        if INT_VALUE.fullmatch(value) is not None:
+            return int(value)
+    elif REAL_VALUE.fullmatch(value) is not None:
+        return float(value)
+    type_name = 'INT' if kind == TokenKind.LITERAL_INT else 'REAL'
+    raise ARuntimeError(f'erro de execução, valor de entrada "{value}" não é {type_name}')
+
+
+def format_value(value: Union[int, float, str]) -> str:
+    """Formata um valor impresso pelo comando ``IMPRIMIR``, seguido de uma quebra de linha.
+
+    Args:
+        value: O valor (inteiro, real ou cadeia de caracteres).
+
+    Returns:
+        O valor formatado.
+    """
+    return f'{value}\n'
+
+
+def division_by_zero(location: Optional[Location] = None) -> ARuntimeError:
+    """Cria o erro de uma divisão por zero.
+
+    Args:
+        location: A localização da divisão no código-fonte (opcional).
+
+    Returns:
+        O erro.
+    """
+    return ARuntimeError('erro de execução, divisão por zero', location)
+
+
+def real_overflow(location: Optional[Location] = None) -> ARuntimeError:
+    """Cria o erro da conversão para real de um inteiro além dos limites dos reais.
+
+    Args:
+        location: A localização da expressão convertida no código-fonte (opcional).
+
+    Returns:
+        O erro.
+    """
+    return ARuntimeError('erro de execução, inteiro fora dos limites de REAL', location)
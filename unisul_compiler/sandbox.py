@@ -0,0 +1,177 @@
+import io
+import math
+import time
+from typing import Callable, NamedTuple, Optional, TextIO, Union
+
+from .bytecode import Code, Opcode, compile_program
+from .exceptions import ALimitExceeded, ARuntimeError
+from .runtime import InputReader
+from .source import Location
+from .syntax_tree import Program
+from .token import TokenKind
+from .vm import execute
+
+# Operações consultadas nos desvios, como em ``vm``
+JUMP, HALT = int(Opcode.JUMP), int(Opcode.HALT)
+
+# Quantidade de operações executadas entre duas consultas ao relógio
+CHECK_INTERVAL = 4096
+
+
+class Limits(NamedTuple):
+    """Limites de uma execução; ``None`` deixa o recurso sem limite."""
+    # quantidade de instruções da máquina virtual executadas
+    max_operations: Optional[int] = None
+    # tempo de execução, em segundos
+    timeout: Optional[float] = None
+    # quantidade de bytes (UTF-8) escritos pelo comando IMPRIMIR
+    max_output: Optional[int] = None
+    # quantidade de valores lidos pelo comando LER
+    max_reads: Optional[int] = None
+
+
+class SandboxResult(NamedTuple):
+    """Resultado de uma execução limitada por ``Sandbox.run``."""
+    output: str
+    error: Optional[ARuntimeError]
+    operations: int
+    elapsed: float
+
+    @property
+    def limit(self) -> Optional[str]:
+        """O nome do limite excedido, ``None`` caso a execução tenha respeitado os limites."""
+        return self.error.limit if isinstance(self.error, ALimitExceeded) else None
+
+
+class _LimitedReader:
+    """Leitor que conta os valores lidos, lançando ``ALimitExceeded`` ao exceder o limite."""
+    __slots__ = ('reader', 'max_reads', 'reads')
+
+    def __init__(self, reader: InputReader, max_reads: Optional[int]):
+        self.reader = reader
+        self.max_reads = max_reads
+        self.reads = 0
+
+    def read(self, kind: TokenKind) -> Union[int, float]:
+        if self.max_reads is not None and self.reads >= self.max_reads:
+            raise ALimitExceeded(f'erro de execução, limite de {self.max_reads} leituras excedido', 'max_reads')
+        self.reads += 1
+        return self.reader.read(kind)
+
+
+class Sandbox:
+    """Executa programas da linguagem "A" na máquina virtual, interrompendo-os ao exceder os limites.
+
+    As operações são contadas nos desvios, pelo tamanho de cada trecho sem desvios executado,
+    e o relógio é consultado a cada ``CHECK_INTERVAL`` operações, no desvio de volta de um
+    ``ENQUANTO``, de forma que os limites quase não custam aos programas sem laços longos.
+    Um programa sem laços sempre termina, e apenas o seu total de operações é verificado.
+    O tempo não interrompe uma leitura bloqueada da entrada nem uma única operação sobre
+    inteiros enormes.
+    """
+    __slots__ = ('limits', 'operations', 'reads', 'output_size')
+
+    def __init__(self, limits: Limits = Limits()):
+        """Cria uma execução limitada.
+
+        Args:
+            limits: Os limites de cada execução.
+        """
+        self.limits = limits
+        # uso dos recursos na última execução
+        self.operations = 0
+        self.reads = 0
+        self.output_size = 0
+
+    def execute(self, code: Code, reader: InputReader, write: Callable[[str], object]):
+        """Executa o código de um programa da linguagem "A", como ``vm.execute``, dentro dos limites.
+
+        O uso dos recursos fica em ``operations``, ``reads`` e ``output_size``, inclusive após um erro.
+        O ``IMPRIMIR`` que excederia o limite de saída não é escrito.
+
+        Args:
+            code: O código do programa.
+            reader: O leitor dos valores de entrada do comando ``LER``.
+            write: A função que recebe a saída do comando ``IMPRIMIR``.
+
+        Raises:
+            ALimitExceeded: Caso a execução exceda um dos limites.
+            ARuntimeError: Caso ocorra um erro de execução.
+        """
+        limits = self.limits
+        # as posições das instruções avançam de dois em dois
+        operation_limit = limits.max_operations * 2 if limits.max_operations is not None else math.inf
+        deadline = time.perf_counter() + limits.timeout if limits.timeout is not None else math.inf
+        output_limit = limits.max_output if limits.max_output is not None else math.inf
+        checked = limits.max_operations is not None or limits.timeout is not None
+        checkpoint = min(CHECK_INTERVAL * 2, operation_limit + 1) if checked else math.inf
+        # posições executadas antes do trecho sem desvios atual
+        executed = 0
+        output_size = 0
+        limited_reader = _LimitedReader(reader, limits.max_reads)
+
+        def on_branch(segment: int, position: int, opcode: int):
+            nonlocal executed, checkpoint
+            # o trecho é somado apenas se respeitar os limites; senão, é contado ao fim da execução
+            total = executed + position + 2 - segment
+            if opcode == JUMP:
+                # o desvio de volta de um ENQUANTO: todo laço passa por aqui a cada repetição
+                if total >= checkpoint:
+                    self._check(total, operation_limit, deadline, code.location(position))
+                    checkpoint = min(total + CHECK_INTERVAL * 2, operation_limit + 1)
+            elif opcode == HALT and total > operation_limit:
+                self._check(total, operation_limit, math.inf, None)
+            executed = total
+
+        def limited_write(text: str):
+            nonlocal output_size
+            size = len(text.encode())
+            if output_size + size > output_limit:
+                raise ALimitExceeded(f'erro de execução, limite de {limits.max_output} bytes de saída excedido',
+                                     'max_output')
+            output_size += size
+            write(text)
+
+        state = [0, 0]
+        try:
+            execute(code, limited_reader, limited_write, on_branch, state)
+        finally:
+            pc, segment = state
+            self.operations = (executed + pc - segment) // 2
+            self.reads = limited_reader.reads
+            self.output_size = output_size
+
+    def _check(self, executed: int, operation_limit: float, deadline: float,
+               location: Optional[Location]):
+        """Verifica os limites de operações e de tempo.
+
+        Raises:
+            ALimitExceeded: Caso um dos limites tenha sido excedido.
+        """
+        if executed > operation_limit:
+            raise ALimitExceeded(f'erro de execução, limite de {self.limits.max_operations} operações excedido',
+                                 'max_operations', location)
+        if time.perf_counter() > deadline:
+            raise ALimitExceeded(f'erro de execução, tempo limite de {self.limits.timeout:g} s excedido',
+                                 'timeout', location)
+
+    def run(self, program: Union[Program, Code], stdin: Union[str, TextIO] = '') -> SandboxResult:
+        """Executa um programa válido da linguagem "A" dentro dos limites.
+
+        Args:
+            program: A árvore sintática ou o código do programa.
+            stdin: Os valores de entrada do comando ``LER``, separados por espaços em branco.
+
+        Returns:
+            A saída produzida até o fim do programa ou até o erro, o erro de execução
+            (``ALimitExceeded`` caso um limite tenha sido excedido), a quantidade de operações
+            executadas e o tempo de execução, em segundos.
+        """
+        code = program if isinstance(program, Code) else compile_program(program)
+        output = io.StringIO()
+        started_at = time.perf_counter()
+        try:
+            self.execute(code, InputReader(stdin), output.write)
+        except ARuntimeError as error:
+            return SandboxResult(output.getvalue(), error, self.operations, time.perf_counter() - started_at)
+        return SandboxResult(output.getvalue(), None, self.operations, time.perf_counter() - started_at)
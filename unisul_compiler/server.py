@@ -0,0 +1,374 @@
+import io
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .bytecode import Code, compile_program
+from .diagnostics import Diagnostics
+from .exceptions import AError, ALimitExceeded, ARuntimeError, ATooManyErrors
+from .lexer import describe
+from .optimizer import optimize
+from .parser import GROUPINGS
+from .pybackend import PythonCode, compile_python
+from .runtime import InputReader
+from .sandbox import Limits, Sandbox
+from .source import Source
+from .syntax_tree import Program
+from .table_parser import PARSERS
+
+# Operações aceitas pelo servidor
+OPERATIONS = ('check', 'compile', 'run')
+
+# Compiladores dos programas, pelo nome do backend; ``run`` executa apenas o código da máquina virtual
+BACKENDS = {
+    'vm': compile_program,
+    'python': compile_python,
+}
+
+# Quantidade padrão de erros relatados por análise, como na linha de comando
+MAX_ERRORS = 20
+
+# Limites de toda execução atendida pelo servidor, que uma requisição pode alterar, mas não remover
+DEFAULT_LIMITS = Limits(max_operations=100_000_000, timeout=10.0)
+
+# Quantidade de análises e de programas compilados mantidos na memória de cada processo
+MEMORY_CACHE_SIZE = 256
+
+# Quantidade de requisições em andamento por processo antes de parar de ler novas requisições
+PENDING_PER_JOB = 64
+
+# Programa analisado ao iniciar cada processo, carregando os módulos e as tabelas
+_WARM_UP_SOURCE = ':DECLARACOES\nx : INT\n:ALGORITMO\nLER x\nATRIBUIR x * 2 A x\nIMPRIMIR x\n'
+
+
+class RequestError(Exception):
+    """Requisição malformada, respondida sem analisar nada."""
+
+
+class Analysis(NamedTuple):
+    """Resultado da análise de um código-fonte, compartilhado entre as requisições."""
+    program: Optional[Program]
+    errors: Tuple[AError, ...]
+    tokens: int
+    symbols: int
+
+
+def format_error(error: AError) -> dict:
+    """Converte um erro do compilador em um objeto JSON.
+
+    Args:
+        error: O erro.
+
+    Returns:
+        O tipo, a mensagem e, quando conhecidas, a linha e a coluna do erro.
+    """
+    location = error.location
+    return {
+        'type': type(error).__name__,
+        'message': error.message,
+        'line': location.line if location is not None else None,
+        'column': location.column if location is not None else None,
+    }
+
+
+@lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def analyze(text: str, name: str, grouping: str, parser: str, max_errors: Optional[int],
+            optimized: bool) -> Analysis:
+    """Analisa léxica, sintática e semanticamente um código-fonte, guardando o resultado na memória.
+
+    Args:
+        text: O código-fonte.
+        name: O nome do código-fonte, usado nas localizações dos erros.
+        grouping: O agrupamento das expressões (``precedence`` ou ``legacy``).
+        parser: O analisador sintático (``descent`` ou ``table``).
+        max_errors: A quantidade máxima de erros registrados (``None``: sem limite).
+        optimized: Se a árvore sintática de um programa válido é otimizada.
+
+    Returns:
+        A árvore sintática, ``None`` caso o programa seja inválido, e os erros ordenados.
+    """
+    diagnostics = Diagnostics(max_errors)
+    tokens = None
+    program = None
+    try:
+        tokens = describe(Source(text, name), None, diagnostics)
+        program = PARSERS[parser](tokens, None, diagnostics, grouping)
+    except ATooManyErrors as error:
+        return Analysis(None, (*diagnostics.sorted(), error), len(tokens or ()), 0)
+    if diagnostics.errors:
+        return Analysis(None, tuple(diagnostics.sorted()), len(tokens), len(program.symbols))
+    if optimized:
+        optimize(program)
+    return Analysis(program, (), len(tokens), len(program.symbols))
+
+
+@lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def compile_backend(text: str, name: str, grouping: str, parser: str, max_errors: Optional[int],
+                    optimized: bool, backend: str) -> Union[Code, PythonCode]:
+    """Compila um programa válido já analisado, guardando o código na memória.
+
+    Args:
+        text: O código-fonte.
+        name: O nome do código-fonte.
+        grouping: O agrupamento das expressões.
+        parser: O analisador sintático.
+        max_errors: A quantidade máxima de erros registrados.
+        optimized: Se a árvore sintática é otimizada.
+        backend: A forma de execução (``vm`` ou ``python``).
+
+    Returns:
+        O código do programa.
+    """
+    program = analyze(text, name, grouping, parser, max_errors, optimized).program
+    return BACKENDS[backend](program)
+
+
+def _option(request: dict, key: str, default: str, choices) -> str:
+    value = request.get(key, default)
+    if not isinstance(value, str) or value not in choices:
+        raise RequestError(f'"{key}" deve ser um de: {", ".join(map(str, choices))}')
+    return value
+
+
+def _limits(request: dict) -> Limits:
+    limits = request.get('limits', {})
+    if not isinstance(limits, dict) or not set(limits) <= set(Limits._fields):
+        raise RequestError(f'"limits" deve ser um objeto com {", ".join(Limits._fields)}')
+    for key, value in limits.items():
+        kind = (int, float) if key == 'timeout' else int
+        if value is None:
+            if getattr(DEFAULT_LIMITS, key) is not None:
+                raise RequestError(f'"limits.{key}" deve ser um número não negativo')
+        elif not isinstance(value, kind) or isinstance(value, bool) or value < 0:
+            raise RequestError(f'"limits.{key}" deve ser um número não negativo ou null')
+    return DEFAULT_LIMITS._replace(**limits)
+
+
+def handle_request(request: dict) -> dict:
+    """Atende uma requisição de análise, compilação ou execução.
+
+    A requisição é um objeto com a operação (``op``: ``check``, ``compile`` ou ``run``),
+    o código-fonte (``source``) ou o caminho do arquivo (``path``) e, opcionalmente,
+    ``id``, ``name``, ``grouping``, ``parser``, ``max_errors``, ``optimize``, ``backend``,
+    os valores de entrada de ``LER`` (``input``) e os limites da execução na máquina virtual
+    (``limits``: ``max_operations``, ``timeout``, ``max_output`` e ``max_reads``).
+    Toda execução ocorre na máquina virtual, dentro de ``DEFAULT_LIMITS`` alterados pelos
+    limites da requisição, de forma que um programa sem fim não ocupa um processo do servidor.
+
+    Args:
+        request: A requisição.
+
+    Returns:
+        A resposta, com o mesmo ``id`` da requisição. ``ok`` é falso apenas caso a requisição
+        seja malformada (``error``); senão, ``valid`` indica se não houve erros, listados em
+        ``diagnostics``, com a listagem do código em ``code`` (``compile``) e a saída do
+        programa em ``output`` (``run``), além do nome do limite excedido em ``limit``.
+    """
+    response = {'id': request.get('id') if isinstance(request, dict) else None}
+    try:
+        if not isinstance(request, dict):
+            raise RequestError('a requisição deve ser um objeto JSON')
+        operation = _option(request, 'op', 'check', OPERATIONS)
+        grouping = _option(request, 'grouping', 'precedence', GROUPINGS)
+        parser = _option(request, 'parser', 'descent', PARSERS)
+        backend = _option(request, 'backend', 'vm', BACKENDS)
+        optimized = bool(request.get('optimize', False))
+        if not isinstance(max_errors := request.get('max_errors', MAX_ERRORS), int) and max_errors is not None:
+            raise RequestError('"max_errors" deve ser um número inteiro ou null')
+        if isinstance(text := request.get('source'), str):
+            name = str(request.get('name', '<código-fonte>'))
+        elif isinstance(path := request.get('path'), str):
+            name = str(request.get('name', path))
+            try:
+                text = Path(path).read_text()
+            except (OSError, UnicodeDecodeError) as error:
+                raise RequestError(f'não foi possível ler "{path}": {error}') from None
+        else:
+            raise RequestError('a requisição deve conter "source" ou "path"')
+        stdin = request.get('input', '')
+        if not isinstance(stdin, str):
+            raise RequestError('"input" deve ser um texto')
+        limits = _limits(request)
+        if operation == 'run' and backend != 'vm':
+            raise RequestError('"run" executa apenas com o backend "vm", que limita a execução')
+    except RequestError as error:
+        response.update(ok=False, error=str(error))
+        return response
+
+    analysis = analyze(text, name, grouping, parser, max_errors, optimized)
+    errors = list(analysis.errors)
+    response.update(ok=True, tokens=analysis.tokens, symbols=analysis.symbols)
+    if analysis.program is not None and operation != 'check':
+        code = compile_backend(text, name, grouping, parser, max_errors, optimized, backend)
+        if operation == 'compile':
+            response['code'] = code.disassemble() if isinstance(code, Code) else code.text
+        else:
+            output = io.StringIO()
+            try:
+                Sandbox(limits).execute(code, InputReader(stdin), output.write)
+            except ALimitExceeded as error:
+                errors.append(error)
+                response['limit'] = error.limit
+            except ARuntimeError as error:
+                errors.append(error)
+            response['output'] = output.getvalue()
+    response.update(valid=not errors, diagnostics=[format_error(error) for error in errors])
+    return response
+
+
+def _warm_up():
+    """Carrega os módulos e as tabelas do compilador antes da primeira requisição."""
+    for operation in OPERATIONS:
+        handle_request({'op': operation, 'source': _WARM_UP_SOURCE, 'input': '1'})
+    analyze.cache_clear()
+    compile_backend.cache_clear()
+
+
+def _init_process():
+    """Prepara um processo do servidor, que é interrompido apenas pelo processo principal."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _warm_up()
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def create_executor(jobs: Optional[int] = None) -> Executor:
+    """Cria o conjunto de processos que atendem as requisições, já carregados.
+
+    Args:
+        jobs: A quantidade de processos (padrão: a quantidade de processadores).
+            Com um único processo, as requisições são atendidas em uma thread do processo atual.
+
+    Returns:
+        O executor das requisições.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        return ThreadPoolExecutor(1, initializer=_warm_up)
+    return ProcessPoolExecutor(jobs, initializer=_init_process)
+
+
+def serve(lines: Iterable[Union[str, bytes]], write: Callable[[str], object], executor: Executor,
+          max_pending: int = PENDING_PER_JOB):
+    """Atende as requisições de uma conexão, uma por linha, em JSON.
+
+    As requisições são distribuídas entre os processos do executor e cada resposta
+    é escrita em uma linha assim que fica pronta, portanto fora de ordem: o ``id``
+    da requisição identifica a resposta. As respostas são escritas por uma thread própria
+    da conexão, de forma que um cliente lento não atrase as demais conexões, e a leitura
+    das requisições é pausada enquanto ``max_pending`` respostas não forem escritas.
+    Retorna após escrever todas as respostas.
+
+    Args:
+        lines: As linhas das requisições.
+        write: A função que escreve as linhas de resposta.
+        executor: O executor das requisições.
+        max_pending: A quantidade de respostas ainda não escritas antes de parar de ler novas requisições.
+    """
+    pending = threading.BoundedSemaphore(max_pending)
+    responses: 'queue.SimpleQueue[Optional[dict]]' = queue.SimpleQueue()
+
+    def writer():
+        finished = False
+        while not finished:
+            # escrever de uma vez as respostas já prontas
+            batch = [responses.get()]
+            while not responses.empty():
+                batch.append(responses.get())
+            if batch[-1] is None:
+                batch.pop()
+                finished = True
+            if batch:
+                write(''.join(json.dumps(response, ensure_ascii=False) + '\n' for response in batch))
+            for _ in batch:
+                pending.release()
+
+    def done(future: Future, request_id):
+        try:
+            responses.put(future.result())
+        except Exception as error:  # um erro inesperado não derruba a conexão
+            responses.put({'id': request_id, 'ok': False, 'error': f'{type(error).__name__}: {error}'})
+
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    writer_thread.start()
+    futures: List[Future] = []
+    try:
+        for line in lines:
+            if not line.strip():
+                continue
+            pending.acquire()
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                responses.put({'id': None, 'ok': False, 'error': f'JSON inválido: {error}'})
+                continue
+            request_id = request.get('id') if isinstance(request, dict) else None
+            future = executor.submit(handle_request, request)
+            future.add_done_callback(lambda future, request_id=request_id: done(future, request_id))
+            futures.append(future)
+            # esquecer as requisições já respondidas
+            if len(futures) > 2 * max_pending:
+                futures = [future for future in futures if not future.done()]
+        for future in futures:
+            future.exception()
+    finally:
+        responses.put(None)
+        writer_thread.join()
+
+
+def serve_stdio(jobs: Optional[int] = None):
+    """Atende as requisições da entrada padrão, respondendo na saída padrão até o fim da entrada.
+
+    Args:
+        jobs: A quantidade de processos (padrão: a quantidade de processadores).
+    """
+    def write(lines: str):
+        sys.stdout.write(lines)
+        sys.stdout.flush()
+
+    jobs = jobs or os.cpu_count() or 1
+    with create_executor(jobs) as executor:
+        serve(sys.stdin, write, executor, PENDING_PER_JOB * jobs)
+
+
+def serve_unix(path: Union[str, Path], jobs: Optional[int] = None):
+    """Atende as requisições de várias conexões em um socket Unix até ser interrompido
+    (``SIGINT`` ou ``SIGTERM``).
+
+    Args:
+        path: O caminho do socket, removido ao encerrar.
+        jobs: A quantidade de processos (padrão: a quantidade de processadores).
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise OSError('sockets Unix não estão disponíveis nesta plataforma')
+    path = Path(path)
+    jobs = jobs or os.cpu_count() or 1
+    with create_executor(jobs) as executor:
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                serve(self.rfile, lambda lines: self.wfile.write(lines.encode()), executor, PENDING_PER_JOB * jobs)
+
+        if path.is_socket():
+            path.unlink()
+        with socketserver.ThreadingUnixStreamServer(str(path), Handler) as server:
+            server.daemon_threads = True
+            signal.signal(signal.SIGTERM, _interrupt)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                path.unlink()
@@ -0,0 +1,145 @@
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import NamedTuple, Optional, Union
+
+
+class Location(NamedTuple):
+    """Localização de um caractere no código-fonte."""
+    name: str
+    line: int
+    column: int
+
+    def __str__(self):
+        return f'{self.name}:{self.line}:{self.column}'
+
+
+class Source:
+    """Representa um código-fonte da linguagem "A".
+
+    O índice das posições de início de linha é construído apenas
+    na primeira consulta de localização, e consultado por busca binária.
+    Na análise sob demanda o texto não é mantido, e o índice é alimentado
+    à medida que os trechos são lidos.
+    """
+    __slots__ = ('name', 'text', '_line_starts')
+
+    def __init__(self, text: Optional[str], name: str = '<código-fonte>'):
+        """Cria um código-fonte.
+
+        Args:
+            text: O texto do código-fonte, ou ``None`` caso seja lido em trechos.
+            name: O nome do código-fonte, geralmente o caminho do arquivo.
+        """
+        self.name = name
+        self.text = text
+        self._line_starts: Optional[array] = None if text is not None else array('q', [0])
+
+    def __repr__(self) -> str:
+        return f'<Source "{self.name}">'
+
+    @property
+    def line_starts(self) -> array:
+        """As posições de início de cada linha."""
+        if self._line_starts is None:
+            self._line_starts = array('q', [0])
+            self._line_starts.extend(accumulate(len(line) + 1 for line in self.text.split('\n')[:-1]))
+        return self._line_starts
+
+    def feed(self, chunk: str, offset: int):
+        """Alimenta o índice de início de linha com um trecho lido sob demanda.
+
+        Args:
+            chunk: O trecho do código-fonte.
+            offset: A posição do início do trecho no código-fonte.
+        """
+        line_starts = self.line_starts
+        position = chunk.find('\n')
+        while position != -1:
+            line_starts.append(offset + position + 1)
+            position = chunk.find('\n', position + 1)
+
+    def lexeme(self, start: int, end: int) -> str:
+        """Recorta um trecho do código-fonte.
+
+        Args:
+            start: A posição do início do trecho.
+            end: A posição do fim do trecho.
+
+        Returns:
+            O trecho.
+        """
+        return self.text[start:end]
+
+    def location(self, offset: int) -> Location:
+        """Retorna a localização (linha e coluna, a partir de 1) de uma posição do código-fonte.
+
+        Args:
+            offset: A posição no código-fonte.
+
+        Returns:
+            A localização da posição.
+        """
+        line = bisect_right(self.line_starts, offset)
+        return Location(self.name, line, offset - self.line_starts[line - 1] + 1)
+
+
+class BytesSource(Source):
+    """Representa um código-fonte da linguagem "A" como bytes em UTF-8,
+    geralmente um arquivo mapeado na memória (``mmap``).
+
+    O código-fonte não é copiado nem decodificado: as posições dos tokens são
+    posições de bytes, e apenas os lexemas consultados são decodificados.
+    As colunas das localizações contam caracteres, como no código-fonte decodificado.
+    """
+    __slots__ = ()
+
+    def __init__(self, data: Union[bytes, mmap.mmap], name: str = '<código-fonte>'):
+        """Cria um código-fonte.
+
+        Args:
+            data: Os bytes do código-fonte.
+            name: O nome do código-fonte, geralmente o caminho do arquivo.
+        """
+        super().__init__(data, name)
+
+    def __repr__(self) -> str:
+        return f'<BytesSource "{self.name}">'
+
+    @classmethod
+    def map(cls, path: Union[str, os.PathLike]) -> 'BytesSource':
+        """Mapeia um arquivo na memória, somente para leitura, sem lê-lo.
+
+        Args:
+            path: O caminho do arquivo.
+
+        Returns:
+            O código-fonte do arquivo.
+        """
+        with open(path, 'rb') as source_file:
+            # um arquivo vazio não pode ser mapeado
+            if os.fstat(source_file.fileno()).st_size == 0:
+                return cls(b'', str(path))
+            return cls(mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ), str(path))
+
+    @property
+    def line_starts(self) -> array:
+        """As posições de início de cada linha."""
+        if self._line_starts is None:
+            self._line_starts = array('q', [0])
+            find = self.text.find
+            position = find(b'\n')
+            while position != -1:
+                self._line_starts.append(position + 1)
+                position = find(b'\n', position + 1)
+        return self._line_starts
+
+    def lexeme(self, start: int, end: int) -> str:
+        return self.text[start:end].decode('utf-8', 'replace')
+
+    def location(self, offset: int) -> Location:
+        line = bisect_right(self.line_starts, offset)
+        line_start = self.line_starts[line - 1]
+        return Location(self.name, line, len(self.text[line_start:offset].decode('utf-8', 'replace')) + 1)
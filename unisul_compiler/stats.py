@@ -0,0 +1,150 @@
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, Callable, Dict, NamedTuple, Optional, Tuple
+
+from .reporter import Reporter, SilentReporter
+from .token import Token, TokenKind
+
+try:
+    import resource
+except ImportError:  # indisponível no Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from .optimizer import OptimizationReport
+
+# Nome do intervalo entre o início do relatório e a primeira fase (leitura do código-fonte e consulta do cache)
+READ_PHASE = 'Leitura'
+
+
+def peak_memory() -> Optional[int]:
+    """Retorna o pico de memória residente do processo.
+
+    Returns:
+        O pico de memória, em bytes, ``None`` caso não possa ser medido na plataforma.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # em KiB no Linux e em bytes no macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class CompileStats(NamedTuple):
+    """Estatísticas da compilação de um código-fonte."""
+    source: str
+    phases: Dict[str, float]
+    counters: Dict[str, Dict[str, int]]
+    tokens: Optional[int]
+    symbols: Optional[int]
+    cached: Optional[bool]
+    peak_memory: Optional[int]
+
+    def to_json(self) -> str:
+        """Formata as estatísticas como um objeto JSON.
+
+        Returns:
+            O objeto JSON, com os tempos das fases em segundos e a memória em bytes.
+        """
+        return json.dumps(self._asdict(), ensure_ascii=False)
+
+
+class StatsReporter(Reporter):
+    """Mede o tempo de cada fase e guarda os contadores do compilador,
+    repassando todos os eventos a outro relatório.
+
+    Os contadores só são calculados pelo analisador léxico e pelo analisador sintático
+    quando um ``StatsReporter`` é usado, portanto os demais relatórios não pagam por eles.
+    """
+    counts = True
+
+    def __init__(self, reporter: Optional[Reporter] = None,
+                 callback: Optional[Callable[[CompileStats], None]] = None):
+        """Cria um relatório de estatísticas.
+
+        Args:
+            reporter: O relatório que recebe os eventos (padrão: silencioso).
+            callback: A função que recebe as estatísticas ao fim do relatório (opcional).
+        """
+        self._reporter = reporter or SilentReporter()
+        self.traces = self._reporter.traces
+        self.prints = self._reporter.prints
+        self._callback = callback
+        self._source_name = ''
+        self._phase = READ_PHASE
+        self._phase_started_at = 0.0
+        self._phases: Dict[str, float] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._token_count: Optional[int] = None
+        self._symbol_count: Optional[int] = None
+        self._hit: Optional[bool] = None
+
+    @property
+    def stats(self) -> CompileStats:
+        """As estatísticas das fases encerradas."""
+        counters = {name: dict(group) for name, group in self._counters.items()}
+        return CompileStats(self._source_name, dict(self._phases), counters,
+                            self._token_count, self._symbol_count, self._hit, peak_memory())
+
+    def _close_phase(self):
+        now = time.perf_counter()
+        self._phases[self._phase] = self._phases.get(self._phase, 0.0) + now - self._phase_started_at
+        self._phase_started_at = now
+
+    def start(self, source_name: str):
+        self._source_name = source_name
+        self._phase = READ_PHASE
+        self._phases = {}
+        self._counters = {}
+        self._token_count = self._symbol_count = self._hit = None
+        self._reporter.start(source_name)
+        self._phase_started_at = time.perf_counter()
+
+    def phase(self, name: str):
+        self._close_phase()
+        self._phase = name
+        self._reporter.phase(name)
+
+    def found(self, token: Token):
+        self._reporter.found(token)
+
+    def described(self, token_count: int):
+        self._token_count = token_count
+        self._reporter.described(token_count)
+
+    def satisfied(self, token: Token, token_kinds: Tuple[TokenKind, ...]):
+        self._reporter.satisfied(token, token_kinds)
+
+    def cached(self, hit: bool):
+        self._hit = hit
+        self._reporter.cached(hit)
+
+    def parsed(self, symbol_count: int):
+        self._symbol_count = symbol_count
+        self._reporter.parsed(symbol_count)
+
+    def optimized(self, report: 'OptimizationReport'):
+        self._counters['optimizer'] = report._asdict()
+        self._reporter.optimized(report)
+
+    def counted(self, name: str, counters: Dict[str, int]):
+        group = self._counters.setdefault(name, {})
+        for counter, value in counters.items():
+            group[counter] = group.get(counter, 0) + value
+        self._reporter.counted(name, counters)
+
+    def printed(self, text: str):
+        self._reporter.printed(text)
+
+    def warned(self, warning: Exception):
+        self._reporter.warned(warning)
+
+    def error(self, error: Exception):
+        self._reporter.error(error)
+
+    def finish(self):
+        self._close_phase()
+        self._reporter.finish()
+        if self._callback is not None:
+            self._callback(self.stats)
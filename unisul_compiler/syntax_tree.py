@@ -0,0 +1,276 @@
+from types import GeneratorType
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Union
+
+from .token import Token, TokenKind
+
+
+class Node:
+    """Nó da árvore sintática de um programa da linguagem "A".
+
+    Cada classe de nó lista os seus filhos e atributos em ``_fields``,
+    na ordem em que aparecem no código-fonte.
+    """
+    __slots__ = ('token',)
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, token: Optional[Token], *values):
+        """Cria um nó.
+
+        Args:
+            token: O token que origina o nó, usado para localizá-lo no código-fonte.
+            values: Os valores dos campos do nó, na ordem de ``_fields``.
+        """
+        self.token = token
+        for field, value in zip(self._fields, values):
+            setattr(self, field, value)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)
+        return f'{type(self).__name__}({fields})'
+
+    def __getstate__(self):
+        return self.token, tuple(getattr(self, field) for field in self._fields)
+
+    def __setstate__(self, state):
+        self.token, values = state
+        for field, value in zip(self._fields, values):
+            setattr(self, field, value)
+
+    def children(self) -> Iterator['Node']:
+        """Gera os nós filhos, na ordem em que aparecem no código-fonte."""
+        for field in self._fields:
+            value = getattr(self, field)
+            if isinstance(value, Node):
+                yield value
+            elif isinstance(value, list):
+                yield from (item for item in value if isinstance(item, Node))
+
+
+# Expressões
+class Expression(Node):
+    """Expressão aritmética, anotada com o seu tipo resolvido
+    (``TokenKind.LITERAL_INT`` ou ``TokenKind.LITERAL_FLOAT``)."""
+    __slots__ = ('type',)
+
+
+class Number(Expression):
+    """Número inteiro ou real."""
+    __slots__ = ('value',)
+    _fields = ('value', 'type')
+
+    value: Union[int, float]
+
+
+class Variable(Expression):
+    """Uso de uma variável."""
+    __slots__ = ('name',)
+    _fields = ('name', 'type')
+
+    name: str
+
+
+class BinaryOperation(Expression):
+    """Operação aritmética (``+``, ``-``, ``*`` ou ``/``)."""
+    __slots__ = ('operator', 'left', 'right')
+    _fields = ('operator', 'left', 'right', 'type')
+
+    operator: TokenKind
+    left: Expression
+    right: Expression
+
+
+class String(Node):
+    """Cadeia de caracteres, sem as aspas."""
+    __slots__ = ('value',)
+    _fields = ('value',)
+
+    value: str
+
+
+# Condições
+class Condition(Node):
+    """Expressão relacional ou booleana."""
+    __slots__ = ()
+
+
+class Relation(Condition):
+    """Comparação entre duas expressões aritméticas."""
+    __slots__ = ('operator', 'left', 'right')
+    _fields = ('operator', 'left', 'right')
+
+    operator: TokenKind
+    left: Expression
+    right: Expression
+
+
+class BooleanOperation(Condition):
+    """Operação booleana (``E`` ou ``OU``) entre duas condições."""
+    __slots__ = ('operator', 'left', 'right')
+    _fields = ('operator', 'left', 'right')
+
+    operator: TokenKind
+    left: Condition
+    right: Condition
+
+
+# Comandos
+class Command(Node):
+    """Comando da linguagem "A"."""
+    __slots__ = ()
+
+
+class Assign(Command):
+    """``ATRIBUIR expressão A variável``."""
+    __slots__ = ('expression', 'target')
+    _fields = ('expression', 'target')
+
+    expression: Expression
+    target: Variable
+
+
+class Read(Command):
+    """``LER variável``."""
+    __slots__ = ('target',)
+    _fields = ('target',)
+
+    target: Variable
+
+
+class Print(Command):
+    """``IMPRIMIR variável`` ou ``IMPRIMIR cadeia``."""
+    __slots__ = ('value',)
+    _fields = ('value',)
+
+    value: Union[Variable, String]
+
+
+class If(Command):
+    """``SE condição ENTAO comando``."""
+    __slots__ = ('condition', 'command')
+    _fields = ('condition', 'command')
+
+    condition: Condition
+    command: Command
+
+
+class While(Command):
+    """``ENQUANTO condição comando``."""
+    __slots__ = ('condition', 'command')
+    _fields = ('condition', 'command')
+
+    condition: Condition
+    command: Command
+
+
+class Block(Command):
+    """``INICIO comandos FIM``."""
+    __slots__ = ('commands',)
+    _fields = ('commands',)
+
+    commands: List[Command]
+
+
+# Programa
+class Declaration(Node):
+    """``variável : tipo``, com o tipo resolvido
+    (``TokenKind.LITERAL_INT`` ou ``TokenKind.LITERAL_FLOAT``)."""
+    __slots__ = ('name', 'type')
+    _fields = ('name', 'type')
+
+    name: str
+    type: TokenKind
+
+
+class Program(Node):
+    """Programa da linguagem "A"."""
+    __slots__ = ('declarations', 'commands')
+    _fields = ('declarations', 'commands')
+
+    declarations: List[Declaration]
+    commands: List[Command]
+
+    @property
+    def symbols(self) -> Dict[str, TokenKind]:
+        """O tipo de cada variável declarada, na ordem das declarações."""
+        return {declaration.name: declaration.type for declaration in self.declarations}
+
+
+class NodeVisitor:
+    """Percorre a árvore sintática chamando ``visit_<Classe>`` para cada nó,
+    ou ``generic_visit`` caso o método não exista.
+
+    Como no analisador sintático, a travessia usa uma pilha explícita, e não a recursão do Python,
+    de forma que programas com milhares de comandos ou operações aninhados não esgotem o limite
+    de recursão: um método de visita pode ser um gerador, que produz (``yield``) cada nó filho a
+    visitar e recebe o retorno da sua visita. Um gerador produzido no lugar de um nó, como o de um
+    método auxiliar recursivo, é executado da mesma forma, e o seu retorno é recebido.
+    """
+
+    def visit(self, node: Node) -> Any:
+        """Visita um nó.
+
+        Args:
+            node: O nó.
+
+        Returns:
+            O retorno do método de visita do nó.
+        """
+        result = self.dispatch(node)
+        if not isinstance(result, GeneratorType):
+            return result
+        stack = [result]
+        result = None
+        while stack:
+            try:
+                request = stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                result = stop.value
+                continue
+            result = self.dispatch(request) if isinstance(request, Node) else request
+            if isinstance(result, GeneratorType):
+                stack.append(result)
+                result = None
+        return result
+
+    def dispatch(self, node: Node) -> Any:
+        """Chama o método de visita de um nó, sem executar o gerador que ele retorna.
+
+        Args:
+            node: O nó.
+
+        Returns:
+            O retorno do método de visita do nó.
+        """
+        return getattr(self, f'visit_{type(node).__name__}', self.generic_visit)(node)
+
+    def generic_visit(self, node: Node) -> Generator[Node, Any, None]:
+        """Visita os filhos de um nó.
+
+        Args:
+            node: O nó.
+        """
+        for child in node.children():
+            yield child
+
+
+class NodeTransformer(NodeVisitor):
+    """Percorre a árvore sintática substituindo cada nó pelo retorno da sua visita.
+
+    Um nó em uma lista é removido caso a sua visita retorne ``None``.
+    """
+
+    def generic_visit(self, node: Node) -> Generator[Node, Any, Node]:
+        for field in node._fields:
+            value = getattr(node, field)
+            if isinstance(value, Node):
+                setattr(node, field, (yield value))
+            elif isinstance(value, list):
+                items = []
+                for item in value:
+                    if isinstance(item, Node):
+                        item = yield item
+                    if item is not None:
+                        items.append(item)
+                value[:] = items
+        return node
@@ -0,0 +1,262 @@
+from typing import Iterable, List, Optional, Tuple
+
+from . import parse_table
+from .diagnostics import Diagnostics
+from .exceptions import AError
+from .grammar import build_tables, grammar_digest
+from .parser import Scope, _EndOfTokens, binary_operation, parse as descent_parse, unexpected_token
+from .reporter import Reporter, SilentReporter
+from .syntax_tree import Assign, Block, BooleanOperation, If, Print, Program, Read, Relation, String, While
+from .token import TOKEN_KINDS, Token, TokenKind
+
+# Tabelas LL(1) de cada agrupamento das expressões, carregadas do módulo gerado,
+# ou reconstruídas caso as regras da gramática tenham mudado desde a sua geração
+TABLES = parse_table.TABLES if parse_table.GRAMMAR_DIGEST == grammar_digest() else build_tables()
+
+
+def parse(tokens: Iterable[Token], reporter: Optional[Reporter] = None,
+          diagnostics: Optional[Diagnostics] = None, grouping: str = 'precedence',
+          check_only: bool = False) -> Program:
+    """Analisa sintática e semanticamente os tokens de um programa da linguagem "A"
+    com a tabela LL(1) gerada a partir das regras de ``grammar.py``.
+
+    Em vez de funções para cada padrão, mantém uma pilha de símbolos: um terminal no topo
+    é comparado com o token, um não terminal é substituído pela produção indexada pelo
+    tipo do token e uma ação semântica constrói um nó a partir da pilha de valores,
+    onde os tokens são empilhados ao serem consumidos. Produz a mesma árvore sintática
+    que ``parser.parse``, com os mesmos erros semânticos e os erros sintáticos nos mesmos
+    tokens, recuperando-se dos erros nas mesmas listas de declarações e de comandos.
+
+    Args:
+        tokens: Os tokens do programa.
+        reporter: O relatório que recebe os eventos da análise (padrão: silencioso).
+        diagnostics: A lista onde os erros são registrados em vez de lançados (opcional).
+        grouping: O agrupamento das expressões (``precedence`` ou ``legacy``).
+        check_only: Se cada comando de nível superior é descartado após ser analisado,
+            como em ``parser.parse`` (padrão: falso).
+
+    Returns:
+        A árvore sintática do programa, com as expressões anotadas com os seus tipos.
+        Caso existam erros registrados, a árvore é parcial e não deve ser executada.
+        Com ``check_only``, a árvore tem apenas as declarações.
+
+    Raises:
+        ASyntaxError: Caso o programa não satisfaça a sintaxe da linguagem.
+        ASemanticError: Caso o programa não satisfaça a semântica da linguagem.
+        ATooManyErrors: Caso os erros registrados excedam o limite.
+    """
+    reporter = reporter or SilentReporter()
+    traces = reporter.traces
+    table = TABLES[grouping]
+    width = table.width
+    first_action = width + len(table.nonterminals)
+    productions = table.productions
+    entries = table.table
+    recovery = table.recovery
+    remaining_tokens = iter(tokens)
+    current_token: Optional[Token] = next(remaining_tokens, None)
+    # o valor do tipo do token, sem passar pela propriedade ``value`` da enumeração
+    current_kind = current_token.kind._value_ if current_token is not None else 0
+
+    def report(error: AError):
+        """Lança um erro, ou registra-o caso os erros sejam registrados.
+
+        Args:
+            error: O erro.
+        """
+        if diagnostics is None:
+            raise error
+        diagnostics.add(error)
+
+    # Dicionário de símbolos do programa (escopo global)
+    scope = Scope(report)
+
+    # Tokens consumidos e nós construídos, desempilhados pelas ações semânticas
+    values = []
+    program_token = None
+    declarations = []
+    commands = []
+
+    # Ações semânticas
+    def on_program():
+        nonlocal program_token
+        program_token = values[-2]
+        del values[-2:]
+
+    def on_algorithm():
+        del values[-2:]
+
+    def on_declaration():
+        type_token = values.pop()
+        del values[-1]
+        # adicionar a variável ao dicionário de símbolos
+        declarations.append(scope.declare(values.pop(), type_token))
+
+    def on_command():
+        node = values.pop()
+        if not check_only:
+            commands.append(node)
+
+    def on_assign():
+        var_token = values.pop()
+        del values[-1]
+        expression = values.pop()
+        values[-1] = Assign(values[-1], expression, scope.variable(var_token, expression.type))
+
+    def on_read():
+        var_token = values.pop()
+        values[-1] = Read(values[-1], scope.variable(var_token))
+
+    def on_print():
+        possible_var_token = values.pop()
+        if possible_var_token.kind == TokenKind.IDENTIFIER:
+            values[-1] = Print(values[-1], scope.variable(possible_var_token))
+        else:
+            values[-1] = Print(values[-1], String(possible_var_token, possible_var_token.lexeme[1:-1]))
+
+    def on_if():
+        command = values.pop()
+        del values[-1]
+        condition = values.pop()
+        values[-1] = If(values[-1], condition, command)
+
+    def on_while():
+        command = values.pop()
+        condition = values.pop()
+        values[-1] = While(values[-1], condition, command)
+
+    def on_block():
+        values.append([])
+
+    def on_end_block():
+        del values[-1]
+        block_commands = values.pop()
+        values[-1] = Block(values[-1], block_commands)
+
+    def on_append():
+        command = values.pop()
+        values[-1].append(command)
+
+    def on_relation():
+        right_expression = values.pop()
+        operator = values.pop()
+        values[-1] = Relation(operator, operator.kind, values[-1], right_expression)
+
+    def on_number():
+        values[-1] = scope.number(values[-1])
+
+    def on_variable():
+        # certificar que a variável foi declarada e resgatar seu tipo
+        values[-1] = scope.variable(values[-1])
+
+    def on_boolean():
+        right_condition = values.pop()
+        operator = values.pop()
+        values[-1] = BooleanOperation(operator, operator.kind, values[-1], right_condition)
+
+    def on_binary():
+        right_expression = values.pop()
+        operator = values.pop()
+        values[-1] = binary_operation(operator, values[-1], right_expression)
+
+    def on_parenthesized():
+        values[-3:] = [values[-2]]
+
+    def on_chain():
+        values.append([])
+
+    def on_fold():
+        # agrupar à direita, sem precedência, como no analisador original
+        chain = values.pop()
+        expression = chain.pop()
+        while chain:
+            operator = chain.pop()
+            expression = binary_operation(operator, chain.pop(), expression)
+        values.append(expression)
+
+    handlers = {
+        'program': on_program, 'algorithm': on_algorithm, 'declaration': on_declaration, 'command': on_command,
+        'assign': on_assign, 'read': on_read, 'print': on_print, 'if': on_if, 'while': on_while,
+        'block': on_block, 'end_block': on_end_block, 'append': on_append, 'relation': on_relation,
+        'number': on_number, 'variable': on_variable, 'boolean': on_boolean, 'binary': on_binary,
+        'parenthesized': on_parenthesized, 'chain': on_chain, 'fold': on_fold,
+    }
+    actions = tuple(handlers[action] for action in table.actions)
+
+    # símbolos ainda não analisados, com o próximo símbolo no topo
+    stack = [table.start]
+    # listas de declarações e de comandos em análise, do mais externo ao mais interno,
+    # com a posição do seu não terminal na pilha de símbolos e a altura da pilha de valores
+    regions: List[Tuple[int, int]] = []
+    try:
+        while stack:
+            symbol = stack.pop()
+            if symbol < width:
+                # terminal
+                if symbol == current_kind:
+                    if traces:
+                        reporter.satisfied(current_token, (current_token.kind,))
+                    values.append(current_token)
+                    current_token = next(remaining_tokens, None)
+                    current_kind = current_token.kind._value_ if current_token is not None else 0
+                    continue
+                expected = (symbol,)
+            elif symbol < first_action:
+                # não terminal
+                row = symbol - width
+                while regions and regions[-1][0] >= len(stack):
+                    regions.pop()
+                production = entries[row * width + current_kind]
+                if production >= 0:
+                    if recovery[row] is not None and productions[production]:
+                        regions.append((len(stack), len(values)))
+                    stack.extend(productions[production])
+                    continue
+                expected = table.expected[row]
+                # um token que não inicia um item da lista é recuperado pela própria lista
+                if recovery[row] is not None:
+                    regions.append((len(stack), len(values)))
+                    stack.append(symbol)
+            else:
+                actions[symbol - first_action]()
+                continue
+
+            error = unexpected_token(current_token, tuple(TOKEN_KINDS[kind] for kind in expected))
+            if diagnostics is None:
+                raise error
+            diagnostics.add(error)
+            # não há mais o que analisar após um erro no fim dos tokens
+            if current_token is None:
+                raise _EndOfTokens
+            while regions and regions[-1][0] >= len(stack):
+                regions.pop()
+            if not regions:
+                # um cabeçalho incorreto: seguir sem descartar nenhum token
+                values.append(None)
+                continue
+
+            # descartar os símbolos e valores da lista mais interna e os tokens até um ponto de sincronização
+            position, height = regions[-1]
+            del stack[position + 1:]
+            del values[height:]
+            row = stack[position] - width
+            while current_token is not None and current_kind not in recovery[row]:
+                current_token = next(remaining_tokens, None)
+                current_kind = current_token.kind._value_ if current_token is not None else 0
+            # um token que a lista não aceita, como um "FIM" sem o seu "INICIO"
+            if current_token is not None and entries[row * width + current_kind] < 0:
+                current_token = next(remaining_tokens, None)
+                current_kind = current_token.kind._value_ if current_token is not None else 0
+    except _EndOfTokens:
+        pass
+
+    reporter.parsed(len(scope.symbols))
+
+    return Program(program_token, declarations, commands)
+
+
+# Analisadores sintáticos por nome
+PARSERS = {
+    'descent': descent_parse,
+    'table': parse,
+}
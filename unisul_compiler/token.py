@@ -1,4 +1,9 @@
+from array import array
+from collections import Counter
 from enum import Enum, auto
+from typing import Dict, Iterator, Optional, Sequence
+
+from .source import Location, Source
 
 
 class TokenKind(Enum):
@@ -49,19 +54,37 @@ class TokenKind(Enum):
         return self.name
 
 
+# Tipos de token indexados pelo seu valor
+TOKEN_KINDS = (None, *TokenKind)
+
+
 class Token:
-    def __init__(self, kind: TokenKind, lexeme: str):
+    """Token da linguagem "A".
+
+    O lexema é mantido apenas quando o código-fonte não está disponível
+    (análise sob demanda), caso contrário é recortado do código-fonte quando consultado.
+    """
+    __slots__ = ('_kind', '_lexeme', '_source', '_start', '_end')
+
+    def __init__(self, kind: TokenKind, lexeme: Optional[str] = None,
+                 source: Optional[Source] = None, start: int = 0, end: int = 0):
         """Cria um token da linguagem "A".
 
         Args:
             kind: O tipo do token.
-            lexeme: O lexema do token.
+            lexeme: O lexema do token, ou ``None`` para recortá-lo do código-fonte.
+            source: O código-fonte do token (opcional).
+            start: A posição do início do token no código-fonte.
+            end: A posição do fim do token no código-fonte.
         """
         self._kind = kind
         self._lexeme = lexeme
+        self._source = source
+        self._start = start
+        self._end = end
 
     def __repr__(self) -> str:
-        return f'<{self._kind}, "{self._lexeme}">'
+        return f'<{self._kind}, "{self.lexeme}">'
 
     @property
     def kind(self):
@@ -69,6 +92,85 @@ class Token:
         return self._kind
 
     @property
-    def lexeme(self):
+    def lexeme(self) -> str:
         """O lexema do token."""
-        return self._lexeme
+        if self._lexeme is not None:
+            return self._lexeme
+        return self._source.lexeme(self._start, self._end)
+
+    @property
+    def source(self) -> Optional[Source]:
+        """O código-fonte do token, ``None`` caso seja desconhecido."""
+        return self._source
+
+    @property
+    def start(self) -> int:
+        """A posição do início do token no código-fonte."""
+        return self._start
+
+    @property
+    def end(self) -> int:
+        """A posição do fim do token no código-fonte."""
+        return self._end
+
+    @property
+    def location(self) -> Optional[Location]:
+        """A localização do token no código-fonte, ``None`` caso seja desconhecida."""
+        return self._source.location(self._start) if self._source is not None else None
+
+
+class TokenBuffer(Sequence[Token]):
+    """Sequência compacta de tokens de um código-fonte.
+
+    Guarda apenas o tipo e as posições de cada token em vetores,
+    criando os objetos ``Token`` somente quando acessados.
+    """
+    __slots__ = ('source', 'kinds', 'starts', 'ends')
+
+    def __init__(self, source: Source):
+        """Cria uma sequência de tokens vazia.
+
+        Args:
+            source: O código-fonte dos tokens.
+        """
+        self.source = source
+        self.kinds = array('B')
+        self.starts = array('q')
+        self.ends = array('q')
+
+    def __repr__(self) -> str:
+        return f'<TokenBuffer "{self.source.name}", {len(self.kinds)} tokens>'
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.kinds)))]
+        return Token(TOKEN_KINDS[self.kinds[index]], None, self.source, self.starts[index], self.ends[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        source = self.source
+        for kind, start, end in zip(self.kinds, self.starts, self.ends):
+            yield Token(TOKEN_KINDS[kind], None, source, start, end)
+
+    def count_kinds(self) -> Dict[str, int]:
+        """Conta os tokens de cada tipo.
+
+        Returns:
+            A quantidade de tokens de cada tipo encontrado, pelo nome do tipo, na ordem da enumeração.
+        """
+        counts = Counter(self.kinds)
+        return {TOKEN_KINDS[kind].name: counts[kind] for kind in sorted(counts)}
+
+    def append(self, kind: TokenKind, start: int, end: int):
+        """Adiciona um token ao fim da sequência.
+
+        Args:
+            kind: O tipo do token.
+            start: A posição do início do token no código-fonte.
+            end: A posição do fim do token no código-fonte.
+        """
+        self.kinds.append(kind.value)
+        self.starts.append(start)
+        self.ends.append(end)
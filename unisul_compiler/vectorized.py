@@ -0,0 +1,313 @@
+import csv
+import io
+import math
+from decimal import Decimal
+from typing import Iterable, List, NamedTuple, Optional, Sequence, TextIO, Union
+
+from .bytecode import Code, compile_program
+from .exceptions import ARuntimeError
+from .runtime import INT_VALUE, REAL_VALUE, InputReader, format_value
+from .syntax_tree import (
+    Assign, Block, BooleanOperation, Command, Condition, Expression, If, Number, Print,
+    Program, Read, String, Variable, While)
+from .token import TokenKind
+from .vm import execute
+
+try:
+    import numpy
+except ImportError:  # dependência opcional: sem ela, cada execução é feita pela máquina virtual
+    numpy = None
+
+# Quantidade mínima de execuções para executá-las juntas sobre vetores; com menos,
+# o custo das operações vetoriais não compensa e cada execução é feita pela máquina virtual
+MIN_LANES = 8
+
+# Fração das execuções abaixo da qual as que ainda estão em um laço são refeitas pela máquina virtual,
+# já que cada iteração sobre vetores custa o mesmo para poucas ou para todas as execuções
+MIN_ACTIVE_FRACTION = 1 / 16
+
+# Limites dos inteiros de 64 bits, além dos quais uma execução é refeita pela máquina virtual
+INT_MIN, INT_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Altura da árvore sintática além da qual as execuções são feitas pela máquina virtual,
+# já que a execução sobre vetores percorre a árvore recursivamente
+MAX_HEIGHT = 200
+
+
+class RunResult(NamedTuple):
+    """Resultado de uma das execuções de um programa por ``run_many``."""
+    output: str
+    error: Optional[ARuntimeError]
+    # se a execução foi feita sobre vetores, e não pela máquina virtual
+    vectorized: bool
+
+
+def read_input_matrix(file: TextIO) -> List[List[str]]:
+    """Lê uma matriz de entradas em CSV, com os valores de ``LER`` de uma execução por linha.
+
+    As linhas vazias são ignoradas.
+
+    Args:
+        file: O arquivo CSV, aberto em modo texto.
+
+    Returns:
+        Os valores de entrada de cada execução.
+    """
+    return [row for row in csv.reader(file) if any(cell.strip() for cell in row)]
+
+
+def _input_value(value) -> str:
+    """Escreve um valor da matriz de entradas; um real, sem expoente, aceito por ``LER``."""
+    text = str(value)
+    if isinstance(value, float) and 'e' in text and math.isfinite(value):
+        return format(Decimal(text), 'f')
+    return text
+
+
+def _input_values(row: Union[str, Iterable]) -> List[str]:
+    """Converte uma linha da matriz de entradas nos valores de ``LER``, separados como pelo ``InputReader``."""
+    if isinstance(row, str):
+        return row.split()
+    if numpy is not None and isinstance(row, numpy.ndarray):
+        row = row.tolist()
+    return ' '.join(map(_input_value, row)).split()
+
+
+def _run_scalar(code: Code, values: List[str]) -> RunResult:
+    """Executa o programa uma vez na máquina virtual."""
+    output = io.StringIO()
+    try:
+        execute(code, InputReader(' '.join(values)), output.write)
+    except ARuntimeError as error:
+        return RunResult(output.getvalue(), error, False)
+    return RunResult(output.getvalue(), None, False)
+
+
+class _VectorMachine:
+    """Executa um programa sobre vetores, com uma posição (faixa) por execução.
+
+    Cada comando recebe as posições das faixas que o executam: um ``SE`` divide as faixas
+    pela condição e um ``ENQUANTO`` repete o seu comando enquanto houver faixas cuja condição
+    é verdadeira. Uma faixa que encontraria uma situação excepcional (divisão por zero,
+    inteiro fora dos 64 bits, entrada ausente ou inválida) ou que permanece em um laço com poucas
+    outras é descartada, para ser refeita pela máquina virtual, que relata os erros como sempre.
+    """
+
+    def __init__(self, program: Program, rows: List[List[str]]):
+        lanes = len(rows)
+        self.values = {name: numpy.zeros(lanes, numpy.int64 if kind == TokenKind.LITERAL_INT else numpy.float64)
+                       for name, kind in program.symbols.items()}
+        self.outputs: List[List[str]] = [[] for _ in range(lanes)]
+        self.alive = numpy.ones(lanes, bool)
+        self.evictions = 0
+        self.straggler_limit = int(lanes * MIN_ACTIVE_FRACTION)
+
+        # os valores de entrada, convertidos de uma vez para os dois tipos
+        columns = max(map(len, rows), default=0) or 1
+        self.ints = numpy.zeros((lanes, columns), numpy.int64)
+        self.int_valid = numpy.zeros((lanes, columns), bool)
+        self.reals = numpy.zeros((lanes, columns), numpy.float64)
+        self.real_valid = numpy.zeros((lanes, columns), bool)
+        for lane, row in enumerate(rows):
+            for column, value in enumerate(row):
+                # os mesmos valores aceitos por ``parse_value``
+                if INT_VALUE.fullmatch(value) is not None and INT_MIN <= (number := int(value)) <= INT_MAX:
+                    self.ints[lane, column] = number
+                    self.int_valid[lane, column] = True
+                if REAL_VALUE.fullmatch(value) is not None:
+                    self.reals[lane, column] = float(value)
+                    self.real_valid[lane, column] = True
+        self.position = numpy.zeros(lanes, numpy.int64)
+
+    def evict(self, lanes: 'numpy.ndarray'):
+        """Descarta as faixas, que serão refeitas pela máquina virtual."""
+        if len(lanes):
+            self.alive[lanes] = False
+            self.evictions += 1
+
+    def run(self, command: Command, lanes: 'numpy.ndarray') -> 'numpy.ndarray':
+        """Executa um comando nas faixas.
+
+        Args:
+            command: O comando.
+            lanes: As posições das faixas.
+
+        Returns:
+            As faixas que não foram descartadas.
+        """
+        evictions = self.evictions
+        if isinstance(command, Block):
+            for inner_command in command.commands:
+                lanes = self.run(inner_command, lanes)
+                if not len(lanes):
+                    break
+        elif isinstance(command, Assign):
+            result = self.expression(command.expression, lanes)
+            self.values[command.target.name][lanes] = result
+        elif isinstance(command, Read):
+            self.read(command.target, lanes)
+        elif isinstance(command, Print):
+            if isinstance(command.value, String):
+                text = format_value(command.value.value)
+                for lane in lanes.tolist():
+                    self.outputs[lane].append(text)
+            else:
+                outputs = self.outputs
+                for lane, value in zip(lanes.tolist(), self.values[command.value.name][lanes].tolist()):
+                    outputs[lane].append(format_value(value))
+        elif isinstance(command, If):
+            result = self.condition(command.condition, lanes)
+            self.run(command.command, lanes[result & self.alive[lanes]])
+        else:
+            self.loop(command, lanes)
+        return lanes[self.alive[lanes]] if self.evictions != evictions else lanes
+
+    def loop(self, command: While, lanes: 'numpy.ndarray'):
+        """Executa um ``ENQUANTO`` até que a condição seja falsa em todas as faixas."""
+        while len(lanes):
+            result = self.condition(command.condition, lanes)
+            lanes = lanes[result & self.alive[lanes]]
+            if 0 < len(lanes) <= self.straggler_limit:
+                self.evict(lanes)
+                return
+            lanes = self.run(command.command, lanes)
+
+    def read(self, target: Variable, lanes: 'numpy.ndarray'):
+        """Executa um ``LER`` nas faixas, descartando as que não têm um valor de entrada válido."""
+        if target.type == TokenKind.LITERAL_INT:
+            matrix, valid = self.ints, self.int_valid
+        else:
+            matrix, valid = self.reals, self.real_valid
+        positions = self.position[lanes]
+        columns = numpy.minimum(positions, matrix.shape[1] - 1)
+        ok = (positions < matrix.shape[1]) & valid[lanes, columns]
+        self.evict(lanes[~ok])
+        lanes, columns = lanes[ok], columns[ok]
+        self.values[target.name][lanes] = matrix[lanes, columns]
+        self.position[lanes] += 1
+
+    def expression(self, node: Expression, lanes: 'numpy.ndarray') -> 'numpy.ndarray':
+        """Calcula uma expressão nas faixas, como a máquina virtual.
+
+        Returns:
+            O valor da expressão em cada faixa, do tipo da expressão.
+        """
+        if isinstance(node, Number):
+            kind = numpy.int64 if node.type == TokenKind.LITERAL_INT else numpy.float64
+            return numpy.full(len(lanes), node.value, kind)
+        if isinstance(node, Variable):
+            return self.values[node.name][lanes]
+
+        left = self.expression(node.left, lanes)
+        right = self.expression(node.right, lanes)
+        operator = node.operator
+        if node.type != TokenKind.LITERAL_INT:
+            left, right = left.astype(numpy.float64), right.astype(numpy.float64)
+            if operator == TokenKind.ADDITION:
+                return left + right
+            if operator == TokenKind.SUBTRACTION:
+                return left - right
+            if operator == TokenKind.MULTIPLICATION:
+                return left * right
+            if (zero := right == 0).any():
+                self.evict(lanes[zero])
+                right = numpy.where(zero, 1.0, right)
+            return left / right
+
+        # os inteiros da linguagem não têm limite: um resultado fora dos 64 bits descarta a faixa
+        if operator == TokenKind.ADDITION:
+            result = left + right
+            overflow = ((left ^ result) & (right ^ result)) < 0
+        elif operator == TokenKind.SUBTRACTION:
+            result = left - right
+            overflow = ((left ^ right) & (left ^ result)) < 0
+        else:
+            result = left * right
+            overflow = (left != 0) & ((result // numpy.where(left == 0, 1, left) != right)
+                                      | ((left == -1) & (right == INT_MIN)))
+        if overflow.any():
+            self.evict(lanes[overflow])
+        return result
+
+    def condition(self, node: Condition, lanes: 'numpy.ndarray') -> 'numpy.ndarray':
+        """Calcula uma condição nas faixas, avaliando o lado direito de um ``E`` ou ``OU``
+        apenas nas faixas em que o resultado ainda não é conhecido, como a máquina virtual.
+
+        Returns:
+            O resultado da condição em cada faixa.
+        """
+        if isinstance(node, BooleanOperation):
+            result = self.condition(node.left, lanes)
+            pending = result if node.operator == TokenKind.AND else ~result
+            if pending.any():
+                result[pending] = self.condition(node.right, lanes[pending])
+            return result
+
+        left = self.expression(node.left, lanes)
+        right = self.expression(node.right, lanes)
+        if node.left.type != node.right.type:
+            left, right = left.astype(numpy.float64), right.astype(numpy.float64)
+        operator = node.operator
+        if operator == TokenKind.EQUAL:
+            return left == right
+        if operator == TokenKind.NOT_EQUAL:
+            return left != right
+        if operator == TokenKind.LESS:
+            return left < right
+        if operator == TokenKind.GREATER:
+            return left > right
+        if operator == TokenKind.LESS_EQUAL:
+            return left <= right
+        return left >= right
+
+
+def _fits(program: Program) -> bool:
+    """Verifica se as constantes inteiras do programa cabem nos inteiros de 64 bits
+    e se a sua árvore sintática tem no máximo ``MAX_HEIGHT`` níveis."""
+    pending = [(program, 0)]
+    while pending:
+        node, height = pending.pop()
+        if isinstance(node, Number) and node.type == TokenKind.LITERAL_INT and not INT_MIN <= node.value <= INT_MAX:
+            return False
+        if height > MAX_HEIGHT:
+            return False
+        pending.extend((child, height + 1) for child in node.children())
+    return True
+
+
+def run_many(program: Program, inputs: Union[Sequence, 'numpy.ndarray'],
+             code: Optional[Code] = None) -> List[RunResult]:
+    """Executa um programa válido uma vez para cada linha de uma matriz de entradas.
+
+    Com NumPy instalado, ao menos ``MIN_LANES`` execuções e uma árvore sintática com até
+    ``MAX_HEIGHT`` níveis, as execuções são feitas juntas, cada comando operando sobre vetores
+    com uma posição por execução; as execuções que encontram uma situação excepcional ou que
+    divergem das demais em um laço são refeitas, desde o início, pela máquina virtual. A saída
+    e o erro de cada execução são sempre os mesmos da máquina virtual.
+
+    Args:
+        program: A árvore sintática do programa.
+        inputs: Os valores de ``LER`` de cada execução: uma sequência de linhas (cada uma um texto
+            ou uma sequência de valores) ou uma matriz NumPy.
+        code: O código do programa na máquina virtual, compilado caso seja necessário (opcional).
+
+    Returns:
+        O resultado de cada execução, na ordem das linhas.
+    """
+    rows = [_input_values(row) for row in inputs]
+    results: List[Optional[RunResult]] = [None] * len(rows)
+    if numpy is not None and len(rows) >= MIN_LANES and _fits(program):
+        machine = _VectorMachine(program, rows)
+        with numpy.errstate(all='ignore'):
+            lanes = numpy.arange(len(rows))
+            for command in program.commands:
+                if not len(lanes := machine.run(command, lanes)):
+                    break
+        for lane in numpy.flatnonzero(machine.alive).tolist():
+            results[lane] = RunResult(''.join(machine.outputs[lane]), None, True)
+
+    for lane, result in enumerate(results):
+        if result is None:
+            code = code or compile_program(program)
+            results[lane] = _run_scalar(code, rows[lane])
+    return results
@@ -0,0 +1,146 @@
+import io
+from typing import Callable, Optional, TextIO, Union
+
+from .bytecode import Code, Opcode, compile_program
+from .exceptions import ARuntimeError
+from .runtime import InputReader, division_by_zero, format_value, real_overflow
+from .syntax_tree import Program
+from .token import TokenKind
+
+# Operações em variáveis locais do módulo, evitando o acesso aos membros da enumeração no laço
+(LOAD_VAR, LOAD_CONST, STORE_VAR, INT_TO_REAL,
+ ADD_INT, SUB_INT, MUL_INT, ADD_REAL, SUB_REAL, MUL_REAL, DIV_REAL,
+ EQUAL, NOT_EQUAL, LESS, GREATER, LESS_EQUAL, GREATER_EQUAL,
+ JUMP, POP_JUMP_IF_FALSE, POP_JUMP_IF_TRUE,
+ READ_INT, READ_REAL, PRINT_INT, PRINT_REAL, PRINT_STR, HALT) = map(int, Opcode)
+
+
+def execute(code: Code, reader: InputReader, write: Callable[[str], object],
+            on_branch: Optional[Callable[[int, int, int], object]] = None, state: Optional[list] = None):
+    """Executa o código de um programa da linguagem "A".
+
+    A execução medida pela ``Sandbox`` e pelo ``Profiler`` usa este mesmo laço, por meio de
+    ``on_branch`` e ``state``, que não custam nada a cada instrução: sem eles, apenas uma
+    comparação por desvio.
+
+    Args:
+        code: O código do programa.
+        reader: O leitor dos valores de entrada do comando ``LER``.
+        write: A função que recebe a saída do comando ``IMPRIMIR``.
+        on_branch: A função chamada em cada desvio e no fim do programa, antes de executá-los,
+            com o início do trecho sem desvios que encerram, a sua posição e a sua operação (opcional).
+        state: Uma lista que recebe, ao fim da execução, a posição seguinte à última instrução
+            executada e o início do trecho sem desvios em que a execução terminou (opcional).
+
+    Raises:
+        ARuntimeError: Caso ocorra um erro de execução, inclusive lançado por ``on_branch``,
+            ``reader`` ou ``write``.
+    """
+    instructions = code.instructions.tolist()
+    constants = code.constants
+    variables = code.initial_values()
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    pc = 0
+    # início do trecho sem desvios atual
+    segment = 0
+
+    try:
+        while True:
+            opcode = instructions[pc]
+            argument = instructions[pc + 1]
+            pc += 2
+
+            if opcode == LOAD_VAR:
+                push(variables[argument])
+            elif opcode == LOAD_CONST:
+                push(constants[argument])
+            elif opcode == STORE_VAR:
+                variables[argument] = pop()
+            elif opcode <= DIV_REAL:
+                if opcode == INT_TO_REAL:
+                    # as operações e comparações entre inteiros e reais convertem o inteiro aqui
+                    try:
+                        stack[-1] = float(stack[-1])
+                    except OverflowError:
+                        raise real_overflow(code.location(pc - 2)) from None
+                    continue
+                right = pop()
+                if opcode == ADD_INT or opcode == ADD_REAL:
+                    stack[-1] += right
+                elif opcode == SUB_INT or opcode == SUB_REAL:
+                    stack[-1] -= right
+                elif opcode == MUL_INT or opcode == MUL_REAL:
+                    stack[-1] *= right
+                elif right == 0:
+                    raise division_by_zero(code.location(pc - 2))
+                else:
+                    stack[-1] /= right
+            elif opcode <= GREATER_EQUAL:
+                right = pop()
+                left = stack[-1]
+                if opcode == LESS:
+                    stack[-1] = left < right
+                elif opcode == GREATER:
+                    stack[-1] = left > right
+                elif opcode == EQUAL:
+                    stack[-1] = left == right
+                elif opcode == NOT_EQUAL:
+                    stack[-1] = left != right
+                elif opcode == LESS_EQUAL:
+                    stack[-1] = left <= right
+                else:
+                    stack[-1] = left >= right
+            elif opcode <= POP_JUMP_IF_TRUE:
+                if on_branch is not None:
+                    on_branch(segment, pc - 2, opcode)
+                if opcode == POP_JUMP_IF_FALSE:
+                    if not pop():
+                        pc = argument
+                elif opcode == POP_JUMP_IF_TRUE:
+                    if pop():
+                        pc = argument
+                else:  # JUMP
+                    pc = argument
+                segment = pc
+            elif opcode == READ_INT or opcode == READ_REAL:
+                try:
+                    variables[argument] = reader.read(
+                        TokenKind.LITERAL_INT if opcode == READ_INT else TokenKind.LITERAL_FLOAT)
+                except ARuntimeError as error:
+                    error.location = error.location or code.location(pc - 2)
+                    raise
+            elif opcode == PRINT_INT or opcode == PRINT_REAL or opcode == PRINT_STR:
+                try:
+                    write(format_value(constants[argument] if opcode == PRINT_STR else variables[argument]))
+                except ARuntimeError as error:
+                    error.location = error.location or code.location(pc - 2)
+                    raise
+            else:  # HALT
+                if on_branch is not None:
+                    on_branch(segment, pc - 2, opcode)
+                segment = pc
+                return
+    finally:
+        if state is not None:
+            state[:] = (pc, segment)
+
+
+def run(program: Union[Program, Code], stdin: Union[str, TextIO] = '') -> str:
+    """Executa um programa válido da linguagem "A" e retorna a sua saída.
+
+    Args:
+        program: A árvore sintática ou o código do programa.
+        stdin: Os valores de entrada do comando ``LER``, separados por espaços em branco.
+
+    Returns:
+        A saída do comando ``IMPRIMIR``.
+
+    Raises:
+        ARuntimeError: Caso ocorra um erro de execução.
+    """
+    code = program if isinstance(program, Code) else compile_program(program)
+    output = io.StringIO()
+    execute(code, InputReader(stdin), output.write)
+    return output.getvalue()